@@ -0,0 +1,327 @@
+# -*- coding: utf-8 -*-
+"""
+.. module:: openzwave.analytics
+
+This file is part of **python-openzwave** project https://github.com/OpenZWave/python-openzwave.
+    :platform: Unix, Windows, MacOS X
+    :sinopsis: openzwave API
+
+.. moduleauthor: bibi21000 aka Sébastien GALLET <bibi21000@gmail.com>
+
+License : GPL(v3)
+
+**python-openzwave** is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+**python-openzwave** is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with python-openzwave. If not, see http://www.gnu.org/licenses.
+
+"""
+from openzwave.object import ZWaveException
+
+# Set default logging handler to avoid "No handler found" warnings.
+import logging
+try:  # Python 2.7+
+    from logging import NullHandler
+except ImportError:
+    class NullHandler(logging.Handler):
+        """NullHandler logger for python 2.6"""
+        def emit(self, record):
+            pass
+logger = logging.getLogger('openzwave')
+logger.addHandler(NullHandler())
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+    logger.warning('numpy is not installed : analytics are disabled')
+
+RESAMPLE_METHODS = ['last', 'mean', 'min', 'max']
+AGGREGATES = ['mean', 'sum', 'min', 'max']
+
+class ZWaveAnalytics(object):
+    """
+    Vectorized queries over the history of the values, using NumPy.
+
+    Samples are loaded from the history in one query for many values
+    and returned as contiguous float64 arrays.
+
+    .. code-block:: python
+
+        analytics = ZWaveAnalytics(history)
+        grid, temperatures = analytics.resample(room_values, 900, start, end)
+        grid, room_average = analytics.aggregate(room_values, 900, start, end)
+        kwh = analytics.meter_consumption(meter_values, start, end)
+
+    """
+
+    def __init__(self, history):
+        """
+        Initialize the analytics
+
+        :param history: The history of the values
+        :type history: ZWaveHistory
+
+        """
+        if np is None:
+            raise ZWaveException(u"numpy is not installed")
+        self._history = history
+
+    def series(self, value_id, start=None, end=None):
+        """
+        The numeric samples of a value.
+
+        :param value_id: The id of the value
+        :type value_id: int
+        :param start: The first timestamp (included)
+        :type start: float
+        :param end: The last timestamp (excluded)
+        :type end: float
+        :return: A tuple of arrays (timestamps, data)
+        :rtype: tuple
+
+        """
+        return self.series_many([value_id], start=start, end=end)[value_id]
+
+    def series_many(self, value_ids, start=None, end=None):
+        """
+        The numeric samples of many values.
+
+        :param value_ids: The ids of the values
+        :type value_ids: list
+        :param start: The first timestamp (included)
+        :type start: float
+        :param end: The last timestamp (excluded)
+        :type end: float
+        :return: A dict value_id : (timestamps, data)
+        :rtype: dict()
+
+        """
+        value_ids = list(value_ids)
+        rows = self._history.get_numeric_many(value_ids, start=start, end=end)
+        ret = {}
+        if len(rows) == 0:
+            for value_id in value_ids:
+                ret[value_id] = (np.empty(0, dtype=np.float64), np.empty(0, dtype=np.float64))
+            return ret
+        table = np.array(rows, dtype=np.float64)
+        #value_id doesn't fit in a float64 : keep it as integers
+        ids = np.array([row[0] for row in rows], dtype=np.uint64)
+        #The rows of a value are contiguous : split them where the id changes
+        bounds = np.concatenate(([0], np.flatnonzero(ids[1:] != ids[:-1]) + 1, [len(ids)]))
+        slices = {}
+        for lo, hi in zip(bounds[:-1], bounds[1:]):
+            slices[rows[lo][0]] = (lo, hi)
+        for value_id in value_ids:
+            lo, hi = slices.get(value_id, (0, 0))
+            ret[value_id] = (np.ascontiguousarray(table[lo:hi, 1]), np.ascontiguousarray(table[lo:hi, 2]))
+        return ret
+
+    def _grid(self, step, start, end):
+        """
+        Build the grid of a resampling.
+
+        """
+        if step <= 0:
+            raise ZWaveException(u"step must be positive")
+        return np.arange(start, end, step, dtype=np.float64)
+
+    def resample(self, value_ids, step, start, end, method='last'):
+        """
+        Resample many values on a regular grid.
+
+        :param value_ids: The ids of the values
+        :type value_ids: list
+        :param step: The step of the grid in seconds
+        :type step: float
+        :param start: The start of the grid
+        :type start: float
+        :param end: The end of the grid (excluded)
+        :type end: float
+        :param method: 'last' keeps the last known data at each point of the grid. 'mean', 'min' and 'max' aggregate the samples of each step.
+        :type method: str
+        :return: A tuple (grid, matrix) with a row by value. Missing data are NaN.
+        :rtype: tuple
+
+        """
+        if method not in RESAMPLE_METHODS:
+            raise ZWaveException(u"Unknown resampling method %s" % method)
+        value_ids = list(value_ids)
+        grid = self._grid(step, start, end)
+        matrix = np.full((len(value_ids), len(grid)), np.nan, dtype=np.float64)
+        if len(grid) == 0:
+            return grid, matrix
+        series = self.series_many(value_ids, start=start, end=end)
+        if method == 'last':
+            lasts = self._history.last_many(value_ids, before=start)
+        for row, value_id in enumerate(value_ids):
+            ts, data = series[value_id]
+            if method == 'last':
+                previous = lasts.get(value_id, None)
+                if previous is not None and isinstance(previous[1], float):
+                    ts = np.concatenate(([previous[0]], ts))
+                    data = np.concatenate(([previous[1]], data))
+                if len(ts) == 0:
+                    continue
+                idx = np.searchsorted(ts, grid, side='right') - 1
+                known = idx >= 0
+                matrix[row, known] = data[idx[known]]
+                continue
+            if len(ts) == 0:
+                continue
+            buckets = ((ts - start) // step).astype(np.int64)
+            if method == 'mean':
+                counts = np.bincount(buckets, minlength=len(grid))[:len(grid)]
+                sums = np.bincount(buckets, weights=data, minlength=len(grid))[:len(grid)]
+                filled = counts > 0
+                matrix[row, filled] = sums[filled] / counts[filled]
+            elif method == 'min':
+                np.fmin.at(matrix[row], buckets, data)
+            else:
+                np.fmax.at(matrix[row], buckets, data)
+        return grid, matrix
+
+    def aggregate(self, value_ids, step, start, end, how='mean', method='mean'):
+        """
+        Aggregate many values on a regular grid, ie the average temperature of a room.
+
+        :param value_ids: The ids of the values
+        :type value_ids: list
+        :param step: The step of the grid in seconds
+        :type step: float
+        :param start: The start of the grid
+        :type start: float
+        :param end: The end of the grid (excluded)
+        :type end: float
+        :param how: The aggregate across the values : 'mean', 'sum', 'min' or 'max'
+        :type how: str
+        :param method: The resampling method of each value
+        :type method: str
+        :return: A tuple of arrays (grid, data). Steps without data are NaN.
+        :rtype: tuple
+
+        """
+        if how not in AGGREGATES:
+            raise ZWaveException(u"Unknown aggregate %s" % how)
+        grid, matrix = self.resample(value_ids, step, start, end, method=method)
+        empty = np.all(np.isnan(matrix), axis=0)
+        if how == 'sum':
+            data = np.nansum(matrix, axis=0)
+        else:
+            #Avoid the "All-NaN slice" warnings of numpy
+            safe = matrix.copy()
+            safe[:, empty] = 0.0
+            data = getattr(np, 'nan%s' % how)(safe, axis=0)
+        data[empty] = np.nan
+        return grid, data
+
+    def integrate(self, value_id, start=None, end=None, scale=1.0 / 3600):
+        """
+        Integrate a value over time with the trapezoidal rule, ie the energy from a power.
+
+        :param value_id: The id of the value
+        :type value_id: int
+        :param start: The first timestamp (included)
+        :type start: float
+        :param end: The last timestamp (excluded)
+        :type end: float
+        :param scale: Multiply the result. The default converts W.s to Wh.
+        :type scale: float
+        :return: The integral
+        :rtype: float
+
+        """
+        ts, data = self.series(value_id, start=start, end=end)
+        if len(ts) < 2:
+            return 0.0
+        return float(np.sum(np.diff(ts) * (data[1:] + data[:-1]) / 2.0) * scale)
+
+    def meter_consumption(self, value_ids, start=None, end=None):
+        """
+        The consumption of many meters (kWh, m3, ...) : the sum of their increments.
+        A meter going back is considered as a reset of the meter.
+
+        :param value_ids: The ids of the values
+        :type value_ids: list
+        :param start: The first timestamp (included)
+        :type start: float
+        :param end: The last timestamp (excluded)
+        :type end: float
+        :return: A dict value_id : consumption
+        :rtype: dict()
+
+        """
+        ret = {}
+        series = self.series_many(value_ids, start=start, end=end)
+        for value_id in series:
+            data = series[value_id][1]
+            if len(data) < 2:
+                ret[value_id] = 0.0
+                continue
+            deltas = np.diff(data)
+            ret[value_id] = float(np.sum(np.where(deltas >= 0, deltas, data[1:])))
+        return ret
+
+    def thresholds(self, value_ids, k=3.0, start=None, end=None):
+        """
+        Compute the anomaly thresholds of many values : mean -/+ k * standard deviation.
+
+        :param value_ids: The ids of the values
+        :type value_ids: list
+        :param k: The number of standard deviations
+        :type k: float
+        :param start: The first timestamp (included)
+        :type start: float
+        :param end: The last timestamp (excluded)
+        :type end: float
+        :return: A dict value_id : (low, high). None for values without samples.
+        :rtype: dict()
+
+        """
+        ret = {}
+        series = self.series_many(value_ids, start=start, end=end)
+        for value_id in series:
+            data = series[value_id][1]
+            if len(data) == 0:
+                ret[value_id] = None
+                continue
+            mean = float(np.mean(data))
+            std = float(np.std(data))
+            ret[value_id] = (mean - k * std, mean + k * std)
+        return ret
+
+    def anomalies(self, value_id, k=3.0, start=None, end=None, baseline_start=None, baseline_end=None):
+        """
+        The samples of a value outside its anomaly thresholds.
+
+        :param value_id: The id of the value
+        :type value_id: int
+        :param k: The number of standard deviations
+        :type k: float
+        :param start: The first timestamp (included)
+        :type start: float
+        :param end: The last timestamp (excluded)
+        :type end: float
+        :param baseline_start: The start of the samples used to compute the thresholds. Default to start.
+        :type baseline_start: float
+        :param baseline_end: The end of the samples used to compute the thresholds. Default to end.
+        :type baseline_end: float
+        :return: A tuple of arrays (timestamps, data)
+        :rtype: tuple
+
+        """
+        if baseline_start is None and baseline_end is None:
+            baseline_start, baseline_end = start, end
+        limits = self.thresholds([value_id], k=k, start=baseline_start, end=baseline_end)[value_id]
+        ts, data = self.series(value_id, start=start, end=end)
+        if limits is None:
+            return ts[:0], data[:0]
+        mask = (data < limits[0]) | (data > limits[1])
+        return ts[mask], data[mask]
@@ -203,7 +203,7 @@ class ZWaveController(ZWaveObject):
         self._library_type_name = None
         self._library_version = None
         self._python_library_version = None
-        self._timer_statistics = None
+        self._job_statistics = None
         self._interval_statistics = 0.0
         self._ctrl_lock = threading.Lock()
         #~ self._manager_last = None
@@ -219,8 +219,9 @@ class ZWaveController(ZWaveObject):
 
         """
         self.cancel_command()
-        if self._timer_statistics is not None:
-            self._timer_statistics.cancel()
+        if self._job_statistics is not None:
+            self._network.scheduler.remove_job(self._job_statistics)
+            self._job_statistics = None
         for i in range(0, 60):
             if self.send_queue_count <= 0:
                 break
@@ -479,16 +480,12 @@ class ZWaveController(ZWaveObject):
 
     def do_poll_statistics(self):
         """
-        Timer based polling system for statistics
+        Polling system for statistics. Run by the scheduler of the network.
         """
-        self._timer_statistics = None
         stats = self.stats
         dispatcher.send(self.SIGNAL_CONTROLLER_STATS, \
             **{'controller':self, 'stats':stats})
 
-        self._timer_statistics = threading.Timer(self._interval_statistics, self.do_poll_statistics)
-        self._timer_statistics.start()
-
     @property
     def poll_stats(self):
         """
@@ -513,12 +510,13 @@ class ZWaveController(ZWaveObject):
 
         """
         if value != self._interval_statistics:
-            if self._timer_statistics is not None:
-                self._timer_statistics.cancel()
+            if self._job_statistics is not None:
+                self._network.scheduler.remove_job(self._job_statistics)
+                self._job_statistics = None
+            self._interval_statistics = value
             if value != 0:
-                self._interval_statistics = value
-                self._timer_statistics = threading.Timer(self._interval_statistics, self.do_poll_statistics)
-                self._timer_statistics.start()
+                self._job_statistics = self._network.scheduler.add_job('controller_stats', \
+                    self.do_poll_statistics, self._interval_statistics, backpressure=True)
 
     @property
     def capabilities(self):
@@ -23,6 +23,7 @@ You should have received a copy of the GNU General Public License
 along with python-openzwave. If not, see http://www.gnu.org/licenses.
 
 """
+import threading
 from openzwave.object import ZWaveObject
 
 # Set default logging handler to avoid "No handler found" warnings.
@@ -42,6 +43,9 @@ class ZWaveGroup(ZWaveObject):
     The driver object.
     Hold options of the manager
     Also used to retrieve information about the library, ...
+
+    The label and the max associations are read once. The associations
+    are cached until the network receives a Group notification for the group.
     """
 
     def __init__(self, group_index, network, node_id):
@@ -61,6 +65,10 @@ class ZWaveGroup(ZWaveObject):
 
         self._node_id = node_id
         self._index = group_index
+        self._label = None
+        self._max_associations = None
+        self._associations = None
+        self._associations_instances = None
 
     def __str__(self):
         """
@@ -89,7 +97,9 @@ class ZWaveGroup(ZWaveObject):
         :rtype: int
 
         """
-        return self._network.manager.getGroupLabel(self.home_id, self._node_id, self.index)
+        if self._label is None:
+            self._label = self._network.manager.getGroupLabel(self.home_id, self._node_id, self.index)
+        return self._label
 
     @property
     def max_associations(self):
@@ -99,7 +109,9 @@ class ZWaveGroup(ZWaveObject):
         :rtype: int
 
         """
-        return self._network.manager.getMaxAssociations(self.home_id, self._node_id, self.index)
+        if self._max_associations is None:
+            self._max_associations = self._network.manager.getMaxAssociations(self.home_id, self._node_id, self.index)
+        return self._max_associations
 
     @property
     def associations(self):
@@ -109,7 +121,9 @@ class ZWaveGroup(ZWaveObject):
         :rtype: set()
 
         """
-        return self._network.manager.getAssociations(self.home_id, self._node_id, self.index)
+        if self._associations is None:
+            self._associations = self._network.manager.getAssociations(self.home_id, self._node_id, self.index)
+        return set(self._associations)
 
     @property
     def associations_instances(self):
@@ -120,7 +134,17 @@ class ZWaveGroup(ZWaveObject):
         :rtype: set() of tuples (nodeid,instanceid)
 
         """
-        return self._network.manager.getAssociationsInstances(self.home_id, self._node_id, self.index)
+        if self._associations_instances is None:
+            self._associations_instances = self._network.manager.getAssociationsInstances(self.home_id, self._node_id, self.index)
+        return set(self._associations_instances)
+
+    def invalidate(self):
+        """
+        Forget the cached associations. They will be read from the manager on the next access.
+
+        """
+        self._associations = None
+        self._associations_instances = None
 
     def add_association(self, target_node_id, instance=0x00):
         """
@@ -175,3 +199,131 @@ class ZWaveGroup(ZWaveObject):
         if 'associations' in extras:
             ret['associations'] = dict.fromkeys(self.associations, 0)
         return ret
+
+class ZWaveAssociationIndex(object):
+    """
+    The association graph of the network, indexed in both directions.
+
+    It answers "which groups report to this node" without querying the
+    manager. The network updates the members of a group when it receives
+    a Group notification.
+
+    """
+
+    def __init__(self):
+        """
+        Initialize the index
+
+        """
+        self._lock = threading.Lock()
+        self._targets = {}
+        self._sources = {}
+        self._loaded = False
+
+    def __str__(self):
+        """
+        The string representation of the index.
+
+        :rtype: str
+
+        """
+        return u'groups: [%s] targets: [%s]' % (len(self._targets), len(self._sources))
+
+    @property
+    def loaded(self):
+        """
+        Have all the groups of the network been read.
+
+        :rtype: bool
+
+        """
+        return self._loaded
+
+    @loaded.setter
+    def loaded(self, value):
+        """
+        Set that all the groups of the network have been read.
+
+        :param value: The new value
+        :type value: bool
+
+        """
+        self._loaded = value
+
+    def update(self, node_id, groupidx, members):
+        """
+        Replace the members of a group.
+
+        :param node_id: The node of the group
+        :type node_id: int
+        :param groupidx: The index of the group
+        :type groupidx: int
+        :param members: The nodes associated to the group
+        :type members: set()
+
+        """
+        key = (node_id, groupidx)
+        members = frozenset(members)
+        with self._lock:
+            old = self._targets.get(key, frozenset())
+            for target in old - members:
+                sources = self._sources.get(target, None)
+                if sources is not None:
+                    sources.discard(key)
+                    if not sources:
+                        del self._sources[target]
+            for target in members - old:
+                self._sources.setdefault(target, set()).add(key)
+            if members:
+                self._targets[key] = members
+            else:
+                self._targets.pop(key, None)
+
+    def remove_node(self, node_id):
+        """
+        Remove the groups of a node.
+
+        :param node_id: The node to remove
+        :type node_id: int
+
+        """
+        with self._lock:
+            keys = [key for key in self._targets if key[0] == node_id]
+        for key in keys:
+            self.update(key[0], key[1], ())
+
+    def clear(self):
+        """
+        Remove all the groups.
+
+        """
+        with self._lock:
+            self._targets = {}
+            self._sources = {}
+            self._loaded = False
+
+    def get_sources(self, node_id):
+        """
+        The groups reporting to a node.
+
+        :param node_id: The target node
+        :type node_id: int
+        :return: The (node_id, groupidx) of the groups
+        :rtype: set()
+
+        """
+        with self._lock:
+            return set(self._sources.get(node_id, ()))
+
+    def get_targets(self, node_id):
+        """
+        The members of the groups of a node.
+
+        :param node_id: The node of the groups
+        :type node_id: int
+        :return: The members by group index
+        :rtype: dict()
+
+        """
+        with self._lock:
+            return dict((key[1], set(members)) for key, members in self._targets.items() if key[0] == node_id)
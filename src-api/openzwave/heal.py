@@ -0,0 +1,395 @@
+# -*- coding: utf-8 -*-
+"""
+.. module:: openzwave.heal
+
+This file is part of **python-openzwave** project https://github.com/OpenZWave/python-openzwave.
+    :platform: Unix, Windows, MacOS X
+    :sinopsis: openzwave API
+
+.. moduleauthor: bibi21000 aka Sébastien GALLET <bibi21000@gmail.com>
+
+License : GPL(v3)
+
+**python-openzwave** is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+**python-openzwave** is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with python-openzwave. If not, see http://www.gnu.org/licenses.
+
+"""
+from collections import deque
+import threading
+import time
+import six
+if six.PY3:
+    from pydispatch import dispatcher
+else:
+    from louie import dispatcher
+from openzwave.sendqueue import PRIORITY_INTERACTIVE, PRIORITY_NAMES
+
+# Set default logging handler to avoid "No handler found" warnings.
+import logging
+try:  # Python 2.7+
+    from logging import NullHandler
+except ImportError:
+    class NullHandler(logging.Handler):
+        """NullHandler logger for python 2.6"""
+        def emit(self, record):
+            pass
+logger = logging.getLogger('openzwave')
+logger.addHandler(NullHandler())
+
+#time.monotonic is not available in python 2
+_clock = getattr(time, 'monotonic', time.time)
+
+class ZWaveHealer(object):
+    """
+    Heal the network node by node, instead of all the nodes at once.
+
+    A node is healed (healNetworkNode) only when :
+
+        - less than wave_size nodes are being healed
+        - node_delay seconds have passed since the last node was healed
+        - the send queue of the controller holds max_queue messages or less
+        - no interactive command is waiting in the send queue of the network
+          and none was sent in the last quiet_time seconds
+
+    A node is healed when the controller command completes. It is retried
+    when the command fails or after node_timeout seconds.
+
+    The progress is saved in the kvals of the network (when they are
+    enabled) : a heal stopped by the duration, stop() or a restart can
+    be continued with resume().
+
+    .. code-block:: python
+
+        network.healer.start(duration=4 * 3600)
+        ...
+        network.healer.resume(duration=4 * 3600)
+
+    """
+
+    JOB_NAME = 'healer'
+
+    SIGNAL_HEAL_NODE = 'HealNode'
+    SIGNAL_HEAL_DONE = 'HealDone'
+
+    def __init__(self, network, wave_size=1, max_queue=0, quiet_time=30.0, node_delay=5.0, node_timeout=120.0, retries=1, interval=1.0):
+        """
+        Initialize the healer
+
+        :param network: The network
+        :type network: ZWaveNetwork
+        :param wave_size: The number of nodes healed at the same time
+        :type wave_size: int
+        :param max_queue: A node is healed only when the send queue of the controller is not longer
+        :type max_queue: int
+        :param quiet_time: The delay in seconds without interactive command before healing a node
+        :type quiet_time: float
+        :param node_delay: The delay in seconds between the end of a heal and the next one
+        :type node_delay: float
+        :param node_timeout: The delay in seconds after which a heal is considered failed
+        :type node_timeout: float
+        :param retries: The number of times a failed node is retried
+        :type retries: int
+        :param interval: The interval of the job in the scheduler
+        :type interval: float
+
+        """
+        self._network = network
+        self.wave_size = wave_size
+        self.max_queue = max_queue
+        self.quiet_time = quiet_time
+        self.node_delay = node_delay
+        self.node_timeout = node_timeout
+        self.retries = retries
+        self.interval = interval
+        self._lock = threading.RLock()
+        self._active = False
+        self._connected = False
+        self._up_node_route = False
+        self._deadline = None
+        self._pending = deque()
+        self._running = {}
+        self._done = []
+        self._failed = []
+        self._tries = {}
+        self._last_finish = None
+        self._last_interactive = None
+        self._interactive_count = None
+
+    def __str__(self):
+        """
+        The string representation of the healer.
+
+        :rtype: str
+
+        """
+        return u'active: [%s] pending: [%s] running: [%s] done: [%s] failed: [%s]' % \
+          (self._active, len(self._pending), len(self._running), len(self._done), len(self._failed))
+
+    @property
+    def is_active(self):
+        """
+        Is a heal in progress.
+
+        :rtype: bool
+
+        """
+        return self._active
+
+    def to_dict(self, extras=['all']):
+        """
+        Return a dict representation of the progress of the heal.
+
+        :param extras: The extra inforamtions to add
+        :type extras: []
+        :returns: A dict
+        :rtype: dict()
+
+        """
+        with self._lock:
+            ret = {}
+            ret['active'] = self._active
+            ret['pending'] = list(self._pending)
+            ret['running'] = sorted(self._running)
+            ret['done'] = list(self._done)
+            ret['failed'] = list(self._failed)
+            return ret
+
+    def _default_nodes(self):
+        """
+        The nodes to heal : the listening nodes which have not failed, the nearest to the controller first.
+
+        """
+        nodes = self._network.nodes or {}
+        controller_id = self._network.controller.node_id
+        node_ids = [node_id for node_id in nodes if node_id != controller_id and \
+            nodes[node_id].is_listening_device and not nodes[node_id].is_failed]
+        hops = self._network.topology.get_hops()
+        return sorted(node_ids, key=lambda node_id: (hops.get(node_id, 255), node_id))
+
+    def start(self, node_ids=None, up_node_route=False, duration=None):
+        """
+        Start a heal. A heal in progress is cancelled.
+
+        :param node_ids: The nodes to heal in this order. Default to the listening nodes, the nearest first
+        :type node_ids: list()
+        :param up_node_route: Update the return routes of the nodes too
+        :type up_node_route: bool
+        :param duration: The maximum duration in seconds. The heal is stopped and can be resumed after.
+        :type duration: float
+        :return: The number of nodes to heal
+        :rtype: int
+
+        """
+        self.cancel()
+        if node_ids is None:
+            node_ids = self._default_nodes()
+        with self._lock:
+            self._pending = deque(node_ids)
+            self._up_node_route = up_node_route
+            self._save()
+        logger.info(u"Heal %s nodes", len(node_ids))
+        self._activate(duration)
+        return len(node_ids)
+
+    def resume(self, duration=None):
+        """
+        Continue a heal stopped by stop(), the duration or a restart.
+
+        :param duration: The maximum duration in seconds
+        :type duration: float
+        :return: The number of nodes to heal. 0 if there is nothing to resume.
+        :rtype: int
+
+        """
+        if self._active:
+            return len(self._pending) + len(self._running)
+        with self._lock:
+            if len(self._pending) == 0:
+                self._load()
+            count = len(self._pending)
+        if count == 0:
+            return 0
+        logger.info(u"Resume heal of %s nodes", count)
+        self._activate(duration)
+        return count
+
+    def stop(self):
+        """
+        Stop the heal. The nodes being healed will be healed again by resume().
+
+        """
+        with self._lock:
+            if not self._active:
+                return
+            self._deactivate()
+            self._pending.extendleft(sorted(self._running, reverse=True))
+            self._running = {}
+            self._save()
+        logger.info(u"Heal stopped : %s nodes left", len(self._pending))
+
+    def cancel(self):
+        """
+        Stop the heal and forget its progress.
+
+        """
+        with self._lock:
+            self._deactivate()
+            self._pending = deque()
+            self._running = {}
+            self._done = []
+            self._failed = []
+            self._tries = {}
+            self._save()
+
+    def _activate(self, duration):
+        """
+        Start the job and listen to the controller commands.
+
+        """
+        with self._lock:
+            self._active = True
+            self._deadline = _clock() + duration if duration is not None else None
+            self._last_finish = None
+            if not self._connected:
+                dispatcher.connect(self._louie_controller_command, self._network.SIGNAL_CONTROLLER_COMMAND)
+                self._connected = True
+        self._network.scheduler.add_job(self.JOB_NAME, self.step, self.interval, delay=0)
+
+    def _deactivate(self):
+        """
+        Stop the job and the listener. Must be called with the lock.
+
+        """
+        self._active = False
+        self._network.scheduler.remove_job(self.JOB_NAME)
+        if self._connected:
+            dispatcher.disconnect(self._louie_controller_command, self._network.SIGNAL_CONTROLLER_COMMAND)
+            self._connected = False
+
+    def _save(self):
+        """
+        Save the progress in the kvals of the network. Must be called with the lock.
+
+        """
+        if len(self._pending) + len(self._running) == 0:
+            kvs = {'heal_pending': None, 'heal_up_node_route': None}
+        else:
+            pending = sorted(self._running) + list(self._pending)
+            kvs = {'heal_pending': ','.join([str(node_id) for node_id in pending]),
+                   'heal_up_node_route': '1' if self._up_node_route else '0'}
+        self._network.kvals = kvs
+
+    def _load(self):
+        """
+        Load the progress from the kvals of the network. Must be called with the lock.
+
+        """
+        kvals = self._network.kvals
+        if not kvals or not kvals.get('heal_pending', None):
+            return
+        self._pending = deque([int(node_id) for node_id in kvals['heal_pending'].split(',')])
+        self._up_node_route = kvals.get('heal_up_node_route', '0') == '1'
+
+    def _is_busy(self, now):
+        """
+        Check the send queues and the interactive traffic.
+
+        """
+        send_queue = self._network.send_queue
+        interactive = send_queue.stats[PRIORITY_NAMES[PRIORITY_INTERACTIVE]]
+        if interactive['pending'] > 0 or interactive['executed'] != self._interactive_count:
+            if self._interactive_count is not None:
+                self._last_interactive = now
+            self._interactive_count = interactive['executed']
+            if interactive['pending'] > 0:
+                return True
+        if self._last_interactive is not None and now - self._last_interactive < self.quiet_time:
+            return True
+        return self._network.controller.send_queue_count > self.max_queue
+
+    def step(self):
+        """
+        Check the nodes being healed and heal the next ones. Run by the scheduler of the network.
+
+        """
+        now = _clock()
+        events = []
+        starts = []
+        with self._lock:
+            if not self._active:
+                return
+            for node_id in [node_id for node_id in self._running if now - self._running[node_id] > self.node_timeout]:
+                logger.warning(u"Heal of node %s timed out", node_id)
+                events.append(self._finish(node_id, False, now))
+            if len(self._pending) + len(self._running) == 0:
+                self._deactivate()
+                self._save()
+                events.append((self.SIGNAL_HEAL_DONE, {'network': self._network, 'done': list(self._done), 'failed': list(self._failed)}))
+                logger.info(u"Heal done : %s nodes healed, %s failed", len(self._done), len(self._failed))
+            elif self._deadline is not None and now > self._deadline:
+                logger.info(u"Heal duration exceeded : %s nodes left", len(self._pending) + len(self._running))
+                self.stop()
+            elif len(self._pending) > 0 and len(self._running) < self.wave_size and \
+              (self._last_finish is None or now - self._last_finish >= self.node_delay) and \
+              not self._is_busy(now):
+                while len(self._pending) > 0 and len(self._running) < self.wave_size:
+                    node_id = self._pending.popleft()
+                    self._running[node_id] = now
+                    starts.append(node_id)
+                self._save()
+        for node_id in starts:
+            logger.debug(u"Heal node %s", node_id)
+            self._network.manager.healNetworkNode(self._network.home_id, node_id, self._up_node_route)
+        for signal, kwargs in events:
+            dispatcher.send(signal, **kwargs)
+
+    def _finish(self, node_id, success, now):
+        """
+        A node is healed or has failed. Must be called with the lock.
+
+        :return: The signal to send
+        :rtype: tuple
+
+        """
+        del self._running[node_id]
+        self._last_finish = now
+        if success:
+            self._done.append(node_id)
+        else:
+            self._tries[node_id] = self._tries.get(node_id, 0) + 1
+            if self._tries[node_id] <= self.retries:
+                self._pending.append(node_id)
+            else:
+                self._failed.append(node_id)
+        self._save()
+        return (self.SIGNAL_HEAL_NODE, {'network': self._network, 'node_id': node_id, 'success': success})
+
+    def _louie_controller_command(self, network, node_id, state, **kwargs):
+        """
+        A controller command has changed of state : check the nodes being healed.
+
+        """
+        if network is not self._network:
+            return
+        controller = self._network.controller
+        if state == controller.STATE_COMPLETED:
+            success = True
+        elif state in (controller.STATE_FAILED, controller.STATE_NODEFAILED, controller.STATE_ERROR, controller.STATE_CANCEL):
+            success = False
+        else:
+            return
+        with self._lock:
+            if node_id not in self._running:
+                return
+            event = self._finish(node_id, success, _clock())
+        logger.debug(u"Heal of node %s finished : %s", node_id, state)
+        dispatcher.send(event[0], **event[1])
@@ -0,0 +1,506 @@
+# -*- coding: utf-8 -*-
+"""
+.. module:: openzwave.history
+
+This file is part of **python-openzwave** project https://github.com/OpenZWave/python-openzwave.
+    :platform: Unix, Windows, MacOS X
+    :sinopsis: openzwave API
+
+.. moduleauthor: bibi21000 aka Sébastien GALLET <bibi21000@gmail.com>
+
+License : GPL(v3)
+
+**python-openzwave** is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+**python-openzwave** is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with python-openzwave. If not, see http://www.gnu.org/licenses.
+
+"""
+import os
+import threading
+import time
+import six
+if six.PY3:
+    from pydispatch import dispatcher
+else:
+    from louie import dispatcher
+
+# Set default logging handler to avoid "No handler found" warnings.
+import logging
+try:  # Python 2.7+
+    from logging import NullHandler
+except ImportError:
+    class NullHandler(logging.Handler):
+        """NullHandler logger for python 2.6"""
+        def emit(self, record):
+            pass
+logger = logging.getLogger('openzwave')
+logger.addHandler(NullHandler())
+
+try:
+    import sqlite3 as lite
+except ImportError:
+    logger.warning('pysqlite is not installed')
+
+def to_number(data):
+    """
+    Convert the data of a value to a float. Return None for non numeric data.
+
+    :param data: The data of the value
+    :type data: depending of the type of the value
+    :rtype: float
+
+    """
+    if isinstance(data, bool):
+        return 1.0 if data else 0.0
+    if isinstance(data, six.integer_types) or isinstance(data, float):
+        return float(data)
+    return None
+
+def to_db_id(value_id):
+    """
+    Convert a value id to the signed 64 bits integer stored by sqlite.
+
+    The instance is in the highest byte of the id : an instance >= 128
+    sets the bit 63 and overflows the INTEGER of sqlite.
+
+    :param value_id: The id of the value
+    :type value_id: int
+    :rtype: int
+
+    """
+    if value_id >= 1 << 63:
+        return value_id - (1 << 64)
+    return value_id
+
+def from_db_id(db_id):
+    """
+    Convert an id stored by sqlite back to the value id.
+
+    :param db_id: The id in the database
+    :type db_id: int
+    :rtype: int
+
+    """
+    if db_id < 0:
+        return db_id + (1 << 64)
+    return db_id
+
+class ZWaveHistory(object):
+    """
+    Record the data of the values in a sqlite database.
+
+    Notifications are buffered in memory and written in batches by a
+    job of the network scheduler. Numeric data are stored in a REAL
+    column, other data as text. Queries only read the database and
+    never hit the Z-Wave network.
+
+    A value id does not contain the home id : the samples are keyed by
+    the home id of the network too, so the networks of a hub can share
+    the same database.
+
+    While the database can't be written, the samples are kept in the
+    buffer. It is capped to max_buffer samples : the oldest ones are dropped.
+
+    .. code-block:: python
+
+        history = ZWaveHistory(network)
+        history.start()
+        ...
+        for bucket, vmin, vmax, vavg, count in history.downsample(value.value_id, 3600, start=time.time()-86400):
+            ...
+
+    """
+
+    JOB_NAME = 'history'
+
+    def __init__(self, network, path=None, flush_interval=5.0, max_batch=500, refreshed=True, max_buffer=50000):
+        """
+        Initialize the history
+
+        :param network: The network
+        :type network: ZWaveNetwork
+        :param path: The path of the database. Default to pyozw_history.sqlite in the user path. Use ':memory:' for a volatile history.
+        :type path: str
+        :param flush_interval: The interval between 2 writes in seconds
+        :type flush_interval: float
+        :param max_batch: Force a write when the buffer contains more samples
+        :type max_batch: int
+        :param refreshed: Also record the ValueRefreshed notifications
+        :type refreshed: bool
+        :param max_buffer: The maximum number of samples kept in memory when the database can't be written
+        :type max_buffer: int
+
+        """
+        self._network = network
+        if path is None:
+            path = os.path.join(network.controller.library_user_path, 'pyozw_history.sqlite')
+        self.path = path
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self.refreshed = refreshed
+        self.max_buffer = max_buffer
+        self.dropped = 0
+        self._dropping = False
+        self._buffer = []
+        self._buffer_lock = threading.Lock()
+        self._db_lock = threading.RLock()
+        self._dbcon = lite.connect(self.path, check_same_thread=False)
+        self._check_db_tables()
+        self._started = False
+
+    def __str__(self):
+        """
+        The string representation of the history.
+
+        :rtype: str
+
+        """
+        return u'path: [%s] buffered: [%s]' % (self.path, len(self._buffer))
+
+    def _check_db_tables(self):
+        """
+        Create the table and its index.
+
+        """
+        with self._db_lock:
+            cur = self._dbcon.cursor()
+            cur.execute("CREATE TABLE IF NOT EXISTS history(home_id INTEGER NOT NULL DEFAULT 0, value_id INTEGER, ts REAL, num REAL, data TEXT)")
+            columns = [row[1] for row in cur.execute("PRAGMA table_info(history)").fetchall()]
+            if 'home_id' not in columns:
+                #Database of a previous version : its samples are kept with the home id 0
+                logger.warning(u"History : add the home_id column to %s", self.path)
+                cur.execute("ALTER TABLE history ADD COLUMN home_id INTEGER NOT NULL DEFAULT 0")
+                cur.execute("DROP INDEX IF EXISTS history_value_ts")
+            cur.execute("CREATE INDEX IF NOT EXISTS history_home_value_ts ON history(home_id, value_id, ts)")
+            self._dbcon.commit()
+
+    @property
+    def home_id(self):
+        """
+        The home id of the samples of the network.
+
+        :rtype: int
+
+        """
+        return self._network.home_id
+
+    def _trim(self):
+        """
+        Drop the oldest samples when the buffer is full. Must be called with the buffer lock.
+
+        """
+        dropped = len(self._buffer) - self.max_buffer
+        if dropped <= 0:
+            return
+        del self._buffer[:dropped]
+        self.dropped += dropped
+        if not self._dropping:
+            self._dropping = True
+            logger.warning(u"History : buffer full (%s samples), drop the oldest ones", self.max_buffer)
+
+    def start(self):
+        """
+        Start recording.
+
+        """
+        if self._started:
+            return
+        dispatcher.connect(self._louie_value_changed, self._network.SIGNAL_VALUE_CHANGED)
+        if self.refreshed:
+            dispatcher.connect(self._louie_value_refreshed, self._network.SIGNAL_VALUE_REFRESHED)
+        self._network.scheduler.add_job(self.JOB_NAME, self.flush, self.flush_interval)
+        self._started = True
+
+    def stop(self):
+        """
+        Stop recording and write the buffer.
+
+        """
+        if not self._started:
+            return
+        dispatcher.disconnect(self._louie_value_changed, self._network.SIGNAL_VALUE_CHANGED)
+        if self.refreshed:
+            dispatcher.disconnect(self._louie_value_refreshed, self._network.SIGNAL_VALUE_REFRESHED)
+        self._network.scheduler.remove_job(self.JOB_NAME)
+        self._started = False
+        self.flush()
+
+    def close(self):
+        """
+        Stop recording and close the database.
+
+        """
+        self.stop()
+        with self._db_lock:
+            self._dbcon.close()
+
+    def _louie_value_changed(self, network, node, value):
+        """
+        A value has changed.
+
+        """
+        if network is self._network:
+            self.record(value.value_id, value.data)
+
+    def _louie_value_refreshed(self, network, node, value):
+        """
+        A value has been refreshed.
+
+        """
+        if network is self._network:
+            self.record(value.value_id, value.data)
+
+    def record(self, value_id, data, timestamp=None):
+        """
+        Add a sample to the history.
+
+        :param value_id: The id of the value
+        :type value_id: int
+        :param data: The data of the value
+        :type data: depending of the type of the value
+        :param timestamp: The time of the sample. Default to now.
+        :type timestamp: float
+
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        num = to_number(data)
+        text = None if num is not None or data is None else u'%s' % data
+        with self._buffer_lock:
+            self._buffer.append((self.home_id, to_db_id(value_id), timestamp, num, text))
+            self._trim()
+            full = len(self._buffer) >= self.max_batch
+        if full and self._started:
+            self._network.scheduler.call_later(0, self.flush, name='history_flush')
+
+    def flush(self):
+        """
+        Write the buffer in the database.
+
+        :return: The number of samples written
+        :rtype: int
+
+        """
+        with self._buffer_lock:
+            rows = self._buffer
+            self._buffer = []
+        if len(rows) == 0:
+            return 0
+        with self._db_lock:
+            try:
+                self._dbcon.executemany("INSERT INTO history(home_id, value_id, ts, num, data) VALUES (?,?,?,?,?)", rows)
+                self._dbcon.commit()
+            except Exception:
+                logger.exception(u"History : can't write %s samples, keep them for the next flush", len(rows))
+                with self._buffer_lock:
+                    self._buffer = rows + self._buffer
+                    self._trim()
+                return 0
+        if self._dropping:
+            logger.warning(u"History : database written again, %s samples dropped", self.dropped)
+            self._dropping = False
+        return len(rows)
+
+    def _where(self, value_id, start, end):
+        """
+        Build the where clause of a query.
+
+        """
+        clause = "home_id=? AND value_id=?"
+        params = [self.home_id, to_db_id(value_id)]
+        if start is not None:
+            clause += " AND ts>=?"
+            params.append(start)
+        if end is not None:
+            clause += " AND ts<?"
+            params.append(end)
+        return clause, params
+
+    def _query(self, sql, params):
+        """
+        Run a query and return all the rows.
+
+        """
+        self.flush()
+        with self._db_lock:
+            cur = self._dbcon.cursor()
+            cur.execute(sql, params)
+            return cur.fetchall()
+
+    def get_range(self, value_id, start=None, end=None, limit=None):
+        """
+        Retrieve the samples of a value.
+
+        :param value_id: The id of the value
+        :type value_id: int
+        :param start: The first timestamp (included)
+        :type start: float
+        :param end: The last timestamp (excluded)
+        :type end: float
+        :param limit: The maximum number of samples
+        :type limit: int
+        :return: A list of (timestamp, data)
+        :rtype: list
+
+        """
+        clause, params = self._where(value_id, start, end)
+        sql = "SELECT ts, num, data FROM history WHERE %s ORDER BY ts" % clause
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [(row[0], row[1] if row[1] is not None else row[2]) for row in self._query(sql, params)]
+
+    def get_numeric(self, value_id, start=None, end=None):
+        """
+        Retrieve the numeric samples of a value as two columns.
+
+        :param value_id: The id of the value
+        :type value_id: int
+        :param start: The first timestamp (included)
+        :type start: float
+        :param end: The last timestamp (excluded)
+        :type end: float
+        :return: A tuple of lists (timestamps, data)
+        :rtype: tuple
+
+        """
+        clause, params = self._where(value_id, start, end)
+        rows = self._query("SELECT ts, num FROM history WHERE %s AND num IS NOT NULL ORDER BY ts" % clause, params)
+        return [row[0] for row in rows], [row[1] for row in rows]
+
+    def get_numeric_many(self, value_ids, start=None, end=None):
+        """
+        Retrieve the numeric samples of many values with a single query by chunk of values.
+
+        :param value_ids: The ids of the values
+        :type value_ids: list
+        :param start: The first timestamp (included)
+        :type start: float
+        :param end: The last timestamp (excluded)
+        :type end: float
+        :return: A list of (value_id, timestamp, data) ordered by value_id and timestamp
+        :rtype: list
+
+        """
+        #Chunks of sorted ids : the rows of the chunks are ordered once concatenated
+        value_ids = sorted(set(value_ids))
+        rows = []
+        for i in range(0, len(value_ids), 500):
+            chunk = value_ids[i:i + 500]
+            clause = "home_id=? AND value_id IN (%s)" % ",".join(["?"] * len(chunk))
+            params = [self.home_id] + [to_db_id(value_id) for value_id in chunk]
+            if start is not None:
+                clause += " AND ts>=?"
+                params.append(start)
+            if end is not None:
+                clause += " AND ts<?"
+                params.append(end)
+            rows.extend((from_db_id(row[0]), row[1], row[2]) for row in self._query("SELECT value_id, ts, num FROM history WHERE %s AND num IS NOT NULL ORDER BY value_id, ts" % clause, params))
+        #sqlite orders the ids above 2^63 first (they are stored negative) : the sort is stable and keeps the timestamps ordered
+        rows.sort(key=lambda row: row[0])
+        return rows
+
+    def last(self, value_id, before=None):
+        """
+        Retrieve the last sample of a value.
+
+        :param value_id: The id of the value
+        :type value_id: int
+        :param before: Look for the last sample before this timestamp
+        :type before: float
+        :return: A tuple (timestamp, data) or None
+        :rtype: tuple
+
+        """
+        clause, params = self._where(value_id, None, before)
+        rows = self._query("SELECT ts, num, data FROM history WHERE %s ORDER BY ts DESC LIMIT 1" % clause, params)
+        if len(rows) == 0:
+            return None
+        return (rows[0][0], rows[0][1] if rows[0][1] is not None else rows[0][2])
+
+    def last_many(self, value_ids, before=None):
+        """
+        Retrieve the last sample of many values with a single query by chunk of values.
+
+        :param value_ids: The ids of the values
+        :type value_ids: list
+        :param before: Look for the last samples before this timestamp
+        :type before: float
+        :return: A dict value_id -> (timestamp, data). The values without samples are missing.
+        :rtype: dict
+
+        """
+        value_ids = sorted(set(value_ids))
+        ret = {}
+        for i in range(0, len(value_ids), 500):
+            chunk = value_ids[i:i + 500]
+            clause = "home_id=? AND value_id IN (%s)" % ",".join(["?"] * len(chunk))
+            params = [self.home_id] + [to_db_id(value_id) for value_id in chunk]
+            if before is not None:
+                clause += " AND ts<?"
+                params.append(before)
+            #sqlite takes the other columns from the row of MAX(ts)
+            for row in self._query("SELECT value_id, MAX(ts), num, data FROM history WHERE %s GROUP BY value_id" % clause, params):
+                ret[from_db_id(row[0])] = (row[1], row[2] if row[2] is not None else row[3])
+        return ret
+
+    def downsample(self, value_id, bucket, start=None, end=None):
+        """
+        Aggregate the numeric samples of a value in buckets.
+
+        :param value_id: The id of the value
+        :type value_id: int
+        :param bucket: The size of a bucket in seconds
+        :type bucket: float
+        :param start: The first timestamp (included). The buckets are aligned on it.
+        :type start: float
+        :param end: The last timestamp (excluded)
+        :type end: float
+        :return: A list of (bucket start, min, max, avg, count)
+        :rtype: list
+
+        """
+        origin = start if start is not None else 0.0
+        clause, params = self._where(value_id, start, end)
+        sql = "SELECT CAST((ts - ?) / ? AS INTEGER) AS b, MIN(num), MAX(num), AVG(num), COUNT(num) " \
+              "FROM history WHERE %s AND num IS NOT NULL GROUP BY b ORDER BY b" % clause
+        rows = self._query(sql, [origin, bucket] + params)
+        return [(origin + row[0] * bucket, row[1], row[2], row[3], row[4]) for row in rows]
+
+    def value_ids(self):
+        """
+        The ids of the values in the history.
+
+        :rtype: list
+
+        """
+        return [from_db_id(row[0]) for row in self._query("SELECT DISTINCT value_id FROM history WHERE home_id=?", [self.home_id])]
+
+    def purge(self, before, value_id=None):
+        """
+        Remove the old samples.
+
+        :param before: Remove the samples older than this timestamp
+        :type before: float
+        :param value_id: Only purge this value. None for all.
+        :type value_id: int
+        :return: The number of samples removed
+        :rtype: int
+
+        """
+        self.flush()
+        with self._db_lock:
+            if value_id is None:
+                cur = self._dbcon.execute("DELETE FROM history WHERE home_id=? AND ts<?", (self.home_id, before))
+            else:
+                cur = self._dbcon.execute("DELETE FROM history WHERE home_id=? AND value_id=? AND ts<?", (self.home_id, to_db_id(value_id), before))
+            self._dbcon.commit()
+            return cur.rowcount
@@ -0,0 +1,682 @@
+# -*- coding: utf-8 -*-
+"""
+.. module:: openzwave.host
+
+This file is part of **python-openzwave** project https://github.com/OpenZWave/python-openzwave.
+    :platform: Unix, Windows, MacOS X
+    :sinopsis: openzwave API
+
+.. moduleauthor: bibi21000 aka Sébastien GALLET <bibi21000@gmail.com>
+
+License : GPL(v3)
+
+**python-openzwave** is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+**python-openzwave** is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with python-openzwave. If not, see http://www.gnu.org/licenses.
+
+"""
+import mmap
+import os
+import struct
+import threading
+import time
+import six
+if six.PY3:
+    from pydispatch import dispatcher
+else:
+    from louie import dispatcher
+from openzwave.rpc import ZWaveRpcServer, ZWaveRpcClient
+
+# Set default logging handler to avoid "No handler found" warnings.
+import logging
+try:  # Python 2.7+
+    from logging import NullHandler
+except ImportError:
+    class NullHandler(logging.Handler):
+        """NullHandler logger for python 2.6"""
+        def emit(self, record):
+            pass
+logger = logging.getLogger('openzwave')
+logger.addHandler(NullHandler())
+
+MAGIC = b'PYOZWSHM'
+VERSION = 1
+
+#magic, version, slots, data_size, reserved, generation
+_HEADER = struct.Struct('<8sIIIIQ')
+#seq, home_id, value_id, timestamp, type, flags, length
+_SLOT = struct.Struct('<IIQdBBH')
+_SEQ = struct.Struct('<I')
+
+TYPE_NONE = 0
+TYPE_BOOL = 1
+TYPE_INT = 2
+TYPE_FLOAT = 3
+TYPE_STRING = 4
+TYPE_BYTES = 5
+
+FLAG_USED = 0x01
+FLAG_REMOVED = 0x02
+FLAG_TRUNCATED = 0x04
+
+_INT = struct.Struct('<q')
+_FLOAT = struct.Struct('<d')
+
+#The multiplier of the Fibonacci hashing
+_HASH = 11400714819323198485
+
+def encode_data(data):
+    """
+    Encode the data of a value for the shared table.
+
+    :param data: The data of the value
+    :type data: depending of the type of the value
+    :return: The type and the bytes of the data
+    :rtype: (int, bytes)
+
+    """
+    if data is None:
+        return TYPE_NONE, b''
+    if isinstance(data, bool):
+        return TYPE_BOOL, b'\x01' if data else b'\x00'
+    if isinstance(data, six.integer_types):
+        return TYPE_INT, _INT.pack(data)
+    if isinstance(data, float):
+        return TYPE_FLOAT, _FLOAT.pack(data)
+    if isinstance(data, six.text_type):
+        return TYPE_STRING, data.encode('utf-8')
+    if isinstance(data, (bytes, bytearray)):
+        return TYPE_BYTES, bytes(data)
+    return TYPE_STRING, six.text_type(data).encode('utf-8')
+
+def decode_data(data_type, raw):
+    """
+    Decode the data of a value of the shared table.
+
+    :param data_type: The type of the data
+    :type data_type: int
+    :param raw: The bytes of the data
+    :type raw: bytes
+    :return: The data
+    :rtype: depending of the type of the value
+
+    """
+    if data_type == TYPE_BOOL:
+        return raw[:1] == b'\x01'
+    if data_type == TYPE_INT:
+        return _INT.unpack(raw)[0]
+    if data_type == TYPE_FLOAT:
+        return _FLOAT.unpack(raw)[0]
+    if data_type == TYPE_STRING:
+        return raw.decode('utf-8', 'ignore')
+    if data_type == TYPE_BYTES:
+        return raw
+    return None
+
+class ZWaveSharedTable(object):
+    """
+    Read the value table published by a host in a memory mapped file.
+
+    The table is an open addressing hash table of fixed size slots. Each slot
+    is protected by a sequence lock : the host makes the sequence odd while it
+    writes the slot, and a reader retries until it reads the same even sequence
+    before and after the copy. Readers never lock and never talk to the host.
+
+    .. code-block:: python
+
+        table = ZWaveSharedTable('/dev/shm/pyozw.table')
+        data = table.get(value_id)
+
+    """
+
+    def __init__(self, path, retries=100):
+        """
+        Open a table
+
+        :param path: The path of the file
+        :type path: str
+        :param retries: The number of reads of a slot before giving up
+        :type retries: int
+
+        """
+        self.path = path
+        self.retries = retries
+        self._open()
+
+    def _open(self):
+        """
+        Map the file and read the header.
+
+        """
+        self._fd = os.open(self.path, os.O_RDONLY)
+        self._mmap = mmap.mmap(self._fd, 0, access=mmap.ACCESS_READ)
+        self._read_header()
+
+    def _read_header(self):
+        """
+        Read the layout of the table.
+
+        """
+        magic, version, slots, data_size, reserved, generation = _HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(u"%s is not a shared table of version %s" % (self.path, VERSION))
+        self.slots = slots
+        self.data_size = data_size
+        self.slot_size = _SLOT.size + data_size
+
+    def __str__(self):
+        """
+        The string representation of the table.
+
+        :rtype: str
+
+        """
+        return u'path: [%s] slots: [%s] data_size: [%s]' % (self.path, self.slots, self.data_size)
+
+    @property
+    def generation(self):
+        """
+        The number of resets of the table.
+
+        :rtype: int
+
+        """
+        return _HEADER.unpack_from(self._mmap, 0)[5]
+
+    def close(self):
+        """
+        Unmap the file.
+
+        """
+        if self._mmap is not None:
+            self._mmap.close()
+            os.close(self._fd)
+            self._mmap = None
+
+    def _offset(self, index):
+        """
+        The offset of a slot.
+
+        """
+        return _HEADER.size + index * self.slot_size
+
+    def _hash(self, home_id, value_id):
+        """
+        The first slot to probe for a value.
+
+        """
+        return (((value_id ^ (home_id << 32)) * _HASH) & 0xFFFFFFFFFFFFFFFF) % self.slots
+
+    def _read_slot(self, index):
+        """
+        Read a consistent copy of a slot.
+
+        :return: (home_id, value_id, timestamp, type, flags, raw data) or None
+        :rtype: tuple
+
+        """
+        offset = self._offset(index)
+        for i in range(self.retries):
+            seq0 = _SEQ.unpack_from(self._mmap, offset)[0]
+            if seq0 & 1:
+                time.sleep(0)
+                continue
+            seq, home_id, value_id, timestamp, data_type, flags, length = _SLOT.unpack_from(self._mmap, offset)
+            if seq != seq0:
+                #The host started to write the slot after the first read
+                time.sleep(0)
+                continue
+            raw = self._mmap[offset + _SLOT.size:offset + _SLOT.size + min(length, self.data_size)]
+            if _SEQ.unpack_from(self._mmap, offset)[0] == seq0:
+                return home_id, value_id, timestamp, data_type, flags, raw
+        logger.warning(u"Shared table : can't read slot %s", index)
+        return None
+
+    def _find(self, value_id, home_id=None):
+        """
+        Probe the slots of a value.
+
+        :return: The slot or None
+        :rtype: tuple
+
+        """
+        if home_id is not None:
+            start = self._hash(home_id, value_id)
+            for i in range(self.slots):
+                slot = self._read_slot((start + i) % self.slots)
+                if slot is None or not slot[4] & FLAG_USED:
+                    return None
+                if slot[0] == home_id and slot[1] == value_id:
+                    return slot
+            return None
+        for slot in self._iter_slots():
+            if slot[1] == value_id:
+                return slot
+        return None
+
+    def _iter_slots(self):
+        """
+        Iter over the used slots.
+
+        """
+        for index in range(self.slots):
+            slot = self._read_slot(index)
+            if slot is not None and slot[4] & FLAG_USED:
+                yield slot
+
+    def get_entry(self, value_id, home_id=None):
+        """
+        Retrieve a value of the table.
+
+        :param value_id: The id of the value
+        :type value_id: int
+        :param home_id: The home id of the network. Scan the whole table if None.
+        :type home_id: int
+        :return: A dict with the home_id, value_id, data, timestamp and truncated keys or None if the value is unknown
+        :rtype: dict()
+
+        """
+        slot = self._find(value_id, home_id)
+        if slot is None or slot[4] & FLAG_REMOVED:
+            return None
+        return self._to_entry(slot)
+
+    def _to_entry(self, slot):
+        """
+        Build an entry from a slot.
+
+        """
+        home_id, value_id, timestamp, data_type, flags, raw = slot
+        return {'home_id': home_id, 'value_id': value_id,
+                'data': decode_data(data_type, raw),
+                'timestamp': timestamp,
+                'truncated': bool(flags & FLAG_TRUNCATED)}
+
+    def get(self, value_id, home_id=None, default=None):
+        """
+        Retrieve the data of a value.
+
+        :param value_id: The id of the value
+        :type value_id: int
+        :param home_id: The home id of the network. Scan the whole table if None.
+        :type home_id: int
+        :param default: The data returned for an unknown value
+        :type default: any
+        :return: The data of the value
+        :rtype: depending of the type of the value
+
+        """
+        entry = self.get_entry(value_id, home_id)
+        if entry is None:
+            return default
+        return entry['data']
+
+    def entries(self):
+        """
+        Retrieve all the values of the table.
+
+        :rtype: list of dict()
+
+        """
+        return [self._to_entry(slot) for slot in self._iter_slots() if not slot[4] & FLAG_REMOVED]
+
+class ZWaveSharedTableWriter(ZWaveSharedTable):
+    """
+    Publish the values in a memory mapped file. Only one writer per file.
+
+    """
+
+    def __init__(self, path, slots=4096, data_size=36):
+        """
+        Create a table. An existing file is overwritten.
+
+        :param path: The path of the file
+        :type path: str
+        :param slots: The maximum number of values
+        :type slots: int
+        :param data_size: The maximum size of the data of a value. Longer strings are truncated.
+        :type data_size: int
+
+        """
+        self.path = path
+        self.retries = 1
+        self.slots = slots
+        self.data_size = data_size
+        self.slot_size = _SLOT.size + data_size
+        self._index = {}
+        self._lock = threading.Lock()
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+        size = _HEADER.size + slots * self.slot_size
+        os.ftruncate(self._fd, size)
+        self._mmap = mmap.mmap(self._fd, size, access=mmap.ACCESS_WRITE)
+        _HEADER.pack_into(self._mmap, 0, MAGIC, VERSION, slots, data_size, 0, 0)
+
+    def _slot_of(self, home_id, value_id):
+        """
+        Find or allocate the slot of a value. Must be called with the lock.
+
+        """
+        key = (home_id, value_id)
+        index = self._index.get(key, None)
+        if index is not None:
+            return index
+        start = self._hash(home_id, value_id)
+        for i in range(self.slots):
+            index = (start + i) % self.slots
+            flags = _SLOT.unpack_from(self._mmap, self._offset(index))[5]
+            if not flags & FLAG_USED:
+                self._index[key] = index
+                return index
+        return None
+
+    def _write_slot(self, index, home_id, value_id, timestamp, data_type, flags, raw):
+        """
+        Write a slot under its sequence lock. Must be called with the lock.
+
+        """
+        offset = self._offset(index)
+        seq = _SEQ.unpack_from(self._mmap, offset)[0]
+        _SEQ.pack_into(self._mmap, offset, (seq + 1) & 0xFFFFFFFF)
+        self._mmap[offset + _SLOT.size:offset + _SLOT.size + len(raw)] = raw
+        _SLOT.pack_into(self._mmap, offset, (seq + 1) & 0xFFFFFFFF, home_id, value_id, timestamp, data_type, flags, len(raw))
+        _SEQ.pack_into(self._mmap, offset, (seq + 2) & 0xFFFFFFFF)
+
+    def write(self, home_id, value_id, data, timestamp=None):
+        """
+        Publish the data of a value.
+
+        :param home_id: The home id of the network
+        :type home_id: int
+        :param value_id: The id of the value
+        :type value_id: int
+        :param data: The data of the value
+        :type data: depending of the type of the value
+        :param timestamp: The time of the change. Default to now.
+        :type timestamp: float
+        :return: False if the table is full
+        :rtype: bool
+
+        """
+        data_type, raw = encode_data(data)
+        flags = FLAG_USED
+        if len(raw) > self.data_size:
+            raw = raw[:self.data_size]
+            flags |= FLAG_TRUNCATED
+        if timestamp is None:
+            timestamp = time.time()
+        with self._lock:
+            index = self._slot_of(home_id, value_id)
+            if index is None:
+                logger.warning(u"Shared table is full : drop value %s", value_id)
+                return False
+            self._write_slot(index, home_id, value_id, timestamp, data_type, flags, raw)
+        return True
+
+    def remove(self, home_id, value_id):
+        """
+        Mark a value as removed. Its slot is reused if the value comes back.
+
+        :param home_id: The home id of the network
+        :type home_id: int
+        :param value_id: The id of the value
+        :type value_id: int
+
+        """
+        with self._lock:
+            index = self._index.get((home_id, value_id), None)
+            if index is not None:
+                self._write_slot(index, home_id, value_id, time.time(), TYPE_NONE, FLAG_USED | FLAG_REMOVED, b'')
+
+    def clear(self):
+        """
+        Empty the table and increment its generation.
+
+        """
+        with self._lock:
+            for index in self._index.values():
+                self._write_slot(index, 0, 0, 0.0, TYPE_NONE, 0, b'')
+            self._index = {}
+            magic, version, slots, data_size, reserved, generation = _HEADER.unpack_from(self._mmap, 0)
+            _HEADER.pack_into(self._mmap, 0, magic, version, slots, data_size, reserved, generation + 1)
+
+    def close(self):
+        """
+        Flush and unmap the file.
+
+        """
+        if self._mmap is not None:
+            self._mmap.flush()
+        ZWaveSharedTable.close(self)
+
+class ZWaveHost(object):
+    """
+    Own the network in a dedicated process and share its values with other processes.
+
+    The values are published in a :class:`ZWaveSharedTableWriter`. Commands are
+    received by a :class:`openzwave.rpc.ZWaveRpcServer` on a local socket (a path
+    for a Unix socket, a (host, port) tuple for TCP) and are sent to the network
+    through its send queue.
+
+    .. code-block:: python
+
+        network = ZWaveNetwork(options, autostart=False)
+        host = ZWaveHost(network, '/dev/shm/pyozw.table', '/tmp/pyozw.sock')
+        host.start()
+        network.start()
+
+    """
+
+    def __init__(self, network, table_path, address, slots=4096, data_size=36):
+        """
+        Initialize the host
+
+        :param network: The network to share
+        :type network: ZWaveNetwork
+        :param table_path: The path of the shared table
+        :type table_path: str
+        :param address: The address of the command socket
+        :type address: str or tuple
+        :param slots: The maximum number of values in the table
+        :type slots: int
+        :param data_size: The maximum size of the data of a value
+        :type data_size: int
+
+        """
+        self._network = network
+        self.table_path = table_path
+        self.address = address
+        self.slots = slots
+        self.data_size = data_size
+        self.table = None
+        self.server = ZWaveRpcServer(network, address)
+        self._running = False
+
+    def __str__(self):
+        """
+        The string representation of the host.
+
+        :rtype: str
+
+        """
+        return u'table: [%s] address: [%s] running: [%s]' % (self.table_path, self.address, self._running)
+
+    @property
+    def is_running(self):
+        """
+        Is the host running.
+
+        :rtype: bool
+
+        """
+        return self._running
+
+    def start(self):
+        """
+        Create the table, publish the known values and listen for commands.
+
+        """
+        if self._running:
+            return
+        self.table = ZWaveSharedTableWriter(self.table_path, slots=self.slots, data_size=self.data_size)
+        self._publish_all()
+        dispatcher.connect(self._louie_value, self._network.SIGNAL_VALUE_ADDED)
+        dispatcher.connect(self._louie_value, self._network.SIGNAL_VALUE_CHANGED)
+        dispatcher.connect(self._louie_value, self._network.SIGNAL_VALUE_REFRESHED)
+        dispatcher.connect(self._louie_value_removed, self._network.SIGNAL_VALUE_REMOVED)
+        dispatcher.connect(self._louie_driver_reset, self._network.SIGNAL_DRIVER_RESET)
+        self.server.start()
+        self._running = True
+        logger.info(u"Host started : %s", self)
+
+    def stop(self):
+        """
+        Stop the server and close the table.
+
+        """
+        if not self._running:
+            return
+        self._running = False
+        dispatcher.disconnect(self._louie_value, self._network.SIGNAL_VALUE_ADDED)
+        dispatcher.disconnect(self._louie_value, self._network.SIGNAL_VALUE_CHANGED)
+        dispatcher.disconnect(self._louie_value, self._network.SIGNAL_VALUE_REFRESHED)
+        dispatcher.disconnect(self._louie_value_removed, self._network.SIGNAL_VALUE_REMOVED)
+        dispatcher.disconnect(self._louie_driver_reset, self._network.SIGNAL_DRIVER_RESET)
+        self.server.stop()
+        self.table.close()
+        logger.info(u"Host stopped : %s", self)
+
+    def _publish_all(self):
+        """
+        Publish the values of the nodes already known.
+
+        """
+        if self._network.nodes is None:
+            return
+        home_id = self._network.home_id
+        for node in list(self._network.nodes.values()):
+            for value in list(node.values.values()):
+                self.table.write(home_id, value.value_id, value.data)
+
+    def _louie_value(self, network, node, value):
+        """
+        A value has been added, changed or refreshed.
+
+        """
+        if network is self._network and value is not None:
+            self.table.write(network.home_id, value.value_id, value.data)
+
+    def _louie_value_removed(self, network, node, value, valueId=None):
+        """
+        A value has been removed.
+
+        """
+        if network is not self._network:
+            return
+        if value is not None:
+            valueId = value.value_id
+        if valueId is not None:
+            self.table.remove(network.home_id, valueId)
+
+    def _louie_driver_reset(self, network):
+        """
+        The driver has been reset : the values are lost.
+
+        """
+        if network is self._network:
+            self.table.clear()
+
+class ZWaveHostClient(ZWaveRpcClient):
+    """
+    Read the values published by a host and send it commands.
+
+    .. code-block:: python
+
+        client = ZWaveHostClient('/dev/shm/pyozw.table', '/tmp/pyozw.sock')
+        data = client.get(value_id)
+        client.set_value(value_id, 50)
+
+    """
+
+    def __init__(self, table_path, address, codec=None, timeout=10.0):
+        """
+        Initialize the client
+
+        :param table_path: The path of the shared table
+        :type table_path: str
+        :param address: The address of the command socket of the host
+        :type address: str or tuple
+        :param codec: The codec of the rpc
+        :type codec: bytes
+        :param timeout: The timeout of the commands in seconds
+        :type timeout: float
+
+        """
+        ZWaveRpcClient.__init__(self, address, codec=codec, timeout=timeout)
+        self.table = ZWaveSharedTable(table_path)
+
+    def close(self):
+        """
+        Close the connection and the table.
+
+        """
+        ZWaveRpcClient.close(self)
+        self.table.close()
+
+    def get(self, value_id, home_id=None, default=None):
+        """
+        Read the data of a value in the shared table.
+
+        :param value_id: The id of the value
+        :type value_id: int
+        :param home_id: The home id of the network
+        :type home_id: int
+        :param default: The data returned for an unknown value
+        :type default: any
+        :rtype: depending of the type of the value
+
+        """
+        return self.table.get(value_id, home_id=home_id, default=default)
+
+def run_host(device, table_path, address, config_path=None, user_path=None, cmd_line=None, slots=4096, data_size=36):
+    """
+    Run a host until it is interrupted. Can be used as the target of a multiprocessing.Process.
+
+    :param device: The device of the controller
+    :type device: str
+    :param table_path: The path of the shared table
+    :type table_path: str
+    :param address: The address of the command socket
+    :type address: str or tuple
+    :param config_path: The openzwave config directory
+    :type config_path: str
+    :param user_path: The user directory
+    :type user_path: str
+    :param cmd_line: The "command line" options of the openzwave library
+    :type cmd_line: str
+
+    """
+    from openzwave.option import ZWaveOption
+    from openzwave.network import ZWaveNetwork
+    options = ZWaveOption(device, config_path=config_path, user_path=user_path, cmd_line=cmd_line)
+    options.lock()
+    network = ZWaveNetwork(options, autostart=False)
+    host = ZWaveHost(network, table_path, address, slots=slots, data_size=data_size)
+    host.start()
+    network.start()
+    try:
+        while True:
+            time.sleep(1.0)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        network.stop()
+        host.stop()
+        network.destroy()
@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+"""
+.. module:: openzwave.hub
+
+This file is part of **python-openzwave** project https://github.com/OpenZWave/python-openzwave.
+    :platform: Unix, Windows, MacOS X
+    :sinopsis: openzwave API
+
+.. moduleauthor: bibi21000 aka Sébastien GALLET <bibi21000@gmail.com>
+
+License : GPL(v3)
+
+**python-openzwave** is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+**python-openzwave** is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with python-openzwave. If not, see http://www.gnu.org/licenses.
+
+"""
+import threading
+
+import libopenzwave
+
+# Set default logging handler to avoid "No handler found" warnings.
+import logging
+try:  # Python 2.7+
+    from logging import NullHandler
+except ImportError:
+    class NullHandler(logging.Handler):
+        """NullHandler logger for python 2.6"""
+        def emit(self, record):
+            pass
+logger = logging.getLogger('openzwave')
+logger.addHandler(NullHandler())
+
+class ZWaveHub(object):
+    """
+    Share the manager of the library between several networks, one for each controller.
+
+    The manager and the options of openzwave are singletons : all the networks
+    of a process use the same config and user directories. The hub installs
+    a single watcher and routes the notifications to the network of their home id.
+    A network is bound to its home id when the driver of its device is ready.
+
+    .. code-block:: python
+
+        options = ZWaveOption(device="/dev/ttyUSB0", config_path=config, user_path=user)
+        options.lock()
+        hub = ZWaveHub(options)
+        network1 = ZWaveNetwork(options, hub=hub)
+        network2 = ZWaveNetwork(ZWaveOption(device="/dev/ttyUSB1", config_path=config, user_path=user), hub=hub)
+        ...
+        network1.stop()
+        network2.stop()
+        hub.destroy()
+
+    """
+
+    def __init__(self, options, compact_notifications=False):
+        """
+        Initialize the hub
+
+        :param options: The locked options used to create the manager
+        :type options: ZWaveOption
+        :param compact_notifications: Receive compact notification objects from the manager instead of dicts.
+        :type compact_notifications: bool
+
+        """
+        self._options = options
+        self._compact_notifications = compact_notifications
+        self._manager = libopenzwave.PyManager()
+        self._manager.create()
+        self._lock = threading.RLock()
+        self._networks = []
+        self._homes = {}
+        self._watching = False
+
+    def __str__(self):
+        """
+        The string representation of the hub.
+
+        :rtype: str
+
+        """
+        return u'networks: [%s] home_ids: [%s]' % (len(self._networks), list(self._homes.keys()))
+
+    @property
+    def manager(self):
+        """
+        The manager shared by the networks.
+
+        :rtype: libopenzwave.PyManager
+
+        """
+        return self._manager
+
+    @property
+    def networks(self):
+        """
+        The started networks.
+
+        :rtype: list()
+
+        """
+        with self._lock:
+            return list(self._networks)
+
+    def get_network(self, home_id):
+        """
+        Retrieve the network of a home id.
+
+        :param home_id: The home id of the controller
+        :type home_id: int
+        :return: The network or None
+        :rtype: ZWaveNetwork
+
+        """
+        with self._lock:
+            return self._homes.get(home_id, None)
+
+    def add_network(self, network):
+        """
+        Add the driver of a network. Called by ZWaveNetwork.start().
+
+        :param network: The network to start
+        :type network: ZWaveNetwork
+
+        """
+        with self._lock:
+            if network in self._networks:
+                return
+            for other in self._networks:
+                if other._options.device == network._options.device:
+                    raise ValueError(u"Device %s is already used by another network" % network._options.device)
+            self._networks.append(network)
+            if not self._watching:
+                self._manager.addWatcher(self.zwcallback, compact=self._compact_notifications)
+                self._watching = True
+        logger.info(u"Hub : add driver %s", network._options.device)
+        self._manager.addDriver(network._options.device)
+
+    def remove_network(self, network):
+        """
+        Remove the driver of a network. Called by ZWaveNetwork.stop().
+        The watcher is removed with the last network.
+
+        :param network: The network to stop
+        :type network: ZWaveNetwork
+
+        """
+        with self._lock:
+            if network not in self._networks:
+                return
+        logger.info(u"Hub : remove driver %s", network._options.device)
+        self._manager.removeDriver(network._options.device)
+        with self._lock:
+            self._networks.remove(network)
+            for home_id in [home_id for home_id in self._homes if self._homes[home_id] is network]:
+                del self._homes[home_id]
+            if self._watching and not self._networks:
+                self._manager.removeWatcher(self.zwcallback)
+                self._watching = False
+
+    def destroy(self):
+        """
+        Stop the remaining networks and destroy the manager and the options.
+
+        """
+        for network in self.networks:
+            network.stop()
+        self._manager.destroy()
+        self._options.destroy()
+        self._manager = None
+        self._options = None
+
+    def _find_network(self, home_id, notify_type):
+        """
+        Find the network of a notification. Bind the home id on DriverReady.
+
+        """
+        with self._lock:
+            network = self._homes.get(home_id, None)
+            if network is not None or not self._networks:
+                return network
+            if notify_type == 'DriverReady':
+                path = self._manager.getControllerPath(home_id)
+                for network in self._networks:
+                    if network._options.device == path:
+                        self._homes[home_id] = network
+                        logger.info(u"Hub : bind home id %s to driver %s", home_id, path)
+                        return network
+            return None
+
+    def zwcallback(self, args):
+        """
+        The callback handler used with the libopenzwave : route the notification
+        to the network of its home id.
+
+        :param args: The notification
+        :type args: dict()
+
+        """
+        try:
+            notify_type = args['notificationType']
+            home_id = args['homeId']
+            network = self._find_network(home_id, notify_type)
+            if network is not None:
+                network.zwcallback(args)
+                if notify_type == 'DriverRemoved':
+                    with self._lock:
+                        self._homes.pop(home_id, None)
+            elif notify_type == 'DriverFailed':
+                #The home id of a failed driver is unknown : send it to the networks without one
+                with self._lock:
+                    networks = [net for net in self._networks if net not in self._homes.values()]
+                for network in networks:
+                    network.zwcallback(args)
+            else:
+                logger.warning(u'Hub : no network for notification [%s]', args)
+        except Exception:
+            logger.exception(u'Error in hub callback')
@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+"""
+.. module:: openzwave.journal
+
+This file is part of **python-openzwave** project https://github.com/OpenZWave/python-openzwave.
+    :platform: Unix, Windows, MacOS X
+    :sinopsis: openzwave API
+
+.. moduleauthor: bibi21000 aka Sébastien GALLET <bibi21000@gmail.com>
+
+License : GPL(v3)
+
+**python-openzwave** is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+**python-openzwave** is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with python-openzwave. If not, see http://www.gnu.org/licenses.
+
+"""
+import collections
+import threading
+import time
+
+# Set default logging handler to avoid "No handler found" warnings.
+import logging
+try:  # Python 2.7+
+    from logging import NullHandler
+except ImportError:
+    class NullHandler(logging.Handler):
+        """NullHandler logger for python 2.6"""
+        def emit(self, record):
+            pass
+logger = logging.getLogger('openzwave')
+logger.addHandler(NullHandler())
+
+KIND_RESET = 'reset'
+KIND_NODE_ADDED = 'node_added'
+KIND_NODE_CHANGED = 'node_changed'
+KIND_NODE_REMOVED = 'node_removed'
+KIND_VALUE_ADDED = 'value_added'
+KIND_VALUE_CHANGED = 'value_changed'
+KIND_VALUE_REMOVED = 'value_removed'
+
+class ZWaveJournal(object):
+    """
+    A change data capture feed of the network.
+
+    Every change of the model (nodes and values added, changed or removed)
+    gets a monotonic sequence number and is kept in a bounded journal.
+    A client remembers the last sequence number it has seen and asks for
+    the changes since this cursor when it reconnects. When the cursor is
+    older than the journal, a full snapshot of the network is returned
+    instead.
+
+    The journal costs nothing until a consumer asks for changes : the
+    network only records them while it is enabled, and the first call
+    to changes_since enables it. When it is enabled, the sequence jumps
+    so the older cursors get a snapshot.
+
+    .. code-block:: python
+
+        feed = network.changes_since(0)
+        cursor = feed['seq']
+        ...
+        feed = network.changes_since(cursor)
+        if 'snapshot' in feed:
+            rebuild(feed['snapshot'])
+        else:
+            for change in feed['changes']:
+                apply(change)
+        cursor = feed['seq']
+
+    """
+
+    def __init__(self, network=None, size=10000, enabled=False):
+        """
+        Initialize the journal
+
+        :param network: The network used to build the snapshots
+        :type network: ZWaveNetwork
+        :param size: The maximum number of changes kept in the journal
+        :type size: int
+        :param enabled: Record the changes before a consumer asks for them
+        :type enabled: bool
+
+        """
+        self._network = network
+        self._size = size
+        self._lock = threading.Lock()
+        self._entries = collections.deque(maxlen=size)
+        self._seq = 0
+        self._enabled = enabled
+
+    def __str__(self):
+        """
+        The string representation of the journal.
+
+        :rtype: str
+
+        """
+        return u'seq: [%s] first_seq: [%s] entries: [%s]' % (self.seq, self.first_seq, len(self._entries))
+
+    @property
+    def size(self):
+        """
+        The maximum number of changes kept in the journal.
+
+        :rtype: int
+
+        """
+        return self._size
+
+    @property
+    def enabled(self):
+        """
+        Are the changes recorded.
+
+        :rtype: bool
+
+        """
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value):
+        """
+        Start or stop recording the changes.
+        The changes missed while disabled can't be replayed : the sequence
+        jumps and the older cursors get a snapshot.
+
+        :param value: True to record the changes
+        :type value: bool
+
+        """
+        with self._lock:
+            if value and not self._enabled:
+                self._entries.clear()
+                self._seq += 1
+            self._enabled = value
+
+    @property
+    def seq(self):
+        """
+        The sequence number of the last change.
+
+        :rtype: int
+
+        """
+        return self._seq
+
+    @property
+    def first_seq(self):
+        """
+        The sequence number of the oldest change still in the journal.
+        It is seq + 1 when the journal is empty.
+
+        :rtype: int
+
+        """
+        with self._lock:
+            if self._entries:
+                return self._entries[0]['seq']
+            return self._seq + 1
+
+    def record(self, kind, node_id, value_id=None, data=None):
+        """
+        Record a change.
+
+        :param kind: The kind of change (node_added, value_changed, ...)
+        :type kind: str
+        :param node_id: The node of the change
+        :type node_id: int
+        :param value_id: The value of the change
+        :type value_id: int
+        :param data: The data of the change
+        :type data: dict()
+        :return: The sequence number of the change
+        :rtype: int
+
+        """
+        with self._lock:
+            self._seq += 1
+            self._entries.append({'seq': self._seq,
+                                  'ts': time.time(),
+                                  'kind': kind,
+                                  'node_id': node_id,
+                                  'value_id': value_id,
+                                  'data': data})
+            return self._seq
+
+    def reset(self):
+        """
+        Record a reset of the network : all nodes and values are gone.
+        Older changes are dropped, so clients with an older cursor get a snapshot.
+
+        :return: The sequence number of the reset
+        :rtype: int
+
+        """
+        with self._lock:
+            self._entries.clear()
+        return self.record(KIND_RESET, None)
+
+    def changes_since(self, seq, extras=['all']):
+        """
+        Return the changes recorded after a sequence number.
+
+        The returned dict contains the current sequence number in 'seq' and
+        the list of changes in 'changes'. When the changes after seq are no
+        longer in the journal, 'changes' is replaced by 'snapshot' which
+        contains the network as returned by nodes_to_dict.
+
+        :param seq: The last sequence number seen by the client
+        :type seq: int
+        :param extras: The extra informations of the snapshot
+        :type extras: []
+        :returns: A dict
+        :rtype: dict()
+
+        """
+        if not self._enabled:
+            #A consumer has a cursor : record the changes from now on
+            self.enabled = True
+        with self._lock:
+            current = self._seq
+            if seq > current:
+                seq = -1
+            first = self._entries[0]['seq'] if self._entries else current + 1
+            if seq + 1 >= first:
+                #The journal is ordered : skip the entries already seen
+                start = len(self._entries) - (current - seq)
+                changes = [dict(entry) for entry in list(self._entries)[start:]]
+                return {'seq': current, 'changes': changes}
+        #The sequence number is read before building the snapshot, so the
+        #changes done while building it are sent again on the next call.
+        logger.debug(u"Journal : cursor %s is too old, send a snapshot", seq)
+        snapshot = self._network.nodes_to_dict(extras=extras) if self._network is not None else {}
+        return {'seq': current, 'snapshot': snapshot}
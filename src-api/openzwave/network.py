@@ -39,8 +39,19 @@ import openzwave
 from openzwave.object import ZWaveException, ZWaveTypeException, ZWaveObject
 from openzwave.controller import ZWaveController
 from openzwave.node import ZWaveNode
+from openzwave.group import ZWaveAssociationIndex
 from openzwave.option import ZWaveOption
 from openzwave.scene import ZWaveScene
+from openzwave.sceneengine import ZWaveSceneEngine
+from openzwave.scheduler import ZWaveScheduler
+from openzwave.sendqueue import ZWaveSendQueue
+from openzwave.polling import ZWavePoller
+from openzwave.value import key_from_id_on_network
+from openzwave.snapshot import ZWaveSnapshot
+from openzwave.statistics import ZWaveStatisticsCollector
+from openzwave.topology import ZWaveTopology
+from openzwave.heal import ZWaveHealer
+from openzwave.journal import ZWaveJournal, KIND_NODE_ADDED, KIND_NODE_CHANGED, KIND_NODE_REMOVED, KIND_VALUE_ADDED, KIND_VALUE_CHANGED, KIND_VALUE_REMOVED
 from openzwave.singleton import Singleton
 
 # Set default logging handler to avoid "No handler found" warnings.
@@ -292,7 +303,7 @@ class ZWaveNetwork(ZWaveObject):
 
     ignoreSubsequent = True
 
-    def __init__(self, options, log=None, autostart=True, kvals=True):
+    def __init__(self, options, log=None, autostart=True, kvals=True, compact_notifications=False, hub=None):
         """
         Initialize zwave network
 
@@ -304,15 +315,38 @@ class ZWaveNetwork(ZWaveObject):
         :type autostart: bool
         :param kvals: Enable kvals (use pysqlite)
         :type kvals: bool
+        :param compact_notifications: Receive compact notification objects from the manager instead of dicts. Their metadata are fetched only when used.
+        :type compact_notifications: bool
+        :param hub: Share the manager of a hub with other networks. The hub routes the notifications of the controller of options.device to this network.
+        :type hub: ZWaveHub
 
         """
         logger.debug("Create network object.")
         self.log = log
         self._options = options
+        self._compact_notifications = compact_notifications
+        self._hub = hub
         ZWaveObject.__init__(self, None, self)
+        self._scheduler = ZWaveScheduler(self)
+        self._send_queue = ZWaveSendQueue(self)
+        self._poller = ZWavePoller(self)
+        self._journal = ZWaveJournal(self)
+        self._snapshot = ZWaveSnapshot()
+        self._snapshot_lock = threading.Lock()
+        self._associations = ZWaveAssociationIndex()
+        self._scenes = None
+        self._scenes_lock = threading.Lock()
+        self._scene_engine = ZWaveSceneEngine(self)
+        self._statistics = ZWaveStatisticsCollector(self)
+        self._topology = ZWaveTopology(self)
+        self._healer = ZWaveHealer(self)
+        self._poll_interval_between = False
         self._controller = ZWaveController(1, self, options)
-        self._manager = libopenzwave.PyManager()
-        self._manager.create()
+        if hub is not None:
+            self._manager = hub.manager
+        else:
+            self._manager = libopenzwave.PyManager()
+            self._manager.create()
         self._state = self.STATE_STOPPED
         self.nodes = None
         self._semaphore_nodes = threading.Semaphore()
@@ -370,8 +404,14 @@ class ZWaveNetwork(ZWaveObject):
         if self._started == True:
             return
         logger.info(u"Start Openzwave network.")
-        self._manager.addWatcher(self.zwcallback)
-        self._manager.addDriver(self._options.device)
+        self._scheduler.start()
+        self._send_queue.start()
+        self._poller.start()
+        if self._hub is not None:
+            self._hub.add_network(self)
+        else:
+            self._manager.addWatcher(self.zwcallback, compact=self._compact_notifications)
+            self._manager.addDriver(self._options.device)
         self._started = True
 
     def stop(self, fire=True):
@@ -381,6 +421,7 @@ class ZWaveNetwork(ZWaveObject):
             - remove the watcher
             - remove the driver
             - clear the nodes
+            - stop the scheduler
 
         .. code-block:: python
 
@@ -390,18 +431,25 @@ class ZWaveNetwork(ZWaveObject):
         if self._started == False:
             return
         logger.info(u"Stop Openzwave network.")
+        self._send_queue.stop()
+        self._poller.stop()
+        self._statistics.stop()
+        self._healer.stop()
         if self.controller is not None:
             self.controller.stop()
         self.write_config()
         try:
             self._semaphore_nodes.acquire()
-            self._manager.removeWatcher(self.zwcallback)
-            try:
-                self.network_event.wait(1.0)
-            except AssertionError:
-                #For gevent AssertionError: Impossible to call blocking function in the event loop callback
-                pass
-            self._manager.removeDriver(self._options.device)
+            if self._hub is not None:
+                self._hub.remove_network(self)
+            else:
+                self._manager.removeWatcher(self.zwcallback)
+                try:
+                    self.network_event.wait(1.0)
+                except AssertionError:
+                    #For gevent AssertionError: Impossible to call blocking function in the event loop callback
+                    pass
+                self._manager.removeDriver(self._options.device)
             try:
                 self.network_event.wait(1.0)
             except AssertionError:
@@ -422,6 +470,7 @@ class ZWaveNetwork(ZWaveObject):
             logger.exception(u'Stop network : %s')
         finally:
             self._semaphore_nodes.release()
+        self._scheduler.stop()
         self._started = False
         self._state = self.STATE_STOPPED
         try:
@@ -435,12 +484,16 @@ class ZWaveNetwork(ZWaveObject):
     def destroy(self):
         """
         Destroy the netwok and all related stuff.
+        The manager and the options of a network using a hub are destroyed by the hub.
         """
+        self._scheduler.stop()
+        self._scheduler.clear()
         if self.dbcon is not None:
             self.dbcon.commit()
             self.dbcon.close()
-        self._manager.destroy()
-        self._options.destroy()
+        if self._hub is None:
+            self._manager.destroy()
+            self._options.destroy()
         self._manager = None
         self._options = None
 
@@ -563,6 +616,77 @@ class ZWaveNetwork(ZWaveObject):
         else:
             raise ZWaveException(u"Manager not initialised")
 
+    @property
+    def hub(self):
+        """
+        The hub sharing the manager with other networks.
+
+        :rtype: ZWaveHub
+
+        """
+        return self._hub
+
+    @property
+    def scheduler(self):
+        """
+        The scheduler of the network.
+        Use it to run periodic jobs instead of creating new threads.
+
+        :return: The scheduler of the network
+        :rtype: ZWaveScheduler
+
+        """
+        return self._scheduler
+
+    @property
+    def send_queue(self):
+        """
+        The command scheduler of the network.
+        Use it to send commands with a priority.
+
+        :return: The command scheduler of the network
+        :rtype: ZWaveSendQueue
+
+        """
+        return self._send_queue
+
+    @property
+    def poller(self):
+        """
+        The adaptive poller of the network.
+
+        :return: The poller of the network
+        :rtype: ZWavePoller
+
+        """
+        return self._poller
+
+    @property
+    def journal(self):
+        """
+        The change data capture feed of the network.
+
+        :return: The journal of the network
+        :rtype: ZWaveJournal
+
+        """
+        return self._journal
+
+    def changes_since(self, seq, extras=['all']):
+        """
+        Return the changes of nodes and values since a sequence number.
+        A snapshot of the nodes is returned when the sequence number is too old.
+
+        :param seq: The last sequence number seen by the client. Use 0 to get all changes
+        :type seq: int
+        :param extras: The extra informations of the snapshot
+        :type extras: []
+        :returns: A dict with 'seq' and 'changes' or 'snapshot'
+        :rtype: dict()
+
+        """
+        return self._journal.changes_since(seq, extras=extras)
+
     @property
     def controller(self):
         """
@@ -582,11 +706,73 @@ class ZWaveNetwork(ZWaveObject):
         """
         The nodes of the network.
 
+        The dict is replaced, never updated, when a node is added or removed.
+        So it can be iterated from any thread, but it must not be updated.
+
         :rtype: dict()
 
         """
         return self._nodes
 
+    @property
+    def snapshot(self):
+        """
+        An immutable snapshot of the nodes and values of the network.
+        Getting it does not block the writers.
+
+        :rtype: ZWaveSnapshot
+
+        """
+        return self._snapshot
+
+    @property
+    def associations(self):
+        """
+        The association graph of the network.
+        All the groups are read the first time, then the graph is updated
+        by the Group notifications.
+
+        .. code-block:: python
+
+            reporters = network.associations.get_sources(1)
+
+        :rtype: ZWaveAssociationIndex
+
+        """
+        if not self._associations.loaded:
+            for node in list(self.nodes.values()):
+                self._index_groups(node)
+            self._associations.loaded = True
+        return self._associations
+
+    def _index_groups(self, node, groupidx=None):
+        """
+        Update the association graph with the groups of a node.
+
+        """
+        groups = node.groups
+        if groupidx is not None:
+            self._associations.update(node.node_id, groupidx, \
+                groups[groupidx].associations if groupidx in groups else ())
+            return
+        self._associations.remove_node(node.node_id)
+        for idx in groups:
+            self._associations.update(node.node_id, idx, groups[idx].associations)
+
+    def _publish_snapshot(self, node_id=None):
+        """
+        Publish a new snapshot. Must be called after replacing the dict of nodes or of values.
+
+        :param node_id: The node whose dict of values was replaced. None to rebuild the whole snapshot.
+        :type node_id: int
+
+        """
+        with self._snapshot_lock:
+            if node_id is None:
+                self._snapshot = ZWaveSnapshot.from_nodes(self._snapshot.version + 1, self._nodes)
+            else:
+                self._snapshot = self._snapshot.with_node_values(self._snapshot.version + 1, self._nodes, node_id)
+
     def nodes_to_dict(self, extras=['all']):
         """
         Return a dict representation of the network.
@@ -636,6 +822,7 @@ class ZWaveNetwork(ZWaveObject):
             self._nodes = value
         else:
             self._nodes = dict()
+        self._publish_snapshot()
 
     def switch_all(self, state):
         """
@@ -667,7 +854,8 @@ class ZWaveNetwork(ZWaveObject):
         """
         Heal network by requesting nodes rediscover their neighbors.
         Sends a ControllerCommand_RequestNodeNeighborUpdate to every node.
-        Can take a while on larger networks.
+        Can take a while on larger networks : use the healer to heal
+        the nodes one by one.
 
         :param upNodeRoute: Optional Whether to perform return routes initialization. (default = false).
         :type upNodeRoute: bool
@@ -679,13 +867,14 @@ class ZWaveNetwork(ZWaveObject):
             logger.warning(u'Network must be awake')
             return False
         self.manager.healNetwork(self.home_id, upNodeRoute)
+        self._topology.invalidate()
         return True
 
     def get_value(self, value_id):
         """
         Retrieve a value on the network.
 
-        Check every nodes to see if it holds the value
+        The node holding the value is read from the value_id.
 
         :param value_id: The id of the value to find
         :type value_id: int
@@ -693,10 +882,26 @@ class ZWaveNetwork(ZWaveObject):
         :rtype: ZWaveValue
 
         """
-        for node in self.nodes:
-            if value_id in self.nodes[node].values:
-                return self.nodes[node].values[value_id]
-        return None
+        node = self.nodes.get((value_id >> 24) & 0xff, None)
+        if node is None:
+            return None
+        return node.values.get(value_id, None)
+
+    def check_values(self, datas):
+        """
+        Check many writes at once with the validators of the values.
+
+        :param datas: The data to check by value_id
+        :type datas: dict()
+        :return: The converted data by value_id. None for incorrect data or unknown values.
+        :rtype: dict()
+
+        """
+        ret = {}
+        for value_id in datas:
+            value = self.get_value(value_id)
+            ret[value_id] = value.validator.check(datas[value_id]) if value is not None else None
+        return ret
 
     @property
     def id_separator(self):
@@ -723,27 +928,37 @@ class ZWaveNetwork(ZWaveObject):
         """
         Retrieve a value on the network from it's id_on_network.
 
-        Check every nodes to see if it holds the value
+        The id_on_network can also be given as the integer key of the value.
+        The node is decoded from it, so only its values are checked.
 
-        :param id_on_network: The id_on_network of the value to find
-        :type id_on_network: str
+        :param id_on_network: The id_on_network or the key of the value to find
+        :type id_on_network: str or int
         :return: The value or None
         :rtype: ZWaveValue
 
         """
-        for node in self.nodes.itervalues():
-            for val in node.values.itervalues():
-                if val.id_on_network == id_on_network:
-                    return val
+        if isinstance(id_on_network, six.string_types):
+            key = key_from_id_on_network(id_on_network, self.id_separator)
+        else:
+            key = id_on_network
+        if key is None:
+            return None
+        node = self.nodes.get((key >> 24) & 0xff, None)
+        if node is None:
+            return None
+        for val in node.values.values():
+            if val.key == key:
+                return val
         return None
 
     def get_scenes(self):
         """
         The scenes of the network.
 
-        Scenes are generated directly from the lib. There is no notification
-        support to keep them up to date. So for a batch job, consider
-        storing them in a local variable.
+        Scenes are loaded once from the lib, then updated by create_scene,
+        remove_scene and the methods of the scenes. There is no notification
+        support in the lib : call reload_scenes if the scenes are changed
+        without this API.
 
         :return: return a dict() (that can be empty) of scene object. Return None if betwork is not ready
         :rtype: dict() or None
@@ -752,7 +967,73 @@ class ZWaveNetwork(ZWaveObject):
         if self.state < self.STATE_AWAKED:
             return None
         else:
-            return self._load_scenes()
+            return dict(self._load_scenes())
+
+    def get_scene(self, scene_id):
+        """
+        Retrieve a scene of the network.
+
+        :param scene_id: The id of the scene
+        :type scene_id: int
+        :return: The scene or None
+        :rtype: ZWaveScene
+
+        """
+        if self.state < self.STATE_AWAKED:
+            return None
+        return self._load_scenes().get(scene_id, None)
+
+    @property
+    def scene_engine(self):
+        """
+        The python scene engine of the network.
+
+        :return: The scene engine
+        :rtype: ZWaveSceneEngine
+
+        """
+        return self._scene_engine
+
+    @property
+    def statistics(self):
+        """
+        The collector of the statistics of the nodes.
+
+        :return: The collector
+        :rtype: ZWaveStatisticsCollector
+
+        """
+        return self._statistics
+
+    @property
+    def topology(self):
+        """
+        The mesh of the network : neighbors of the nodes and quality of the links.
+
+        :return: The topology
+        :rtype: ZWaveTopology
+
+        """
+        return self._topology
+
+    @property
+    def healer(self):
+        """
+        The healer of the network : heal the nodes one by one.
+
+        :return: The healer
+        :rtype: ZWaveHealer
+
+        """
+        return self._healer
+
+    def reload_scenes(self):
+        """
+        Forget the scenes. They will be loaded from the lib on the next access.
+
+        """
+        with self._scenes_lock:
+            self._scenes = None
 
     def scenes_to_dict(self, extras=['all']):
         """
@@ -778,13 +1059,16 @@ class ZWaveNetwork(ZWaveObject):
         :rtype: dict()
 
         """
-        ret = {}
-        set_scenes = self._manager.getAllScenes()
-        logger.debug(u'Load Scenes: %s', set_scenes)
-        for scene_id in set_scenes:
-            scene = ZWaveScene(scene_id, network=self)
-            ret[scene_id] = scene
-        return ret
+        with self._scenes_lock:
+            if self._scenes is None:
+                ret = {}
+                set_scenes = self._manager.getAllScenes()
+                logger.debug(u'Load Scenes: %s', set_scenes)
+                for scene_id in set_scenes:
+                    scene = ZWaveScene(scene_id, network=self)
+                    ret[scene_id] = scene
+                self._scenes = ret
+            return self._scenes
 
     def create_scene(self, label=None):
         """
@@ -801,7 +1085,12 @@ class ZWaveNetwork(ZWaveObject):
 
         """
         scene = ZWaveScene(None, network=self)
-        return scene.create(label)
+        scene_id = scene.create(label)
+        if scene_id != 0:
+            with self._scenes_lock:
+                if self._scenes is not None:
+                    self._scenes[scene_id] = scene
+        return scene_id
 
     def scene_exists(self, scene_id):
         """
@@ -836,7 +1125,12 @@ class ZWaveNetwork(ZWaveObject):
         :rtype: bool
 
         """
-        return self._network.manager.removeScene(scene_id)
+        ret = self._network.manager.removeScene(scene_id)
+        if ret:
+            with self._scenes_lock:
+                if self._scenes is not None:
+                    self._scenes.pop(scene_id, None)
+        return ret
 
     @property
     def nodes_count(self):
@@ -892,6 +1186,7 @@ class ZWaveNetwork(ZWaveObject):
 
         """
         self.manager.setPollInterval(milliseconds, bIntervalBetweenPolls)
+        self._poll_interval_between = bIntervalBetweenPolls
 
     def zwcallback(self, args):
         """
@@ -1025,8 +1320,8 @@ class ZWaveNetwork(ZWaveObject):
         try:
             controller_node = ZWaveNode(args['nodeId'], network=self)
             self._semaphore_nodes.acquire()
-            self.nodes = None
-            self.nodes[args['nodeId']] = controller_node
+            #Build the dict before publishing it : the snapshots must not see it change
+            self.nodes = {args['nodeId']: controller_node}
             self._controller.node = self.nodes[args['nodeId']]
             logger.info(u'Driver ready using library %s', self._controller.library_description)
             logger.info(u'home_id 0x%0.8x, controller node id is %d', self.home_id, self._controller.node_id)
@@ -1066,7 +1361,16 @@ class ZWaveNetwork(ZWaveObject):
         try:
             self._semaphore_nodes.acquire()
             logger.debug(u'DriverReset received. Remove all nodes')
+            self._send_queue.clear()
+            self._poller.clear()
             self.nodes = None
+            self._associations.clear()
+            self.reload_scenes()
+            self._scene_engine.clear()
+            self._statistics.reset()
+            self._topology.clear()
+            self._healer.stop()
+            self._journal.reset()
             self._state = self.STATE_RESETTED
             dispatcher.send(self.SIGNAL_DRIVER_RESET, \
                 **{'network': self})
@@ -1089,6 +1393,8 @@ class ZWaveNetwork(ZWaveObject):
         logger.debug(u'Z-Wave Notification DriverRemoved : %s', args)
         try:
             self._semaphore_nodes.acquire()
+            self._send_queue.clear()
+            self.reload_scenes()
             self._state = self.STATE_STOPPED
             dispatcher.send(self.SIGNAL_DRIVER_REMOVED, \
                 **{'network': self})
@@ -1108,6 +1414,13 @@ class ZWaveNetwork(ZWaveObject):
 
         """
         logger.debug(u'Z-Wave Notification Group : %s', args)
+        if args['nodeId'] in self.nodes:
+            node = self.nodes[args['nodeId']]
+            if node.invalidate_groups(args['groupIdx']):
+                if self._associations.loaded:
+                    self._index_groups(node, args['groupIdx'])
+            elif self._associations.loaded:
+                self._index_groups(node)
         dispatcher.send(self.SIGNAL_GROUP, \
                 **{'network': self, 'node': self.nodes[args['nodeId']], 'groupidx': args['groupIdx']})
 
@@ -1144,7 +1457,11 @@ class ZWaveNetwork(ZWaveObject):
         try:
             node = ZWaveNode(args['nodeId'], network=self)
             self._semaphore_nodes.acquire()
-            self.nodes[args['nodeId']] = node
+            nodes = dict(self.nodes)
+            nodes[args['nodeId']] = node
+            self.nodes = nodes
+            if self._journal.enabled:
+                self._journal.record(KIND_NODE_ADDED, args['nodeId'])
             dispatcher.send(self.SIGNAL_NODE_ADDED, \
                 **{'network': self, 'node': self.nodes[args['nodeId']]})
             self._handle_node(self.nodes[args['nodeId']])
@@ -1194,6 +1511,9 @@ class ZWaveNetwork(ZWaveObject):
 
         """
         logger.debug(u'Z-Wave Notification NodeNaming : %s', args)
+        self.nodes[args['nodeId']].invalidate_static_info()
+        if self._journal.enabled:
+            self._journal.record(KIND_NODE_CHANGED, args['nodeId'], data=self.nodes[args['nodeId']].to_dict(extras=[]))
         dispatcher.send(self.SIGNAL_NODE_NAMING, \
             **{'network': self, 'node': self.nodes[args['nodeId']]})
         self._handle_node(self.nodes[args['nodeId']])
@@ -1223,6 +1543,9 @@ class ZWaveNetwork(ZWaveObject):
 
         """
         logger.debug(u'Z-Wave Notification NodeProtocolInfo : %s', args)
+        self.nodes[args['nodeId']].invalidate_static_info()
+        if self._journal.enabled:
+            self._journal.record(KIND_NODE_CHANGED, args['nodeId'], data=self.nodes[args['nodeId']].to_dict(extras=[]))
         dispatcher.send(self.SIGNAL_NODE_PROTOCOL_INFO, \
             **{'network': self, 'node': self.nodes[args['nodeId']]})
         self._handle_node(self.nodes[args['nodeId']])
@@ -1243,9 +1566,16 @@ class ZWaveNetwork(ZWaveObject):
         logger.debug(u'Z-Wave Notification NodeRemoved : %s', args)
         try:
             self._semaphore_nodes.acquire()
+            self._send_queue.drop_node(args['nodeId'])
             if args['nodeId'] in self.nodes:
                 node = self.nodes[args['nodeId']]
-                del self.nodes[args['nodeId']]
+                nodes = dict(self.nodes)
+                del nodes[args['nodeId']]
+                self.nodes = nodes
+                self._associations.remove_node(args['nodeId'])
+                self._topology.remove_node(args['nodeId'])
+                if self._journal.enabled:
+                    self._journal.record(KIND_NODE_REMOVED, args['nodeId'])
                 dispatcher.send(self.SIGNAL_NODE_REMOVED, \
                     **{'network': self, 'node': node})
                 self._handle_node(node)
@@ -1264,6 +1594,7 @@ class ZWaveNetwork(ZWaveObject):
 
         """
         logger.debug(u'Z-Wave Notification EssentialNodeQueriesComplete : %s', args)
+        self.nodes[args['nodeId']].invalidate_static_info()
         dispatcher.send(self.SIGNAL_ESSENTIAL_NODE_QUERIES_COMPLETE, \
             **{'network': self, 'node': self.nodes[args['nodeId']]})
 
@@ -1281,8 +1612,15 @@ class ZWaveNetwork(ZWaveObject):
 
         """
         logger.debug(u'Z-Wave Notification NodeQueriesComplete : %s', args)
+        self.nodes[args['nodeId']].invalidate_static_info()
         #the query stage are now completed, set the flag is ready to operate
         self.nodes[args['nodeId']].is_ready = True
+        self.nodes[args['nodeId']].invalidate_groups()
+        if self._associations.loaded:
+            self._index_groups(self.nodes[args['nodeId']])
+        self._topology.invalidate(args['nodeId'])
+        if self._journal.enabled:
+            self._journal.record(KIND_NODE_CHANGED, args['nodeId'], data=self.nodes[args['nodeId']].to_dict(extras=[]))
         dispatcher.send(self.SIGNAL_NODE_QUERIES_COMPLETE, \
             **{'network': self, 'node': self.nodes[args['nodeId']]})
         self._handle_node(self.nodes[args['nodeId']])
@@ -1474,6 +1812,10 @@ class ZWaveNetwork(ZWaveObject):
         """
         logger.debug(u'Z-Wave Notification ValueAdded : %s', args)
         self.nodes[args['nodeId']].add_value(args['valueId']['id'])
+        self._publish_snapshot(args['nodeId'])
+        if self._journal.enabled:
+            self._journal.record(KIND_VALUE_ADDED, args['nodeId'], value_id=args['valueId']['id'], \
+                data=self.nodes[args['nodeId']].values[args['valueId']['id']].to_dict(extras=[]))
         dispatcher.send(self.SIGNAL_VALUE_ADDED, \
             **{'network': self, \
                'node' : self.nodes[args['nodeId']], \
@@ -1499,6 +1841,13 @@ class ZWaveNetwork(ZWaveObject):
             logger.warning('Z-Wave Notification ValueChanged (%s) for an unknown node %s', args['valueId'], args['nodeId'])
             return False
         self.nodes[args['nodeId']].change_value(args['valueId']['id'])
+        if args['valueId']['type'] == 'List':
+            #The items of a list can change with its data : build the validator again
+            self.nodes[args['nodeId']].values[args['valueId']['id']].invalidate_validator()
+        if self._journal.enabled:
+            self._journal.record(KIND_VALUE_CHANGED, args['nodeId'], value_id=args['valueId']['id'], \
+                data={'data': args['valueId']['value']})
+        self._poller.handle_update(args['valueId']['id'], True)
         dispatcher.send(self.SIGNAL_VALUE_CHANGED, \
             **{'network': self, 'node' : self.nodes[args['nodeId']], \
                 'value' : self.nodes[args['nodeId']].values[args['valueId']['id']]})
@@ -1522,6 +1871,10 @@ class ZWaveNetwork(ZWaveObject):
             logger.warning('Z-Wave Notification ValueRefreshed (%s) for an unknown node %s', args['valueId'], args['nodeId'])
             return False
         self.nodes[args['nodeId']].refresh_value(args['valueId']['id'])
+        if args['valueId']['type'] == 'List':
+            #The items of a list can change with its data : build the validator again
+            self.nodes[args['nodeId']].values[args['valueId']['id']].invalidate_validator()
+        self._poller.handle_update(args['valueId']['id'], False)
         dispatcher.send(self.SIGNAL_VALUE_REFRESHED, \
             **{'network': self, 'node' : self.nodes[args['nodeId']], \
                 'value' : self.nodes[args['nodeId']].values[args['valueId']['id']]})
@@ -1542,10 +1895,11 @@ class ZWaveNetwork(ZWaveObject):
 
         """
         logger.debug(u'Z-Wave Notification ValueRemoved : %s', args)
+        self._poller.unmanage(args['valueId']['id'])
         if args['nodeId'] not in self.nodes:
             logger.warning(u'Z-Wave Notification ValueRemoved (%s) for an unknown node %s', args['valueId'], args['nodeId'])
             return False
-        if args['valueId']['id'] in self.nodes[args['nodeId']].values:
+        if args['valueId']['id'] not in self.nodes[args['nodeId']].values:
             logger.warning(u'Z-Wave Notification ValueRemoved for an unknown value (%s) on node %s', args['valueId'], args['nodeId'])
             dispatcher.send(self.SIGNAL_VALUE_REMOVED, \
                 **{'network': self, 'node' : self.nodes[args['nodeId']], \
@@ -1553,12 +1907,13 @@ class ZWaveNetwork(ZWaveObject):
             return False
         val = self.nodes[args['nodeId']].values[args['valueId']['id']]
         if self.nodes[args['nodeId']].remove_value(args['valueId']['id']):
+            self._publish_snapshot(args['nodeId'])
+            if self._journal.enabled:
+                self._journal.record(KIND_VALUE_REMOVED, args['nodeId'], value_id=args['valueId']['id'])
             dispatcher.send(self.SIGNAL_VALUE_REMOVED, \
                 **{'network': self, 'node' : self.nodes[args['nodeId']], \
                     'value' : val, 'valueId' : args['valueId']['id']})
             #self._handle_value(node=self.nodes[args['nodeId']], value=val)
-        if args['nodeId'] in self.nodes and args['valueId']['id'] in self.nodes[args['nodeId']].values:
-            del self.nodes[args['nodeId']].values[args['valueId']['id']]
         return True
 
     def _handle_notification(self, args):
@@ -1572,6 +1927,17 @@ class ZWaveNetwork(ZWaveObject):
 
         """
         logger.debug(u'Z-Wave Notification : %s', args)
+        try:
+            code = libopenzwave.PyNotificationCodes[args['notificationCode']]
+        except (KeyError, IndexError, TypeError):
+            #A code unknown by the binding : the notification is still sent to the consumers
+            logger.warning(u'Z-Wave Notification : unknown notification code in %s', args)
+            code = None
+        if code == self.SIGNAL_MSG_COMPLETE:
+            self._handle_msg_complete(args)
+        elif code == 'Timeout':
+            #The message has left the send queue too
+            self._send_queue.wake()
         dispatcher.send(self.SIGNAL_NOTIFICATION, \
             **{'network': self, 'args': args})
 
@@ -1598,6 +1964,9 @@ class ZWaveNetwork(ZWaveObject):
         :type args: dict()
 
         """
+        if args['controllerState'] == self._controller.STATE_COMPLETED:
+            #The neighbors of the node may have been updated
+            self._topology.invalidate(args['nodeId'])
         self._controller._handle_controller_command(args)
 
     def _handle_msg_complete(self, args):
@@ -1611,6 +1980,7 @@ class ZWaveNetwork(ZWaveObject):
 
         """
         logger.debug(u'Z-Wave Notification MsgComplete : %s', args)
+        self._send_queue.wake()
         dispatcher.send(self.SIGNAL_MSG_COMPLETE, \
             **{'network': self})
 
@@ -69,6 +69,8 @@ class ZWaveNode(ZWaveObject,
         ZWaveObject.__init__(self, node_id, network)
         #No cache management for values in nodes
         self.values = dict()
+        self._groups = None
+        self._static_info = None
         self._is_locked = False
         self._isReady = False
 
@@ -146,7 +148,7 @@ class ZWaveNode(ZWaveObject,
         :rtype: str
 
         """
-        return self._network.manager.getNodeProductName(self.home_id, self.object_id)
+        return self._get_static_info()['product_name']
 
     @product_name.setter
     def product_name(self, value):
@@ -158,6 +160,7 @@ class ZWaveNode(ZWaveObject,
 
         """
         self._network.manager.setNodeProductName(self.home_id, self.object_id, value)
+        self.invalidate_static_info()
 
     @property
     def product_type(self):
@@ -167,7 +170,7 @@ class ZWaveNode(ZWaveObject,
         :rtype: str
 
         """
-        return self._network.manager.getNodeProductType(self.home_id, self.object_id)
+        return self._get_static_info()['product_type']
 
     @property
     def product_id(self):
@@ -177,7 +180,7 @@ class ZWaveNode(ZWaveObject,
         :rtype: str
 
         """
-        return self._network.manager.getNodeProductId(self.home_id, self.object_id)
+        return self._get_static_info()['product_id']
 
     @property
     def device_type(self):
@@ -187,7 +190,7 @@ class ZWaveNode(ZWaveObject,
         :rtype: str
 
         """
-        return self._network.manager.getNodeDeviceTypeString(self.home_id, self.object_id)
+        return self._get_static_info()['device_type']
 
     @property
     def role(self):
@@ -197,7 +200,7 @@ class ZWaveNode(ZWaveObject,
         :rtype: str
 
         """
-        return self._network.manager.getNodeRoleString(self.home_id, self.object_id)
+        return self._get_static_info()['role']
 
     def to_dict(self, extras=['all']):
         """
@@ -231,6 +234,28 @@ class ZWaveNode(ZWaveObject,
                 ret[key]=vals[key]
         return ret
 
+    def _get_static_info(self):
+        """
+        The informations of the node which change only when the node is interviewed.
+        They are read from the manager in a single call and cached until invalidate_static_info.
+
+        :rtype: dict()
+
+        """
+        info = self._static_info
+        if info is None:
+            info = self._network.manager.getNodeStaticInfo(self.home_id, self.object_id)
+            self._static_info = info
+        return info
+
+    def invalidate_static_info(self):
+        """
+        Forget the cached static informations (names, types, capabilities, command classes).
+        Called by the network on NodeProtocolInfo, NodeNaming and the end of the queries.
+
+        """
+        self._static_info = None
+
     @property
     def capabilities(self):
         """
@@ -260,12 +285,12 @@ class ZWaveNode(ZWaveObject,
     @property
     def neighbors(self):
         """
-        The neighbors of the node.
+        The neighbors of the node. They are cached by the topology of the network.
 
         :rtype: set()
 
         """
-        return self._network.manager.getNodeNeighbors(self.home_id, self.object_id)
+        return set(self._network.topology.get_neighbors(self.object_id))
 
     @property
     def num_groups(self):
@@ -297,18 +322,39 @@ class ZWaveNode(ZWaveObject,
         GetNumGroups returns 4, the _groupIdx value to use in calls to GetAssociations
         AddAssociation and RemoveAssociation will be a number between 1 and 4.
 
+        The groups are cached until invalidate_groups is called.
+
         :rtype: dict()
 
         """
-        groups = dict()
-        groups_added = 0
-        i = 1
-        while groups_added < self.num_groups and i<256:
-            if self.get_max_associations(i) > 0:
-                groups[i] = ZWaveGroup(i, network=self._network, node_id=self.node_id)
-                groups_added += 1
-            i += 1
-        return groups
+        groups = self._groups
+        if groups is None:
+            groups = dict()
+            num_groups = self.num_groups
+            i = 1
+            while len(groups) < num_groups and i<256:
+                if self.get_max_associations(i) > 0:
+                    groups[i] = ZWaveGroup(i, network=self._network, node_id=self.node_id)
+                i += 1
+            self._groups = groups
+        return dict(groups)
+
+    def invalidate_groups(self, groupidx=None):
+        """
+        Forget the cached groups. Called by the network when it receives a Group notification.
+
+        :param groupidx: Forget only the associations of this group. None to forget all the groups.
+        :type groupidx: int
+        :return: True if only the associations of the group were forgotten
+        :rtype: bool
+
+        """
+        groups = self._groups
+        if groupidx is not None and groups is not None and groupidx in groups:
+            groups[groupidx].invalidate()
+            return True
+        self._groups = None
+        return False
 
     def groups_to_dict(self, extras=['all']):
         """
@@ -334,11 +380,7 @@ class ZWaveNode(ZWaveObject,
         :rtype: set()
 
         """
-        command_classes = set()
-        for cls in self._network.manager.COMMAND_CLASS_DESC:
-            if self._network.manager.getNodeClassInformation(self.home_id, self.object_id, cls):
-                command_classes.add(cls)
-        return command_classes
+        return set(self._get_static_info()['command_classes'])
 
     @property
     def command_classes_as_string(self):
@@ -488,7 +530,10 @@ class ZWaveNode(ZWaveObject,
 
         """
         value = ZWaveValue(value_id, network=self.network, parent=self)
-        self.values[value_id] = value
+        #Copy on write : readers may iterate the old dict
+        values = dict(self.values)
+        values[value_id] = value
+        self.values = values
 
     def change_value(self, value_id):
         """
@@ -510,7 +555,7 @@ class ZWaveNode(ZWaveObject,
         :type value_id: int
 
         """
-        return self._network.manager.refreshValue(value_id)
+        return self._network.manager.refreshValue(value_id, homeid=self._network.home_id)
 
     def remove_value(self, value_id):
         """
@@ -524,7 +569,9 @@ class ZWaveNode(ZWaveObject,
         """
         if value_id in self.values:
             logger.debug("Remove value : %s", self.values[value_id])
-            del self.values[value_id]
+            values = dict(self.values)
+            del values[value_id]
+            self.values = values
             return True
         return False
 
@@ -567,7 +614,7 @@ class ZWaveNode(ZWaveObject,
         :rtype: str
 
         """
-        return self._network.manager.getNodeManufacturerId(self.home_id, self.object_id)
+        return self._get_static_info()['manufacturer_id']
 
     @property
     def manufacturer_name(self):
@@ -577,7 +624,7 @@ class ZWaveNode(ZWaveObject,
         :rtype: str
 
         """
-        return self._network.manager.getNodeManufacturerName(self.home_id, self.object_id)
+        return self._get_static_info()['manufacturer_name']
 
     @manufacturer_name.setter
     def manufacturer_name(self, value):
@@ -589,6 +636,7 @@ class ZWaveNode(ZWaveObject,
 
         """
         self._network.manager.setNodeManufacturerName(self.home_id, self.object_id, value)
+        self.invalidate_static_info()
 
     @property
     def generic(self):
@@ -598,7 +646,7 @@ class ZWaveNode(ZWaveObject,
         :rtype: int
 
         """
-        return self._network.manager.getNodeGeneric(self.home_id, self.object_id)
+        return self._get_static_info()['generic']
 
     @property
     def basic(self):
@@ -608,7 +656,7 @@ class ZWaveNode(ZWaveObject,
         :rtype: int
 
         """
-        return self._network.manager.getNodeBasic(self.home_id, self.object_id)
+        return self._get_static_info()['basic']
 
     @property
     def specific(self):
@@ -619,7 +667,7 @@ class ZWaveNode(ZWaveObject,
         :rtype: int
 
         """
-        return self._network.manager.getNodeSpecific(self.home_id, self.object_id)
+        return self._get_static_info()['specific']
 
     @property
     def security(self):
@@ -630,7 +678,7 @@ class ZWaveNode(ZWaveObject,
         :rtype: int
 
         """
-        return self._network.manager.getNodeSecurity(self.home_id, self.object_id)
+        return self._get_static_info()['security']
 
     @property
     def version(self):
@@ -641,7 +689,7 @@ class ZWaveNode(ZWaveObject,
         :rtype: int
 
         """
-        return self._network.manager.getNodeVersion(self.home_id, self.object_id)
+        return self._get_static_info()['version']
 
     @property
     def is_listening_device(self):
@@ -651,7 +699,7 @@ class ZWaveNode(ZWaveObject,
         :rtype: bool
 
         """
-        return self._network.manager.isNodeListeningDevice(self.home_id, self.object_id)
+        return self._get_static_info()['is_listening_device']
 
     @property
     def is_beaming_device(self):
@@ -661,7 +709,7 @@ class ZWaveNode(ZWaveObject,
         :rtype: bool
 
         """
-        return self._network.manager.isNodeBeamingDevice(self.home_id, self.object_id)
+        return self._get_static_info()['is_beaming_device']
 
     @property
     def is_frequent_listening_device(self):
@@ -671,7 +719,7 @@ class ZWaveNode(ZWaveObject,
         :rtype: bool
 
         """
-        return self._network.manager.isNodeFrequentListeningDevice(self.home_id, self.object_id)
+        return self._get_static_info()['is_frequent_listening_device']
 
     @property
     def is_security_device(self):
@@ -681,7 +729,7 @@ class ZWaveNode(ZWaveObject,
         :rtype: bool
 
         """
-        return self._network.manager.isNodeSecurityDevice(self.home_id, self.object_id)
+        return self._get_static_info()['is_security_device']
 
     @property
     def is_routing_device(self):
@@ -691,7 +739,7 @@ class ZWaveNode(ZWaveObject,
         :rtype: bool
 
         """
-        return self._network.manager.isNodeRoutingDevice(self.home_id, self.object_id)
+        return self._get_static_info()['is_routing_device']
 
     @property
     def is_zwave_plus(self):
@@ -701,7 +749,7 @@ class ZWaveNode(ZWaveObject,
         :rtype: bool
 
         """
-        return self._network.manager.isNodeZWavePlus(self.home_id, self.object_id)
+        return self._get_static_info()['is_zwave_plus']
 
     @property
     def is_locked(self):
@@ -766,7 +814,7 @@ class ZWaveNode(ZWaveObject,
         Get the maximum baud rate of a node
 
         """
-        return self._network.manager.getNodeMaxBaudRate(self.home_id, self.object_id)
+        return self._get_static_info()['max_baud_rate']
 
     def heal(self, upNodeRoute=False):
         """
@@ -825,6 +873,9 @@ class ZWaveNode(ZWaveObject,
 
         """
         logger.debug(u'refresh_info for node [%s]', self.object_id)
+        #The node is interviewed again : the min, max and items of its values may change
+        for value in self.values.values():
+            value.invalidate_validator()
         return self._network.manager.refreshNodeInfo(self.home_id, self.object_id)
 
     def request_state(self):
@@ -1055,7 +1106,7 @@ class ZWaveNode(ZWaveObject,
         Get a human-readable label describing the node
         :rtype: str
         """
-        return self._network.manager.getNodeType(self.home_id, self.object_id)
+        return self._get_static_info()['type']
 
     @property
     def stats(self):
@@ -0,0 +1,460 @@
+# -*- coding: utf-8 -*-
+"""
+.. module:: openzwave.polling
+
+This file is part of **python-openzwave** project https://github.com/OpenZWave/python-openzwave.
+    :platform: Unix, Windows, MacOS X
+    :sinopsis: openzwave API
+
+.. moduleauthor: bibi21000 aka Sébastien GALLET <bibi21000@gmail.com>
+
+License : GPL(v3)
+
+**python-openzwave** is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+**python-openzwave** is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with python-openzwave. If not, see http://www.gnu.org/licenses.
+
+"""
+import math
+import threading
+import time
+
+# Set default logging handler to avoid "No handler found" warnings.
+import logging
+try:  # Python 2.7+
+    from logging import NullHandler
+except ImportError:
+    class NullHandler(logging.Handler):
+        """NullHandler logger for python 2.6"""
+        def emit(self, record):
+            pass
+logger = logging.getLogger('openzwave')
+logger.addHandler(NullHandler())
+
+#time.monotonic is not available in python 2
+_clock = getattr(time, 'monotonic', time.time)
+
+#Driver statistics showing that the radio is struggling
+CONGESTION_STATS = ['retries', 'noack', 'netbusy', 'nondelivery', 'routedbusy', 'CANCnt', 'NAKCnt', 'dropped']
+
+class ZWavePolledValue(object):
+    """
+    The polling state of a value managed by the poller.
+
+    """
+
+    def __init__(self, value_id, min_intensity=1, max_intensity=32, max_age=3600):
+        """
+        Initialize the polling state
+
+        :param value_id: The id of the value
+        :type value_id: int
+        :param min_intensity: The minimal intensity (the fastest poll)
+        :type min_intensity: int
+        :param max_intensity: The maximal intensity (the slowest poll)
+        :type max_intensity: int
+        :param max_age: A value not polled and not updated since max_age seconds is polled again
+        :type max_age: float
+
+        """
+        self.value_id = value_id
+        self.min_intensity = min_intensity
+        self.max_intensity = max_intensity
+        self.max_age = max_age
+        self.intensity = 0
+        self.self_reporting = False
+        self.last_update = None
+        self.last_change = None
+        self.updates = 0
+        self.changes = 0
+        self.window_start = _clock()
+        self.report_interval = None
+
+    def __str__(self):
+        """
+        The string representation of the polling state.
+
+        :rtype: str
+
+        """
+        return u'value_id: [%s] intensity: [%s] self_reporting: [%s] report_interval: [%s]' % \
+          (self.value_id, self.intensity, self.self_reporting, self.report_interval)
+
+    @property
+    def is_polled(self):
+        """
+        Is the value polled by the poller.
+
+        :rtype: bool
+
+        """
+        return self.intensity > 0
+
+    @property
+    def age(self):
+        """
+        The number of seconds since the last update of the value. None if never updated.
+
+        :rtype: float
+
+        """
+        if self.last_update is None:
+            return None
+        return _clock() - self.last_update
+
+    def update(self, changed, now=None):
+        """
+        A notification has been received for the value.
+
+        :param changed: The data of the value has changed
+        :type changed: bool
+
+        """
+        if now is None:
+            now = _clock()
+        if self.last_update is not None:
+            interval = now - self.last_update
+            #Exponential moving average of the interval between reports
+            if self.report_interval is None:
+                self.report_interval = interval
+            else:
+                self.report_interval = 0.8 * self.report_interval + 0.2 * interval
+        self.last_update = now
+        self.updates += 1
+        if changed:
+            self.last_change = now
+            self.changes += 1
+
+    def reset_window(self, now=None):
+        """
+        Start a new observation window.
+
+        """
+        self.updates = 0
+        self.changes = 0
+        self.window_start = now if now is not None else _clock()
+
+    def to_dict(self, extras=['all']):
+        """
+        Return a dict representation of the polling state.
+
+        :param extras: The extra inforamtions to add
+        :type extras: []
+        :returns: A dict
+        :rtype: dict()
+
+        """
+        ret = {}
+        ret['value_id'] = self.value_id
+        ret['intensity'] = self.intensity
+        ret['self_reporting'] = self.self_reporting
+        ret['report_interval'] = self.report_interval
+        ret['age'] = self.age
+        return ret
+
+class ZWavePoller(object):
+    """
+    Adaptive polling of values.
+
+    Managed values are observed through their notifications :
+
+        - values that report on their own while polled are detected and
+          their poll is disabled. If they stay silent longer than max_age,
+          they are polled again.
+        - values that change at most polls are polled faster, values that
+          rarely change are polled slower.
+        - the sum of the polls is kept under an airtime budget (polls by
+          second) which is shrinked when the send queue of the controller is
+          long or when the driver statistics show retries, NAK, busy network, ...
+          The polls are slowed down first. When their max_intensity is
+          reached, the values which report on their own and then the ones
+          which have not changed for the longest time are not polled anymore.
+
+    The adjustments are made by a job of the network scheduler.
+
+    .. code-block:: python
+
+        network.poller.manage(value, max_intensity=10)
+
+    """
+
+    JOB_NAME = 'poller'
+
+    def __init__(self, network, budget=1.0, interval=60.0, max_queue=3, report_threshold=2):
+        """
+        Initialize the poller
+
+        :param network: The network
+        :type network: ZWaveNetwork
+        :param budget: The maximum number of polls by second
+        :type budget: float
+        :param interval: The interval between 2 adjustments in seconds
+        :type interval: float
+        :param max_queue: The budget is halved when the send queue is longer
+        :type max_queue: int
+        :param report_threshold: The number of unexpected updates needed to mark a value as self reporting
+        :type report_threshold: int
+
+        """
+        self._network = network
+        self.budget = budget
+        self.interval = interval
+        self.max_queue = max_queue
+        self.report_threshold = report_threshold
+        self._values = {}
+        self._lock = threading.RLock()
+        self._last_stats = None
+        self._last_load = 1.0
+
+    def __str__(self):
+        """
+        The string representation of the poller.
+
+        :rtype: str
+
+        """
+        return u'values: [%s] budget: [%s] load: [%s]' % \
+          (len(self._values), self.budget, self._last_load)
+
+    def start(self):
+        """
+        Start the adjustment job.
+
+        """
+        self._network.scheduler.add_job(self.JOB_NAME, self.adjust, self.interval, jitter=self.interval / 10.0, backpressure=True)
+
+    def stop(self):
+        """
+        Stop the adjustment job.
+
+        """
+        self._network.scheduler.remove_job(self.JOB_NAME)
+
+    @property
+    def values(self):
+        """
+        The polling states of the managed values.
+
+        :rtype: dict()
+
+        """
+        with self._lock:
+            return dict(self._values)
+
+    def manage(self, value, intensity=None, min_intensity=1, max_intensity=32, max_age=3600):
+        """
+        Let the poller manage the polling of a value.
+
+        :param value: The value or its id
+        :type value: ZWaveValue or int
+        :param intensity: The first intensity. None to use the current intensity of the value or max_intensity.
+        :type intensity: int
+        :param min_intensity: The minimal intensity (the fastest poll)
+        :type min_intensity: int
+        :param max_intensity: The maximal intensity (the slowest poll)
+        :type max_intensity: int
+        :param max_age: A value not polled and not updated since max_age seconds is polled again
+        :type max_age: float
+        :return: The polling state of the value
+        :rtype: ZWavePolledValue
+
+        """
+        value_id = getattr(value, 'value_id', value)
+        state = ZWavePolledValue(value_id, min_intensity=min_intensity, max_intensity=max_intensity, max_age=max_age)
+        if intensity is None:
+            intensity = self._network.manager.getPollIntensity(value_id, homeid=self._network.home_id)
+            if intensity <= 0:
+                intensity = max_intensity
+        intensity = max(min_intensity, min(max_intensity, intensity))
+        with self._lock:
+            self._values[value_id] = state
+        self._set_intensity(state, intensity)
+        return state
+
+    def unmanage(self, value, disable=False):
+        """
+        Stop managing the polling of a value.
+
+        :param value: The value or its id
+        :type value: ZWaveValue or int
+        :param disable: Disable the poll of the value
+        :type disable: bool
+        :return: True if the value was managed
+        :rtype: bool
+
+        """
+        value_id = getattr(value, 'value_id', value)
+        with self._lock:
+            state = self._values.pop(value_id, None)
+        if state is None:
+            return False
+        if disable and state.is_polled:
+            self._set_intensity(state, 0)
+        return True
+
+    def clear(self):
+        """
+        Forget all the managed values. Their poll is not modified.
+
+        """
+        with self._lock:
+            self._values = {}
+
+    def handle_update(self, value_id, changed):
+        """
+        A value has been updated from the network.
+        Called by the network for ValueChanged and ValueRefreshed notifications.
+
+        :param value_id: The id of the value
+        :type value_id: int
+        :param changed: The data of the value has changed
+        :type changed: bool
+
+        """
+        with self._lock:
+            state = self._values.get(value_id, None)
+            if state is not None:
+                state.update(changed)
+
+    def poll_cycle(self):
+        """
+        The estimated duration of a poll cycle, in seconds.
+
+        :rtype: float
+
+        """
+        interval = self._network.manager.getPollInterval() / 1000.0
+        if getattr(self._network, '_poll_interval_between', False):
+            with self._lock:
+                polled = len([1 for state in self._values.values() if state.is_polled])
+            return max(interval * max(polled, 1), 0.001)
+        return max(interval, 0.001)
+
+    def load_factor(self):
+        """
+        The part of the budget available, computed from the send queue and the driver statistics.
+
+        :rtype: float
+
+        """
+        factor = 1.0
+        try:
+            if self._network.controller.send_queue_count > self.max_queue:
+                factor *= 0.5
+            stats = self._network.controller.stats
+        except Exception:
+            logger.exception(u"Poller : can't retrieve driver statistics")
+            return factor
+        if self._last_stats is not None and stats:
+            written = stats.get('writeCnt', 0) - self._last_stats.get('writeCnt', 0)
+            errors = sum([stats.get(key, 0) - self._last_stats.get(key, 0) for key in CONGESTION_STATS])
+            if written > 0 and errors > 0.1 * written:
+                factor *= 0.5
+        self._last_stats = stats
+        return factor
+
+    def adjust(self):
+        """
+        Adjust the intensities of the managed values. Run by the scheduler.
+
+        """
+        now = _clock()
+        cycle = self.poll_cycle()
+        budget = self.budget * self.load_factor()
+        self._last_load = budget / self.budget if self.budget > 0 else 0.0
+        intensities = {}
+        with self._lock:
+            states = list(self._values.values())
+        for state in states:
+            intensities[state.value_id] = self._desired_intensity(state, now, cycle)
+        #Keep the polls under the budget
+        rate = self._rate(intensities, cycle)
+        if budget > 0 and rate > budget:
+            factor = rate / budget
+            for state in states:
+                if intensities[state.value_id] > 0:
+                    intensities[state.value_id] = min(state.max_intensity, int(math.ceil(intensities[state.value_id] * factor)))
+            #The clamped intensities may still be over the budget : stop polling the least useful values
+            rate = self._rate(intensities, cycle)
+            for state in sorted(states, key=self._usefulness):
+                if rate <= budget:
+                    break
+                if intensities[state.value_id] > 0:
+                    logger.debug(u"Poller : over budget, stop polling value %s", state.value_id)
+                    rate -= 1.0 / (intensities[state.value_id] * cycle)
+                    intensities[state.value_id] = 0
+        for state in states:
+            state.reset_window(now)
+            if intensities[state.value_id] != state.intensity:
+                self._set_intensity(state, intensities[state.value_id])
+        logger.debug(u"Poller adjusted : %s", self)
+
+    def _rate(self, intensities, cycle):
+        """
+        The number of polls by second for the intensities.
+
+        """
+        return sum([1.0 / (intensity * cycle) for intensity in intensities.values() if intensity > 0])
+
+    def _usefulness(self, state):
+        """
+        The sort key of the values to stop polling when over the budget :
+        the values known to report on their own, then the ones which
+        have not changed for the longest time.
+
+        """
+        return (not state.self_reporting, state.last_change is not None, state.last_change or 0.0)
+
+    def _desired_intensity(self, state, now, cycle):
+        """
+        Compute the intensity wanted for a value from the last observation window.
+
+        """
+        window = now - state.window_start
+        if not state.is_polled:
+            if state.updates > 0:
+                state.self_reporting = True
+                return 0
+            if state.self_reporting and (state.age is None or state.age < state.max_age):
+                return 0
+            #The value is silent : poll it again
+            logger.debug(u"Poller : value %s is silent, poll it again", state.value_id)
+            state.self_reporting = False
+            return state.max_intensity
+        expected = window / (state.intensity * cycle)
+        if state.updates - expected >= self.report_threshold and state.updates > 1.5 * expected:
+            logger.debug(u"Poller : value %s reports on its own, disable poll", state.value_id)
+            state.self_reporting = True
+            return 0
+        if state.updates == 0:
+            return state.intensity
+        ratio = float(state.changes) / state.updates
+        if ratio > 0.5:
+            return max(state.min_intensity, state.intensity // 2)
+        if ratio < 0.1:
+            return min(state.max_intensity, state.intensity * 2)
+        return state.intensity
+
+    def _set_intensity(self, state, intensity):
+        """
+        Send the intensity to the manager.
+
+        """
+        try:
+            if intensity <= 0:
+                self._network.manager.disablePoll(state.value_id, homeid=self._network.home_id)
+            elif state.is_polled:
+                self._network.manager.setPollIntensity(state.value_id, intensity, homeid=self._network.home_id)
+            else:
+                self._network.manager.enablePoll(state.value_id, intensity, homeid=self._network.home_id)
+            state.intensity = intensity
+        except Exception:
+            logger.exception(u"Poller : can't set intensity of value %s", state.value_id)
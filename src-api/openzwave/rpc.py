@@ -0,0 +1,946 @@
+# -*- coding: utf-8 -*-
+"""
+.. module:: openzwave.rpc
+
+This file is part of **python-openzwave** project https://github.com/OpenZWave/python-openzwave.
+    :platform: Unix, Windows, MacOS X
+    :sinopsis: openzwave API
+
+.. moduleauthor: bibi21000 aka Sébastien GALLET <bibi21000@gmail.com>
+
+License : GPL(v3)
+
+**python-openzwave** is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+**python-openzwave** is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with python-openzwave. If not, see http://www.gnu.org/licenses.
+
+"""
+import json
+import os
+import socket
+import struct
+import threading
+import time
+import six
+from six.moves import queue
+if six.PY3:
+    from pydispatch import dispatcher
+else:
+    from louie import dispatcher
+from openzwave.object import ZWaveException
+from openzwave.serializer import json_default
+from openzwave.sendqueue import node_id_from_value_id, PRIORITY_INTERACTIVE, PRIORITY_AUTOMATION, PRIORITY_MAINTENANCE
+
+# Set default logging handler to avoid "No handler found" warnings.
+import logging
+try:  # Python 2.7+
+    from logging import NullHandler
+except ImportError:
+    class NullHandler(logging.Handler):
+        """NullHandler logger for python 2.6"""
+        def emit(self, record):
+            pass
+logger = logging.getLogger('openzwave')
+logger.addHandler(NullHandler())
+
+try:
+    import msgpack
+    #msgpack < 1.0 does not know strict_map_key
+    _UNPACK_KWARGS = {'raw': False}
+    if msgpack.version >= (1, 0):
+        _UNPACK_KWARGS['strict_map_key'] = False
+except ImportError:
+    msgpack = None
+    logger.warning('msgpack is not installed : the rpc uses json')
+
+#time.monotonic is not available in python 2
+_clock = getattr(time, 'monotonic', time.time)
+
+CODEC_MSGPACK = b'M'
+CODEC_JSON = b'J'
+
+_FRAME = struct.Struct('>I')
+
+def encode(obj, codec=None):
+    """
+    Encode a message. The first byte of the result is the codec.
+
+    :param obj: The message
+    :type obj: dict() or list()
+    :param codec: CODEC_MSGPACK or CODEC_JSON. Default to msgpack if it is installed.
+    :type codec: bytes
+    :rtype: bytes
+
+    """
+    if codec is None:
+        codec = CODEC_MSGPACK if msgpack is not None else CODEC_JSON
+    if codec == CODEC_MSGPACK:
+        return codec + msgpack.packb(obj, use_bin_type=True, default=json_default)
+    return CODEC_JSON + json.dumps(obj, default=json_default).encode('utf-8')
+
+def decode(payload):
+    """
+    Decode a message.
+
+    :param payload: The frame
+    :type payload: bytes
+    :return: The codec and the message
+    :rtype: (bytes, object)
+
+    """
+    codec = payload[:1]
+    if codec == CODEC_MSGPACK:
+        if msgpack is None:
+            raise ValueError(u"msgpack is not installed")
+        return codec, msgpack.unpackb(payload[1:], **_UNPACK_KWARGS)
+    if codec == CODEC_JSON:
+        return codec, json.loads(payload[1:].decode('utf-8'))
+    raise ValueError(u"Unknown codec %r" % codec)
+
+def make_socket(address):
+    """
+    Create a socket for an address : a path for a Unix socket, a (host, port) tuple for TCP.
+
+    :param address: The address
+    :type address: str or tuple
+    :rtype: socket.socket
+
+    """
+    if isinstance(address, six.string_types):
+        return socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    return socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+
+def _recv_exactly(sock, size):
+    """
+    Read size bytes from a socket. Return None when the socket is closed.
+
+    """
+    chunks = []
+    while size > 0:
+        chunk = sock.recv(size)
+        if not chunk:
+            return None
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b''.join(chunks)
+
+def send_frame(sock, payload):
+    """
+    Send a length prefixed frame.
+
+    :param sock: The socket
+    :type sock: socket.socket
+    :param payload: The frame
+    :type payload: bytes
+
+    """
+    sock.sendall(_FRAME.pack(len(payload)) + payload)
+
+def recv_frame(sock):
+    """
+    Receive a length prefixed frame.
+
+    :param sock: The socket
+    :type sock: socket.socket
+    :return: The frame or None when the socket is closed
+    :rtype: bytes
+
+    """
+    header = _recv_exactly(sock, _FRAME.size)
+    if header is None:
+        return None
+    return _recv_exactly(sock, _FRAME.unpack(header)[0])
+
+class ZWaveRpcSubscription(object):
+    """
+    The events a client wants to receive. Empty filters match everything.
+
+    """
+
+    def __init__(self, sub_id, signals=None, node_ids=None, value_ids=None):
+        """
+        Initialize a subscription
+
+        :param sub_id: The id of the subscription
+        :type sub_id: int
+        :param signals: The signals to receive
+        :type signals: list()
+        :param node_ids: Only receive the events of these nodes
+        :type node_ids: list()
+        :param value_ids: Only receive the events of these values
+        :type value_ids: list()
+
+        """
+        self.sub_id = sub_id
+        self.signals = set(signals) if signals else None
+        self.node_ids = set(node_ids) if node_ids else None
+        self.value_ids = set(value_ids) if value_ids else None
+
+    def match(self, signal, node_id, value_id):
+        """
+        Check an event against the filters.
+
+        :rtype: bool
+
+        """
+        if self.signals is not None and signal not in self.signals:
+            return False
+        if self.node_ids is not None and node_id not in self.node_ids:
+            return False
+        if self.value_ids is not None and value_id not in self.value_ids:
+            return False
+        return True
+
+class ZWaveRpcConnection(object):
+    """
+    A client of the server.
+
+    Responses and events are sent by a dedicated thread, so a slow client
+    never blocks the notification thread : events are dropped when its
+    queue is full.
+
+    """
+
+    def __init__(self, server, sock, max_events=1000):
+        """
+        Initialize the connection
+
+        :param server: The server
+        :type server: ZWaveRpcServer
+        :param sock: The socket of the client
+        :type sock: socket.socket
+        :param max_events: The maximum number of events waiting to be sent
+        :type max_events: int
+
+        """
+        self._server = server
+        self._sock = sock
+        self._queue = queue.Queue(max_events)
+        self.codec = None
+        self.subscriptions = {}
+        self.dropped = 0
+        self._running = False
+
+    def start(self):
+        """
+        Start the threads of the connection.
+
+        """
+        self._running = True
+        for target, name in ((self._read, 'openzwave.rpc.read'), (self._write, 'openzwave.rpc.write')):
+            thread = threading.Thread(target=target, name=name)
+            thread.daemon = True
+            thread.start()
+
+    def close(self):
+        """
+        Close the connection.
+
+        """
+        if not self._running:
+            return
+        self._running = False
+        try:
+            self._sock.shutdown(socket.SHUT_RDWR)
+        except socket.error:
+            pass
+        self._sock.close()
+        try:
+            self._queue.put_nowait(None)
+        except queue.Full:
+            pass
+        self._server._remove_connection(self)
+
+    def send(self, message):
+        """
+        Queue a response.
+
+        """
+        self._queue.put(message)
+
+    def send_event(self, message):
+        """
+        Queue an event. Drop it if the client is too slow.
+
+        """
+        try:
+            self._queue.put_nowait(message)
+        except queue.Full:
+            self.dropped += 1
+
+    def _read(self):
+        """
+        Read and execute the requests.
+
+        """
+        try:
+            while self._running:
+                frame = recv_frame(self._sock)
+                if frame is None:
+                    break
+                self.codec, request = decode(frame)
+                if isinstance(request, list):
+                    self.send([self._server.execute(item, self) for item in request])
+                else:
+                    self.send(self._server.execute(request, self))
+        except (socket.error, ValueError):
+            logger.debug(u"Rpc : client disconnected", exc_info=True)
+        finally:
+            self.close()
+
+    def _write(self):
+        """
+        Send the responses and the events.
+
+        """
+        try:
+            while self._running:
+                message = self._queue.get()
+                if message is None:
+                    break
+                send_frame(self._sock, encode(message, self.codec))
+        except socket.error:
+            logger.debug(u"Rpc : client disconnected", exc_info=True)
+            self.close()
+
+class ZWaveRpcServer(object):
+    """
+    Expose the network to local processes.
+
+    Requests are length prefixed frames, encoded with msgpack (or json when it is
+    not installed). A request is a dict with the id, method and params keys. A list
+    of requests is a batch : it is executed in order and answered by a list of
+    responses in a single frame. Events of the subscriptions are sent as dicts with
+    the event, sub and data keys.
+
+    .. code-block:: python
+
+        server = ZWaveRpcServer(network, '/tmp/pyozw.sock')
+        server.start()
+
+        client = ZWaveRpcClient('/tmp/pyozw.sock')
+        client.batch([('set_value', {'value_id': id1, 'data': 50}), ('get_values', {'value_ids': [id2, id3]})])
+
+    """
+
+    def __init__(self, network, address, max_events=1000):
+        """
+        Initialize the server
+
+        :param network: The network
+        :type network: ZWaveNetwork
+        :param address: A path for a Unix socket, a (host, port) tuple for TCP
+        :type address: str or tuple
+        :param max_events: The maximum number of events waiting to be sent to a client
+        :type max_events: int
+
+        """
+        self._network = network
+        self.address = address
+        self.max_events = max_events
+        self._server = None
+        self._thread = None
+        self._connections = []
+        self._lock = threading.Lock()
+        self._counter = 0
+        self._running = False
+        self._methods = {
+            'ping': self._rpc_ping,
+            'network': self._rpc_network,
+            'nodes': self._rpc_nodes,
+            'node': self._rpc_node,
+            'changes_since': self._rpc_changes_since,
+            'values': self._rpc_values,
+            'get_values': self._rpc_get_values,
+            'set_value': self._rpc_set_value,
+            'set_values': self._rpc_set_values,
+            'refresh_value': self._rpc_refresh_value,
+            'refresh_values': self._rpc_refresh_values,
+            'request_node_state': self._rpc_request_node_state,
+            'request_all_config_params': self._rpc_request_all_config_params,
+            'subscribe': self._rpc_subscribe,
+            'unsubscribe': self._rpc_unsubscribe,
+        }
+        self._signals = [network.SIGNAL_VALUE_ADDED, network.SIGNAL_VALUE_CHANGED,
+                         network.SIGNAL_VALUE_REFRESHED, network.SIGNAL_VALUE_REMOVED,
+                         network.SIGNAL_NODE_ADDED, network.SIGNAL_NODE_REMOVED,
+                         network.SIGNAL_NODE_EVENT, network.SIGNAL_SCENE_EVENT,
+                         network.SIGNAL_NETWORK_READY, network.SIGNAL_NETWORK_STOPPED]
+
+    def __str__(self):
+        """
+        The string representation of the server.
+
+        :rtype: str
+
+        """
+        return u'address: [%s] clients: [%s]' % (self.address, len(self._connections))
+
+    @property
+    def is_running(self):
+        """
+        Is the server running.
+
+        :rtype: bool
+
+        """
+        return self._running
+
+    def register(self, name, method):
+        """
+        Add a method to the server.
+
+        :param name: The name of the method
+        :type name: str
+        :param method: The function. Its keyword arguments are the params of the requests.
+        :type method: callable
+
+        """
+        self._methods[name] = method
+
+    def start(self):
+        """
+        Listen for the clients.
+
+        """
+        if self._running:
+            return
+        if isinstance(self.address, six.string_types) and os.path.exists(self.address):
+            os.unlink(self.address)
+        self._server = make_socket(self.address)
+        if not isinstance(self.address, six.string_types):
+            self._server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._server.bind(self.address)
+        self._server.listen(5)
+        for signal in self._signals:
+            dispatcher.connect(self._louie_event, signal)
+        self._running = True
+        self._thread = threading.Thread(target=self._accept, name='openzwave.rpc')
+        self._thread.daemon = True
+        self._thread.start()
+        logger.info(u"Rpc server started : %s", self)
+
+    def stop(self):
+        """
+        Stop listening and disconnect the clients.
+
+        """
+        if not self._running:
+            return
+        self._running = False
+        for signal in self._signals:
+            dispatcher.disconnect(self._louie_event, signal)
+        try:
+            self._server.shutdown(socket.SHUT_RDWR)
+        except socket.error:
+            pass
+        self._server.close()
+        for connection in self.connections:
+            connection.close()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(5.0)
+        self._thread = None
+        if isinstance(self.address, six.string_types) and os.path.exists(self.address):
+            os.unlink(self.address)
+        logger.info(u"Rpc server stopped : %s", self)
+
+    @property
+    def connections(self):
+        """
+        The connected clients.
+
+        :rtype: list()
+
+        """
+        with self._lock:
+            return list(self._connections)
+
+    def _remove_connection(self, connection):
+        """
+        Forget a closed connection.
+
+        """
+        with self._lock:
+            if connection in self._connections:
+                self._connections.remove(connection)
+
+    def _accept(self):
+        """
+        Accept the clients.
+
+        """
+        while self._running:
+            try:
+                sock, addr = self._server.accept()
+            except socket.error:
+                break
+            connection = ZWaveRpcConnection(self, sock, max_events=self.max_events)
+            with self._lock:
+                self._connections.append(connection)
+            connection.start()
+
+    def execute(self, request, connection=None):
+        """
+        Execute a request.
+
+        :param request: A dict with the id, method and params keys
+        :type request: dict()
+        :param connection: The connection of the client
+        :type connection: ZWaveRpcConnection
+        :return: A dict with the id and the result or error keys
+        :rtype: dict()
+
+        """
+        if not isinstance(request, dict):
+            return {'id': None, 'error': u"Bad request"}
+        response = {'id': request.get('id', None)}
+        method = self._methods.get(request.get('method', None), None)
+        if method is None:
+            response['error'] = u"Unknown method %s" % request.get('method', None)
+            return response
+        params = request.get('params', None) or {}
+        if method in (self._rpc_subscribe, self._rpc_unsubscribe):
+            params = dict(params, connection=connection)
+        try:
+            response['result'] = method(**params)
+        except Exception as e:
+            logger.debug(u"Rpc : error in request %s", request, exc_info=True)
+            response['error'] = six.text_type(e)
+        return response
+
+    def _get_node(self, node_id):
+        """
+        Retrieve a node of the network.
+
+        """
+        nodes = self._network.nodes
+        if nodes is None or node_id not in nodes:
+            raise ZWaveException(u"Unknown node %s" % node_id)
+        return nodes[node_id]
+
+    def _get_value(self, value_id):
+        """
+        Retrieve a value of the network. Return None if it is unknown.
+
+        """
+        nodes = self._network.nodes
+        if nodes is None:
+            return None
+        node = nodes.get(node_id_from_value_id(value_id), None)
+        if node is None:
+            return None
+        return node.values.get(value_id, None)
+
+    def _louie_event(self, signal=None, sender=None, **kwargs):
+        """
+        Send an event to the matching subscriptions.
+
+        """
+        if kwargs.get('network', None) is not self._network:
+            return
+        node = kwargs.get('node', None)
+        value = kwargs.get('value', None)
+        node_id = node.node_id if node is not None else kwargs.get('node_id', None)
+        value_id = value.value_id if value is not None else kwargs.get('valueId', None)
+        data = None
+        for connection in self.connections:
+            for sub in list(connection.subscriptions.values()):
+                if not sub.match(signal, node_id, value_id):
+                    continue
+                if data is None:
+                    data = {'node_id': node_id, 'value_id': value_id}
+                    if value is not None:
+                        data['data'] = value.data
+                    for key in ('event', 'scene_id'):
+                        if key in kwargs:
+                            data[key] = kwargs[key]
+                connection.send_event({'event': signal, 'sub': sub.sub_id, 'data': data})
+
+    def _rpc_ping(self):
+        """
+        Check the connection.
+
+        """
+        return True
+
+    def _rpc_network(self):
+        """
+        The state of the network.
+
+        """
+        return {'home_id': self._network.home_id, 'state': self._network.state,
+                'state_str': self._network.state_str, 'nodes_count': self._network.nodes_count}
+
+    def _rpc_nodes(self, extras=None):
+        """
+        The nodes of the network.
+
+        """
+        nodes = self._network.nodes or {}
+        return [nodes[node_id].to_dict(extras=extras or []) for node_id in list(nodes.keys())]
+
+    def _rpc_changes_since(self, seq, extras=None):
+        """
+        The changes of the network since a sequence number.
+
+        """
+        return self._network.changes_since(seq, extras=extras or ['all'])
+
+    def _rpc_node(self, node_id, extras=None):
+        """
+        A node of the network.
+
+        """
+        return self._get_node(node_id).to_dict(extras=extras or ['all'])
+
+    def _rpc_values(self, node_id, genre='All'):
+        """
+        The values of a node.
+
+        """
+        values = self._get_node(node_id).get_values(genre=genre)
+        return [values[value_id].to_dict(extras=[]) for value_id in values]
+
+    def _rpc_get_values(self, value_ids):
+        """
+        The data of many values. Unknown values are None.
+
+        """
+        ret = []
+        for value_id in value_ids:
+            value = self._get_value(value_id)
+            ret.append(value.data if value is not None else None)
+        return ret
+
+    def _rpc_set_value(self, value_id, data, priority=PRIORITY_INTERACTIVE):
+        """
+        Change the data of a value.
+
+        """
+        self._network.send_queue.set_value(value_id, data, priority=priority)
+        return True
+
+    def _rpc_set_values(self, values, priority=PRIORITY_INTERACTIVE):
+        """
+        Change the data of many values : a list of (value_id, data).
+
+        """
+        for value_id, data in values:
+            self._network.send_queue.set_value(value_id, data, priority=priority)
+        return len(values)
+
+    def _rpc_refresh_value(self, value_id, priority=PRIORITY_AUTOMATION):
+        """
+        Refresh a value.
+
+        """
+        self._network.send_queue.refresh_value(value_id, priority=priority)
+        return True
+
+    def _rpc_refresh_values(self, value_ids, priority=PRIORITY_AUTOMATION):
+        """
+        Refresh many values.
+
+        """
+        for value_id in value_ids:
+            self._network.send_queue.refresh_value(value_id, priority=priority)
+        return len(value_ids)
+
+    def _rpc_request_node_state(self, node_id, priority=PRIORITY_MAINTENANCE):
+        """
+        Request the state of a node.
+
+        """
+        self._network.send_queue.request_node_state(node_id, priority=priority)
+        return True
+
+    def _rpc_request_all_config_params(self, node_id, priority=PRIORITY_MAINTENANCE):
+        """
+        Request the configuration parameters of a node.
+
+        """
+        self._network.send_queue.request_all_config_params(node_id, priority=priority)
+        return True
+
+    def _rpc_subscribe(self, connection, signals=None, node_ids=None, value_ids=None):
+        """
+        Subscribe to events. Return the id of the subscription.
+
+        """
+        if connection is None:
+            raise ZWaveException(u"Subscriptions need a connection")
+        with self._lock:
+            self._counter += 1
+            sub_id = self._counter
+        connection.subscriptions[sub_id] = ZWaveRpcSubscription(sub_id, signals=signals, node_ids=node_ids, value_ids=value_ids)
+        return sub_id
+
+    def _rpc_unsubscribe(self, connection, sub_id):
+        """
+        Remove a subscription.
+
+        """
+        if connection is None:
+            raise ZWaveException(u"Subscriptions need a connection")
+        return connection.subscriptions.pop(sub_id, None) is not None
+
+class ZWaveRpcClient(object):
+    """
+    A client of the rpc server. It can be shared between threads.
+
+    """
+
+    def __init__(self, address, codec=None, timeout=10.0):
+        """
+        Initialize the client
+
+        :param address: The address of the server
+        :type address: str or tuple
+        :param codec: CODEC_MSGPACK or CODEC_JSON. Default to msgpack if it is installed.
+        :type codec: bytes
+        :param timeout: The timeout of the requests in seconds
+        :type timeout: float
+
+        """
+        self.address = address
+        self.codec = codec
+        self.timeout = timeout
+        self._sock = None
+        self._lock = threading.Lock()
+        self._condition = threading.Condition(threading.Lock())
+        self._responses = {}
+        self._callbacks = {}
+        #The subscriptions waiting for their response : request id -> callback
+        self._subscribing = {}
+        #The events received before the response of their subscription
+        self._early_events = {}
+        self._counter = 0
+
+    def connect(self):
+        """
+        Connect to the server. Called by the first request.
+
+        """
+        with self._lock:
+            if self._sock is not None:
+                return
+            sock = make_socket(self.address)
+            sock.connect(self.address)
+            self._sock = sock
+        thread = threading.Thread(target=self._read, args=(sock,), name='openzwave.rpc.client')
+        thread.daemon = True
+        thread.start()
+
+    def close(self):
+        """
+        Close the connection.
+
+        """
+        with self._lock:
+            sock = self._sock
+            self._sock = None
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except socket.error:
+                pass
+            sock.close()
+
+    def _read(self, sock):
+        """
+        Read the responses and dispatch the events.
+
+        """
+        try:
+            while True:
+                frame = recv_frame(sock)
+                if frame is None:
+                    break
+                codec, message = decode(frame)
+                if isinstance(message, dict) and 'event' in message:
+                    sub_id = message.get('sub', None)
+                    callback = self._callbacks.get(sub_id, None)
+                    if callback is not None:
+                        self._dispatch(callback, message)
+                    elif self._subscribing:
+                        #The server may send the events before the response of the subscription
+                        self._early_events.setdefault(sub_id, []).append(message)
+                    continue
+                if isinstance(message, dict):
+                    key = message.get('id', None)
+                elif isinstance(message, list) and message and isinstance(message[0], dict):
+                    key = message[0].get('id', None)
+                else:
+                    logger.warning(u"Rpc client : malformed frame %r", message)
+                    continue
+                callback = self._subscribing.pop(key, None)
+                if callback is not None and isinstance(message, dict) and 'result' in message:
+                    #Register the subscription before the caller gets its response
+                    self._callbacks[message['result']] = callback
+                    for event in self._early_events.pop(message['result'], []):
+                        self._dispatch(callback, event)
+                if not self._subscribing:
+                    self._early_events.clear()
+                with self._condition:
+                    self._responses[key] = message
+                    self._condition.notify_all()
+        except (socket.error, ValueError):
+            logger.debug(u"Rpc client : connection closed", exc_info=True)
+        finally:
+            with self._lock:
+                if self._sock is sock:
+                    self._sock = None
+            with self._condition:
+                self._condition.notify_all()
+
+    def _dispatch(self, callback, message):
+        """
+        Call the callback of a subscription with an event.
+
+        """
+        try:
+            callback(message['event'], message['data'])
+        except Exception:
+            logger.exception(u"Rpc client : error in callback")
+
+    def _request(self, requests):
+        """
+        Send a request (or a batch) and wait for the response.
+
+        """
+        self.connect()
+        key = requests[0]['id'] if isinstance(requests, list) else requests['id']
+        with self._lock:
+            sock = self._sock
+            if sock is None:
+                raise ZWaveException(u"Connection closed by the server")
+            send_frame(sock, encode(requests, self.codec))
+        with self._condition:
+            end = _clock() + self.timeout
+            while key not in self._responses:
+                if self._sock is not sock:
+                    raise ZWaveException(u"Connection closed by the server")
+                remaining = end - _clock()
+                if remaining <= 0:
+                    raise ZWaveException(u"Timeout waiting for the server")
+                self._condition.wait(remaining)
+            return self._responses.pop(key)
+
+    def _new_request(self, method, params):
+        """
+        Build a request.
+
+        """
+        with self._lock:
+            self._counter += 1
+            return {'id': self._counter, 'method': method, 'params': params}
+
+    def call(self, method, **params):
+        """
+        Call a method of the server.
+
+        :param method: The name of the method
+        :type method: str
+        :return: The result of the method
+        :raises: ZWaveException if the method failed
+
+        """
+        response = self._request(self._new_request(method, params))
+        if 'error' in response:
+            raise ZWaveException(response['error'])
+        return response['result']
+
+    def batch(self, calls):
+        """
+        Call many methods in a single round trip.
+
+        :param calls: A list of (method, params)
+        :type calls: list()
+        :return: The results, in the same order. A failed call returns a ZWaveException instead of raising it.
+        :rtype: list()
+
+        """
+        if not calls:
+            return []
+        requests = [self._new_request(method, params or {}) for method, params in calls]
+        responses = self._request(requests)
+        return [ZWaveException(response['error']) if 'error' in response else response['result'] for response in responses]
+
+    def get_values(self, value_ids):
+        """
+        Retrieve the data of many values.
+
+        :param value_ids: The ids of the values
+        :type value_ids: list()
+        :rtype: list()
+
+        """
+        return self.call('get_values', value_ids=list(value_ids))
+
+    def set_value(self, value_id, data):
+        """
+        Change the data of a value.
+
+        :param value_id: The id of the value
+        :type value_id: int
+        :param data: The new data
+        :type data: depending of the type of the value
+
+        """
+        return self.call('set_value', value_id=value_id, data=data)
+
+    def refresh_value(self, value_id):
+        """
+        Refresh a value from the network.
+
+        :param value_id: The id of the value
+        :type value_id: int
+
+        """
+        return self.call('refresh_value', value_id=value_id)
+
+    def subscribe(self, callback, signals=None, node_ids=None, value_ids=None):
+        """
+        Subscribe to events. The filters are applied by the server.
+
+        :param callback: Called with the signal and the data of each event, in the reader thread
+        :type callback: callable
+        :param signals: The signals to receive. All the signals if None.
+        :type signals: list()
+        :param node_ids: Only receive the events of these nodes
+        :type node_ids: list()
+        :param value_ids: Only receive the events of these values
+        :type value_ids: list()
+        :return: The id of the subscription
+        :rtype: int
+
+        """
+        request = self._new_request('subscribe', {'signals': signals, 'node_ids': node_ids, 'value_ids': value_ids})
+        self._subscribing[request['id']] = callback
+        try:
+            response = self._request(request)
+        finally:
+            self._subscribing.pop(request['id'], None)
+        if 'error' in response:
+            raise ZWaveException(response['error'])
+        self._callbacks[response['result']] = callback
+        return response['result']
+
+    def unsubscribe(self, sub_id):
+        """
+        Remove a subscription.
+
+        :param sub_id: The id of the subscription
+        :type sub_id: int
+
+        """
+        self._callbacks.pop(sub_id, None)
+        return self.call('unsubscribe', sub_id=sub_id)
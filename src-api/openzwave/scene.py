@@ -40,6 +40,9 @@ logger.addHandler(NullHandler())
 class ZWaveScene(ZWaveObject):
     """
     Represents a single scene within the Z-Wave Network
+
+    The label and the values of the scene are read once from the manager,
+    then updated by the methods of the scene.
     """
 
     def __init__(self, scene_id, network):
@@ -55,6 +58,8 @@ class ZWaveScene(ZWaveObject):
         ZWaveObject.__init__(self, scene_id, network)
         logger.debug(u"Create object scene (scene_id:%s)", scene_id)
         self.values = dict()
+        self._label = None
+        self._values = None
 
     def __str__(self):
         """
@@ -83,7 +88,9 @@ class ZWaveScene(ZWaveObject):
         :rtype: str
 
         """
-        return self._network.manager.getSceneLabel(self.object_id)
+        if self._label is None:
+            self._label = self._network.manager.getSceneLabel(self.object_id)
+        return self._label
 
     @label.setter
     def label(self, value):
@@ -95,6 +102,7 @@ class ZWaveScene(ZWaveObject):
 
         """
         self._network.manager.setSceneLabel(self.object_id, value)
+        self._label = value
 
     def create(self, label=None):
         """
@@ -110,6 +118,7 @@ class ZWaveScene(ZWaveObject):
         scene_id = self._network.manager.createScene()
         if scene_id != 0:
             self._object_id = scene_id
+            self._values = dict()
             if label is not None:
                 self.label = label
         return scene_id
@@ -124,8 +133,10 @@ class ZWaveScene(ZWaveObject):
         :type value_data: variable
 
         """
-        ret = self._network.manager.addSceneValue(self.scene_id, value_id, value_data)
+        ret = self._network.manager.addSceneValue(self.scene_id, value_id, value_data, homeid=self._network.home_id)
         if ret == 1:
+            if self._values is not None:
+                self._values[value_id] = value_data
             return True
         return False
 
@@ -139,11 +150,34 @@ class ZWaveScene(ZWaveObject):
         :type value_data: variable
 
         """
-        ret = self._network.manager.setSceneValue(self.scene_id, value_id, value_data)
+        ret = self._network.manager.setSceneValue(self.scene_id, value_id, value_data, homeid=self._network.home_id)
         if ret == 1:
+            if self._values is not None:
+                self._values[value_id] = value_data
             return True
         return False
 
+    def _get_scene_values(self):
+        """
+        The data of the values of the scene, read once from the manager.
+
+        :returns: A dict of data : {value_id=data, ...}.
+        :rtype: dict()
+
+        """
+        if self._values is None:
+            values = self._network.manager.sceneGetValues(self.scene_id)
+            self._values = dict(values) if values is not None else dict()
+        return self._values
+
+    def invalidate(self):
+        """
+        Forget the cached label and values. They will be read from the manager on the next access.
+
+        """
+        self._label = None
+        self._values = None
+
     def get_values(self):
         """
         Get all the values of the scene
@@ -153,9 +187,7 @@ class ZWaveScene(ZWaveObject):
 
         """
         ret = dict()
-        values = self._network.manager.sceneGetValues(self.scene_id)
-        if values is None:
-            return ret
+        values = dict(self._get_scene_values())
         for val in values:
             value = self._network.get_value(val)
             ret[val] = {'value':value, 'data':values[val]}
@@ -170,9 +202,7 @@ class ZWaveScene(ZWaveObject):
 
         """
         ret = dict()
-        values = self._network.manager.sceneGetValues(self.scene_id)
-        if values is None:
-            return ret
+        values = dict(self._get_scene_values())
         for val in values:
             value = self._network.get_value(val)
             if value is not None:
@@ -191,7 +221,10 @@ class ZWaveScene(ZWaveObject):
         :rtype: bool
 
         """
-        return self._network.manager.removeSceneValue(self.scene_id, value_id)
+        ret = self._network.manager.removeSceneValue(self.scene_id, value_id, homeid=self._network.home_id)
+        if ret and self._values is not None:
+            self._values.pop(value_id, None)
+        return ret
 
     def activate(self):
         """
@@ -203,6 +236,26 @@ class ZWaveScene(ZWaveObject):
         """
         return self._network.manager.activateScene(self.object_id)
 
+    def execute(self, priority=None, timeout=None, callback=None):
+        """
+        Execute the scene with the scene engine of the network instead of the lib.
+        The values are sent node by node through the send queue and
+        the run tells when all of them are confirmed.
+
+        :param priority: The priority of the commands. Default to interactive.
+        :type priority: int
+        :param timeout: The time in seconds to wait for the confirmations
+        :type timeout: float
+        :param callback: A function called with the run when it is finished
+        :type callback: callable
+        :returns: The run
+        :rtype: ZWaveSceneRun
+
+        """
+        if priority is None:
+            return self._network.scene_engine.execute(self, timeout=timeout, callback=callback)
+        return self._network.scene_engine.execute(self, priority=priority, timeout=timeout, callback=callback)
+
     def to_dict(self, extras=['kvals']):
         """
         Return a dict representation of the node.
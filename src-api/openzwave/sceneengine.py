@@ -0,0 +1,383 @@
+# -*- coding: utf-8 -*-
+"""
+.. module:: openzwave.sceneengine
+
+This file is part of **python-openzwave** project https://github.com/OpenZWave/python-openzwave.
+    :platform: Unix, Windows, MacOS X
+    :sinopsis: openzwave API
+
+.. moduleauthor: bibi21000 aka Sébastien GALLET <bibi21000@gmail.com>
+
+License : GPL(v3)
+
+**python-openzwave** is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+**python-openzwave** is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with python-openzwave. If not, see http://www.gnu.org/licenses.
+
+"""
+import threading
+import time
+import six
+if six.PY3:
+    from pydispatch import dispatcher
+else:
+    from louie import dispatcher
+from openzwave.sendqueue import node_id_from_value_id, PRIORITY_INTERACTIVE
+
+# Set default logging handler to avoid "No handler found" warnings.
+import logging
+try:  # Python 2.7+
+    from logging import NullHandler
+except ImportError:
+    class NullHandler(logging.Handler):
+        """NullHandler logger for python 2.6"""
+        def emit(self, record):
+            pass
+logger = logging.getLogger('openzwave')
+logger.addHandler(NullHandler())
+
+#time.monotonic is not available in python 2
+_clock = getattr(time, 'monotonic', time.time)
+
+class ZWaveSceneRun(object):
+    """
+    An execution of a scene by the scene engine.
+
+    """
+
+    def __init__(self, scene_id, targets, skipped, unknown, callback=None):
+        """
+        Initialize a run
+
+        :param scene_id: The id of the scene
+        :type scene_id: int
+        :param targets: The data to set, by value_id
+        :type targets: dict()
+        :param skipped: The values already at their target data
+        :type skipped: list
+        :param unknown: The values of the scene not found on the network
+        :type unknown: list
+        :param callback: A function called with the run when it is finished
+        :type callback: callable
+
+        """
+        self.scene_id = scene_id
+        self.targets = targets
+        self.skipped = skipped
+        self.unknown = unknown
+        self.callback = callback
+        self.pending = set(targets.keys())
+        self.confirmed = {}
+        self.failed = []
+        self.started = _clock()
+        self.finished = None
+        self._event = threading.Event()
+
+    def __str__(self):
+        """
+        The string representation of the run.
+
+        :rtype: str
+
+        """
+        return u'scene_id: [%s] targets: [%s] confirmed: [%s] skipped: [%s] failed: [%s] latency: [%s]' % \
+          (self.scene_id, len(self.targets), len(self.confirmed), len(self.skipped), len(self.failed), self.latency)
+
+    @property
+    def is_done(self):
+        """
+        Is the run finished : all the values are confirmed or the timeout is expired.
+
+        :rtype: bool
+
+        """
+        return self.finished is not None
+
+    @property
+    def is_success(self):
+        """
+        Have all the values been confirmed.
+
+        :rtype: bool
+
+        """
+        return self.is_done and len(self.failed) == 0
+
+    @property
+    def latency(self):
+        """
+        The time in seconds between the start of the run and its end. None while running.
+
+        :rtype: float
+
+        """
+        if self.finished is None:
+            return None
+        return self.finished - self.started
+
+    def wait(self, timeout=None):
+        """
+        Wait for the end of the run.
+
+        :param timeout: The maximum time to wait in seconds
+        :type timeout: float
+        :return: True if the run is finished
+        :rtype: bool
+
+        """
+        self._event.wait(timeout)
+        return self.is_done
+
+    def to_dict(self, extras=['all']):
+        """
+        Return a dict representation of the run.
+
+        :param extras: The extra inforamtions to add
+        :type extras: []
+        :returns: A dict
+        :rtype: dict()
+
+        """
+        ret = {}
+        ret['scene_id'] = self.scene_id
+        ret['targets'] = len(self.targets)
+        ret['confirmed'] = dict(self.confirmed)
+        ret['skipped'] = list(self.skipped)
+        ret['unknown'] = list(self.unknown)
+        ret['failed'] = list(self.failed)
+        ret['latency'] = self.latency
+        return ret
+
+class ZWaveSceneEngine(object):
+    """
+    Run the scenes from python instead of activateScene.
+
+    OpenZWave sets the values of a scene one by one in list order and does
+    not tell when the scene is applied. The engine :
+
+        - skips the values already at their target data
+        - sends the values node by node through the send queue, at interactive priority
+        - waits for the ValueChanged/ValueRefreshed notification of each value
+        - reports the latency of the whole scene
+
+    .. code-block:: python
+
+        run = network.scene_engine.execute(scene)
+        if run.wait(10):
+            print(run.latency)
+
+    """
+
+    def __init__(self, network, timeout=30.0):
+        """
+        Initialize the scene engine
+
+        :param network: The network
+        :type network: ZWaveNetwork
+        :param timeout: The default time in seconds to wait for the confirmations
+        :type timeout: float
+
+        """
+        self._network = network
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._runs = {}
+        self._connected = False
+
+    def __str__(self):
+        """
+        The string representation of the engine.
+
+        :rtype: str
+
+        """
+        return u'runs: [%s]' % len(self.runs)
+
+    @property
+    def runs(self):
+        """
+        The runs not yet finished.
+
+        :rtype: list
+
+        """
+        with self._lock:
+            runs = set()
+            for value_runs in self._runs.values():
+                runs.update(value_runs)
+            return list(runs)
+
+    def execute(self, scene, priority=PRIORITY_INTERACTIVE, timeout=None, callback=None):
+        """
+        Execute a scene.
+
+        :param scene: The scene
+        :type scene: ZWaveScene
+        :param priority: The priority of the commands in the send queue
+        :type priority: int
+        :param timeout: The time in seconds to wait for the confirmations. Default to the timeout of the engine
+        :type timeout: float
+        :param callback: A function called with the run when it is finished
+        :type callback: callable
+        :return: The run
+        :rtype: ZWaveSceneRun
+
+        """
+        targets = {}
+        skipped = []
+        unknown = []
+        values = scene.get_values()
+        for value_id in values:
+            value = values[value_id]['value']
+            data = values[value_id]['data']
+            if value is None:
+                unknown.append(value_id)
+            elif value.data == data:
+                skipped.append(value_id)
+            else:
+                targets[value_id] = data
+        run = ZWaveSceneRun(scene.scene_id, targets, skipped, unknown, callback=callback)
+        logger.debug(u"Scene engine execute %s", run)
+        if len(targets) == 0:
+            self._finish(run)
+            return run
+        with self._lock:
+            for value_id in targets:
+                self._runs.setdefault(value_id, []).append(run)
+            self._connect()
+        #Node by node : the send queue keeps the commands of a node together
+        for value_id in sorted(targets, key=node_id_from_value_id):
+            self._network.send_queue.set_value(value_id, targets[value_id], priority=priority, callback=self._set_value_done)
+        self._network.scheduler.call_later(timeout if timeout is not None else self.timeout, \
+            self._expire, name=u'scene_engine_%s' % id(run), args=(run,))
+        return run
+
+    def _connect(self):
+        """
+        Listen to the values. Must be called with the lock.
+
+        """
+        if not self._connected:
+            dispatcher.connect(self._louie_value, self._network.SIGNAL_VALUE_CHANGED)
+            dispatcher.connect(self._louie_value, self._network.SIGNAL_VALUE_REFRESHED)
+            self._connected = True
+
+    def _disconnect(self):
+        """
+        Stop listening to the values when no run is waiting. Must be called with the lock.
+
+        """
+        if self._connected and len(self._runs) == 0:
+            dispatcher.disconnect(self._louie_value, self._network.SIGNAL_VALUE_CHANGED)
+            dispatcher.disconnect(self._louie_value, self._network.SIGNAL_VALUE_REFRESHED)
+            self._connected = False
+
+    def _louie_value(self, network, node, value):
+        """
+        A value has been updated : confirm it in the runs waiting for its data.
+
+        """
+        if network is not self._network or value is None:
+            return
+        finished = []
+        with self._lock:
+            runs = self._runs.get(value.value_id, None)
+            if runs is None:
+                return
+            data = value.data
+            for run in list(runs):
+                if run.targets[value.value_id] != data:
+                    continue
+                runs.remove(run)
+                run.pending.discard(value.value_id)
+                run.confirmed[value.value_id] = _clock() - run.started
+                if len(run.pending) == 0:
+                    finished.append(run)
+            if len(runs) == 0:
+                del self._runs[value.value_id]
+            self._disconnect()
+        for run in finished:
+            self._finish(run)
+
+    def _set_value_done(self, cmd):
+        """
+        A setValue has been given to the manager : when it is rejected, the value
+        is failed in the runs waiting for its data without waiting for the timeout.
+
+        """
+        if cmd.result == 1:
+            return
+        value_id, data = cmd.args[0], cmd.args[1]
+        logger.warning(u"Scene engine : setValue of %s rejected (%s)", value_id, cmd.result)
+        finished = []
+        with self._lock:
+            runs = self._runs.get(value_id, None)
+            if runs is None:
+                return
+            for run in list(runs):
+                if run.targets[value_id] != data:
+                    continue
+                runs.remove(run)
+                run.pending.discard(value_id)
+                run.failed.append(value_id)
+                if len(run.pending) == 0:
+                    finished.append(run)
+            if len(runs) == 0:
+                del self._runs[value_id]
+            self._disconnect()
+        for run in finished:
+            self._finish(run)
+
+    def _expire(self, run):
+        """
+        The timeout of a run is expired : the values not confirmed are failed.
+
+        """
+        with self._lock:
+            if run.is_done or len(run.pending) == 0:
+                return
+            for value_id in list(run.pending):
+                runs = self._runs.get(value_id, None)
+                if runs is not None and run in runs:
+                    runs.remove(run)
+                    if len(runs) == 0:
+                        del self._runs[value_id]
+                run.failed.append(value_id)
+            run.pending = set()
+            self._disconnect()
+        self._finish(run)
+
+    def _finish(self, run):
+        """
+        End a run and call its callback.
+
+        """
+        with self._lock:
+            if run.is_done:
+                return
+            run.finished = _clock()
+        self._network.scheduler.remove_job(u'scene_engine_%s' % id(run))
+        logger.debug(u"Scene engine finished %s", run)
+        run._event.set()
+        if run.callback is not None:
+            try:
+                run.callback(run)
+            except Exception:
+                logger.exception(u"Scene engine : error in callback of %s", run)
+
+    def clear(self):
+        """
+        Forget the runs. They are not finished.
+
+        """
+        with self._lock:
+            self._runs = {}
+            self._disconnect()
@@ -0,0 +1,436 @@
+# -*- coding: utf-8 -*-
+"""
+.. module:: openzwave.scheduler
+
+This file is part of **python-openzwave** project https://github.com/OpenZWave/python-openzwave.
+    :platform: Unix, Windows, MacOS X
+    :sinopsis: openzwave API
+
+.. moduleauthor: bibi21000 aka Sébastien GALLET <bibi21000@gmail.com>
+
+License : GPL(v3)
+
+**python-openzwave** is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+**python-openzwave** is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with python-openzwave. If not, see http://www.gnu.org/licenses.
+
+"""
+import heapq
+import itertools
+import random
+import threading
+import time
+
+# Set default logging handler to avoid "No handler found" warnings.
+import logging
+try:  # Python 2.7+
+    from logging import NullHandler
+except ImportError:
+    class NullHandler(logging.Handler):
+        """NullHandler logger for python 2.6"""
+        def emit(self, record):
+            pass
+logger = logging.getLogger('openzwave')
+logger.addHandler(NullHandler())
+
+#time.monotonic is not available in python 2
+_clock = getattr(time, 'monotonic', time.time)
+
+class ZWaveScheduledJob(object):
+    """
+    A job run by the scheduler.
+
+    A job with an interval of 0 is run only once.
+
+    """
+
+    def __init__(self, name, callback, interval=0.0, jitter=0.0, backpressure=False, args=None, kwargs=None):
+        """
+        Initialize a scheduled job
+
+        :param name: The name of the job. Must be unique in a scheduler.
+        :type name: str
+        :param callback: The function to call
+        :type callback: callable
+        :param interval: The interval between two runs in seconds. 0 for a one shot job.
+        :type interval: float
+        :param jitter: A random delay (in seconds) added to each run to spread the load
+        :type jitter: float
+        :param backpressure: Postpone the job when the send queue of the controller is full.
+        :type backpressure: bool
+        :param args: The positional arguments of the callback
+        :type args: tuple
+        :param kwargs: The keyword arguments of the callback
+        :type kwargs: dict()
+
+        """
+        self.name = name
+        self.callback = callback
+        self.interval = interval
+        self.jitter = jitter
+        self.backpressure = backpressure
+        self.args = args if args is not None else ()
+        self.kwargs = kwargs if kwargs is not None else {}
+        self.next_run = None
+        self.last_run = None
+        self.last_duration = None
+        self.runs = 0
+        self.postponed = 0
+        self.active = True
+
+    def __str__(self):
+        """
+        The string representation of the job.
+
+        :rtype: str
+
+        """
+        return u'name: [%s] interval: [%s] runs: [%s] postponed: [%s]' % \
+          (self.name, self.interval, self.runs, self.postponed)
+
+    @property
+    def is_periodic(self):
+        """
+        Is this job run periodically.
+
+        :rtype: bool
+
+        """
+        return self.interval > 0
+
+    def cancel(self):
+        """
+        Cancel the job. It will be dropped from the queue the next time it is due.
+
+        """
+        self.active = False
+
+    def to_dict(self, extras=['all']):
+        """
+        Return a dict representation of the job.
+
+        :param extras: The extra inforamtions to add
+        :type extras: []
+        :returns: A dict
+        :rtype: dict()
+
+        """
+        ret = {}
+        ret['name'] = self.name
+        ret['interval'] = self.interval
+        ret['jitter'] = self.jitter
+        ret['backpressure'] = self.backpressure
+        ret['runs'] = self.runs
+        ret['postponed'] = self.postponed
+        ret['last_duration'] = self.last_duration
+        return ret
+
+class ZWaveScheduler(object):
+    """
+    Run the periodic tasks of the library (statistics, polling, ...) in a single thread.
+
+    Jobs are stored in a heap ordered by their next run time. Jobs flagged
+    with backpressure are postponed while the send queue of the controller
+    holds more than max_queue messages, so periodic work never piles up
+    behind user commands.
+
+    .. code-block:: python
+
+        job = network.scheduler.add_job('my_job', my_callback, 60, jitter=5)
+        ...
+        network.scheduler.remove_job('my_job')
+
+    """
+
+    def __init__(self, network=None, max_queue=5, backoff=1.0, name='openzwave.scheduler'):
+        """
+        Initialize the scheduler
+
+        :param network: The network used to check the send queue
+        :type network: ZWaveNetwork
+        :param max_queue: The send queue size above which backpressure jobs are postponed
+        :type max_queue: int
+        :param backoff: The delay in seconds used to postpone a job
+        :type backoff: float
+        :param name: The name of the thread
+        :type name: str
+
+        """
+        self._network = network
+        self.max_queue = max_queue
+        self.backoff = backoff
+        self._name = name
+        self._heap = []
+        self._jobs = {}
+        self._counter = 0
+        #The default names of the call_later jobs
+        self._names = itertools.count()
+        self._condition = threading.Condition(threading.Lock())
+        self._thread = None
+        self._running = False
+
+    def __str__(self):
+        """
+        The string representation of the scheduler.
+
+        :rtype: str
+
+        """
+        return u'running: [%s] jobs: [%s]' % (self.is_running, len(self._jobs))
+
+    @property
+    def is_running(self):
+        """
+        Is the scheduler thread running.
+
+        :rtype: bool
+
+        """
+        return self._running
+
+    @property
+    def jobs(self):
+        """
+        The active jobs of the scheduler.
+
+        :rtype: dict()
+
+        """
+        with self._condition:
+            return dict(self._jobs)
+
+    def get_job(self, name):
+        """
+        Retrieve a job by its name.
+
+        :param name: The name of the job
+        :type name: str
+        :return: The job or None
+        :rtype: ZWaveScheduledJob
+
+        """
+        with self._condition:
+            return self._jobs.get(name, None)
+
+    def start(self):
+        """
+        Start the scheduler thread.
+
+        """
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+            self._thread = threading.Thread(target=self._run, name=self._name)
+            self._thread.daemon = True
+            self._thread.start()
+        logger.debug(u"Scheduler started.")
+
+    def stop(self, timeout=5.0):
+        """
+        Stop the scheduler thread and wait for it.
+        Jobs are kept, so the scheduler can be started again.
+
+        :param timeout: The maximum time to wait for the running job
+        :type timeout: float
+
+        """
+        with self._condition:
+            if not self._running:
+                return
+            self._running = False
+            self._condition.notify_all()
+            thread = self._thread
+            self._thread = None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        logger.debug(u"Scheduler stopped.")
+
+    def add_job(self, name, callback, interval, jitter=0.0, backpressure=False, delay=None, args=None, kwargs=None):
+        """
+        Add a periodic job. A job with the same name is replaced.
+
+        :param name: The name of the job
+        :type name: str
+        :param callback: The function to call
+        :type callback: callable
+        :param interval: The interval between two runs in seconds
+        :type interval: float
+        :param jitter: A random delay (in seconds) added to each run
+        :type jitter: float
+        :param backpressure: Postpone the job when the send queue of the controller is full
+        :type backpressure: bool
+        :param delay: The delay before the first run. Default to interval.
+        :type delay: float
+        :param args: The positional arguments of the callback
+        :type args: tuple
+        :param kwargs: The keyword arguments of the callback
+        :type kwargs: dict()
+        :return: The job
+        :rtype: ZWaveScheduledJob
+
+        """
+        job = ZWaveScheduledJob(name, callback, interval=interval, jitter=jitter,
+                                backpressure=backpressure, args=args, kwargs=kwargs)
+        if delay is None:
+            delay = interval
+        with self._condition:
+            old = self._jobs.pop(name, None)
+            if old is not None:
+                old.cancel()
+            self._jobs[name] = job
+            self._push(job, _clock() + delay + self._jitter(job))
+        logger.debug(u"Scheduler add job %s", job)
+        return job
+
+    def call_later(self, delay, callback, name=None, backpressure=False, args=None, kwargs=None):
+        """
+        Run a function once after a delay.
+
+        :param delay: The delay in seconds
+        :type delay: float
+        :param callback: The function to call
+        :type callback: callable
+        :param name: The name of the job. A unique name is generated if None.
+        :type name: str
+        :param backpressure: Postpone the job when the send queue of the controller is full
+        :type backpressure: bool
+        :return: The job
+        :rtype: ZWaveScheduledJob
+
+        """
+        if name is None:
+            name = u'call_later_%s' % next(self._names)
+        return self.add_job(name, callback, 0, backpressure=backpressure, delay=delay, args=args, kwargs=kwargs)
+
+    def remove_job(self, job):
+        """
+        Remove a job.
+
+        :param job: The job or its name
+        :type job: ZWaveScheduledJob or str
+        :return: True if the job was found
+        :rtype: bool
+
+        """
+        name = job.name if isinstance(job, ZWaveScheduledJob) else job
+        with self._condition:
+            old = self._jobs.get(name, None)
+            if old is None or (isinstance(job, ZWaveScheduledJob) and old is not job):
+                return False
+            del self._jobs[name]
+            old.cancel()
+        logger.debug(u"Scheduler remove job %s", name)
+        return True
+
+    def clear(self):
+        """
+        Remove all jobs.
+
+        """
+        with self._condition:
+            for job in self._jobs.values():
+                job.cancel()
+            self._jobs = {}
+            self._heap = []
+
+    def _jitter(self, job):
+        """
+        Compute the jitter of a run.
+
+        """
+        if job.jitter > 0:
+            return random.uniform(0, job.jitter)
+        return 0.0
+
+    def _push(self, job, when):
+        """
+        Push a job in the heap and wake up the thread. Must be called with the lock.
+
+        """
+        job.next_run = when
+        self._counter += 1
+        heapq.heappush(self._heap, (when, self._counter, job))
+        self._condition.notify_all()
+
+    def _is_congested(self):
+        """
+        Check the send queue of the controller.
+
+        """
+        if self._network is None:
+            return False
+        try:
+            if self._network.state < self._network.STATE_STARTED:
+                return False
+            return self._network.controller.send_queue_count > self.max_queue
+        except Exception:
+            return False
+
+    def _next(self):
+        """
+        Wait for the next job. Return None when the scheduler is stopped.
+
+        """
+        with self._condition:
+            while self._running:
+                if not self._heap:
+                    self._condition.wait()
+                    continue
+                when, counter, job = self._heap[0]
+                if not job.active:
+                    heapq.heappop(self._heap)
+                    continue
+                delay = when - _clock()
+                if delay > 0:
+                    self._condition.wait(delay)
+                    continue
+                heapq.heappop(self._heap)
+                return job
+        return None
+
+    def _reschedule(self, job, delay):
+        """
+        Put back a job in the heap.
+
+        """
+        with self._condition:
+            if job.active and self._jobs.get(job.name, None) is job:
+                self._push(job, _clock() + delay)
+
+    def _run(self):
+        """
+        The main loop of the scheduler thread.
+
+        """
+        while True:
+            job = self._next()
+            if job is None:
+                break
+            if job.backpressure and self._is_congested():
+                job.postponed += 1
+                logger.debug(u"Scheduler postpone job %s : send queue is full", job.name)
+                self._reschedule(job, self.backoff)
+                continue
+            start = _clock()
+            try:
+                job.callback(*job.args, **job.kwargs)
+            except Exception:
+                logger.exception(u"Scheduler : error in job %s", job.name)
+            job.last_run = start
+            job.last_duration = _clock() - start
+            job.runs += 1
+            if job.is_periodic:
+                self._reschedule(job, max(0.0, job.interval - job.last_duration) + self._jitter(job))
+            else:
+                with self._condition:
+                    if self._jobs.get(job.name, None) is job:
+                        del self._jobs[job.name]
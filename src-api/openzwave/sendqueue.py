@@ -0,0 +1,438 @@
+# -*- coding: utf-8 -*-
+"""
+.. module:: openzwave.sendqueue
+
+This file is part of **python-openzwave** project https://github.com/OpenZWave/python-openzwave.
+    :platform: Unix, Windows, MacOS X
+    :sinopsis: openzwave API
+
+.. moduleauthor: bibi21000 aka Sébastien GALLET <bibi21000@gmail.com>
+
+License : GPL(v3)
+
+**python-openzwave** is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+**python-openzwave** is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with python-openzwave. If not, see http://www.gnu.org/licenses.
+
+"""
+import threading
+import time
+from collections import deque, OrderedDict
+
+# Set default logging handler to avoid "No handler found" warnings.
+import logging
+try:  # Python 2.7+
+    from logging import NullHandler
+except ImportError:
+    class NullHandler(logging.Handler):
+        """NullHandler logger for python 2.6"""
+        def emit(self, record):
+            pass
+logger = logging.getLogger('openzwave')
+logger.addHandler(NullHandler())
+
+#time.monotonic is not available in python 2
+_clock = getattr(time, 'monotonic', time.time)
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_AUTOMATION = 1
+PRIORITY_MAINTENANCE = 2
+PRIORITIES = [PRIORITY_INTERACTIVE, PRIORITY_AUTOMATION, PRIORITY_MAINTENANCE]
+PRIORITY_NAMES = {PRIORITY_INTERACTIVE:'interactive', PRIORITY_AUTOMATION:'automation', PRIORITY_MAINTENANCE:'maintenance'}
+
+def node_id_from_value_id(value_id):
+    """
+    Extract the node id from a 64 bits value id.
+
+    :param value_id: The id of the value
+    :type value_id: int
+    :rtype: int
+
+    """
+    return (value_id >> 24) & 0xff
+
+class ZWaveCommandRequest(object):
+    """
+    A command waiting in the send queue.
+
+    """
+
+    def __init__(self, node_id, method, args, priority, callback=None, key=None):
+        """
+        Initialize a command
+
+        :param node_id: The node the command is sent to
+        :type node_id: int
+        :param method: The name of the method of the manager to call
+        :type method: str
+        :param args: The arguments of the method
+        :type args: list
+        :param priority: The priority of the command
+        :type priority: int
+        :param callback: A function called with the command when it has been given to the manager
+        :type callback: callable
+        :param key: Commands with the same key are coalesced while waiting
+        :type key: hashable
+
+        """
+        self.node_id = node_id
+        self.method = method
+        self.args = args
+        self.priority = priority
+        self.callback = callback
+        self.key = key
+        self.submitted = _clock()
+        self.executed = None
+        self.result = None
+
+    def __str__(self):
+        """
+        The string representation of the command.
+
+        :rtype: str
+
+        """
+        return u'node: [%s] method: [%s] args: [%s] priority: [%s]' % \
+          (self.node_id, self.method, self.args, PRIORITY_NAMES.get(self.priority, self.priority))
+
+    @property
+    def wait_time(self):
+        """
+        The time spent in the queue, in seconds.
+
+        :rtype: float
+
+        """
+        if self.executed is None:
+            return _clock() - self.submitted
+        return self.executed - self.submitted
+
+class ZWaveSendQueue(object):
+    """
+    A command scheduler in front of the manager.
+
+    OpenZWave sends its messages in FIFO order, so a bulk read of
+    configuration parameters can delay an interactive command by seconds.
+    Commands submitted here are held in python and given to the manager
+    only when the send queue of the controller is short enough :
+
+        - interactive commands are admitted first and may use a longer queue
+        - automation commands come next
+        - maintenance commands (refreshes, configuration reads) come last
+
+    Inside a priority class, nodes are served in round robin so a single
+    node can't monopolize the radio.
+
+    .. code-block:: python
+
+        network.send_queue.set_value(value.value_id, 99)
+        network.send_queue.request_all_config_params(node.node_id)
+
+    """
+
+    JOB_NAME = 'send_queue'
+
+    def __init__(self, network, max_queue=2, interactive_queue=4, interval=0.5):
+        """
+        Initialize the send queue
+
+        :param network: The network
+        :type network: ZWaveNetwork
+        :param max_queue: Commands are admitted while the send queue of the controller is shorter
+        :type max_queue: int
+        :param interactive_queue: Same as max_queue for interactive commands
+        :type interactive_queue: int
+        :param interval: The interval of the pump job in the scheduler
+        :type interval: float
+
+        """
+        self._network = network
+        self.max_queue = max_queue
+        self.interactive_queue = interactive_queue
+        self.interval = interval
+        self._lock = threading.RLock()
+        self._pump_lock = threading.Lock()
+        self._pending = dict([(prio, OrderedDict()) for prio in PRIORITIES])
+        self._keys = dict([(prio, {}) for prio in PRIORITIES])
+        self._stats = dict([(prio, {'submitted':0, 'coalesced':0, 'executed':0, 'wait':0.0}) for prio in PRIORITIES])
+
+    def __str__(self):
+        """
+        The string representation of the send queue.
+
+        :rtype: str
+
+        """
+        return u'pending: [%s]' % self.pending_count()
+
+    def start(self):
+        """
+        Start pumping the commands from the scheduler of the network.
+
+        """
+        self._network.scheduler.add_job(self.JOB_NAME, self.pump, self.interval)
+
+    def stop(self):
+        """
+        Stop pumping and drop the pending commands.
+
+        """
+        self._network.scheduler.remove_job(self.JOB_NAME)
+        self.clear()
+
+    def clear(self):
+        """
+        Drop all the pending commands.
+
+        """
+        with self._lock:
+            for prio in PRIORITIES:
+                self._pending[prio].clear()
+                self._keys[prio].clear()
+
+    def drop_node(self, node_id):
+        """
+        Drop the pending commands of a node.
+
+        :param node_id: The id of the node
+        :type node_id: int
+
+        """
+        with self._lock:
+            for prio in PRIORITIES:
+                commands = self._pending[prio].pop(node_id, None)
+                if commands is not None:
+                    for cmd in commands:
+                        if cmd.key is not None:
+                            self._keys[prio].pop(cmd.key, None)
+
+    def pending_count(self, priority=None):
+        """
+        The number of commands waiting.
+
+        :param priority: Count only this priority. None for all.
+        :type priority: int
+        :rtype: int
+
+        """
+        with self._lock:
+            if priority is not None:
+                return sum([len(cmds) for cmds in self._pending[priority].values()])
+            return sum([len(cmds) for prio in PRIORITIES for cmds in self._pending[prio].values()])
+
+    @property
+    def stats(self):
+        """
+        The statistics of the send queue, by priority.
+
+        :rtype: dict()
+
+        """
+        ret = {}
+        with self._lock:
+            for prio in PRIORITIES:
+                stat = dict(self._stats[prio])
+                stat['pending'] = sum([len(cmds) for cmds in self._pending[prio].values()])
+                stat['wait_avg'] = stat['wait'] / stat['executed'] if stat['executed'] > 0 else 0.0
+                del stat['wait']
+                ret[PRIORITY_NAMES[prio]] = stat
+        return ret
+
+    def submit(self, node_id, method, args, priority=PRIORITY_AUTOMATION, callback=None, key=None):
+        """
+        Submit a command.
+
+        :param node_id: The node the command is sent to
+        :type node_id: int
+        :param method: The name of the method of the manager to call
+        :type method: str
+        :param args: The arguments of the method
+        :type args: list
+        :param priority: The priority of the command
+        :type priority: int
+        :param callback: A function called with the command when it has been given to the manager
+        :type callback: callable
+        :param key: A command waiting with the same key and priority is updated instead of adding a new one
+        :type key: hashable
+        :return: The command
+        :rtype: ZWaveCommandRequest
+
+        """
+        if priority not in PRIORITIES:
+            raise ValueError(u"Unknown priority %s" % priority)
+        with self._lock:
+            self._stats[priority]['submitted'] += 1
+            if key is not None and key in self._keys[priority]:
+                cmd = self._keys[priority][key]
+                cmd.args = args
+                cmd.callback = callback
+                self._stats[priority]['coalesced'] += 1
+                return cmd
+            cmd = ZWaveCommandRequest(node_id, method, args, priority, callback=callback, key=key)
+            if node_id not in self._pending[priority]:
+                self._pending[priority][node_id] = deque()
+            self._pending[priority][node_id].append(cmd)
+            if key is not None:
+                self._keys[priority][key] = cmd
+        self.pump()
+        return cmd
+
+    def set_value(self, value_id, data, priority=PRIORITY_INTERACTIVE, callback=None):
+        """
+        Set the data of a value. Successive sets of a waiting value are coalesced.
+
+        :param value_id: The id of the value
+        :type value_id: int
+        :param data: The new data of the value
+        :type data: depending of the type of the value
+        :param priority: The priority of the command
+        :type priority: int
+        :rtype: ZWaveCommandRequest
+
+        """
+        return self.submit(node_id_from_value_id(value_id), 'setValue', [value_id, data, self._network.home_id],
+                           priority=priority, callback=callback, key=('setValue', value_id))
+
+    def refresh_value(self, value_id, priority=PRIORITY_AUTOMATION, callback=None):
+        """
+        Request the data of a value from the node.
+
+        :param value_id: The id of the value
+        :type value_id: int
+        :param priority: The priority of the command
+        :type priority: int
+        :rtype: ZWaveCommandRequest
+
+        """
+        return self.submit(node_id_from_value_id(value_id), 'refreshValue', [value_id, self._network.home_id],
+                           priority=priority, callback=callback, key=('refreshValue', value_id))
+
+    def request_node_state(self, node_id, priority=PRIORITY_MAINTENANCE, callback=None):
+        """
+        Request the dynamic values of a node.
+
+        :param node_id: The id of the node
+        :type node_id: int
+        :param priority: The priority of the command
+        :type priority: int
+        :rtype: ZWaveCommandRequest
+
+        """
+        return self.submit(node_id, 'requestNodeState', [self._network.home_id, node_id],
+                           priority=priority, callback=callback, key=('requestNodeState', node_id))
+
+    def request_all_config_params(self, node_id, priority=PRIORITY_MAINTENANCE, callback=None):
+        """
+        Request the values of all the configuration parameters of a node.
+
+        :param node_id: The id of the node
+        :type node_id: int
+        :param priority: The priority of the command
+        :type priority: int
+        :rtype: ZWaveCommandRequest
+
+        """
+        return self.submit(node_id, 'requestAllConfigParams', [self._network.home_id, node_id],
+                           priority=priority, callback=callback, key=('requestAllConfigParams', node_id))
+
+    def wake(self):
+        """
+        Pump the commands from the scheduler thread as soon as possible.
+        Used when a message has been completed.
+
+        """
+        if self.pending_count() > 0:
+            self._network.scheduler.call_later(0, self.pump, name='send_queue_wake')
+
+    def _queue_count(self):
+        """
+        The size of the send queue of the controller. None if the network is not started.
+
+        """
+        try:
+            if self._network.state < self._network.STATE_STARTED:
+                return None
+            return self._network.controller.send_queue_count
+        except Exception:
+            return None
+
+    def _pop(self, queue_count):
+        """
+        Pop the next command that can be admitted. Must be called with the lock.
+
+        """
+        for prio in PRIORITIES:
+            limit = self.interactive_queue if prio == PRIORITY_INTERACTIVE else self.max_queue
+            nodes = self._pending[prio]
+            if queue_count >= limit or len(nodes) == 0:
+                continue
+            #Round robin : take the first node and move it at the end
+            node_id = next(iter(nodes))
+            commands = nodes.pop(node_id)
+            cmd = commands.popleft()
+            if len(commands) > 0:
+                nodes[node_id] = commands
+            if cmd.key is not None:
+                self._keys[prio].pop(cmd.key, None)
+            return cmd
+        return None
+
+    def pump(self):
+        """
+        Give the manager the commands that can be admitted.
+
+        :return: The number of commands admitted
+        :rtype: int
+
+        """
+        if not self._pump_lock.acquire(False):
+            return 0
+        admitted = 0
+        try:
+            base = self._queue_count()
+            if base is None or base < 0:
+                return 0
+            while True:
+                #Some commands are not counted in the send queue (ie sleeping nodes)
+                #so we keep our own estimation
+                count = self._queue_count()
+                if count is None:
+                    break
+                count = max(count, base + admitted)
+                with self._lock:
+                    cmd = self._pop(count)
+                if cmd is None:
+                    break
+                self._execute(cmd)
+                admitted += 1
+        finally:
+            self._pump_lock.release()
+        return admitted
+
+    def _execute(self, cmd):
+        """
+        Give a command to the manager.
+
+        """
+        cmd.executed = _clock()
+        with self._lock:
+            self._stats[cmd.priority]['executed'] += 1
+            self._stats[cmd.priority]['wait'] += cmd.executed - cmd.submitted
+        logger.debug(u"Send queue execute %s", cmd)
+        try:
+            cmd.result = getattr(self._network.manager, cmd.method)(*cmd.args)
+        except Exception:
+            logger.exception(u"Send queue : error when executing %s", cmd)
+        if cmd.callback is not None:
+            try:
+                cmd.callback(cmd)
+            except Exception:
+                logger.exception(u"Send queue : error in callback of %s", cmd)
@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+"""
+.. module:: openzwave.serializer
+
+This file is part of **python-openzwave** project https://github.com/OpenZWave/python-openzwave.
+    :platform: Unix, Windows, MacOS X
+    :sinopsis: openzwave API
+
+.. moduleauthor: bibi21000 aka Sébastien GALLET <bibi21000@gmail.com>
+
+License : GPL(v3)
+
+**python-openzwave** is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+**python-openzwave** is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with python-openzwave. If not, see http://www.gnu.org/licenses.
+
+"""
+import json
+from operator import attrgetter
+import six
+from openzwave.object import ZWaveException
+
+# Set default logging handler to avoid "No handler found" warnings.
+import logging
+try:  # Python 2.7+
+    from logging import NullHandler
+except ImportError:
+    class NullHandler(logging.Handler):
+        """NullHandler logger for python 2.6"""
+        def emit(self, record):
+            pass
+logger = logging.getLogger('openzwave')
+logger.addHandler(NullHandler())
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+#The fields of the nodes which can be serialized. values holds the values of the node.
+NODE_FIELDS = ['node_id', 'name', 'location', 'product_name', 'product_type', 'product_id',
+               'manufacturer_name', 'manufacturer_id', 'type', 'device_type', 'role',
+               'basic', 'generic', 'specific', 'version', 'security', 'max_baud_rate',
+               'capabilities', 'neighbors', 'command_classes',
+               'is_listening_device', 'is_routing_device', 'is_zwave_plus',
+               'is_sleeping', 'is_awake', 'is_failed', 'is_ready', 'values']
+
+#The fields of the values which can be serialized
+VALUE_FIELDS = ['value_id', 'node_id', 'id_on_network', 'label', 'help', 'units', 'genre',
+                'type', 'command_class', 'instance', 'index', 'min', 'max', 'data',
+                'data_items', 'precision', 'is_read_only', 'is_write_only', 'is_polled']
+
+#The same fields as ZWaveNode.to_dict(extras=['values'])
+DEFAULT_NODE_FIELDS = ['node_id', 'name', 'location', 'product_type', 'product_name', 'values']
+
+#The same fields as ZWaveValue.to_dict(extras=[])
+DEFAULT_VALUE_FIELDS = ['value_id', 'node_id', 'label', 'units', 'genre', 'data']
+
+#The node_id of a value is decoded from its value_id : no need to go through the node
+_VALUE_GETTERS = {'node_id': lambda value: value.identity.node_id}
+
+def json_default(obj):
+    """
+    Serialize the raw data of the values and the sets in json.
+
+    """
+    if isinstance(obj, (bytes, bytearray)):
+        return list(bytearray(obj))
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    return six.text_type(obj)
+
+class ZWaveSerializer(object):
+    """
+    Serialize the nodes and values of a network in json or msgpack.
+
+    The fields are resolved once when the serializer is created, and the
+    nodes are read from the snapshot of the network, so the lock of the
+    network is never held. The encoding is done node by node : a large
+    network can be sent while it is encoded.
+
+    .. code-block:: python
+
+        serializer = ZWaveSerializer(network, node_fields=['node_id', 'values'],
+                                     value_fields=['label', 'data'])
+        for chunk in serializer.iterencode():
+            stream.write(chunk)
+
+    """
+
+    def __init__(self, network, node_fields=None, value_fields=None):
+        """
+        Initialize the serializer
+
+        :param network: The network to serialize
+        :type network: ZWaveNetwork
+        :param node_fields: The fields of the nodes. Default to DEFAULT_NODE_FIELDS
+        :type node_fields: list()
+        :param value_fields: The fields of the values. Default to DEFAULT_VALUE_FIELDS
+        :type value_fields: list()
+        :raises: ZWaveException if a field is unknown
+
+        """
+        self._network = network
+        self.node_fields = list(node_fields) if node_fields is not None else list(DEFAULT_NODE_FIELDS)
+        self.value_fields = list(value_fields) if value_fields is not None else list(DEFAULT_VALUE_FIELDS)
+        for field in self.node_fields:
+            if field not in NODE_FIELDS:
+                raise ZWaveException(u"Unknown node field %s" % field)
+        for field in self.value_fields:
+            if field not in VALUE_FIELDS:
+                raise ZWaveException(u"Unknown value field %s" % field)
+        self._with_values = 'values' in self.node_fields
+        self._node_getters = [(field, attrgetter(field)) for field in self.node_fields if field != 'values']
+        self._value_getters = [(field, _VALUE_GETTERS.get(field, None) or attrgetter(field)) for field in self.value_fields]
+        self._encoder = json.JSONEncoder(default=json_default, separators=(',', ':'))
+
+    def __str__(self):
+        """
+        The string representation of the serializer.
+
+        :rtype: str
+
+        """
+        return u'node_fields: [%s] value_fields: [%s]' % (self.node_fields, self.value_fields)
+
+    def value_to_dict(self, value):
+        """
+        Return a dict representation of a value with the selected fields.
+
+        :param value: The value
+        :type value: ZWaveValue
+        :rtype: dict()
+
+        """
+        ret = {}
+        for field, getter in self._value_getters:
+            ret[field] = getter(value)
+        return ret
+
+    def node_to_dict(self, node, values=None):
+        """
+        Return a dict representation of a node with the selected fields.
+
+        :param node: The node
+        :type node: ZWaveNode
+        :param values: The values of the node. Default to node.values
+        :type values: dict()
+        :rtype: dict()
+
+        """
+        ret = {}
+        for field, getter in self._node_getters:
+            ret[field] = getter(node)
+        if self._with_values:
+            if values is None:
+                values = node.values
+            value_to_dict = self.value_to_dict
+            ret['values'] = dict((value_id, value_to_dict(values[value_id])) for value_id in values)
+        return ret
+
+    def iter_nodes(self, snapshot=None):
+        """
+        Iterate over the dict representations of the nodes of the snapshot, ordered by node_id.
+
+        :param snapshot: The snapshot to serialize. Default to the current snapshot of the network
+        :type snapshot: ZWaveSnapshot
+        :returns: (node_id, dict) tuples
+        :rtype: generator
+
+        """
+        if snapshot is None:
+            snapshot = self._network.snapshot
+        nodes = snapshot.nodes
+        for node_id in sorted(nodes):
+            yield node_id, self.node_to_dict(nodes[node_id], snapshot.get_values(node_id))
+
+    def to_dict(self):
+        """
+        Return a dict representation of the nodes of the network.
+
+        :rtype: dict()
+
+        """
+        return dict(self.iter_nodes())
+
+    def iterencode(self):
+        """
+        Encode the nodes of the network in json, one node at a time.
+
+        :returns: The chunks of the json document
+        :rtype: generator
+
+        """
+        encode = self._encoder.encode
+        separator = u''
+        yield u'{'
+        for node_id, node in self.iter_nodes():
+            yield u'%s"%s":%s' % (separator, node_id, encode(node))
+            separator = u','
+        yield u'}'
+
+    def encode(self):
+        """
+        Encode the nodes of the network in json.
+
+        :rtype: str
+
+        """
+        return u''.join(self.iterencode())
+
+    def iterpack(self):
+        """
+        Encode the nodes of the network in msgpack, one node at a time.
+
+        :returns: The chunks of the msgpack map
+        :rtype: generator
+        :raises: ZWaveException if msgpack is not installed
+
+        """
+        if msgpack is None:
+            raise ZWaveException(u"msgpack is not installed")
+        packer = msgpack.Packer(use_bin_type=True, default=json_default)
+        snapshot = self._network.snapshot
+        yield packer.pack_map_header(len(snapshot.nodes))
+        for node_id, node in self.iter_nodes(snapshot):
+            yield packer.pack(node_id) + packer.pack(node)
+
+    def pack(self):
+        """
+        Encode the nodes of the network in msgpack.
+
+        :rtype: bytes
+        :raises: ZWaveException if msgpack is not installed
+
+        """
+        return b''.join(self.iterpack())
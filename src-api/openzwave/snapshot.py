@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+"""
+.. module:: openzwave.snapshot
+
+This file is part of **python-openzwave** project https://github.com/OpenZWave/python-openzwave.
+    :platform: Unix, Windows, MacOS X
+    :sinopsis: openzwave API
+
+.. moduleauthor: bibi21000 aka Sébastien GALLET <bibi21000@gmail.com>
+
+License : GPL(v3)
+
+**python-openzwave** is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+**python-openzwave** is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with python-openzwave. If not, see http://www.gnu.org/licenses.
+
+"""
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+# Set default logging handler to avoid "No handler found" warnings.
+import logging
+try:  # Python 2.7+
+    from logging import NullHandler
+except ImportError:
+    class NullHandler(logging.Handler):
+        """NullHandler logger for python 2.6"""
+        def emit(self, record):
+            pass
+logger = logging.getLogger('openzwave')
+logger.addHandler(NullHandler())
+
+class ZWaveFrozenDict(Mapping):
+    """
+    A read only view of a dict.
+
+    The dict is never copied : the network replaces its dicts instead of
+    updating them, so the view never changes.
+
+    """
+
+    def __init__(self, data=None):
+        """
+        Initialize the view
+
+        :param data: The dict to wrap
+        :type data: dict()
+
+        """
+        self._data = data if data is not None else {}
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __repr__(self):
+        return u'ZWaveFrozenDict(%r)' % self._data
+
+class ZWaveSnapshot(object):
+    """
+    A frozen index of the nodes and values of the network.
+
+    The network never updates the dicts of nodes and values : a writer copies
+    the dict, updates the copy and publishes a new snapshot. Taking a snapshot
+    is only reading a reference, and the dicts of the nodes which have not
+    changed are shared between versions, so two snapshots are compared
+    node by node with an identity test.
+
+    Only the index is frozen : which nodes and values exist. The snapshot
+    holds the live ZWaveNode and ZWaveValue objects of the network, so their
+    data, labels and other attributes may change after the snapshot is taken.
+
+    .. code-block:: python
+
+        old = network.snapshot
+        ...
+        new = network.snapshot
+        if new.version != old.version:
+            changes = new.diff(old)
+
+    """
+
+    def __init__(self, version=0, nodes=None, values=None):
+        """
+        Initialize the snapshot
+
+        :param version: The version of the snapshot
+        :type version: int
+        :param nodes: The nodes by node_id
+        :type nodes: dict()
+        :param values: The dict of values of each node, by node_id
+        :type values: dict()
+
+        """
+        self._version = version
+        self._nodes = nodes if nodes is not None else {}
+        self._values = values if values is not None else {}
+
+    def __str__(self):
+        """
+        The string representation of the snapshot.
+
+        :rtype: str
+
+        """
+        return u'version: [%s] nodes: [%s]' % (self._version, len(self._nodes))
+
+    @classmethod
+    def from_nodes(cls, version, nodes):
+        """
+        Build a snapshot from the dict of nodes of the network.
+
+        The dicts of values of the nodes are shared, not copied.
+
+        :param version: The version of the snapshot
+        :type version: int
+        :param nodes: The nodes by node_id
+        :type nodes: dict()
+        :rtype: ZWaveSnapshot
+
+        """
+        return cls(version, nodes, dict((node_id, nodes[node_id].values) for node_id in nodes))
+
+    def with_node_values(self, version, nodes, node_id):
+        """
+        Build the next snapshot when only the values of a node have changed.
+
+        The dicts of values of the other nodes are taken from this snapshot
+        instead of being read again from the nodes. A full snapshot is built
+        when the dict of nodes has been replaced.
+
+        :param version: The version of the new snapshot
+        :type version: int
+        :param nodes: The nodes by node_id
+        :type nodes: dict()
+        :param node_id: The node whose values have changed
+        :type node_id: int
+        :rtype: ZWaveSnapshot
+
+        """
+        if nodes is not self._nodes or node_id not in nodes:
+            return self.from_nodes(version, nodes)
+        values = dict(self._values)
+        values[node_id] = nodes[node_id].values
+        return self.__class__(version, nodes, values)
+
+    @property
+    def version(self):
+        """
+        The version of the snapshot. It is incremented each time nodes or values are added or removed.
+
+        :rtype: int
+
+        """
+        return self._version
+
+    @property
+    def nodes(self):
+        """
+        The nodes of the snapshot.
+
+        :rtype: ZWaveFrozenDict
+
+        """
+        return ZWaveFrozenDict(self._nodes)
+
+    def get_node(self, node_id):
+        """
+        Retrieve a node of the snapshot.
+
+        :param node_id: The id of the node
+        :type node_id: int
+        :return: The node or None
+        :rtype: ZWaveNode
+
+        """
+        return self._nodes.get(node_id, None)
+
+    def get_values(self, node_id):
+        """
+        The values of a node in the snapshot.
+
+        :param node_id: The id of the node
+        :type node_id: int
+        :rtype: ZWaveFrozenDict
+
+        """
+        return ZWaveFrozenDict(self._values.get(node_id, None))
+
+    def get_value(self, value_id):
+        """
+        Retrieve a value of the snapshot.
+
+        The node is read from the value_id, so the lookup does not scan the nodes.
+
+        :param value_id: The id of the value
+        :type value_id: int
+        :return: The value or None
+        :rtype: ZWaveValue
+
+        """
+        values = self._values.get((value_id >> 24) & 0xff, None)
+        if values is None:
+            return None
+        return values.get(value_id, None)
+
+    def diff(self, other):
+        """
+        Compare with an other snapshot.
+
+        The nodes sharing the same dict of values are skipped.
+
+        :param other: The snapshot to compare with, usually an older one
+        :type other: ZWaveSnapshot
+        :returns: A dict with the nodes_added, nodes_removed, values_added and values_removed lists
+        :rtype: dict()
+
+        """
+        ret = {'nodes_added': [], 'nodes_removed': [], 'values_added': [], 'values_removed': []}
+        if other is self:
+            return ret
+        for node_id in self._nodes:
+            if node_id not in other._nodes:
+                ret['nodes_added'].append(node_id)
+                ret['values_added'].extend(self._values[node_id].keys())
+                continue
+            new = self._values[node_id]
+            old = other._values[node_id]
+            if new is old:
+                continue
+            ret['values_added'].extend(value_id for value_id in new if value_id not in old)
+            ret['values_removed'].extend(value_id for value_id in old if value_id not in new)
+        for node_id in other._nodes:
+            if node_id not in self._nodes:
+                ret['nodes_removed'].append(node_id)
+                ret['values_removed'].extend(other._values[node_id].keys())
+        return ret
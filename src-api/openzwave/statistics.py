@@ -0,0 +1,347 @@
+# -*- coding: utf-8 -*-
+"""
+.. module:: openzwave.statistics
+
+This file is part of **python-openzwave** project https://github.com/OpenZWave/python-openzwave.
+    :platform: Unix, Windows, MacOS X
+    :sinopsis: openzwave API
+
+.. moduleauthor: bibi21000 aka Sébastien GALLET <bibi21000@gmail.com>
+
+License : GPL(v3)
+
+**python-openzwave** is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+**python-openzwave** is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with python-openzwave. If not, see http://www.gnu.org/licenses.
+
+"""
+from array import array
+import threading
+import time
+import six
+if six.PY3:
+    from pydispatch import dispatcher
+else:
+    from louie import dispatcher
+
+# Set default logging handler to avoid "No handler found" warnings.
+import logging
+try:  # Python 2.7+
+    from logging import NullHandler
+except ImportError:
+    class NullHandler(logging.Handler):
+        """NullHandler logger for python 2.6"""
+        def emit(self, record):
+            pass
+logger = logging.getLogger('openzwave')
+logger.addHandler(NullHandler())
+
+#time.monotonic is not available in python 2
+_clock = getattr(time, 'monotonic', time.time)
+
+#The counters only grow : deltas and rates are computed for them
+COUNTERS = ['sentCnt', 'sentFailed', 'retries', 'receivedCnt', 'receivedDups', 'receivedUnsolicited']
+
+#The gauges are the last measures
+GAUGES = ['lastRequestRTT', 'averageRequestRTT', 'lastResponseRTT', 'averageResponseRTT', 'quality']
+
+class ZWaveNodesStatistics(object):
+    """
+    The statistics of the nodes at a given time.
+
+    The statistics are stored by column : one array per counter or
+    gauge, in the order of node_ids. The deltas and the rates (per
+    second) of the counters are computed against the previous snapshot.
+    A counter lower than in the previous snapshot (the lib was restarted)
+    and a node not in the previous snapshot count from 0.
+
+    .. code-block:: python
+
+        stats = network.statistics.collect()
+        for node_id, retries in zip(stats.node_ids, stats.rates['retries']):
+            ...
+
+    """
+
+    def __init__(self, timestamp, stats, previous=None):
+        """
+        Initialize the statistics
+
+        :param timestamp: The time of the snapshot
+        :type timestamp: float
+        :param stats: The dict returned by getAllNodesStatistics
+        :type stats: dict()
+        :param previous: The previous statistics
+        :type previous: ZWaveNodesStatistics
+
+        """
+        self.timestamp = timestamp
+        self.node_ids = tuple(stats['nodeIds'])
+        self._index = dict((node_id, i) for i, node_id in enumerate(self.node_ids))
+        self.columns = {}
+        for name in COUNTERS + GAUGES:
+            self.columns[name] = array('L', stats[name])
+        self.interval = timestamp - previous.timestamp if previous is not None else 0.0
+        self.deltas = {}
+        self.rates = {}
+        for name in COUNTERS:
+            column = self.columns[name]
+            if previous is None:
+                deltas = array('l', [0] * len(column))
+            else:
+                old_column = previous.columns[name]
+                old_index = previous._index
+                deltas = array('l')
+                for node_id, count in zip(self.node_ids, column):
+                    i = old_index.get(node_id, None)
+                    old = old_column[i] if i is not None else 0
+                    deltas.append(count - old if count >= old else count)
+            self.deltas[name] = deltas
+            if self.interval > 0:
+                self.rates[name] = array('d', [delta / self.interval for delta in deltas])
+            else:
+                self.rates[name] = array('d', [0.0] * len(deltas))
+
+    def __str__(self):
+        """
+        The string representation of the statistics.
+
+        :rtype: str
+
+        """
+        return u'nodes: [%s] interval: [%s]' % (len(self.node_ids), self.interval)
+
+    def __len__(self):
+        """
+        The number of nodes.
+
+        :rtype: int
+
+        """
+        return len(self.node_ids)
+
+    def __contains__(self, node_id):
+        """
+        Check that a node is in the statistics.
+
+        :rtype: bool
+
+        """
+        return node_id in self._index
+
+    def get(self, node_id, name, default=None):
+        """
+        Retrieve a counter or a gauge of a node.
+
+        :param node_id: The id of the node
+        :type node_id: int
+        :param name: The name of the counter or gauge (retries, averageRequestRTT, ...)
+        :type name: str
+        :param default: The value returned when the node is unknown
+        :return: The counter or the gauge
+        :rtype: int
+
+        """
+        i = self._index.get(node_id, None)
+        if i is None:
+            return default
+        return self.columns[name][i]
+
+    def get_delta(self, node_id, name, default=None):
+        """
+        Retrieve the delta of a counter of a node since the previous statistics.
+
+        :param node_id: The id of the node
+        :type node_id: int
+        :param name: The name of the counter
+        :type name: str
+        :param default: The value returned when the node is unknown
+        :rtype: int
+
+        """
+        i = self._index.get(node_id, None)
+        if i is None:
+            return default
+        return self.deltas[name][i]
+
+    def get_rate(self, node_id, name, default=None):
+        """
+        Retrieve the rate (per second) of a counter of a node since the previous statistics.
+
+        :param node_id: The id of the node
+        :type node_id: int
+        :param name: The name of the counter
+        :type name: str
+        :param default: The value returned when the node is unknown
+        :rtype: float
+
+        """
+        i = self._index.get(node_id, None)
+        if i is None:
+            return default
+        return self.rates[name][i]
+
+    def to_dict(self, extras=['all']):
+        """
+        Return a dict representation of the statistics.
+
+        :param extras: The extra inforamtions to add
+        :type extras: []
+        :returns: A dict
+        :rtype: dict()
+
+        """
+        ret = {}
+        ret['interval'] = self.interval
+        ret['node_ids'] = list(self.node_ids)
+        for name in self.columns:
+            ret[name] = self.columns[name].tolist()
+        if 'all' in extras or 'deltas' in extras:
+            ret['deltas'] = dict((name, self.deltas[name].tolist()) for name in self.deltas)
+        if 'all' in extras or 'rates' in extras:
+            ret['rates'] = dict((name, self.rates[name].tolist()) for name in self.rates)
+        return ret
+
+class ZWaveStatisticsCollector(object):
+    """
+    Collect the statistics of all the nodes in a single call to the manager.
+
+    The collector can be run periodically by the scheduler of the network.
+
+    .. code-block:: python
+
+        network.statistics.poll_stats = 15
+        ...
+        stats = network.statistics.last
+
+    """
+
+    SIGNAL_NODES_STATS = 'NodesStats'
+
+    def __init__(self, network):
+        """
+        Initialize the collector
+
+        :param network: The network
+        :type network: ZWaveNetwork
+
+        """
+        self._network = network
+        self._last = None
+        self._lock = threading.Lock()
+        self._job = None
+        self._interval = 0.0
+
+    def __str__(self):
+        """
+        The string representation of the collector.
+
+        :rtype: str
+
+        """
+        return u'interval: [%s] last: [%s]' % (self._interval, self._last)
+
+    @property
+    def last(self):
+        """
+        The last statistics collected.
+
+        :rtype: ZWaveNodesStatistics
+
+        """
+        return self._last
+
+    def collect(self, node_ids=None):
+        """
+        Collect the statistics of the nodes. The deltas and rates are
+        computed against the last statistics.
+
+        :param node_ids: The nodes to query. Default to all the nodes of the network
+        :type node_ids: list()
+        :return: The statistics
+        :rtype: ZWaveNodesStatistics
+
+        """
+        if node_ids is None:
+            node_ids = sorted(self._network.snapshot.nodes)
+        with self._lock:
+            stats = self._network.manager.getAllNodesStatistics(self._network.home_id, node_ids)
+            self._last = ZWaveNodesStatistics(_clock(), stats, self._last)
+            return self._last
+
+    def snapshot(self, node_ids=None):
+        """
+        Take the statistics of the nodes without storing them : the
+        deltas and rates of the next collect are not changed.
+        The deltas and rates of the snapshot are 0.
+
+        :param node_ids: The nodes to query. Default to all the nodes of the network
+        :type node_ids: list()
+        :return: The statistics
+        :rtype: ZWaveNodesStatistics
+
+        """
+        if node_ids is None:
+            node_ids = sorted(self._network.snapshot.nodes)
+        stats = self._network.manager.getAllNodesStatistics(self._network.home_id, node_ids)
+        return ZWaveNodesStatistics(_clock(), stats)
+
+    def reset(self):
+        """
+        Forget the last statistics. The next deltas will start from 0.
+
+        """
+        with self._lock:
+            self._last = None
+
+    def do_poll_statistics(self):
+        """
+        Polling system for statistics. Run by the scheduler of the network.
+        """
+        stats = self.collect()
+        dispatcher.send(self.SIGNAL_NODES_STATS, \
+            **{'network':self._network, 'stats':stats})
+
+    @property
+    def poll_stats(self):
+        """
+        The interval for polling statistics
+
+        :return: The interval in seconds
+        :rtype: float
+
+        """
+        return self._interval
+
+    @poll_stats.setter
+    def poll_stats(self, value):
+        """
+        The interval for polling statistics
+
+        :param value: The interval in seconds. 0 to stop polling.
+        :type value: float
+
+        """
+        if value != self._interval:
+            if self._job is not None:
+                self._network.scheduler.remove_job(self._job)
+                self._job = None
+            self._interval = value
+            if value != 0:
+                self._job = self._network.scheduler.add_job('nodes_stats', \
+                    self.do_poll_statistics, self._interval, backpressure=True)
+
+    def stop(self):
+        """
+        Stop polling the statistics.
+
+        """
+        self.poll_stats = 0
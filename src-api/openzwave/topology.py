@@ -0,0 +1,376 @@
+# -*- coding: utf-8 -*-
+"""
+.. module:: openzwave.topology
+
+This file is part of **python-openzwave** project https://github.com/OpenZWave/python-openzwave.
+    :platform: Unix, Windows, MacOS X
+    :sinopsis: openzwave API
+
+.. moduleauthor: bibi21000 aka Sébastien GALLET <bibi21000@gmail.com>
+
+License : GPL(v3)
+
+**python-openzwave** is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+**python-openzwave** is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with python-openzwave. If not, see http://www.gnu.org/licenses.
+
+"""
+import heapq
+import threading
+from collections import deque
+from openzwave.snapshot import ZWaveFrozenDict
+
+# Set default logging handler to avoid "No handler found" warnings.
+import logging
+try:  # Python 2.7+
+    from logging import NullHandler
+except ImportError:
+    class NullHandler(logging.Handler):
+        """NullHandler logger for python 2.6"""
+        def emit(self, record):
+            pass
+logger = logging.getLogger('openzwave')
+logger.addHandler(NullHandler())
+
+class ZWaveTopology(object):
+    """
+    The mesh of the network : the neighbors of the nodes and the quality of the links.
+
+    The neighbors of all the nodes are read from the lib in a single call
+    the first time they are needed. The network invalidates a node when
+    its neighbors may have changed (end of the queries, end of a controller
+    command like a neighbor update, heal) : only the invalidated nodes are
+    read again.
+
+    The quality of a node is computed from its statistics (failed messages,
+    retries and round trip time), between 0 and 1. The quality of a link is
+    the lowest quality of its two nodes and the quality of a route is the
+    quality of its weakest link.
+
+    .. code-block:: python
+
+        topology = network.topology
+        hops = topology.get_hops()
+        for node_a, node_b, quality in topology.get_weak_links(0.5):
+            ...
+
+    """
+
+    def __init__(self, network, rtt_reference=100):
+        """
+        Initialize the topology
+
+        :param network: The network
+        :type network: ZWaveNetwork
+        :param rtt_reference: The average request RTT (ms) above which the quality of a node decreases
+        :type rtt_reference: int
+
+        """
+        self._network = network
+        self.rtt_reference = rtt_reference
+        self._lock = threading.Lock()
+        self._adjacency = None
+        self._stale = set()
+
+    def __str__(self):
+        """
+        The string representation of the topology.
+
+        :rtype: str
+
+        """
+        return u'loaded: [%s] stale: [%s]' % (self.loaded, len(self._stale))
+
+    @property
+    def loaded(self):
+        """
+        Are the neighbors of the nodes loaded.
+
+        :rtype: bool
+
+        """
+        return self._adjacency is not None
+
+    def refresh(self, node_ids=None):
+        """
+        Read the neighbors of nodes from the lib.
+
+        :param node_ids: The nodes to read. Default to all the nodes of the network
+        :type node_ids: list()
+
+        """
+        with self._lock:
+            self._refresh(node_ids)
+
+    def _refresh(self, node_ids=None):
+        """
+        Read the neighbors of nodes from the lib. Must be called with the lock.
+
+        """
+        if node_ids is None:
+            adjacency = {}
+            node_ids = list(self._network.snapshot.nodes)
+        else:
+            adjacency = dict(self._adjacency or {})
+        neighbors = self._network.manager.getNodesNeighbors(self._network.home_id, node_ids)
+        for node_id in neighbors:
+            adjacency[node_id] = frozenset(neighbors[node_id])
+        self._stale.difference_update(node_ids)
+        self._adjacency = adjacency
+
+    def invalidate(self, node_id=None):
+        """
+        Forget the neighbors of a node. They will be read again on the next access.
+
+        :param node_id: The node. None to forget all the nodes.
+        :type node_id: int
+
+        """
+        with self._lock:
+            if node_id is None:
+                self._adjacency = None
+                self._stale = set()
+            elif self._adjacency is not None:
+                self._stale.add(node_id)
+
+    def remove_node(self, node_id):
+        """
+        Remove a node from the topology.
+
+        :param node_id: The node
+        :type node_id: int
+
+        """
+        with self._lock:
+            self._stale.discard(node_id)
+            if self._adjacency is not None and node_id in self._adjacency:
+                adjacency = dict(self._adjacency)
+                del adjacency[node_id]
+                self._adjacency = adjacency
+
+    def clear(self):
+        """
+        Forget all the nodes.
+
+        """
+        self.invalidate()
+
+    @property
+    def adjacency(self):
+        """
+        The neighbors of the nodes.
+
+        :return: The neighbors (a frozenset) by node_id
+        :rtype: ZWaveFrozenDict
+
+        """
+        with self._lock:
+            if self._adjacency is None:
+                self._refresh()
+            elif self._stale:
+                self._refresh(list(self._stale))
+            return ZWaveFrozenDict(self._adjacency)
+
+    def get_neighbors(self, node_id):
+        """
+        Retrieve the neighbors of a node.
+
+        :param node_id: The node
+        :type node_id: int
+        :rtype: frozenset()
+
+        """
+        return self.adjacency.get(node_id, frozenset())
+
+    def get_links(self):
+        """
+        Retrieve the links of the mesh. A link is reported when one of its nodes sees the other.
+
+        :return: The links as (lowest node_id, highest node_id)
+        :rtype: set()
+
+        """
+        adjacency = self.adjacency
+        links = set()
+        for node_id in adjacency:
+            for neighbor in adjacency[node_id]:
+                links.add((min(node_id, neighbor), max(node_id, neighbor)))
+        return links
+
+    def get_hops(self, source=None):
+        """
+        Compute the number of hops from a node to the other ones.
+
+        :param source: The node to start from. Default to the controller
+        :type source: int
+        :return: The number of hops by node_id. The unreachable nodes are missing.
+        :rtype: dict()
+
+        """
+        if source is None:
+            source = self._network.controller.node_id
+        adjacency = self.adjacency
+        hops = {source: 0}
+        queue = deque([source])
+        while queue:
+            node_id = queue.popleft()
+            for neighbor in adjacency.get(node_id, ()):
+                if neighbor not in hops:
+                    hops[neighbor] = hops[node_id] + 1
+                    queue.append(neighbor)
+        return hops
+
+    def _get_stats(self, stats):
+        """
+        The statistics used to compute the qualities.
+
+        """
+        if stats is not None:
+            return stats
+        stats = self._network.statistics.last
+        if stats is None:
+            #Do not store it : the next poll computes its rates against the last one
+            stats = self._network.statistics.snapshot()
+        return stats
+
+    def get_node_quality(self, node_id, stats=None):
+        """
+        Compute the quality of a node from its statistics.
+
+        :param node_id: The node
+        :type node_id: int
+        :param stats: The statistics to use. Default to the last ones of the network.
+        :type stats: ZWaveNodesStatistics
+        :return: The quality between 0 and 1. 1 if the node has no statistics.
+        :rtype: float
+
+        """
+        stats = self._get_stats(stats)
+        sent = stats.get(node_id, 'sentCnt', 0)
+        if sent == 0:
+            return 1.0
+        failed = min(1.0, float(stats.get(node_id, 'sentFailed')) / sent)
+        retries = float(stats.get(node_id, 'retries')) / sent
+        rtt = stats.get(node_id, 'averageRequestRTT')
+        quality = (1.0 - failed) / (1.0 + retries)
+        if rtt > self.rtt_reference:
+            quality = quality * self.rtt_reference / rtt
+        return quality
+
+    def get_link_quality(self, node_a, node_b, stats=None):
+        """
+        Compute the quality of a link : the lowest quality of its nodes.
+
+        :param node_a: A node of the link
+        :type node_a: int
+        :param node_b: The other node of the link
+        :type node_b: int
+        :param stats: The statistics to use. Default to the last ones of the network.
+        :type stats: ZWaveNodesStatistics
+        :rtype: float
+
+        """
+        stats = self._get_stats(stats)
+        return min(self.get_node_quality(node_a, stats), self.get_node_quality(node_b, stats))
+
+    def get_route_qualities(self, source=None, stats=None):
+        """
+        Compute the quality of the best route from a node to the other ones.
+        The quality of a route is the quality of its weakest link.
+
+        :param source: The node to start from. Default to the controller
+        :type source: int
+        :param stats: The statistics to use. Default to the last ones of the network.
+        :type stats: ZWaveNodesStatistics
+        :return: The quality by node_id. The unreachable nodes are missing.
+        :rtype: dict()
+
+        """
+        if source is None:
+            source = self._network.controller.node_id
+        stats = self._get_stats(stats)
+        adjacency = self.adjacency
+        qualities = dict((node_id, self.get_node_quality(node_id, stats)) for node_id in adjacency)
+        best = {source: 1.0}
+        heap = [(-1.0, source)]
+        while heap:
+            quality, node_id = heapq.heappop(heap)
+            quality = -quality
+            if quality < best.get(node_id, 0.0):
+                continue
+            for neighbor in adjacency.get(node_id, ()):
+                link = min(quality, qualities.get(node_id, 1.0), qualities.get(neighbor, 1.0))
+                if link > best.get(neighbor, -1.0):
+                    best[neighbor] = link
+                    heapq.heappush(heap, (-link, neighbor))
+        return best
+
+    def get_weak_links(self, threshold=0.5, stats=None):
+        """
+        Retrieve the links with a quality lower than a threshold.
+
+        :param threshold: The quality under which a link is weak
+        :type threshold: float
+        :param stats: The statistics to use. Default to the last ones of the network.
+        :type stats: ZWaveNodesStatistics
+        :return: The weak links as (node_a, node_b, quality), the weakest first
+        :rtype: list()
+
+        """
+        stats = self._get_stats(stats)
+        ret = []
+        for node_a, node_b in self.get_links():
+            quality = self.get_link_quality(node_a, node_b, stats)
+            if quality < threshold:
+                ret.append((node_a, node_b, quality))
+        ret.sort(key=lambda link: (link[2], link[0], link[1]))
+        return ret
+
+    def get_weak_nodes(self, min_neighbors=2, threshold=0.5, source=None, stats=None):
+        """
+        Retrieve the nodes which could need a repeater : the nodes with few
+        neighbors, with a poor route or unreachable.
+
+        :param min_neighbors: The number of neighbors under which a node is weak
+        :type min_neighbors: int
+        :param threshold: The route quality under which a node is weak
+        :type threshold: float
+        :param source: The node to start from. Default to the controller
+        :type source: int
+        :param stats: The statistics to use. Default to the last ones of the network.
+        :type stats: ZWaveNodesStatistics
+        :return: The weak nodes
+        :rtype: set()
+
+        """
+        adjacency = self.adjacency
+        routes = self.get_route_qualities(source=source, stats=stats)
+        return set([node_id for node_id in adjacency
+                    if len(adjacency[node_id]) < min_neighbors or routes.get(node_id, 0.0) < threshold])
+
+    def to_dict(self, extras=['all']):
+        """
+        Return a dict representation of the topology.
+
+        :param extras: The extra inforamtions to add
+        :type extras: []
+        :returns: A dict
+        :rtype: dict()
+
+        """
+        adjacency = self.adjacency
+        ret = {}
+        ret['neighbors'] = dict((node_id, sorted(adjacency[node_id])) for node_id in adjacency)
+        if 'all' in extras or 'hops' in extras:
+            ret['hops'] = self.get_hops()
+        if 'all' in extras or 'qualities' in extras:
+            ret['qualities'] = self.get_route_qualities()
+        return ret
@@ -23,6 +23,7 @@ You should have received a copy of the GNU General Public License
 along with python-openzwave. If not, see http://www.gnu.org/licenses.
 
 """
+from collections import namedtuple
 from six import string_types
 from openzwave.object import ZWaveObject
 
@@ -38,6 +39,195 @@ except ImportError:
 logger = logging.getLogger('openzwave')
 logger.addHandler(NullHandler())
 
+#The range of the integer types
+TYPE_RANGES = {'Byte':(0, 255), 'Short':(-32768, 32767), 'Int':(-2147483648, 2147483647)}
+
+#The genres of the values, in the order of the lib
+GENRES = ['Basic', 'User', 'Config', 'System']
+
+#The identity of a value, decoded from its value_id
+ZWaveValueIdentity = namedtuple('ZWaveValueIdentity', ['home_id', 'node_id', 'command_class', 'instance', 'index', 'genre'])
+
+def decode_value_id(value_id, home_id=0):
+    """
+    Decode the identity of a value from its 64 bits value_id.
+
+    The packing is the one of ValueID::GetId() in the lib.
+
+    :param value_id: The value_id of the value
+    :type value_id: int
+    :param home_id: The home_id of the network
+    :type home_id: int
+    :return: The identity of the value
+    :rtype: ZWaveValueIdentity
+
+    """
+    return ZWaveValueIdentity(home_id,
+                              (value_id >> 24) & 0xff,
+                              (value_id >> 14) & 0xff,
+                              (value_id >> 56) & 0xff,
+                              (value_id >> 4) & 0xff,
+                              GENRES[(value_id >> 22) & 0x03])
+
+def pack_identity(home_id, node_id, command_class, instance, index):
+    """
+    Pack the parts of an id_on_network in an integer.
+
+    :param home_id: The home_id of the network
+    :type home_id: int
+    :param node_id: The node_id of the value
+    :type node_id: int
+    :param command_class: The command class of the value
+    :type command_class: int
+    :param instance: The instance of the value
+    :type instance: int
+    :param index: The index of the value
+    :type index: int
+    :return: The key of the value on the network
+    :rtype: int
+
+    """
+    return (home_id << 32) | (node_id << 24) | (command_class << 16) | (instance << 8) | index
+
+def key_from_id_on_network(id_on_network, separator='.'):
+    """
+    Convert an id_on_network to the key of the value.
+
+    :param id_on_network: The id_on_network of the value
+    :type id_on_network: str
+    :param separator: The separator used in the id_on_network
+    :type separator: str
+    :return: The key or None if id_on_network is not valid
+    :rtype: int
+
+    """
+    try:
+        home_id, node_id, command_class, instance, index = id_on_network.split(separator)
+        return pack_identity(int(home_id, 16), int(node_id), int(command_class, 16), int(instance), int(index))
+    except (ValueError, AttributeError):
+        return None
+
+class ZWaveValueValidator(object):
+    """
+    Check and convert the data of a value.
+
+    The validator is built once from the type, the read only flag, the
+    min and max and the list items of the value, so checking data does
+    not call the manager.
+
+    .. code-block:: python
+
+        validator = value.validator
+        new_data = validator.check(some_data)
+
+    """
+
+    def __init__(self, value_type, read_only=False, min_value=None, max_value=None, items=None):
+        """
+        Initialize the validator
+
+        :param value_type: The type of the value (Bool, Byte, List, ...)
+        :type value_type: str
+        :param read_only: Is the value read only
+        :type read_only: bool
+        :param min_value: The minimum of the value. Used when lower than max_value.
+        :type min_value: int
+        :param max_value: The maximum of the value.
+        :type max_value: int
+        :param items: The items of a list value
+        :type items: set()
+
+        """
+        self.type = value_type
+        self.read_only = read_only
+        self.items = frozenset(items) if items is not None else frozenset()
+        low, high = TYPE_RANGES.get(value_type, (None, None))
+        if min_value is not None and max_value is not None and min_value < max_value and low is not None:
+            low = max(low, min_value)
+            high = min(high, max_value)
+        self.min = low
+        self.max = high
+        if read_only:
+            self.check = self._check_none
+        elif value_type in ('Bool', 'Button'):
+            self.check = self._check_bool
+        elif value_type in TYPE_RANGES:
+            self.check = self._check_integer
+        elif value_type == 'Decimal':
+            self.check = self._check_decimal
+        elif value_type == 'String':
+            self.check = self._check_string
+        elif value_type == 'List':
+            self.check = self._check_list
+        else:
+            self.check = self._check_none
+
+    def __str__(self):
+        """
+        The string representation of the validator.
+
+        :rtype: str
+
+        """
+        return u'type: [%s] read_only: [%s] min: [%s] max: [%s] items: [%s]' % \
+          (self.type, self.read_only, self.min, self.max, len(self.items))
+
+    def __call__(self, data):
+        """
+        Check data. Same as check.
+
+        """
+        return self.check(data)
+
+    def _check_none(self, data):
+        return None
+
+    def _check_bool(self, data):
+        if isinstance(data, string_types):
+            return data not in ["False", "false", "FALSE", "0"]
+        try:
+            return bool(data)
+        except Exception:
+            return None
+
+    def _check_integer(self, data):
+        try:
+            new_data = int(data)
+        except Exception:
+            return None
+        if new_data < self.min:
+            return self.min
+        if new_data > self.max:
+            return self.max
+        return new_data
+
+    def _check_decimal(self, data):
+        try:
+            return float(data)
+        except Exception:
+            return None
+
+    def _check_string(self, data):
+        return data
+
+    def _check_list(self, data):
+        if isinstance(data, string_types) and data in self.items:
+            return data
+        return None
+
+    def check_many(self, datas):
+        """
+        Check a list of data.
+
+        :param datas: The data to check
+        :type datas: list
+        :return: The converted data. None for the incorrect ones.
+        :rtype: list
+
+        """
+        check = self.check
+        return [check(data) for data in datas]
+
 # TODO: don't report controller node as sleeping
 # TODO: allow value identification by device/index/instance
 class ZWaveValue(ZWaveObject):
@@ -73,6 +263,11 @@ class ZWaveValue(ZWaveObject):
         ZWaveObject.__init__(self, value_id, network=network)
         logger.debug(u"Create object value (valueId:%s)", value_id)
         self._parent = parent
+        self._validator = None
+        self._identity = decode_value_id(value_id, network.home_id if network is not None else 0)
+        self._key = pack_identity(*self._identity[:5])
+        self._id_on_network = None
+        self._id_separator = None
 
     def __str__(self):
         """
@@ -117,11 +312,37 @@ class ZWaveValue(ZWaveObject):
 
         """
         separator = self._network.id_separator
-        return "%0.8x%s%s%s%0.2x%s%s%s%s" % (self._network.home_id, \
-          separator, self.parent_id, \
-          separator, self.command_class, \
-          separator, self.instance, \
-          separator, self.index)
+        if self._id_on_network is None or separator != self._id_separator:
+            self._id_separator = separator
+            self._id_on_network = "%0.8x%s%s%s%0.2x%s%s%s%s" % (self._identity.home_id, \
+              separator, self._identity.node_id, \
+              separator, self._identity.command_class, \
+              separator, self._identity.instance, \
+              separator, self._identity.index)
+        return self._id_on_network
+
+    @property
+    def key(self):
+        """
+        Get an unique integer key for this value.
+
+        It holds the same informations as id_on_network, packed as
+        home_id, node_id, command_class, instance and index.
+
+        :rtype: int
+
+        """
+        return self._key
+
+    @property
+    def identity(self):
+        """
+        Get the identity of the value, decoded once from its value_id.
+
+        :rtype: ZWaveValueIdentity
+
+        """
+        return self._identity
 
     @property
     def node(self):
@@ -137,7 +358,7 @@ class ZWaveValue(ZWaveObject):
 
         :rtype: str
         """
-        return self._network.manager.getValueLabel(self.value_id)
+        return self._network.manager.getValueLabel(self.value_id, homeid=self._network.home_id)
 
     @label.setter
     def label(self, value):
@@ -147,7 +368,7 @@ class ZWaveValue(ZWaveObject):
         :param value: The new label value
         :type value: str
         """
-        self._network.manager.setValueLabel(self.value_id, value)
+        self._network.manager.setValueLabel(self.value_id, value, homeid=self._network.home_id)
 
     @property
     def help(self):
@@ -156,7 +377,7 @@ class ZWaveValue(ZWaveObject):
 
         :rtype: str
         """
-        return self._network.manager.getValueHelp(self.value_id)
+        return self._network.manager.getValueHelp(self.value_id, homeid=self._network.home_id)
 
     @help.setter
     def help(self, value):
@@ -167,7 +388,7 @@ class ZWaveValue(ZWaveObject):
         :type value: str
 
         """
-        self._network.manager.setValueHelp(self.value_id, value)
+        self._network.manager.setValueHelp(self.value_id, value, homeid=self._network.home_id)
 
     @property
     def units(self):
@@ -177,7 +398,7 @@ class ZWaveValue(ZWaveObject):
         :rtype: str
 
         """
-        return self._network.manager.getValueUnits(self.value_id)
+        return self._network.manager.getValueUnits(self.value_id, homeid=self._network.home_id)
 
     @units.setter
     def units(self, value):
@@ -188,7 +409,7 @@ class ZWaveValue(ZWaveObject):
         :type value: str
 
         """
-        self._network.manager.setValueUnits(self.value_id, value)
+        self._network.manager.setValueUnits(self.value_id, value, homeid=self._network.home_id)
 
     @property
     def max(self):
@@ -198,7 +419,7 @@ class ZWaveValue(ZWaveObject):
         :rtype: int
 
         """
-        return self._network.manager.getValueMax(self.value_id)
+        return self._network.manager.getValueMax(self.value_id, homeid=self._network.home_id)
 
     @property
     def min(self):
@@ -208,7 +429,7 @@ class ZWaveValue(ZWaveObject):
         :rtype: int
 
         """
-        return self._network.manager.getValueMin(self.value_id)
+        return self._network.manager.getValueMin(self.value_id, homeid=self._network.home_id)
 
     @property
     def type(self):
@@ -221,7 +442,7 @@ class ZWaveValue(ZWaveObject):
         :rtype: str
 
         """
-        return self._network.manager.getValueType(self.value_id)
+        return self._network.manager.getValueType(self.value_id, homeid=self._network.home_id)
 
     @property
     def genre(self):
@@ -234,7 +455,7 @@ class ZWaveValue(ZWaveObject):
         :rtype: str
 
         """
-        return self._network.manager.getValueGenre(self.value_id)
+        return self._identity.genre
 
     @property
     def index(self):
@@ -248,7 +469,7 @@ class ZWaveValue(ZWaveObject):
         :rtype: int
 
         """
-        return self._network.manager.getValueIndex(self.value_id)
+        return self._identity.index
 
     @property
     def instance(self):
@@ -261,7 +482,7 @@ class ZWaveValue(ZWaveObject):
         :rtype: int
 
         """
-        return self._network.manager.getValueInstance(self.value_id)
+        return self._identity.instance
 
     @property
     def data(self):
@@ -272,7 +493,7 @@ class ZWaveValue(ZWaveObject):
         :rtype: depending of the type of the value
 
         """
-        return self._network.manager.getValue(self.value_id)
+        return self._network.manager.getValue(self.value_id, homeid=self._network.home_id)
 
     @data.setter
     def data(self, value):
@@ -289,7 +510,7 @@ class ZWaveValue(ZWaveObject):
         :type value:
 
         """
-        self._network.manager.setValue(self.value_id, value)
+        self._network.manager.setValue(self.value_id, value, homeid=self._network.home_id)
 
     @property
     def data_as_string(self):
@@ -299,7 +520,7 @@ class ZWaveValue(ZWaveObject):
         :rtype: str
 
         """
-        return self._network.manager.getValueAsString(self.value_id)
+        return self._network.manager.getValueAsString(self.value_id, homeid=self._network.home_id)
 
     @property
     def data_items(self):
@@ -327,91 +548,58 @@ class ZWaveValue(ZWaveObject):
         elif self.type == "Button":
             return "True or False"
         elif self.type == "List":
-            return self._network.manager.getValueListItems(self.value_id)
+            return self._network.manager.getValueListItems(self.value_id, homeid=self._network.home_id)
         else:
             return "Unknown"
 
+    @property
+    def validator(self):
+        """
+        The validator of the value. It is built on first use from the type,
+        the min and max and the list items of the value.
+
+        :rtype: ZWaveValueValidator
+
+        """
+        validator = self._validator
+        if validator is None:
+            value_type = self.type
+            read_only = self.is_read_only
+            min_value = max_value = items = None
+            if not read_only:
+                if value_type in TYPE_RANGES:
+                    min_value = self.min
+                    max_value = self.max
+                elif value_type == "List":
+                    items = self._network.manager.getValueListItems(self.value_id, homeid=self._network.home_id)
+            validator = ZWaveValueValidator(value_type, read_only=read_only, \
+                min_value=min_value, max_value=max_value, items=items)
+            self._validator = validator
+        return validator
+
+    def invalidate_validator(self):
+        """
+        Forget the validator, ie when the list items of the value have changed.
+        The network calls it on ValueChanged and ValueRefreshed of a List value,
+        and the node when it is interviewed again.
+
+        """
+        self._validator = None
+
     def check_data(self, data):
         """
         Check that data is correct for this value.
         Return the data in a correct type. None is data is incorrect.
 
+        The check is done by the validator of the value.
+
         :param data:  The data value to check
         :type data: lambda
         :return: A variable of the good type if the data is correct. None otherwise.
         :rtype: variable
 
         """
-        if self.is_read_only:
-            return None
-        new_data = None
-        logger.debug(u"check_data type :%s", self.type)
-        if self.type == "Bool":
-            if isinstance(data, string_types):
-                if data in ["False", "false", "FALSE", "0"]:
-                    new_data = False
-                else:
-                    new_data = True
-            else:
-                try:
-                    new_data = bool(data)
-                except:
-                    new_data = None
-        elif self.type == "Byte":
-            try:
-                new_data = int(data)
-            except:
-                new_data = None
-            if new_data is not None:
-                if new_data < 0:
-                    new_data = 0
-                elif new_data > 255:
-                    new_data = 255
-        elif self.type == "Decimal":
-            try:
-                new_data = float(data)
-            except:
-                new_data = None
-        elif self.type == "Int":
-            try:
-                new_data = int(data)
-            except:
-                new_data = None
-            if new_data is not None:
-                if new_data < -2147483648:
-                    new_data = -2147483648
-                elif new_data > 2147483647:
-                    new_data = 2147483647
-        elif self.type == "Short":
-            try:
-                new_data = int(data)
-            except:
-                new_data = None
-            if new_data is not None:
-                if new_data < -32768:
-                    new_data = -32768
-                elif new_data > 32767:
-                    new_data = 32767
-        elif self.type == "String":
-            new_data = data
-        elif self.type == "Button":
-            if isinstance(data, string_types):
-                if data in ["False", "false", "FALSE", "0"]:
-                    new_data = False
-                else:
-                    new_data = True
-            else:
-                try:
-                    new_data = bool(data)
-                except:
-                    new_data = None
-        elif self.type == "List":
-            if isinstance(data, string_types):
-                if data in self.data_items:
-                    new_data = data
-                else:
-                    new_data = None
-        return new_data
+        return self.validator.check(data)
 
     @property
     def is_set(self):
@@ -423,7 +611,7 @@ class ZWaveValue(ZWaveObject):
         :rtype: bool
 
         """
-        return self._network.manager.isValueSet(self.value_id)
+        return self._network.manager.isValueSet(self.value_id, homeid=self._network.home_id)
 
     @property
     def is_read_only(self):
@@ -434,7 +622,7 @@ class ZWaveValue(ZWaveObject):
         :rtype: bool
 
         """
-        return self._network.manager.isValueReadOnly(self.value_id)
+        return self._network.manager.isValueReadOnly(self.value_id, homeid=self._network.home_id)
 
     @property
     def is_write_only(self):
@@ -445,7 +633,7 @@ class ZWaveValue(ZWaveObject):
         :rtype: bool
 
         """
-        return self._network.manager.isValueWriteOnly(self.value_id)
+        return self._network.manager.isValueWriteOnly(self.value_id, homeid=self._network.home_id)
 
     def enable_poll(self, intensity=1):
         """
@@ -457,7 +645,7 @@ class ZWaveValue(ZWaveObject):
         :rtype: bool
 
         """
-        return self._network.manager.enablePoll(self.value_id, intensity)
+        return self._network.manager.enablePoll(self.value_id, intensity, homeid=self._network.home_id)
 
     def disable_poll(self):
         """
@@ -467,7 +655,7 @@ class ZWaveValue(ZWaveObject):
         :rtype: bool
 
         """
-        return self._network.manager.disablePoll(self.value_id)
+        return self._network.manager.disablePoll(self.value_id, homeid=self._network.home_id)
 
     @property
     def poll_intensity(self):
@@ -479,7 +667,7 @@ class ZWaveValue(ZWaveObject):
 
         """
         #always ask to manager to get poll intensity
-        return self._network.manager.getPollIntensity(self.value_id)
+        return self._network.manager.getPollIntensity(self.value_id, homeid=self._network.home_id)
 
     @property
     def is_polled(self):
@@ -489,7 +677,7 @@ class ZWaveValue(ZWaveObject):
         :rtype: bool
 
         """
-        return self._network.manager.isPolled(self.value_id)
+        return self._network.manager.isPolled(self.value_id, homeid=self._network.home_id)
 
     @property
     def command_class(self):
@@ -500,7 +688,7 @@ class ZWaveValue(ZWaveObject):
         :rtype: int
 
         """
-        return self._network.manager.getValueCommandClass(self.value_id)
+        return self._identity.command_class
 
     def refresh(self):
         """
@@ -510,7 +698,7 @@ class ZWaveValue(ZWaveObject):
         :rtype: bool
 
         """
-        return self._network.manager.refreshValue(self.value_id)
+        return self._network.manager.refreshValue(self.value_id, homeid=self._network.home_id)
 
     @property
     def precision(self):
@@ -521,7 +709,7 @@ class ZWaveValue(ZWaveObject):
         :rtype: int
 
         """
-        return self._network.manager.getValueFloatPrecision(self.value_id)
+        return self._network.manager.getValueFloatPrecision(self.value_id, homeid=self._network.home_id)
 
     def is_change_verified(self):
         """
@@ -529,7 +717,7 @@ class ZWaveValue(ZWaveObject):
         If so, the library will immediately refresh the value a second time whenever a change is observed.
         This helps to filter out spurious data reported occasionally by some devices.
         """
-        return self._network.manager.getChangeVerified(self.value_id)
+        return self._network.manager.getChangeVerified(self.value_id, homeid=self._network.home_id)
 
 
     def set_change_verified(self, verify):
@@ -543,7 +731,7 @@ class ZWaveValue(ZWaveObject):
         :type verify: bool
         """
         logger.debug(u'Set change verified %s for valueId [%s]', verify, self.value_id)
-        self._network.manager.setChangeVerified(self.value_id, verify)
+        self._network.manager.setChangeVerified(self.value_id, verify, homeid=self._network.home_id)
 
     def to_dict(self, extras=['all']):
         """
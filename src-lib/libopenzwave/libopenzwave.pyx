@@ -27,8 +27,9 @@ You should have received a copy of the GNU General Public License
 along with python-openzwave. If not, see http://www.gnu.org/licenses.
 
 """
-from cython.operator cimport dereference as deref
+from cython.operator cimport dereference as deref, preincrement as inc
 from libcpp.map cimport map, pair
+from libcpp.unordered_map cimport unordered_map
 from libcpp cimport bool
 #from libc.stdint cimport bint
 from libcpp.vector cimport vector
@@ -50,10 +51,16 @@ from notification cimport Type_ValueAdded, Type_ValueRemoved, Type_ValueChanged,
 from notification cimport Type_ControllerCommand
 from notification cimport const_notification, pfnOnNotification_t
 from values cimport ValueGenre, ValueType, ValueID
+from values cimport ValueGenre_Basic, uint64
 from options cimport Options, Create as CreateOptions, OptionType, OptionType_Invalid, OptionType_Bool, OptionType_Int, OptionType_String
 from manager cimport Manager, Create as CreateManager, Get as GetManager
 from manager cimport struct_associations, int_associations
 from log cimport LogLevel
+
+cdef extern from *:
+    #The arrays returned by the lib are allocated with new[]
+    void delete_uint8_array "delete[]" (uint8_t* ptr) nogil
+
 import os
 import sys
 import warnings
@@ -387,9 +394,87 @@ PyLogLevels = {
     'Internal' : {'doc':'Used only within the log class (uses existing timestamp, etc', 'value':11},
     }
 
-cdef map[uint64_t, ValueID] values_map
+ctypedef unordered_map[uint64_t, ValueID] values_map_t
+
+#The ValueIDs reported by the notifications : home id -> id -> ValueID
+#The map of a driver is dropped on DriverRemoved and DriverReset
+cdef unordered_map[uint32_t, values_map_t] values_map
+
+#Static metadata of the values : home id -> id -> (label, units, readOnly)
+#Filled on ValueAdded (or on a miss) and reused for ValueChanged and ValueRefreshed
+values_metadata = {}
+
+cdef ValueID* findValueId(uint64_t id, uint32_t homeid=0):
+    """
+    Look for a ValueID in the map of a driver, or in the maps of all the drivers
+    when homeid is 0. Return NULL if it is unknown.
+    """
+    cdef values_map_t* values
+    cdef unordered_map[uint32_t, values_map_t].iterator hit
+    if homeid != 0:
+        if values_map.count(homeid) == 0:
+            return NULL
+        values = &values_map[homeid]
+        if values.count(id) == 0:
+            return NULL
+        return &values.at(id)
+    hit = values_map.begin()
+    while hit != values_map.end():
+        values = &values_map[deref(hit).first]
+        if values.count(id) != 0:
+            return &values.at(id)
+        inc(hit)
+    return NULL
+
+cdef clearValueIds(uint32_t homeid):
+    """
+    Remove the ValueIDs and the cached metadata of a driver.
+    """
+    values_map.erase(homeid)
+    values_metadata.pop(homeid, None)
+
+cdef getValueMetadata(Manager *manager, ValueID v, bint refresh=False):
+    """
+    Retrieve the label, units and read only flag of a value from the cache.
+    They are fetched from the manager on a miss or when refresh is True.
+    """
+    metadata = values_metadata.setdefault(v.GetHomeId(), {})
+    if not refresh:
+        ret = metadata.get(v.GetId(), None)
+        if ret is not None:
+            return ret
+    ret = (manager.GetValueLabel(v).c_str(), manager.GetValueUnits(v).c_str(), manager.IsValueReadOnly(v))
+    metadata[v.GetId()] = ret
+    return ret
+
+cdef popValueMetadata(ValueID v):
+    """
+    Remove the cached metadata of a value.
+    """
+    metadata = values_metadata.get(v.GetHomeId(), None)
+    if metadata is not None:
+        metadata.pop(v.GetId(), None)
+
+cdef clearNodeMetadata(uint32_t homeid, uint8_t nodeid):
+    """
+    Remove the cached metadata of the values of a node.
+    """
+    metadata = values_metadata.get(homeid, {})
+    for key in [key for key in metadata if (key >> 24) & 0xff == nodeid]:
+        del metadata[key]
 
-cdef getValueFromType(Manager *manager, valueId):
+cdef ValueID* newValueId(uint64_t id, uint32_t homeid=0):
+    """
+    Return a copy of a ValueID of the map or NULL if it is unknown.
+    The copy stays valid while the GIL is released, even if the value is removed
+    from the map by the notification thread. It must be freed with del.
+    """
+    cdef ValueID* v = findValueId(id, homeid)
+    if v == NULL:
+        return NULL
+    return new ValueID(v.GetHomeId(), <uint64>id)
+
+cdef getValueFromType(Manager *manager, valueId, uint32_t homeid=0):
     """
     Translate a value in the right type
     """
@@ -402,21 +487,22 @@ cdef getValueFromType(Manager *manager, valueId):
     cdef vector[string] vect
     cdef uint8_t* vectraw = NULL
     cdef uint8_t size
+    cdef ValueID* v = findValueId(valueId, homeid)
     cdef string s
     c = ""
     ret = None
-    if values_map.find(valueId) != values_map.end():
-        datatype = PyValueTypes[values_map.at(valueId).GetType()]
+    if v != NULL:
+        datatype = PyValueTypes[v.GetType()]
         if datatype == "Bool":
-            cret = manager.GetValueAsBool(values_map.at(valueId), &type_bool)
+            cret = manager.GetValueAsBool(deref(v), &type_bool)
             ret = type_bool if cret else None
             return ret
         elif datatype == "Byte":
-            cret = manager.GetValueAsByte(values_map.at(valueId), &type_byte)
+            cret = manager.GetValueAsByte(deref(v), &type_byte)
             ret = type_byte if cret else None
             return ret
         elif datatype == "Raw":
-            cret = manager.GetValueAsRaw(values_map.at(valueId), &vectraw, &size)
+            cret = manager.GetValueAsRaw(deref(v), &vectraw, &size)
             if cret:
                 for x in range (0, size):
                     c += chr(vectraw[x])
@@ -424,50 +510,55 @@ cdef getValueFromType(Manager *manager, valueId):
             free(vectraw)
             return ret
         elif datatype == "Decimal":
-            cret = manager.GetValueAsFloat(values_map.at(valueId), &type_float)
+            cret = manager.GetValueAsFloat(deref(v), &type_float)
             ret = type_float if cret else None
             return ret
         elif datatype == "Int":
-            cret = manager.GetValueAsInt(values_map.at(valueId), &type_int)
+            cret = manager.GetValueAsInt(deref(v), &type_int)
             ret = type_int if cret else None
             return ret
         elif datatype == "Short":
-            cret = manager.GetValueAsShort(values_map.at(valueId), &type_short)
+            cret = manager.GetValueAsShort(deref(v), &type_short)
             ret = type_short if cret else None
             return ret
         elif datatype == "String":
-            cret = manager.GetValueAsString(values_map.at(valueId), &type_string)
+            cret = manager.GetValueAsString(deref(v), &type_string)
             ret = type_string.c_str() if cret else None
             return ret
         elif datatype == "Button":
-            cret = manager.GetValueAsBool(values_map.at(valueId), &type_bool)
+            cret = manager.GetValueAsBool(deref(v), &type_bool)
             ret = type_bool if cret else None
             return ret
         elif datatype == "List":
-            cret = manager.GetValueListSelection(values_map.at(valueId), &type_string)
+            cret = manager.GetValueListSelection(deref(v), &type_string)
             ret = type_string.c_str() if cret else None
             return ret
         else :
-            cret = manager.GetValueAsString(values_map.at(valueId), &type_string)
+            cret = manager.GetValueAsString(deref(v), &type_string)
             ret = type_string.c_str() if cret else None
     logger.debug("getValueFromType return %s", ret)
     return ret
 
 cdef delValueId(ValueID v, n):
     logger.debug("delValueId : ValueID : %s", v.GetId())
-    if values_map.find(v.GetId()) != values_map.end():
-        values_map.erase(values_map.find(v.GetId()))
+    cdef unordered_map[uint32_t, values_map_t].iterator hit = values_map.find(v.GetHomeId())
+    if hit != values_map.end():
+        deref(hit).second.erase(v.GetId())
+    popValueMetadata(v)
+
+cdef storeValueId(ValueID v):
+    item = new pair[uint64_t, ValueID](v.GetId(), v)
+    values_map[v.GetHomeId()].insert(deref(item))
+    del item
 
-cdef addValueId(ValueID v, n):
+cdef addValueId(ValueID v, n, bint added=False):
     logger.debug("addValueId : ValueID : %s", v.GetId())
     #check is a valid value
     if v.GetInstance() == 0:
         return
     logger.debug("addValueId : GetCommandClassId : %s, GetType : %s", v.GetCommandClassId(), v.GetType())
     cdef Manager *manager = GetManager()
-    item = new pair[uint64_t, ValueID](v.GetId(), v)
-    values_map.insert(deref(item))
-    del item
+    storeValueId(v)
     genre = PyGenres[v.GetGenre()]
     #handle basic value in different way
     if genre =="Basic":
@@ -485,6 +576,7 @@ cdef addValueId(ValueID v, n):
                     'readOnly': False,
                     }
     else:
+        label, units, read_only = getValueMetadata(manager, v, added)
         n['valueId'] = {'homeId' : v.GetHomeId(),
                         'nodeId' : v.GetNodeId(),
                         'commandClass' : PyManager.COMMAND_CLASS_DESC[v.GetCommandClassId()],
@@ -493,13 +585,334 @@ cdef addValueId(ValueID v, n):
                         'id' : v.GetId(),
                         'genre' : genre,
                         'type' : PyValueTypes[v.GetType()],
-                        'value' : getValueFromType(manager,v.GetId()),
-                        'label' : manager.GetValueLabel(v).c_str(),
-                        'units' : manager.GetValueUnits(v).c_str(),
-                        'readOnly': manager.IsValueReadOnly(v),
+                        'value' : getValueFromType(manager,v.GetId(),v.GetHomeId()),
+                        'label' : label,
+                        'units' : units,
+                        'readOnly': read_only,
                         }
     logger.debug("addValueId : Notification : %s", n)
 
+cdef class PyCompactMapping:
+    '''
+Base class of the compact notification objects.
+
+Provides a read only dict interface built on keys() and __getitem__.
+
+    '''
+
+    def keys(self):
+        return []
+
+    def __getitem__(self, key):
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key):
+        return key in self.keys()
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def values(self):
+        return [self[key] for key in self.keys()]
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+
+    def to_dict(self):
+        '''
+Convert to a plain dict, like the ones sent by the default watcher.
+
+:rtype: dict()
+
+        '''
+        ret = {}
+        for key in self.keys():
+            data = self[key]
+            if isinstance(data, PyCompactMapping):
+                data = data.to_dict()
+            ret[key] = data
+        return ret
+
+    def __richcmp__(self, other, int op):
+        if op == 2:
+            return self.to_dict() == other
+        elif op == 3:
+            return self.to_dict() != other
+        return NotImplemented
+
+PyValueIdKeys = ('homeId', 'nodeId', 'commandClass', 'instance', 'index', 'id', 'genre', 'type', 'value', 'label', 'units', 'readOnly')
+
+cdef class PyValueId(PyCompactMapping):
+    '''
+Compact and immutable view of the value of a notification.
+
+The ids are copied from the ValueID when the notification is received.
+The label, units, read only flag and data are fetched from the manager
+the first time they are accessed.
+
+It can be used like the 'valueId' dict of the default watcher.
+
+    '''
+    cdef readonly uint32_t home_id
+    cdef readonly uint8_t node_id
+    cdef readonly uint64_t id
+    cdef readonly uint8_t genre_id
+    cdef readonly uint8_t command_class_id
+    cdef readonly uint8_t instance
+    cdef readonly uint8_t index
+    cdef readonly uint8_t type_id
+    cdef bint _fetched
+    cdef bint _data_fetched
+    cdef object _label
+    cdef object _units
+    cdef object _read_only
+    cdef object _data
+
+    cdef _fetch(self):
+        cdef ValueID* v
+        if self._fetched:
+            return
+        self._fetched = True
+        self._read_only = False
+        if self.genre_id == ValueGenre_Basic:
+            return
+        v = findValueId(self.id, self.home_id)
+        if v != NULL:
+            self._label, self._units, self._read_only = getValueMetadata(GetManager(), deref(v))
+
+    property genre:
+        def __get__(self):
+            if self.genre_id == ValueGenre_Basic:
+                return ''
+            return PyGenres[self.genre_id]
+
+    property type:
+        def __get__(self):
+            return PyValueTypes[self.type_id]
+
+    property command_class:
+        def __get__(self):
+            return PyManager.COMMAND_CLASS_DESC[self.command_class_id]
+
+    property label:
+        def __get__(self):
+            self._fetch()
+            return self._label
+
+    property units:
+        def __get__(self):
+            self._fetch()
+            return self._units
+
+    property read_only:
+        def __get__(self):
+            self._fetch()
+            return self._read_only
+
+    property data:
+        def __get__(self):
+            if not self._data_fetched:
+                self._data_fetched = True
+                if self.genre_id != ValueGenre_Basic:
+                    self._data = getValueFromType(GetManager(), self.id, self.home_id)
+            return self._data
+
+    def keys(self):
+        return PyValueIdKeys
+
+    def __getitem__(self, key):
+        if key == 'id':
+            return self.id
+        elif key == 'nodeId':
+            return self.node_id
+        elif key == 'homeId':
+            return self.home_id
+        elif key == 'value':
+            return self.data
+        elif key == 'commandClass':
+            return self.command_class
+        elif key == 'instance':
+            return self.instance
+        elif key == 'index':
+            return self.index
+        elif key == 'genre':
+            return self.genre
+        elif key == 'type':
+            return self.type
+        elif key == 'label':
+            return self.label
+        elif key == 'units':
+            return self.units
+        elif key == 'readOnly':
+            return self.read_only
+        raise KeyError(key)
+
+    def __repr__(self):
+        return "PyValueId(id=%s, nodeId=%s, commandClass=%s, instance=%s, index=%s)" % \
+            (self.id, self.node_id, self.command_class_id, self.instance, self.index)
+
+cdef PyValueId buildPyValueId(ValueID v):
+    cdef PyValueId ret = PyValueId.__new__(PyValueId)
+    ret.home_id = v.GetHomeId()
+    ret.node_id = v.GetNodeId()
+    ret.id = v.GetId()
+    ret.genre_id = v.GetGenre()
+    ret.command_class_id = v.GetCommandClassId()
+    ret.instance = v.GetInstance()
+    ret.index = v.GetIndex()
+    ret.type_id = v.GetType()
+    return ret
+
+cdef class PyNotification(PyCompactMapping):
+    '''
+Compact and immutable notification, sent by the watcher when it is added with compact=True.
+
+It can be used like the dict sent by the default watcher : the values
+are computed when they are accessed.
+
+    '''
+    cdef readonly int type_id
+    cdef readonly uint32_t home_id
+    cdef readonly uint8_t node_id
+    cdef readonly int group_idx
+    cdef readonly int event
+    cdef readonly int notification_code
+    cdef readonly int button_id
+    cdef readonly int scene_id
+    cdef readonly object value_id
+
+    property notification_type:
+        def __get__(self):
+            return PyNotifications[self.type_id]
+
+    def keys(self):
+        ret = ['notificationType', 'homeId', 'nodeId']
+        if self.type_id == Type_Group:
+            ret.append('groupIdx')
+        elif self.type_id == Type_NodeEvent:
+            ret.append('event')
+        elif self.type_id == Type_Notification:
+            ret.append('notificationCode')
+        elif self.type_id == Type_ControllerCommand:
+            ret.extend(['controllerStateInt', 'controllerState', 'controllerStateDoc',
+                        'controllerErrorInt', 'controllerError', 'controllerErrorDoc'])
+        elif self.type_id in (Type_CreateButton, Type_DeleteButton, Type_ButtonOn, Type_ButtonOff):
+            ret.append('buttonId')
+        elif self.type_id == Type_SceneEvent:
+            ret.append('sceneId')
+        if self.value_id is not None:
+            ret.append('valueId')
+        return ret
+
+    def __getitem__(self, key):
+        if key == 'notificationType':
+            return PyNotifications[self.type_id]
+        elif key == 'nodeId':
+            return self.node_id
+        elif key == 'homeId':
+            return self.home_id
+        elif key == 'valueId' and self.value_id is not None:
+            return self.value_id
+        elif key == 'groupIdx' and self.type_id == Type_Group:
+            return self.group_idx
+        elif key == 'event' and self.type_id == Type_NodeEvent:
+            return self.event
+        elif key == 'notificationCode' and self.type_id == Type_Notification:
+            return self.notification_code
+        elif key == 'buttonId' and self.type_id in (Type_CreateButton, Type_DeleteButton, Type_ButtonOn, Type_ButtonOff):
+            return self.button_id
+        elif key == 'sceneId' and self.type_id == Type_SceneEvent:
+            return self.scene_id
+        elif self.type_id == Type_ControllerCommand:
+            if key == 'controllerStateInt':
+                return self.event
+            elif key == 'controllerState':
+                return PyControllerState[self.event]
+            elif key == 'controllerStateDoc':
+                return PyControllerState[self.event].doc
+            elif key == 'controllerErrorInt':
+                return self.notification_code
+            elif key == 'controllerError':
+                return PyControllerError[self.notification_code]
+            elif key == 'controllerErrorDoc':
+                return PyControllerError[self.notification_code].doc
+        raise KeyError(key)
+
+    def __repr__(self):
+        return "PyNotification(notificationType=%s, homeId=%s, nodeId=%s, valueId=%r)" % \
+            (PyNotifications[self.type_id], self.home_id, self.node_id, self.value_id)
+
+cdef PyNotification buildPyNotification(Notification* notification):
+    cdef PyNotification ret = PyNotification.__new__(PyNotification)
+    cdef NotificationType ntype = notification.GetType()
+    ret.type_id = ntype
+    ret.home_id = notification.GetHomeId()
+    ret.node_id = notification.GetNodeId()
+    ret.group_idx = -1
+    ret.event = -1
+    ret.notification_code = -1
+    ret.button_id = -1
+    ret.scene_id = -1
+    ret.value_id = None
+    if ntype == Type_Group:
+        ret.group_idx = notification.GetGroupIdx()
+    elif ntype == Type_NodeEvent:
+        ret.event = notification.GetEvent()
+    elif ntype == Type_Notification:
+        ret.notification_code = notification.GetNotification()
+    elif ntype == Type_ControllerCommand:
+        ret.event = notification.GetEvent()
+        ret.notification_code = notification.GetNotification()
+    elif ntype in (Type_CreateButton, Type_DeleteButton, Type_ButtonOn, Type_ButtonOff):
+        ret.button_id = notification.GetButtonId()
+    elif ntype == Type_SceneEvent:
+        ret.scene_id = notification.GetSceneId()
+    elif ntype in (Type_ValueAdded, Type_ValueChanged, Type_ValueRefreshed):
+        #Same as addValueId : skip invalid values
+        if notification.GetValueID().GetInstance() != 0:
+            ret.value_id = buildPyValueId(notification.GetValueID())
+    elif ntype == Type_ValueRemoved:
+        ret.value_id = buildPyValueId(notification.GetValueID())
+    return ret
+
+cdef void notif_callback_compact(const_notification _notification, void* _context) with gil:
+    """
+    Notification callback to the C++ library, sending PyNotification objects
+
+    """
+    cdef Notification* notification = <Notification*>_notification
+    cdef NotificationType ntype = notification.GetType()
+    try:
+        if ntype in (Type_ValueAdded, Type_ValueChanged, Type_ValueRefreshed):
+            if notification.GetValueID().GetInstance() != 0:
+                storeValueId(notification.GetValueID())
+                if ntype == Type_ValueAdded:
+                    #The metadata will be fetched again when used
+                    popValueMetadata(notification.GetValueID())
+        elif ntype in (Type_DriverRemoved, Type_DriverReset):
+            logger.debug("Notification : Type_DriverRemoved or Type_DriverReset received : clean the valueids of the driver")
+            clearValueIds(notification.GetHomeId())
+        n = buildPyNotification(notification)
+    except:
+        logger.exception("notif_callback_compact exception")
+        raise
+    (<object>_context)(n)
+    if ntype == Type_ValueRemoved:
+        try:
+            delValueId(notification.GetValueID(), n)
+        except:
+            logger.exception("notif_callback_compact exception Type_ValueRemoved delete")
+            raise
+
 cdef void notif_callback(const_notification _notification, void* _context) with gil:
     """
     Notification callback to the C++ library
@@ -554,15 +967,15 @@ cdef void notif_callback(const_notification _notification, void* _context) with
             raise
     elif notification.GetType() == Type_DriverRemoved:
         try:
-            logger.debug("Notification : Type_DriverRemoved received : clean all valueids")
-            values_map.empty()
+            logger.debug("Notification : Type_DriverRemoved received : clean the valueids of the driver")
+            clearValueIds(notification.GetHomeId())
         except:
             logger.exception("notif_callback exception Type_DriverRemoved")
             raise
     elif notification.GetType() == Type_DriverReset:
         try:
-            logger.debug("Notification : Type_DriverReset received : clean all valueids")
-            values_map.empty()
+            logger.debug("Notification : Type_DriverReset received : clean the valueids of the driver")
+            clearValueIds(notification.GetHomeId())
         except:
             logger.exception("notif_callback exception Type_DriverReset")
             raise
@@ -574,7 +987,7 @@ cdef void notif_callback(const_notification _notification, void* _context) with
             raise
     elif notification.GetType() in (Type_ValueAdded, Type_ValueChanged, Type_ValueRefreshed):
         try:
-            addValueId(notification.GetValueID(), n)
+            addValueId(notification.GetValueID(), n, notification.GetType() == Type_ValueAdded)
         except:
             logger.exception("notif_callback exception Type_ValueAdded, Type_ValueChanged, Type_ValueRefreshed")
             raise
@@ -1145,6 +1558,7 @@ sleeping) have been polled, an "AllNodesQueried" notification is sent.
 
     cdef Manager *manager
     cdef object _watcherCallback
+    cdef bint _watcherCompact
     cdef object _controllerCallback
 
     def create(self):
@@ -1185,7 +1599,7 @@ Deletes the Manager and cleans up any associated objects.
 # For saving the Z-Wave network configuration so that the entire network does not need to be
 # polled every time the application starts.
 #
-    def writeConfig(self, homeid):
+    def writeConfig(self, uint32_t homeid):
         '''
 Saves the configuration of a PC Controller's Z-Wave network to the
 application's user data folder.
@@ -1203,7 +1617,8 @@ etc.
 :type homeid: int
 
         '''
-        self.manager.WriteConfig(homeid)
+        with nogil:
+            self.manager.WriteConfig(homeid)
 #
 # -----------------------------------------------------------------------------
 # Drivers
@@ -1231,7 +1646,11 @@ Home ID is required by most of the OpenZWave Manager class methods.
 :see: removeDriver_
 
         '''
-        self.manager.AddDriver(str_to_cppstr(serialport))
+        cdef bool ret
+        cdef string c_serialport = str_to_cppstr(serialport)
+        with nogil:
+            ret = self.manager.AddDriver(c_serialport)
+        return ret
 
     def removeDriver(self, str serialport):
         '''
@@ -1249,7 +1668,11 @@ handled automatically.
 :see: addDriver_
 
         '''
-        self.manager.RemoveDriver(str_to_cppstr(serialport))
+        cdef bool ret
+        cdef string c_serialport = str_to_cppstr(serialport)
+        with nogil:
+            ret = self.manager.RemoveDriver(c_serialport)
+        return ret
 
     def getControllerInterfaceType(self, homeid):
         '''
@@ -1494,7 +1917,7 @@ method.
         cdef string c_string = self.manager.GetLibraryTypeName(homeid)
         return cstr_to_str(c_string.c_str())
 
-    def getSendQueueCount(self, homeid):
+    def getSendQueueCount(self, uint32_t homeid):
         '''
 .. _getSendQueueCount:
 
@@ -1506,7 +1929,36 @@ Get count of messages in the outgoing send queue.
 :rtype: int
 
         '''
-        return self.manager.GetSendQueueCount(homeid)
+        cdef int32_t ret
+        with nogil:
+            ret = self.manager.GetSendQueueCount(homeid)
+        return ret
+
+    def getValuesMapSize(self, homeid=None):
+        '''
+.. _getValuesMapSize:
+
+Get the count of ValueIDs held by the library for a driver.
+The ValueIDs of a driver are dropped when it is removed or reset.
+
+:param homeid: The Home ID of the Z-Wave controller. None for all the drivers.
+:type homeid: int
+:return: ValueID count
+:rtype: int
+
+        '''
+        cdef size_t ret = 0
+        cdef unordered_map[uint32_t, values_map_t].iterator hit
+        if homeid is not None:
+            hit = values_map.find(homeid)
+            if hit != values_map.end():
+                ret = deref(hit).second.size()
+            return ret
+        hit = values_map.begin()
+        while hit != values_map.end():
+            ret += deref(hit).second.size()
+            inc(hit)
+        return ret
 
     def logDriverStatistics(self, homeid):
         '''
@@ -1518,12 +1970,14 @@ Send current driver statistics to the log file.
 :type homeid: int
 
         '''
-        self.manager.LogDriverStatistics(homeid)
+        cdef uint32_t c_homeid = homeid
+        with nogil:
+            self.manager.LogDriverStatistics(c_homeid)
 
 #-----------------------------------------------------------------------------
 # Statistics interface
 #-----------------------------------------------------------------------------
-    def getDriverStatistics(self, homeId):
+    def getDriverStatistics(self, uint32_t homeId):
         '''
 .. _getDriverStatistics:
 
@@ -1562,7 +2016,8 @@ Statistics:
 
        '''
         cdef DriverData_t data
-        self.manager.GetDriverStatistics( homeId, &data );
+        with nogil:
+            self.manager.GetDriverStatistics( homeId, &data )
         ret = {}
         ret['SOFCnt'] = data.m_SOFCnt
         ret['ACKWaiting'] = data.m_ACKWaiting
@@ -1595,7 +2050,7 @@ Statistics:
 
 
 
-    def testNetworkNode(self, homeid, nodeid, count):
+    def testNetworkNode(self, uint32_t homeid, uint8_t nodeid, uint32_t count):
         '''
 .. _testNetworkNode:
 
@@ -1612,9 +2067,10 @@ Sends a series of messages to a network node for testing network reliability.
 :see: testNetwork_
 
         '''
-        self.manager.TestNetworkNode(homeid, nodeid, count)
+        with nogil:
+            self.manager.TestNetworkNode(homeid, nodeid, count)
 
-    def testNetwork(self, homeid, count):
+    def testNetwork(self, uint32_t homeid, uint32_t count):
         '''
 .. _testNetwork:
 
@@ -1629,9 +2085,10 @@ Sends a series of messages to every node on the network for testing network reli
 :see: testNetworkNode_
 
         '''
-        self.manager.TestNetwork(homeid, count)
+        with nogil:
+            self.manager.TestNetwork(homeid, count)
 
-    def healNetworkNode(self, homeid, nodeid,  upNodeRoute = False):
+    def healNetworkNode(self, uint32_t homeid, uint8_t nodeid, bint upNodeRoute=False):
         '''
 .. _healNetworkNode:
 
@@ -1646,9 +2103,10 @@ Sends a ControllerCommand_RequestNodeNeighborUpdate to the node.
 :type upNodeRoute: bool
 :see: healNetwork_
         '''
-        self.manager.HealNetworkNode(homeid, nodeid,  upNodeRoute)
+        with nogil:
+            self.manager.HealNetworkNode(homeid, nodeid,  upNodeRoute)
 
-    def healNetwork(self, homeid, upNodeRoute = False):
+    def healNetwork(self, uint32_t homeid, bint upNodeRoute=False):
         '''
 .. _healNetwork:
 
@@ -1662,7 +2120,8 @@ Can take a while on larger networks.
 :type upNodeRoute: bool
 :see: healNetworkNode_
         '''
-        self.manager.HealNetwork(homeid, upNodeRoute)
+        with nogil:
+            self.manager.HealNetwork(homeid, upNodeRoute)
 
 # -----------------------------------------------------------------------------
 # Polling Z-Wave devices
@@ -1708,7 +2167,7 @@ does not have to cope with more than one poll per second).
         '''
         self.manager.SetPollInterval(milliseconds, bIntervalBetweenPolls)
 
-    def enablePoll(self, id, intensity = 1):
+    def enablePoll(self, id, uint8_t intensity=1, uint32_t homeid=0):
         '''
 .. _enablePoll:
 
@@ -1716,6 +2175,8 @@ Enable the polling of a device's state.
 
 :param id: The ID of the value to start polling
 :type id: int
+:param homeid: The home id of the network of the value. 0 to look for it in all the networks.
+:type homeid: int
 :param intensity: The intensity of the poll
 :type intensity: int
 :return: True if polling was enabled.
@@ -1723,12 +2184,16 @@ Enable the polling of a device's state.
 :see: getPollInterval_, setPollInterval_, isPolled_, setPollIntensity_, disablePoll_, getPollIntensity_
 
         '''
-        if values_map.find(id) != values_map.end():
-            return self.manager.EnablePoll(values_map.at(id), intensity)
-        else :
+        cdef bool ret
+        cdef ValueID* c_value = newValueId(id, homeid)
+        if c_value == NULL:
             return False
+        with nogil:
+            ret = self.manager.EnablePoll(deref(c_value), intensity)
+        del c_value
+        return ret
 
-    def disablePoll(self, id):
+    def disablePoll(self, id, uint32_t homeid=0):
         '''
 .. _disablePoll:
 
@@ -1736,17 +2201,23 @@ Disable polling of a value.
 
 :param id: The ID of the value to disable polling.
 :type id: int
+:param homeid: The home id of the network of the value. 0 to look for it in all the networks.
+:type homeid: int
 :return: True if polling was disabled.
 :rtype: bool
 :see: getPollInterval_, setPollInterval_, enablePoll_, isPolled_, setPollIntensity_, getPollIntensity_
 
         '''
-        if values_map.find(id) != values_map.end():
-            return self.manager.DisablePoll(values_map.at(id))
-        else :
+        cdef bool ret
+        cdef ValueID* c_value = newValueId(id, homeid)
+        if c_value == NULL:
             return False
+        with nogil:
+            ret = self.manager.DisablePoll(deref(c_value))
+        del c_value
+        return ret
 
-    def isPolled(self, id):
+    def isPolled(self, id, uint32_t homeid=0):
         '''
 .. _isPolled:
 
@@ -1754,35 +2225,39 @@ Check polling status of a value
 
 :param id: The ID of the value to check polling.
 :type id: int
+:param homeid: The home id of the network of the value. 0 to look for it in all the networks.
+:type homeid: int
 :return: True if polling is active.
 :rtype: bool
 :see: getPollInterval_, setPollInterval_, enablePoll_, setPollIntensity_, disablePoll_, getPollIntensity_
 
         '''
-        if values_map.find(id) != values_map.end():
-            return self.manager.isPolled(values_map.at(id))
+        if findValueId(id, homeid) != NULL:
+            return self.manager.isPolled(deref(findValueId(id, homeid)))
         else :
             return False
 
-    def getPollIntensity(self, id):
+    def getPollIntensity(self, id, uint32_t homeid=0):
         '''
 .. _getPollIntensity:
 
 Get the intensity with which this value is polled (0=none, 1=every time through the list, 2-every other time, etc).
 :param id: The ID of a value.
 :type id: int
+:param homeid: The home id of the network of the value. 0 to look for it in all the networks.
+:type homeid: int
 :return: A integer containing the poll intensity
 :rtype: int
 :see: getPollInterval_, setPollInterval_, enablePoll_, setPollIntensity_, disablePoll_, isPolled_
 
        '''
-        if values_map.find(id) != values_map.end():
-            intensity = self.manager.GetPollIntensity(values_map.at(id))
+        if findValueId(id, homeid) != NULL:
+            intensity = self.manager.GetPollIntensity(deref(findValueId(id, homeid)))
             return intensity
         else :
             return 0
 
-    def setPollIntensity(self, id, intensity):
+    def setPollIntensity(self, id, uint8_t intensity, uint32_t homeid=0):
         '''
 .. _setPollIntensity:
 
@@ -1790,13 +2265,19 @@ Set the frequency of polling (0=none, 1=every time through the set, 2-every othe
 
 :param id: The ID of the value whose intensity should be set
 :type id: int
+:param homeid: The home id of the network of the value. 0 to look for it in all the networks.
+:type homeid: int
 :param intensity: the intensity of the poll
 :type intensity: int
 :see: getPollInterval_, setPollInterval_, enablePoll_, isPolled_, disablePoll_, getPollIntensity_
 
         '''
-        if values_map.find(id) != values_map.end():
-            self.manager.SetPollIntensity(values_map.at(id), intensity)
+        cdef ValueID* c_value = newValueId(id, homeid)
+        if c_value == NULL:
+            return
+        with nogil:
+            self.manager.SetPollIntensity(deref(c_value), intensity)
+        del c_value
 
 #
 # -----------------------------------------------------------------------------
@@ -1805,7 +2286,7 @@ Set the frequency of polling (0=none, 1=every time through the set, 2-every othe
 # Methods for accessing information on individual nodes..
 #
 
-    def getNodeStatistics(self, homeId, nodeId):
+    def getNodeStatistics(self, uint32_t homeId, uint8_t nodeId):
         '''
 .. _getNodeStatistics:
 
@@ -1842,7 +2323,8 @@ Statistics:
        '''
 
         cdef NodeData_t data
-        self.manager.GetNodeStatistics( homeId, nodeId, &data );
+        with nogil:
+            self.manager.GetNodeStatistics( homeId, nodeId, &data )
         ret = {}
         ret['sentCnt'] = data.m_sentCnt
         ret['sentFailed'] = data.m_sentFailed
@@ -1862,7 +2344,59 @@ Statistics:
             ret['lastReceivedMessage'] .append(data.m_lastReceivedMessage[i])
         return ret
 
-    def requestNodeDynamic(self, homeid, nodeid):
+    def getAllNodesStatistics(self, uint32_t homeId, nodeIds):
+        '''
+.. _getAllNodesStatistics:
+
+Retrieve in a single call the counters of the statistics of many nodes.
+
+The manager is queried without holding the GIL. The timestamps and the
+last received message are not retrieved.
+
+:param homeId: The Home ID of the Z-Wave controller.
+:type homeId: int
+:param nodeIds: The IDs of the nodes to query.
+:type nodeIds: list()
+:return: A dict of lists : nodeIds and one list per counter (sentCnt, sentFailed, retries, receivedCnt, receivedDups, receivedUnsolicited, lastRequestRTT, averageRequestRTT, lastResponseRTT, averageResponseRTT, quality), in the order of nodeIds.
+:rtype: dict()
+:see: getNodeStatistics_
+
+       '''
+        cdef vector[uint8_t] nodes
+        cdef vector[uint32_t] counters
+        cdef NodeData_t data
+        cdef size_t i, count
+        for nodeId in nodeIds:
+            nodes.push_back(nodeId)
+        count = nodes.size()
+        counters.resize(count * 11)
+        with nogil:
+            for i in range(count):
+                data.m_sentCnt = data.m_sentFailed = data.m_retries = 0
+                data.m_receivedCnt = data.m_receivedDups = data.m_receivedUnsolicited = 0
+                data.m_lastRequestRTT = data.m_averageRequestRTT = 0
+                data.m_lastResponseRTT = data.m_averageResponseRTT = 0
+                data.m_quality = 0
+                data.m_ccData.clear()
+                self.manager.GetNodeStatistics(homeId, nodes[i], &data)
+                counters[i * 11] = data.m_sentCnt
+                counters[i * 11 + 1] = data.m_sentFailed
+                counters[i * 11 + 2] = data.m_retries
+                counters[i * 11 + 3] = data.m_receivedCnt
+                counters[i * 11 + 4] = data.m_receivedDups
+                counters[i * 11 + 5] = data.m_receivedUnsolicited
+                counters[i * 11 + 6] = data.m_lastRequestRTT
+                counters[i * 11 + 7] = data.m_averageRequestRTT
+                counters[i * 11 + 8] = data.m_lastResponseRTT
+                counters[i * 11 + 9] = data.m_averageResponseRTT
+                counters[i * 11 + 10] = data.m_quality
+        ret = {'nodeIds': [nodes[i] for i in range(count)]}
+        for j, name in enumerate(['sentCnt', 'sentFailed', 'retries', 'receivedCnt', 'receivedDups', 'receivedUnsolicited',
+                                  'lastRequestRTT', 'averageRequestRTT', 'lastResponseRTT', 'averageResponseRTT', 'quality']):
+            ret[name] = [counters[i * 11 + j] for i in range(count)]
+        return ret
+
+    def requestNodeDynamic(self, uint32_t homeid, uint8_t nodeid):
         '''
 .. _requestNodeDynamic:
 
@@ -1883,9 +2417,12 @@ first run.
 :rtype: bool
 
         '''
-        return self.manager.RequestNodeDynamic(homeid, nodeid)
+        cdef bool ret
+        with nogil:
+            ret = self.manager.RequestNodeDynamic(homeid, nodeid)
+        return ret
 
-    def refreshNodeInfo(self, homeid, nodeid):
+    def refreshNodeInfo(self, uint32_t homeid, uint8_t nodeid):
         '''
 .. _refreshNodeInfo:
 
@@ -1906,9 +2443,14 @@ first run.
 :rtype: bool
 
         '''
-        return self.manager.RefreshNodeInfo(homeid, nodeid)
+        #The node is interviewed again : its values may change
+        clearNodeMetadata(homeid, nodeid)
+        cdef bool ret
+        with nogil:
+            ret = self.manager.RefreshNodeInfo(homeid, nodeid)
+        return ret
 
-    def requestNodeState(self, homeid, nodeid):
+    def requestNodeState(self, uint32_t homeid, uint8_t nodeid):
         '''
 .. _requestNodeState:
 
@@ -1924,7 +2466,10 @@ same as the query state starting from the dynamic state.
 :rtype: bool
 
         '''
-        return self.manager.RequestNodeState(homeid, nodeid)
+        cdef bool ret
+        with nogil:
+            ret = self.manager.RequestNodeState(homeid, nodeid)
+        return ret
 
     def isNodeBeamingDevice(self, homeid, nodeid):
         '''
@@ -2133,7 +2678,7 @@ on which of those values are specified by the node.
         cdef string c_string = self.manager.GetNodeType(homeid, nodeid)
         return cstr_to_str(c_string.c_str())
 
-    def getNodeNeighbors(self, homeid, nodeid):
+    def getNodeNeighbors(self, uint32_t homeid, uint8_t nodeid):
         '''
 .. _getNodeNeighbors:
 
@@ -2145,36 +2690,67 @@ Get the bitmap of this node's neighbors.
 :type nodeId: int
 :return: A set containing neighboring node IDs
 :rtype: set()
+:see: getNodesNeighbors_
 
         '''
         data = set()
-        #Allocate memory for the c++ function
-        #Return value is pointer to uint8_t[]
-        cdef uint8_t** dbuf = <uint8_t**>malloc(sizeof(uint8_t)*29)
-        #Get the number of neigbors
-        cdef uint32_t count = self.manager.GetNodeNeighbors(homeid, nodeid, dbuf)
-        if count == 0:
-            #Don't need to allocate memory.
-            free(dbuf)
+        cdef uint8_t* neighbors = NULL
+        cdef uint32_t count, i
+        with nogil:
+            count = self.manager.GetNodeNeighbors(homeid, nodeid, &neighbors)
+        if neighbors == NULL:
             return data
-        #Allocate memory for the returned values
-        cdef RetAlloc retuint8 = RetAlloc(count)
-        cdef uint8_t* p
-        cdef uint32_t start = 0
-        if count:
-            try:
-                p = dbuf[0] # p is now pointing at first element of array
-                for i in range(start, count):
-                    #cdef uint8_t = retuint8[i]
-                    retuint8.data[i] = p[0]
-                    data.add(retuint8.data[i])
-                    p += 1
-            finally:
-                #Free memory
-                free(dbuf)
-                pass
+        try:
+            for i in range(count):
+                data.add(neighbors[i])
+        finally:
+            delete_uint8_array(neighbors)
         return data
 
+    def getNodesNeighbors(self, uint32_t homeid, nodeids):
+        '''
+.. _getNodesNeighbors:
+
+Get in a single call the neighbors of many nodes.
+
+The manager is queried without holding the GIL.
+
+:param homeId: The Home ID of the Z-Wave controller that manages the nodes.
+:type homeId: int
+:param nodeIds: The IDs of the nodes to query.
+:type nodeIds: list()
+:return: A dict containing the set of neighboring node IDs of each node
+:rtype: dict()
+:see: getNodeNeighbors_
+
+        '''
+        cdef vector[uint8_t] nodes
+        cdef vector[uint8_t*] neighbors
+        cdef vector[uint32_t] counts
+        cdef size_t i, count
+        cdef uint32_t j
+        for nodeid in nodeids:
+            nodes.push_back(nodeid)
+        count = nodes.size()
+        neighbors.resize(count, NULL)
+        counts.resize(count, 0)
+        with nogil:
+            for i in range(count):
+                counts[i] = self.manager.GetNodeNeighbors(homeid, nodes[i], &neighbors[i])
+        ret = {}
+        try:
+            for i in range(count):
+                data = set()
+                if neighbors[i] != NULL:
+                    for j in range(counts[i]):
+                        data.add(neighbors[i][j])
+                ret[nodes[i]] = data
+        finally:
+            for i in range(count):
+                if neighbors[i] != NULL:
+                    delete_uint8_array(neighbors[i])
+        return ret
+
     def getNodeManufacturerName(self, homeid, nodeid):
         '''
         .. _getNodeManufacturerName:
@@ -2455,7 +3031,7 @@ Node Naming command class, the new location will be sent to the node.
         '''
         self.manager.SetNodeLocation(homeid, nodeid, str_to_cppstr(location))
 
-    def setNodeOn(self, homeid, nodeid):
+    def setNodeOn(self, uint32_t homeid, uint8_t nodeid):
         '''
 .. _setNodeOn:
 
@@ -2475,9 +3051,10 @@ device, otherwise it will turn it on at 100%.
 
         '''
 
-        self.manager.SetNodeOn(homeid, nodeid)
+        with nogil:
+            self.manager.SetNodeOn(homeid, nodeid)
 
-    def setNodeOff(self, homeid, nodeid):
+    def setNodeOff(self, uint32_t homeid, uint8_t nodeid):
         '''
 .. _setNodeOff:
 
@@ -2494,9 +3071,10 @@ zero, and will generate a ValueChanged notification from that class.
 :see: setNodeOn_, setNodeLevel_
 
         '''
-        self.manager.SetNodeOff(homeid, nodeid)
+        with nogil:
+            self.manager.SetNodeOff(homeid, nodeid)
 
-    def setNodeLevel(self, homeid, nodeid, level):
+    def setNodeLevel(self, uint32_t homeid, uint8_t nodeid, uint8_t level):
         '''
 .. _setNodeLevel:
 
@@ -2515,7 +3093,8 @@ and will generate a ValueChanged notification from that class.
 :see: setNodeOn_, setNodeOff_
 
         '''
-        self.manager.SetNodeLevel(homeid, nodeid, level)
+        with nogil:
+            self.manager.SetNodeLevel(homeid, nodeid, level)
 
     def isNodeInfoReceived(self, homeid, nodeid):
         '''
@@ -2661,6 +3240,80 @@ Helper method to return whether a particular class is available in a node
         else :
             return False
 
+    def getNodeStaticInfo(self, uint32_t homeid, uint8_t nodeid):
+        '''
+.. _getNodeStaticInfo:
+
+Get in a single call the informations of a node which change only
+when the node is interviewed : names, types, capabilities and command classes.
+
+The manager is queried without holding the GIL.
+
+:param homeId: The Home ID of the Z-Wave controller that manages the node.
+:type homeId: int
+:param nodeId: The ID of the node to query.
+:type nodeId: int
+:return: A dict with the keys manufacturer_id, manufacturer_name, product_name, product_type, product_id, type, device_type, role, basic, generic, specific, security, version, max_baud_rate, is_listening_device, is_frequent_listening_device, is_beaming_device, is_routing_device, is_security_device, is_zwave_plus and command_classes (a set of ids).
+:rtype: dict()
+:see: getNodeClassInformation_, getNodeType_, getNodeManufacturerName_
+
+        '''
+        cdef string manufacturer_id, manufacturer_name, product_name, product_type, product_id
+        cdef string node_type, device_type, role
+        cdef uint8_t basic, generic, specific, security, version
+        cdef uint32_t max_baud_rate
+        cdef bool listening, frequent, beaming, routing, secure, zwave_plus
+        cdef bool classes[256]
+        cdef string oclassName
+        cdef uint8_t oclassVersion
+        cdef int i
+        with nogil:
+            manufacturer_id = self.manager.GetNodeManufacturerId(homeid, nodeid)
+            manufacturer_name = self.manager.GetNodeManufacturerName(homeid, nodeid)
+            product_name = self.manager.GetNodeProductName(homeid, nodeid)
+            product_type = self.manager.GetNodeProductType(homeid, nodeid)
+            product_id = self.manager.GetNodeProductId(homeid, nodeid)
+            node_type = self.manager.GetNodeType(homeid, nodeid)
+            device_type = self.manager.GetNodeDeviceTypeString(homeid, nodeid)
+            role = self.manager.GetNodeRoleString(homeid, nodeid)
+            basic = self.manager.GetNodeBasic(homeid, nodeid)
+            generic = self.manager.GetNodeGeneric(homeid, nodeid)
+            specific = self.manager.GetNodeSpecific(homeid, nodeid)
+            security = self.manager.GetNodeSecurity(homeid, nodeid)
+            version = self.manager.GetNodeVersion(homeid, nodeid)
+            max_baud_rate = self.manager.GetNodeMaxBaudRate(homeid, nodeid)
+            listening = self.manager.IsNodeListeningDevice(homeid, nodeid)
+            frequent = self.manager.IsNodeFrequentListeningDevice(homeid, nodeid)
+            beaming = self.manager.IsNodeBeamingDevice(homeid, nodeid)
+            routing = self.manager.IsNodeRoutingDevice(homeid, nodeid)
+            secure = self.manager.IsNodeSecurityDevice(homeid, nodeid)
+            zwave_plus = self.manager.IsNodeZWavePlus(homeid, nodeid)
+            for i in range(256):
+                classes[i] = self.manager.GetNodeClassInformation(homeid, nodeid, <uint8_t>i, &oclassName, &oclassVersion)
+        return {
+            'manufacturer_id': cstr_to_str(manufacturer_id.c_str()),
+            'manufacturer_name': cstr_to_str(manufacturer_name.c_str()),
+            'product_name': cstr_to_str(product_name.c_str()),
+            'product_type': cstr_to_str(product_type.c_str()),
+            'product_id': cstr_to_str(product_id.c_str()),
+            'type': cstr_to_str(node_type.c_str()),
+            'device_type': cstr_to_str(device_type.c_str()),
+            'role': cstr_to_str(role.c_str()),
+            'basic': basic,
+            'generic': generic,
+            'specific': specific,
+            'security': security,
+            'version': version,
+            'max_baud_rate': max_baud_rate,
+            'is_listening_device': listening,
+            'is_frequent_listening_device': frequent,
+            'is_beaming_device': beaming,
+            'is_routing_device': routing,
+            'is_security_device': secure,
+            'is_zwave_plus': zwave_plus,
+            'command_classes': set([cls for cls in self.COMMAND_CLASS_DESC if classes[cls]]),
+        }
+
 
     def isNodeAwake(self, homeId, nodeId):
         '''
@@ -2820,7 +3473,7 @@ Get whether the node is a ZWave+ one
 #        bool SetValue(ValueID& valueid, string value)
 #        bool SetValueListSelection(ValueID& valueid, string selecteditem)
 
-    def setValue(self, id, value):
+    def setValue(self, id, value, uint32_t homeid=0):
         '''
 .. _setValue:
 
@@ -2831,6 +3484,8 @@ if the Z-Wave message actually failed to get through.  Notification callbacks wi
 
 :param id: The ID of a value.
 :type id: int
+:param homeid: The home id of the network of the value. 0 to look for it in all the networks.
+:type homeid: int
 :param value: The value to set.
 :type value: int
 :return: An integer representing the result of the operation  0 : The C method fails, 1 : The C method succeed, 2 : Can't find id in the map
@@ -2844,60 +3499,76 @@ if the Z-Wave message actually failed to get through.  Notification callbacks wi
         cdef int16_t type_short
         cdef string type_string
         cdef uint8_t* type_raw
+        cdef uint8_t type_len
+        cdef bool cret
+        cdef ValueID* c_value = newValueId(id, homeid)
         ret = 2
-        if values_map.find(id) != values_map.end():
-            datatype = PyValueTypes[values_map.at(id).GetType()]
-            if datatype == "Bool":
-                type_bool = value
-                cret = self.manager.SetValue(values_map.at(id), type_bool)
-                ret = 1 if cret else 0
-            elif datatype == "Byte":
-                type_byte = value
-                cret = self.manager.SetValue(values_map.at(id), type_byte)
-                ret = 1 if cret else 0
-            elif datatype == "Raw":
-                type_raw = <uint8_t*> malloc(len(value)*sizeof(uint8_t))
-                for x in range(0, len(value)):
-                    #print value[x]
-                    type_raw[x] = ord(value[x])
-                cret = self.manager.SetValue(values_map.at(id), type_raw, len(value))
-                ret = 1 if cret else 0
-                free(type_raw)
-            elif datatype == "Decimal":
-                type_float = value
-                cret = self.manager.SetValue(values_map.at(id), type_float)
-                ret = 1 if cret else 0
-            elif datatype == "Int":
-                type_int = value
-                cret = self.manager.SetValue(values_map.at(id), type_int)
-                ret = 1 if cret else 0
-            elif datatype == "Short":
-                type_short = value
-                cret = self.manager.SetValue(values_map.at(id), type_short)
-                ret = 1 if cret else 0
-            elif datatype == "String":
-                if six.PY3:
-                    type_string = str_to_cppstr(value)
-                else:
-                    type_string = str_to_cppstr(string(value))
-                cret = self.manager.SetValue(values_map.at(id), type_string)
-                ret = 1 if cret else 0
-            elif datatype == "Button":
-                type_bool = value
-                cret = self.manager.SetValue(values_map.at(id), type_bool)
-                ret = 1 if cret else 0
-            elif datatype == "List":
-                logger.debug("SetValueListSelection %s", value)
-                if six.PY3:
-                    type_string = str_to_cppstr(value)
-                else:
-                    type_string = str_to_cppstr(string(value))
-                cret = self.manager.SetValueListSelection(values_map.at(id), type_string)
-                logger.debug("SetValueListSelection %s", cret)
-                ret = 1 if cret else 0
+        if c_value != NULL:
+            try:
+                datatype = PyValueTypes[c_value.GetType()]
+                if datatype == "Bool":
+                    type_bool = value
+                    with nogil:
+                        cret = self.manager.SetValue(deref(c_value), type_bool)
+                    ret = 1 if cret else 0
+                elif datatype == "Byte":
+                    type_byte = value
+                    with nogil:
+                        cret = self.manager.SetValue(deref(c_value), type_byte)
+                    ret = 1 if cret else 0
+                elif datatype == "Raw":
+                    type_raw = <uint8_t*> malloc(len(value)*sizeof(uint8_t))
+                    for x in range(0, len(value)):
+                        #print value[x]
+                        type_raw[x] = ord(value[x])
+                    type_len = len(value)
+                    with nogil:
+                        cret = self.manager.SetValue(deref(c_value), type_raw, type_len)
+                    ret = 1 if cret else 0
+                    free(type_raw)
+                elif datatype == "Decimal":
+                    type_float = value
+                    with nogil:
+                        cret = self.manager.SetValue(deref(c_value), type_float)
+                    ret = 1 if cret else 0
+                elif datatype == "Int":
+                    type_int = value
+                    with nogil:
+                        cret = self.manager.SetValue(deref(c_value), type_int)
+                    ret = 1 if cret else 0
+                elif datatype == "Short":
+                    type_short = value
+                    with nogil:
+                        cret = self.manager.SetValue(deref(c_value), type_short)
+                    ret = 1 if cret else 0
+                elif datatype == "String":
+                    if six.PY3:
+                        type_string = str_to_cppstr(value)
+                    else:
+                        type_string = str_to_cppstr(string(value))
+                    with nogil:
+                        cret = self.manager.SetValue(deref(c_value), type_string)
+                    ret = 1 if cret else 0
+                elif datatype == "Button":
+                    type_bool = value
+                    with nogil:
+                        cret = self.manager.SetValue(deref(c_value), type_bool)
+                    ret = 1 if cret else 0
+                elif datatype == "List":
+                    logger.debug("SetValueListSelection %s", value)
+                    if six.PY3:
+                        type_string = str_to_cppstr(value)
+                    else:
+                        type_string = str_to_cppstr(string(value))
+                    with nogil:
+                        cret = self.manager.SetValueListSelection(deref(c_value), type_string)
+                    logger.debug("SetValueListSelection %s", cret)
+                    ret = 1 if cret else 0
+            finally:
+                del c_value
         return ret
 
-    def refreshValue(self, id):
+    def refreshValue(self, id, uint32_t homeid=0):
         '''
 .. _refreshValue:
 
@@ -2907,12 +3578,21 @@ of the specified ValueID (just like a poll, except only one-time, not recurring)
 
 :param id: The unique identifier of the value to be refreshed.
 :type id: int
+:param homeid: The home id of the network of the value. 0 to look for it in all the networks.
+:type homeid: int
 :return: bool -- True if the driver and node were found; false otherwise
 
         '''
-        return self.manager.RefreshValue(values_map.at(id))
+        cdef bool ret
+        cdef ValueID* c_value = newValueId(id, homeid)
+        if c_value == NULL:
+            return False
+        with nogil:
+            ret = self.manager.RefreshValue(deref(c_value))
+        del c_value
+        return ret
 
-    def getValueLabel(self, id):
+    def getValueLabel(self, id, uint32_t homeid=0):
         '''
 .. _getValueLabel:
 
@@ -2920,19 +3600,19 @@ Gets the user-friendly label for the value
 
 :param id: The ID of a value.
 :type id: int
+:param homeid: The home id of the network of the value. 0 to look for it in all the networks.
+:type homeid: int
 :return: A string containing the user-friendly label of the value
 :rtype: str
 :see: setValueLabel_
 
        '''
-        cdef string c_string
-        if values_map.find(id) != values_map.end():
-            c_string = self.manager.GetValueLabel(values_map.at(id))
-            return cstr_to_str(c_string.c_str())
+        if findValueId(id, homeid) != NULL:
+            return cstr_to_str(getValueMetadata(self.manager, deref(findValueId(id, homeid)))[0])
         else :
             return None
 
-    def setValueLabel(self, id, str label):
+    def setValueLabel(self, id, str label, uint32_t homeid=0):
         '''
 .. _setValueLabel:
 
@@ -2940,15 +3620,18 @@ Sets the user-friendly label for the value
 
 :param id: The ID of a value.
 :type id: int
+:param homeid: The home id of the network of the value. 0 to look for it in all the networks.
+:type homeid: int
 :param label: The label of the value.
 :type label: str
 :see: getValueLabel_
 
         '''
-        if values_map.find(id) != values_map.end():
-            self.manager.SetValueLabel(values_map.at(id), str_to_cppstr(label))
+        if findValueId(id, homeid) != NULL:
+            self.manager.SetValueLabel(deref(findValueId(id, homeid)), str_to_cppstr(label))
+            popValueMetadata(deref(findValueId(id, homeid)))
 
-    def getValueUnits(self, id):
+    def getValueUnits(self, id, uint32_t homeid=0):
         '''
 .. _getValueUnits:
 
@@ -2956,19 +3639,19 @@ Gets the units that the value is measured in.
 
 :param id: The ID of a value.
 :type id: int
+:param homeid: The home id of the network of the value. 0 to look for it in all the networks.
+:type homeid: int
 :return: A string containing the value of the units.
 :rtype: str
 :see: setValueUnits_
 
         '''
-        cdef string c_string
-        if values_map.find(id) != values_map.end():
-            c_string = self.manager.GetValueUnits(values_map.at(id))
-            return cstr_to_str(c_string.c_str())
+        if findValueId(id, homeid) != NULL:
+            return cstr_to_str(getValueMetadata(self.manager, deref(findValueId(id, homeid)))[1])
         else :
             return None
 
-    def setValueUnits(self, id, str unit):
+    def setValueUnits(self, id, str unit, uint32_t homeid=0):
         '''
 .. _setValueUnits:
 
@@ -2976,15 +3659,18 @@ Sets the units that the value is measured in.
 
 :param id: The ID of a value.
 :type id: int
+:param homeid: The home id of the network of the value. 0 to look for it in all the networks.
+:type homeid: int
 :param label: The new value of the units.
 :type label: str
 :see: getValueUnits_
 
         '''
-        if values_map.find(id) != values_map.end():
-            self.manager.SetValueUnits(values_map.at(id), str_to_cppstr(unit))
+        if findValueId(id, homeid) != NULL:
+            self.manager.SetValueUnits(deref(findValueId(id, homeid)), str_to_cppstr(unit))
+            popValueMetadata(deref(findValueId(id, homeid)))
 
-    def getValueHelp(self, id):
+    def getValueHelp(self, id, uint32_t homeid=0):
         '''
 .. _getValueHelp:
 
@@ -2992,19 +3678,21 @@ Gets a help string describing the value's purpose and usage.
 
 :param id: The ID of a value.
 :type id: int
+:param homeid: The home id of the network of the value. 0 to look for it in all the networks.
+:type homeid: int
 :return: A string containing the value help text.
 :rtype: str
 :see: setValueHelp_
 
         '''
         cdef string c_string
-        if values_map.find(id) != values_map.end():
-            c_string = self.manager.GetValueHelp(values_map.at(id))
+        if findValueId(id, homeid) != NULL:
+            c_string = self.manager.GetValueHelp(deref(findValueId(id, homeid)))
             return cstr_to_str(c_string.c_str())
         else :
             return None
 
-    def setValueHelp(self, id, str help):
+    def setValueHelp(self, id, str help, uint32_t homeid=0):
         '''
 .. _setValueHelp:
 
@@ -3012,15 +3700,17 @@ Sets a help string describing the value's purpose and usage.
 
 :param id: the ID of a value.
 :type id: int
+:param homeid: The home id of the network of the value. 0 to look for it in all the networks.
+:type homeid: int
 :param help: The new value of the help text.
 :type help: str
 :see: getValueHelp_
 
         '''
-        if values_map.find(id) != values_map.end():
-            self.manager.SetValueHelp(values_map.at(id), str_to_cppstr(help))
+        if findValueId(id, homeid) != NULL:
+            self.manager.SetValueHelp(deref(findValueId(id, homeid)), str_to_cppstr(help))
 
-    def getValueMin(self, id):
+    def getValueMin(self, id, uint32_t homeid=0):
         '''
 .. _getValueMin:
 
@@ -3028,17 +3718,19 @@ Gets the minimum that this value may contain.
 
 :param id: The ID of a value.
 :type id: int
+:param homeid: The home id of the network of the value. 0 to look for it in all the networks.
+:type homeid: int
 :return: The value minimum.
 :rtype: int
 :see: getValueMax_
 
         '''
-        if values_map.find(id) != values_map.end():
-            return self.manager.GetValueMin(values_map.at(id))
+        if findValueId(id, homeid) != NULL:
+            return self.manager.GetValueMin(deref(findValueId(id, homeid)))
         else :
             return None
 
-    def getValueMax(self, id):
+    def getValueMax(self, id, uint32_t homeid=0):
         '''
 .. _getValueMax:
 
@@ -3046,17 +3738,19 @@ Gets the maximum that this value may contain.
 
 :param id: The ID of a value.
 :type id: int
+:param homeid: The home id of the network of the value. 0 to look for it in all the networks.
+:type homeid: int
 :return: The value maximum.
 :rtype: int
 :see: getValueMin_
 
         '''
-        if values_map.find(id) != values_map.end():
-            return self.manager.GetValueMax(values_map.at(id))
+        if findValueId(id, homeid) != NULL:
+            return self.manager.GetValueMax(deref(findValueId(id, homeid)))
         else :
             return None
 
-    def isValueReadOnly(self, id):
+    def isValueReadOnly(self, id, uint32_t homeid=0):
         '''
 .. _isValueReadOnly:
 
@@ -3064,17 +3758,19 @@ Test whether the value is read-only.
 
 :param id: The ID of a value.
 :type id: int
+:param homeid: The home id of the network of the value. 0 to look for it in all the networks.
+:type homeid: int
 :return: True if the value cannot be changed by the user.
 :rtype: bool
 :see: isValueWriteOnly_
 
         '''
-        if values_map.find(id) != values_map.end():
-            return self.manager.IsValueReadOnly(values_map.at(id))
+        if findValueId(id, homeid) != NULL:
+            return getValueMetadata(self.manager, deref(findValueId(id, homeid)))[2]
         else :
             return None
 
-    def isValueWriteOnly(self, id):
+    def isValueWriteOnly(self, id, uint32_t homeid=0):
         '''
 .. _isValueWriteOnly:
 
@@ -3082,17 +3778,19 @@ Test whether the value is write-only.
 
 :param id: The ID of a value.
 :type id: int
+:param homeid: The home id of the network of the value. 0 to look for it in all the networks.
+:type homeid: int
 :return: True if the value can only be written to and not read.
 :rtype: bool
 :see: isValueReadOnly_
 
         '''
-        if values_map.find(id) != values_map.end():
-            return self.manager.IsValueWriteOnly(values_map.at(id))
+        if findValueId(id, homeid) != NULL:
+            return self.manager.IsValueWriteOnly(deref(findValueId(id, homeid)))
         else :
             return None
 
-    def isValueSet(self, id):
+    def isValueSet(self, id, uint32_t homeid=0):
         '''
 .. _isValueSet:
 
@@ -3100,6 +3798,8 @@ Test whether the value has been set.
 
 :param id: the ID of a value.
 :type id: int
+:param homeid: The home id of the network of the value. 0 to look for it in all the networks.
+:type homeid: int
 :return: True if the value has actually been set by a status message from the device, rather than simply being the default.
 :rtype: bool
 :see: getValue_, getValueAsBool_, getValueAsByte_, getValueListItems_, \
@@ -3107,12 +3807,12 @@ getValueAsFloat_, getValueAsShort_, getValueAsInt_, getValueAsString_, \
 getValueType_, getValueInstance_, getValueIndex_
 
         '''
-        if values_map.find(id) != values_map.end():
-            return self.manager.IsValueSet(values_map.at(id))
+        if findValueId(id, homeid) != NULL:
+            return self.manager.IsValueSet(deref(findValueId(id, homeid)))
         else :
             return None
 
-    def isValuePolled(self, id):
+    def isValuePolled(self, id, uint32_t homeid=0):
         '''
 .. _isValuePolled:
 
@@ -3120,16 +3820,18 @@ Test whether the value is currently being polled.
 
 :param id: the ID of a value.
 :type id: int
+:param homeid: The home id of the network of the value. 0 to look for it in all the networks.
+:type homeid: int
 :return: True if the value is being polled, otherwise false.
 :rtype: bool
 
         '''
-        if values_map.find(id) != values_map.end():
-            return self.manager.IsValuePolled(values_map.at(id))
+        if findValueId(id, homeid) != NULL:
+            return self.manager.IsValuePolled(deref(findValueId(id, homeid)))
         else :
             return None
 
-    def getValueGenre(self, id):
+    def getValueGenre(self, id, uint32_t homeid=0):
         '''
 .. _getValueGenre:
 
@@ -3139,6 +3841,8 @@ by the application
 
 :param id: The ID of a value.
 :type id: int
+:param homeid: The home id of the network of the value. 0 to look for it in all the networks.
+:type homeid: int
 :return: A string containing the type of the value
 :rtype: str
 :see: isValueSet_, getValueAsBool_, getValueAsByte_, getValueListItems_, \
@@ -3147,13 +3851,13 @@ getValueAsFloat_, getValueAsShort_, getValueAsInt_, getValueCommandClass_,\
 getValueAsString_, getValue_, getValueType_, getValueInstance_, getValueIndex_
 
        '''
-        if values_map.find(id) != values_map.end():
-            genre = PyGenres[values_map.at(id).GetGenre()]
+        if findValueId(id, homeid) != NULL:
+            genre = PyGenres[deref(findValueId(id, homeid)).GetGenre()]
             return genre
         else :
             return None
 
-    def getValueCommandClass(self, id):
+    def getValueCommandClass(self, id, uint32_t homeid=0):
         '''
 .. _getValueCommandClass:
 
@@ -3166,6 +3870,8 @@ information is exposed in case it is of interest.
 
 :param id: The ID of a value.
 :type id: int
+:param homeid: The home id of the network of the value. 0 to look for it in all the networks.
+:type homeid: int
 :return: The command class of the value
 :rtype: int
 :see: isValueSet_, getValueAsBool_, getValueAsByte_, getValueListItems_, \
@@ -3174,13 +3880,13 @@ getValueAsFloat_, getValueAsShort_, getValueAsInt_, getValueGenre_, \
 getValueAsString_, getValue_, getValueType_, getValueInstance_, getValueIndex_
 
        '''
-        if values_map.find(id) != values_map.end():
-            cmd_cls = values_map.at(id).GetCommandClassId()
+        if findValueId(id, homeid) != NULL:
+            cmd_cls = deref(findValueId(id, homeid)).GetCommandClassId()
             return cmd_cls
         else :
             return None
 
-    def getValueInstance(self, id):
+    def getValueInstance(self, id, uint32_t homeid=0):
         '''
 .. _getValueInstance:
 
@@ -3190,6 +3896,8 @@ only the SensorMultilevel command class ever does this.
 
 :param id: The ID of a value.
 :type id: int
+:param homeid: The home id of the network of the value. 0 to look for it in all the networks.
+:type homeid: int
 :return: A string containing the type of the value
 :rtype: str
 :see: isValueSet_, getValueAsBool_, getValueAsByte_, getValueListItems_, \
@@ -3198,13 +3906,13 @@ getValueAsFloat_, getValueAsShort_, getValueAsInt_, getValueCommandClass_, \
 getValueAsString_, getValue_, getValueType_, getValueIndex_
 
        '''
-        if values_map.find(id) != values_map.end():
-            genre = values_map.at(id).GetInstance()
+        if findValueId(id, homeid) != NULL:
+            genre = deref(findValueId(id, homeid)).GetInstance()
             return genre
         else :
             return None
 
-    def getValueIndex(self, id):
+    def getValueIndex(self, id, uint32_t homeid=0):
         '''
 .. _getValueIndex:
 
@@ -3215,6 +3923,8 @@ same as the parameter ID.
 
 :param id: The ID of a value.
 :type id: int
+:param homeid: The home id of the network of the value. 0 to look for it in all the networks.
+:type homeid: int
 :return: A string containing the type of the value
 :rtype: str
 :see: isValueSet_, getValueAsBool_, getValueAsByte_, getValueListItems_, \
@@ -3223,13 +3933,13 @@ getValueAsFloat_, getValueAsShort_, getValueAsInt_, getValueCommandClass_, \
 getValueAsString_, getValue_, getValueType_
 
        '''
-        if values_map.find(id) != values_map.end():
-            genre = values_map.at(id).GetIndex()
+        if findValueId(id, homeid) != NULL:
+            genre = deref(findValueId(id, homeid)).GetIndex()
             return genre
         else :
             return None
 
-    def getValueType(self, id):
+    def getValueType(self, id, uint32_t homeid=0):
         '''
 .. _getValueType:
 
@@ -3237,6 +3947,8 @@ Gets the type of the value
 
 :param id: The ID of a value.
 :type id: int
+:param homeid: The home id of the network of the value. 0 to look for it in all the networks.
+:type homeid: int
 :return: A string containing the type of the value
 :rtype: str
 :see: isValueSet_, getValueAsBool_, getValueAsByte_, getValueListItems_, \
@@ -3245,13 +3957,13 @@ getValueAsFloat_, getValueAsShort_, getValueAsInt_, getValueAsString_, \
 getValue_, getValueInstance_, getValueIndex_, getValueCommandClass_
 
        '''
-        if values_map.find(id) != values_map.end():
-            datatype = PyValueTypes[values_map.at(id).GetType()]
+        if findValueId(id, homeid) != NULL:
+            datatype = PyValueTypes[deref(findValueId(id, homeid)).GetType()]
             return datatype
         else :
             return None
 
-    def getValue(self, id):
+    def getValue(self, id, uint32_t homeid=0):
         '''
 .. _getValue:
 
@@ -3259,6 +3971,8 @@ Gets a value.
 
 :param id: The ID of a value.
 :type id: int
+:param homeid: The home id of the network of the value. 0 to look for it in all the networks.
+:type homeid: int
 :param value: The value to set.
 :type value: int
 :return: Depending of the type of the valueId, None otherwise
@@ -3269,9 +3983,9 @@ getValueAsFloat_, getValueAsShort_, getValueAsInt_, getValueAsString_, \
 getValueType_, getValueInstance_, getValueIndex_, getValueCommandClass_
 
         '''
-        return getValueFromType(self.manager,id)
+        return getValueFromType(self.manager, id, homeid)
 
-    def getValueAsBool(self, id):
+    def getValueAsBool(self, id, uint32_t homeid=0):
         '''
 .. _getValueAsBool:
 
@@ -3279,6 +3993,8 @@ Gets a value as a bool.
 
 :param id: The ID of a value.
 :type id: int
+:param homeid: The home id of the network of the value. 0 to look for it in all the networks.
+:type homeid: int
 :return: The value
 :rtype: bool
 :see: isValueSet_, getValue_, getValueAsByte_, getValueListItems_, \
@@ -3287,9 +4003,9 @@ getValueAsFloat_, getValueAsShort_, getValueAsInt_, getValueAsString_, \
 getValueType_, getValueInstance_, getValueIndex_, getValueCommandClass_
 
         '''
-        return getValueFromType(self.manager,id)
+        return getValueFromType(self.manager, id, homeid)
 
-    def getValueAsByte(self, id):
+    def getValueAsByte(self, id, uint32_t homeid=0):
         '''
 .. _getValueAsByte:
 
@@ -3297,6 +4013,8 @@ Gets a value as an 8-bit unsigned integer.
 
 :param id: The ID of a value.
 :type id: int
+:param homeid: The home id of the network of the value. 0 to look for it in all the networks.
+:type homeid: int
 :return: The value
 :rtype: int
 :see: isValueSet_, getValue_, getValueAsBool_, getValueListItems_, \
@@ -3305,9 +4023,9 @@ getValueAsFloat_, getValueAsShort_, getValueAsInt_, getValueAsString_, \
 getValueType_, getValueInstance_, getValueIndex_, getValueCommandClass_
 
         '''
-        return getValueFromType(self.manager,id)
+        return getValueFromType(self.manager, id, homeid)
 
-    def getValueAsFloat(self, id):
+    def getValueAsFloat(self, id, uint32_t homeid=0):
         '''
 .. _getValueAsFloat:
 
@@ -3315,6 +4033,8 @@ Gets a value as a float.
 
 :param id: The ID of a value.
 :type id: int
+:param homeid: The home id of the network of the value. 0 to look for it in all the networks.
+:type homeid: int
 :return: The value
 :rtype: float
 :see: isValueSet_, getValue_, getValueAsBool_, getValueAsByte_, \
@@ -3323,9 +4043,9 @@ getValueAsShort_, getValueAsInt_, getValueAsString_, getValueListItems_, \
 getValueType_, getValueInstance_, getValueIndex_
 
         '''
-        return getValueFromType(self.manager,id)
+        return getValueFromType(self.manager, id, homeid)
 
-    def getValueAsShort(self, id):
+    def getValueAsShort(self, id, uint32_t homeid=0):
         '''
 .. _getValueAsShort:
 
@@ -3333,6 +4053,8 @@ Gets a value as a 16-bit signed integer.
 
 :param id: The ID of a value.
 :type id: int
+:param homeid: The home id of the network of the value. 0 to look for it in all the networks.
+:type homeid: int
 :return: The value
 :rtype: int
 :see: isValueSet_, getValue_, getValueAsBool_, getValueAsByte_, \
@@ -3341,9 +4063,9 @@ getValueAsFloat_, getValueAsInt_, getValueAsString_, getValueListItems_, \
 getValueType_, getValueInstance_, getValueIndex_
 
         '''
-        return getValueFromType(self.manager,id)
+        return getValueFromType(self.manager, id, homeid)
 
-    def getValueAsInt(self, id):
+    def getValueAsInt(self, id, uint32_t homeid=0):
         '''
 .. _getValueAsInt:
 
@@ -3351,6 +4073,8 @@ Gets a value as a 32-bit signed integer.
 
 :param id: The ID of a value.
 :type id: int
+:param homeid: The home id of the network of the value. 0 to look for it in all the networks.
+:type homeid: int
 :return: The value
 :rtype: int
 :see: isValueSet_, getValue_, getValueAsBool_, getValueAsByte_, \
@@ -3359,9 +4083,9 @@ getValueAsFloat_, getValueAsShort_, getValueAsString_, getValueListItems_, \
 getValueType_, getValueInstance_, getValueIndex_
 
         '''
-        return getValueFromType(self.manager,id)
+        return getValueFromType(self.manager, id, homeid)
 
-    def getValueAsString(self, id):
+    def getValueAsString(self, id, uint32_t homeid=0):
         '''
 .. _getValueAsString:
 
@@ -3369,6 +4093,8 @@ Gets a value as a string.
 
 :param id: The ID of a value.
 :type id: int
+:param homeid: The home id of the network of the value. 0 to look for it in all the networks.
+:type homeid: int
 :return: The value
 :rtype: str
 :see: isValueSet_, getValue_, getValueAsBool_, getValueAsByte_, \
@@ -3377,9 +4103,9 @@ getValueAsFloat_, getValueAsShort_, getValueAsInt_, getValueListItems_, \
 getValueType_, getValueInstance_, getValueIndex_
 
         '''
-        return getValueFromType(self.manager,id)
+        return getValueFromType(self.manager, id, homeid)
 
-    def getValueAsRaw(self, id):
+    def getValueAsRaw(self, id, uint32_t homeid=0):
         '''
 .. _getValueAsRaw:
 
@@ -3387,6 +4113,8 @@ Gets a value as raw.
 
 :param id: The ID of a value.
 :type id: int
+:param homeid: The home id of the network of the value. 0 to look for it in all the networks.
+:type homeid: int
 :return: The value
 :rtype: str
 :see: isValueSet_, getValue_, getValueAsBool_, getValueAsByte_, \
@@ -3395,9 +4123,9 @@ getValueAsFloat_, getValueAsShort_, getValueAsInt_, getValueListItems_, \
 getValueType_, getValueInstance_, getValueIndex_
 
         '''
-        return getValueFromType(self.manager,id)
+        return getValueFromType(self.manager, id, homeid)
 
-    def getValueListSelectionStr(self,  id):
+    def getValueListSelectionStr(self,  id, uint32_t homeid=0):
         '''
 .. _getValueListSelectionStr:
 
@@ -3405,6 +4133,8 @@ Gets value of items from a list value
 
 :param id: The ID of a value.
 :type id: int
+:param homeid: The home id of the network of the value. 0 to look for it in all the networks.
+:type homeid: int
 :return: The value
 :rtype: str
 :see: isValueSet_, getValue_, getValueAsBool_, getValueAsByte_, \
@@ -3412,9 +4142,9 @@ getValueListSelectionNum_, getValueListItems_,\
 getValueAsFloat_, getValueAsShort_, getValueAsInt_, getValueAsString_, \
 getValueType_, getValueInstance_, getValueIndex_
     '''
-        return getValueFromType(self.manager,id)
+        return getValueFromType(self.manager, id, homeid)
 
-    def getValueListSelectionNum(self,  id):
+    def getValueListSelectionNum(self,  id, uint32_t homeid=0):
         '''
 .. _getValueListSelectionNum:
 
@@ -3422,6 +4152,8 @@ Gets value of items from a list value
 
 :param id: The ID of a value.
 :type id: int
+:param homeid: The home id of the network of the value. 0 to look for it in all the networks.
+:type homeid: int
 :return: The value
 :rtype: int
 :see: isValueSet_, getValue_, getValueAsBool_, getValueAsByte_, \
@@ -3431,13 +4163,13 @@ getValueType_, getValueInstance_, getValueIndex_
     '''
         cdef int32_t type_int
         ret=-1
-        if values_map.find(id) != values_map.end():
-            if self.manager.GetValueListSelection(values_map.at(id), &type_int):
+        if findValueId(id, homeid) != NULL:
+            if self.manager.GetValueListSelection(deref(findValueId(id, homeid)), &type_int):
                 ret = type_int
         #print "//////// Value Num list item : " ,  ret
         return ret
 
-    def getValueListItems(self, id):
+    def getValueListItems(self, id, uint32_t homeid=0):
         '''
 .. _getValueListItems:
 
@@ -3445,6 +4177,8 @@ Gets the list of items from a list value
 
 :param id: The ID of a value.
 :type id: int
+:param homeid: The home id of the network of the value. 0 to look for it in all the networks.
+:type homeid: int
 :return: The list of possible values
 :rtype: set()
 :see: isValueSet_, getValue_, getValueAsBool_, getValueAsByte_, \
@@ -3455,15 +4189,15 @@ getValueType_, getValueInstance_, getValueIndex_
         '''
         cdef vector[string] vect
         ret = set()
-        if values_map.find(id) != values_map.end():
-            if self.manager.GetValueListItems(values_map.at(id), &vect):
+        if findValueId(id, homeid) != NULL:
+            if self.manager.GetValueListItems(deref(findValueId(id, homeid)), &vect):
                 while not vect.empty() :
                     temp = vect.back()
                     ret.add(temp.c_str())
                     vect.pop_back();
         return ret
 
-    def getValueListValues(self, id):
+    def getValueListValues(self, id, uint32_t homeid=0):
         '''
 .. _getValueListValues:
 
@@ -3471,6 +4205,8 @@ Gets the list of values from a list value.
 
 :param id: The ID of a value.
 :type id: int
+:param homeid: The home id of the network of the value. 0 to look for it in all the networks.
+:type homeid: int
 :return: The list of values
 :rtype: set()
 :see: isValueSet_, getValue_, getValueAsBool_, getValueAsByte_, \
@@ -3481,15 +4217,15 @@ getValueType_, getValueInstance_, getValueIndex_
         '''
         cdef vector[int32_t] vect
         ret = set()
-        if values_map.find(id) != values_map.end():
-            if self.manager.GetValueListValues(values_map.at(id), &vect):
+        if findValueId(id, homeid) != NULL:
+            if self.manager.GetValueListValues(deref(findValueId(id, homeid)), &vect):
                 while not vect.empty() :
                     temp = vect.back()
                     ret.add(temp)
                     vect.pop_back();
         return ret
 
-    def pressButton(self, id):
+    def pressButton(self, id, uint32_t homeid=0):
         '''
 .. _pressButton:
 
@@ -3499,17 +4235,23 @@ no notification callbacks are sent.
 
 :param id: The ID of an integer value.
 :type id: int
+:param homeid: The home id of the network of the value. 0 to look for it in all the networks.
+:type homeid: int
 :return: True if the activity was started. Returns false if the value is not a ValueID::ValueType_Button. The type can be tested with a call to ValueID::GetType.
 :rtype: bool
 :see: releaseButton_
 
         '''
-        if values_map.find(id) != values_map.end():
-            return self.manager.PressButton(values_map.at(id))
-        else :
+        cdef bool ret
+        cdef ValueID* c_value = newValueId(id, homeid)
+        if c_value == NULL:
             return False
+        with nogil:
+            ret = self.manager.PressButton(deref(c_value))
+        del c_value
+        return ret
 
-    def releaseButton(self, id):
+    def releaseButton(self, id, uint32_t homeid=0):
         '''
 .. _releaseButton:
 
@@ -3519,34 +4261,42 @@ no notification callbacks are sent.
 
 :param id: the ID of an integer value.
 :type id: int
+:param homeid: The home id of the network of the value. 0 to look for it in all the networks.
+:type homeid: int
 :return: True if the activity was stopped. Returns false if the value is not a ValueID::ValueType_Button. The type can be tested with a call to ValueID::GetType.
 :rtype: bool
 :see: pressButton_
 
         '''
-        if values_map.find(id) != values_map.end():
-            return self.manager.ReleaseButton(values_map.at(id))
-        else :
+        cdef bool ret
+        cdef ValueID* c_value = newValueId(id, homeid)
+        if c_value == NULL:
             return False
+        with nogil:
+            ret = self.manager.ReleaseButton(deref(c_value))
+        del c_value
+        return ret
 
 
-    def getValueFloatPrecision(self, id):
+    def getValueFloatPrecision(self, id, uint32_t homeid=0):
         '''
 .. _getValueFloatPrecision: Gets a float value's precision
 
 :param id: The unique identifier of the value.
 :type id: int
+:param homeid: The home id of the network of the value. 0 to look for it in all the networks.
+:type homeid: int
 :return: a float value's precision.
 :rtype: int
 
         '''
         cdef uint8_t precision
-        if values_map.find(id) != values_map.end():
-            success = self.manager.GetValueFloatPrecision(values_map.at(id), &precision)
+        if findValueId(id, homeid) != NULL:
+            success = self.manager.GetValueFloatPrecision(deref(findValueId(id, homeid)), &precision)
             return precision if success else None
         return None
 
-    def getChangeVerified(self, id):
+    def getChangeVerified(self, id, uint32_t homeid=0):
         '''
 .. _getChangeVerified: determine if value changes upon a refresh should be verified.
 
@@ -3555,16 +4305,18 @@ This helps to filter out spurious data reported occasionally by some devices.
 
 :param id:  The unique identifier of the value whose changes should or should not be verified.
 :type id: int
+:param homeid: The home id of the network of the value. 0 to look for it in all the networks.
+:type homeid: int
 :return: True if is verified.
 :rtype: bool
 
         '''
 
-        if values_map.find(id) != values_map.end():
-            return self.manager.GetChangeVerified(values_map.at(id))
+        if findValueId(id, homeid) != NULL:
+            return self.manager.GetChangeVerified(deref(findValueId(id, homeid)))
         return False
 
-    def setChangeVerified(self, id, verify ):
+    def setChangeVerified(self, id, verify, uint32_t homeid=0):
         '''
 .. _setChangeVerified: Sets a flag indicating whether value changes noted upon a refresh should be verified.
 
@@ -3572,13 +4324,15 @@ If so, the library will immediately refresh the value a second time whenever a c
 
 :param id: The unique identifier of the value whose changes should or should not be verified.
 :type id: int
+:param homeid: The home id of the network of the value. 0 to look for it in all the networks.
+:type homeid: int
 :param verify: if true, verify changes; if false, don't verify changes
 :type verify: bool
 
         '''
 
-        if values_map.find(id) != values_map.end():
-            self.manager.SetChangeVerified(values_map.at(id), verify)
+        if findValueId(id, homeid) != NULL:
+            self.manager.SetChangeVerified(deref(findValueId(id, homeid)), verify)
 
 #
 # -----------------------------------------------------------------------------
@@ -3595,7 +4349,7 @@ If so, the library will immediately refresh the value a second time whenever a c
 # The switch point methods only modify OpenZWave's copy of the schedule information.  Once all changes
 # have been made, they are sent to the device by calling SetSchedule.
 #
-    def setSwitchPoint(self, id, hours, minutes, setback):
+    def setSwitchPoint(self, id, hours, minutes, setback, uint32_t homeid=0):
         '''
 .. _setSwitchPoint:
 
@@ -3603,6 +4357,8 @@ Set a switch point in the schedule.
 
 :param id: The unique identifier of the schedule value.
 :type id: int
+:param homeid: The home id of the network of the value. 0 to look for it in all the networks.
+:type homeid: int
 :param hours: The hours part of the time when the switch point will trigger. The time is set using the 24-hour clock, so this value must be between 0 and 23.
 :type hours: int
 :param minutes: The minutes part of the time when the switch point will trigger.  This value must be between 0 and 59.
@@ -3614,12 +4370,12 @@ Set a switch point in the schedule.
 :see: removeSwitchPoint_, clearSwitchPoints_, getSwitchPoint_, getNumSwitchPoints_
 
         '''
-        if values_map.find(id) != values_map.end():
-            return self.manager.SetSwitchPoint(values_map.at(id), hours, minutes, setback)
+        if findValueId(id, homeid) != NULL:
+            return self.manager.SetSwitchPoint(deref(findValueId(id, homeid)), hours, minutes, setback)
         else :
             return False
 
-    def removeSwitchPoint(self, id, hours, minutes):
+    def removeSwitchPoint(self, id, hours, minutes, uint32_t homeid=0):
         '''
 .. _removeSwitchPoint:
 
@@ -3627,6 +4383,8 @@ Remove a switch point from the schedule
 
 :param id: The unique identifier of the schedule value.
 :type id: int
+:param homeid: The home id of the network of the value. 0 to look for it in all the networks.
+:type homeid: int
 :param hours: The hours part of the time when the switch point will trigger.  The time is set using the 24-hour clock, so this value must be between 0 and 23.
 :type hours: int
 :param minutes: The minutes part of the time when the switch point will trigger.  This value must be between 0 and 59.
@@ -3636,12 +4394,12 @@ Remove a switch point from the schedule
 :see: setSwitchPoint_, clearSwitchPoints_, getSwitchPoint_, getNumSwitchPoints_
 
         '''
-        if values_map.find(id) != values_map.end():
-            return self.manager.RemoveSwitchPoint(values_map.at(id), hours, minutes)
+        if findValueId(id, homeid) != NULL:
+            return self.manager.RemoveSwitchPoint(deref(findValueId(id, homeid)), hours, minutes)
         else :
             return False
 
-    def clearSwitchPoints(self, id):
+    def clearSwitchPoints(self, id, uint32_t homeid=0):
         '''
 .. _clearSwitchPoints:
 
@@ -3649,15 +4407,17 @@ Clears all switch points from the schedule
 
 :param id: The unique identifier of the schedule value.
 :type id: int
+:param homeid: The home id of the network of the value. 0 to look for it in all the networks.
+:type homeid: int
 :return: True if all switch points are clear.
 :rtype: bool
 :see: setSwitchPoint_, removeSwitchPoint_, getSwitchPoint_, getNumSwitchPoints_
 
         '''
-        if values_map.find(id) != values_map.end():
-            self.manager.ClearSwitchPoints(values_map.at(id))
+        if findValueId(id, homeid) != NULL:
+            self.manager.ClearSwitchPoints(deref(findValueId(id, homeid)))
 
-    def getSwitchPoint(self, id, idx, hours, minutes, setback):
+    def getSwitchPoint(self, id, idx, hours, minutes, setback, uint32_t homeid=0):
         '''
 .. _getSwitchPoint:
 
@@ -3665,6 +4425,8 @@ Gets switch point data from the schedule
 
 :param id: The unique identifier of the schedule value.
 :type id: int
+:param homeid: The home id of the network of the value. 0 to look for it in all the networks.
+:type homeid: int
 :param idx: The index of the switch point, between zero and one less than the value returned by GetNumSwitchPoints.
 :type idx: int
 :param hours: An integer that will be filled with the hours part of the switch point data.
@@ -3681,8 +4443,8 @@ Gets switch point data from the schedule
         cdef uint8_t ohours
         cdef uint8_t ominutes
         cdef int8_t osetback
-        if values_map.find(id) != values_map.end():
-            ret=self.manager.GetSwitchPoint(values_map.at(id), idx, \
+        if findValueId(id, homeid) != NULL:
+            ret=self.manager.GetSwitchPoint(deref(findValueId(id, homeid)), idx, \
                 &ohours, &ominutes, &osetback)
             if ret :
                 hours = ohours
@@ -3693,7 +4455,7 @@ Gets switch point data from the schedule
             return False
 #        return False
 
-    def getNumSwitchPoints(self, id):
+    def getNumSwitchPoints(self, id, uint32_t homeid=0):
         '''
 .. _getNumSwitchPoints:
 
@@ -3701,13 +4463,15 @@ Get the number of switch points defined in a schedule
 
 :param id: The unique identifier of the schedule value.
 :type id: int
+:param homeid: The home id of the network of the value. 0 to look for it in all the networks.
+:type homeid: int
 :return: The number of switch points defined in this schedule.  Returns zero if the value is not a ValueID::ValueType_Schedule. The type can be tested with a call to ValueID::GetType.
 :rtype: int
 :see: setSwitchPoint_, removeSwitchPoint_, clearSwitchPoints_, getSwitchPoint_
 
         '''
-        if values_map.find(id) != values_map.end():
-            return self.manager.GetNumSwitchPoints(values_map.at(id))
+        if findValueId(id, homeid) != NULL:
+            return self.manager.GetNumSwitchPoints(deref(findValueId(id, homeid)))
         else :
             return 0
 
@@ -3720,7 +4484,7 @@ Get the number of switch points defined in a schedule
 # then followed up with individual commands to each node (because broadcasts are
 # not routed, the message might not otherwise reach all the nodes).
 #
-    def switchAllOn(self, homeid):
+    def switchAllOn(self, uint32_t homeid):
         '''
 .. _switchAllOn:
 
@@ -3732,9 +4496,10 @@ will be turned on.
 :see: switchAllOff_
 
         '''
-        self.manager.SwitchAllOn(homeid)
+        with nogil:
+            self.manager.SwitchAllOn(homeid)
 
-    def switchAllOff(self, homeid):
+    def switchAllOff(self, uint32_t homeid):
         '''
 .. _switchAllOff:
 
@@ -3746,7 +4511,8 @@ will be turned off.
 :see: switchAllOn_
 
         '''
-        self.manager.SwitchAllOff(homeid)
+        with nogil:
+            self.manager.SwitchAllOff(homeid)
 
 # -----------------------------------------------------------------------------
 # Configuration Parameters
@@ -3759,7 +4525,7 @@ will be turned off.
 # An ongoing task for the OpenZWave project is to create XML files describing the available
 # parameters for every Z-Wave.  See the config folder in the project source code for examples.
 #
-    def setConfigParam(self, homeid, nodeid, param, value, size=2):
+    def setConfigParam(self, uint32_t homeid, uint8_t nodeid, uint8_t param, uint32_t value, uint8_t size=2):
         '''
 .. _setConfigParam:
 
@@ -3786,9 +4552,12 @@ has been made.
 :see: requestConfigParam_, requestAllConfigParams_
 
         '''
-        return self.manager.SetConfigParam(homeid, nodeid, param, value, size)
+        cdef bool ret
+        with nogil:
+            ret = self.manager.SetConfigParam(homeid, nodeid, param, value, size)
+        return ret
 
-    def requestConfigParam(self, homeid, nodeid, param):
+    def requestConfigParam(self, uint32_t homeid, uint8_t nodeid, uint8_t param):
         '''
 .. _requestConfigParam:
 
@@ -3813,9 +4582,10 @@ as returned by a call to Configuration::StaticGetCommandClassId.
 :see: requestAllConfigParams_, setConfigParam_
 
         '''
-        self.manager.RequestConfigParam(homeid, nodeid, param)
+        with nogil:
+            self.manager.RequestConfigParam(homeid, nodeid, param)
 
-    def requestAllConfigParams(self, homeid, nodeid):
+    def requestAllConfigParams(self, uint32_t homeid, uint8_t nodeid):
         '''
 .. _requestAllConfigParams:
 
@@ -3828,7 +4598,8 @@ Request the values of all known configurable parameters from a device.
 :see: requestConfigParam_, setConfigParam_
 
         '''
-        self.manager.RequestAllConfigParams(homeid, nodeid)
+        with nogil:
+            self.manager.RequestAllConfigParams(homeid, nodeid)
 #
 # -----------------------------------------------------------------------------
 # Groups (wrappers for the Node methods)
@@ -3988,7 +4759,7 @@ This label is populated by the device specific configuration files.
         cdef string c_string = self.manager.GetGroupLabel(homeid, nodeid, groupidx)
         return cstr_to_str(c_string.c_str())
 
-    def addAssociation(self, homeid, nodeid, groupidx, targetnodeid, instance=0x00):
+    def addAssociation(self, uint32_t homeid, uint8_t nodeid, uint8_t groupidx, uint8_t targetnodeid, uint8_t instance=0x00):
         '''
 .. _addAssociation:
 
@@ -4013,9 +4784,10 @@ both cases.
 :see: getNumGroups_, getAssociations_, getMaxAssociations_, removeAssociation_
 
         '''
-        self.manager.AddAssociation(homeid, nodeid, groupidx, targetnodeid, instance)
+        with nogil:
+            self.manager.AddAssociation(homeid, nodeid, groupidx, targetnodeid, instance)
 
-    def removeAssociation(self, homeid, nodeid, groupidx, targetnodeid, instance=0x00):
+    def removeAssociation(self, uint32_t homeid, uint8_t nodeid, uint8_t groupidx, uint8_t targetnodeid, uint8_t instance=0x00):
         '''
 .. _removeAssociation:
 
@@ -4040,14 +4812,15 @@ in both cases.
 :see: getNumGroups_, getAssociations_, getMaxAssociations_, addAssociation_
 
         '''
-        self.manager.RemoveAssociation(homeid, nodeid, groupidx, targetnodeid, instance)
+        with nogil:
+            self.manager.RemoveAssociation(homeid, nodeid, groupidx, targetnodeid, instance)
 #
 # -----------------------------------------------------------------------------
 # Notifications
 # -----------------------------------------------------------------------------
 # For notification of changes to the Z-Wave network or device values and associations.
 #
-    def addWatcher(self, pythonfunc):
+    def addWatcher(self, pythonfunc, compact=False):
         '''
 .. _addWatcher:
 
@@ -4060,11 +4833,20 @@ add a single watcher - all notifications will be reported to it.
 
 :param pythonfunc: Watcher pointer to a function that will be called by the notification system.
 :type pythonfunc: callback
+:param compact: Send immutable PyNotification objects instead of dicts. They can be used like the dicts but their values are computed only when accessed.
+:type compact: bool
 :see: removeWatcher_
 
         '''
+        cdef bool ret
+        cdef void* context = <void*>pythonfunc
+        cdef pfnOnNotification_t callback = notif_callback_compact if compact else notif_callback
         self._watcherCallback = pythonfunc # need to keep a reference to this
-        if not self.manager.AddWatcher(notif_callback, <void*>pythonfunc):
+        self._watcherCompact = compact
+        #The notification thread holds the watchers lock while it waits for the GIL
+        with nogil:
+            ret = self.manager.AddWatcher(callback, context)
+        if not ret:
             raise ValueError("call to AddWatcher failed")
 
     def removeWatcher(self, pythonfunc):
@@ -4078,10 +4860,14 @@ Remove a notification watcher.
 :see: addWatcher_
 
         '''
-        if not self.manager.RemoveWatcher(notif_callback, <void*>self._watcherCallback):
+        cdef bool ret
+        cdef void* context = <void*>self._watcherCallback
+        cdef pfnOnNotification_t callback = notif_callback_compact if self._watcherCompact else notif_callback
+        with nogil:
+            ret = self.manager.RemoveWatcher(callback, context)
+        if not ret:
             raise ValueError("call to RemoveWatcher failed")
-        else:
-            self._watcherCallback = None
+        self._watcherCallback = None
 
 
 #
@@ -4090,7 +4876,7 @@ Remove a notification watcher.
 # ----------------------------------------------------------------------------
 # Commands for Z-Wave network management using the PC Controller.
 #
-    def resetController(self, homeid):
+    def resetController(self, uint32_t homeid):
         '''
 .. _resetController:
 
@@ -4104,10 +4890,11 @@ controller becomes a primary controller ready to add devices to a new network.
 :see: softResetController_
 
         '''
-        values_map.clear()
-        self.manager.ResetController(homeid)
+        clearValueIds(homeid)
+        with nogil:
+            self.manager.ResetController(homeid)
 
-    def softResetController(self, homeid):
+    def softResetController(self, uint32_t homeid):
         '''
 .. _softResetController:
 
@@ -4120,9 +4907,10 @@ Resets a controller without erasing its network configuration settings.
 :see: resetController_
 
         '''
-        self.manager.SoftReset(homeid)
+        with nogil:
+            self.manager.SoftReset(homeid)
 
-    def cancelControllerCommand(self, homeid):
+    def cancelControllerCommand(self, uint32_t homeid):
         '''
 .. _cancelControllerCommand:
 
@@ -4135,7 +4923,10 @@ Cancels any in-progress command running on a controller.
 :see: beginControllerCommand_
 
         '''
-        return self.manager.CancelControllerCommand(homeid)
+        cdef bool ret
+        with nogil:
+            ret = self.manager.CancelControllerCommand(homeid)
+        return ret
 
     def beginControllerCommand(self, homeId, command, pythonfunc,\
             highPower=False, nodeId=0xff, arg=0):
@@ -4207,7 +4998,7 @@ operate at normal power levels instead.  Defaults to false.
         return self.manager.BeginControllerCommand(homeId, command, \
                  ctrl_callback, <void*>pythonfunc, highPower, nodeId, arg)
 
-    def createNewPrimary(self, homeid):
+    def createNewPrimary(self, uint32_t homeid):
         '''
 .. _createNewPrimary:
 
@@ -4224,9 +5015,12 @@ Notification::Type_ControllerCommand
 :rtype: bool
 
         '''
-        return self.manager.CreateNewPrimary(homeid)
+        cdef bool ret
+        with nogil:
+            ret = self.manager.CreateNewPrimary(homeid)
+        return ret
 
-    def transferPrimaryRole(self, homeid):
+    def transferPrimaryRole(self, uint32_t homeid):
         '''
 .. _transferPrimaryRole:
 
@@ -4243,9 +5037,12 @@ Notification::Type_ControllerCommand
 :rtype: bool
 
         '''
-        return self.manager.TransferPrimaryRole(homeid)
+        cdef bool ret
+        with nogil:
+            ret = self.manager.TransferPrimaryRole(homeid)
+        return ret
 
-    def receiveConfiguration(self, homeid):
+    def receiveConfiguration(self, uint32_t homeid):
         '''
 .. _receiveConfiguration:
 
@@ -4262,9 +5059,12 @@ Notification::Type_ControllerCommand
 :rtype: bool
 
         '''
-        return self.manager.ReceiveConfiguration(homeid)
+        cdef bool ret
+        with nogil:
+            ret = self.manager.ReceiveConfiguration(homeid)
+        return ret
 
-    def addNode(self, homeid, doSecurity):
+    def addNode(self, uint32_t homeid, bint doSecurity):
         '''
 .. _addNode:
 
@@ -4284,9 +5084,12 @@ Notification::Type_ControllerCommand
 :rtype: bool
 
         '''
-        return self.manager.AddNode(homeid, doSecurity)
+        cdef bool ret
+        with nogil:
+            ret = self.manager.AddNode(homeid, doSecurity)
+        return ret
 
-    def removeNode(self, homeid):
+    def removeNode(self, uint32_t homeid):
         '''
 .. _removeNode:
 
@@ -4306,9 +5109,12 @@ Notification::Type_ControllerCommand
 :rtype: bool
 
         '''
-        return self.manager.RemoveNode(homeid)
+        cdef bool ret
+        with nogil:
+            ret = self.manager.RemoveNode(homeid)
+        return ret
 
-    def removeFailedNode(self, homeid, nodeid):
+    def removeFailedNode(self, uint32_t homeid, uint8_t nodeid):
         '''
 .. _removeFailedNode:
 
@@ -4330,9 +5136,12 @@ Notification::Type_ControllerCommand
 :rtype: bool
 
         '''
-        return self.manager.RemoveFailedNode(homeid, nodeid)
+        cdef bool ret
+        with nogil:
+            ret = self.manager.RemoveFailedNode(homeid, nodeid)
+        return ret
 
-    def hasNodeFailed(self, homeid, nodeid):
+    def hasNodeFailed(self, uint32_t homeid, uint8_t nodeid):
         '''
 .. _hasNodeFailed:
 
@@ -4351,9 +5160,12 @@ Notification::Type_ControllerCommand
 :rtype: bool
 
         '''
-        return self.manager.HasNodeFailed(homeid, nodeid)
+        cdef bool ret
+        with nogil:
+            ret = self.manager.HasNodeFailed(homeid, nodeid)
+        return ret
 
-    def requestNodeNeighborUpdate(self, homeid, nodeid):
+    def requestNodeNeighborUpdate(self, uint32_t homeid, uint8_t nodeid):
         '''
 .. _requestNodeNeighborUpdate:
 
@@ -4372,9 +5184,12 @@ Notification::Type_ControllerCommand
 :rtype: bool
 
         '''
-        return self.manager.RequestNodeNeighborUpdate(homeid, nodeid)
+        cdef bool ret
+        with nogil:
+            ret = self.manager.RequestNodeNeighborUpdate(homeid, nodeid)
+        return ret
 
-    def assignReturnRoute(self, homeid, nodeid):
+    def assignReturnRoute(self, uint32_t homeid, uint8_t nodeid):
         '''
 .. _assignReturnRoute:
 
@@ -4393,9 +5208,12 @@ Notification::Type_ControllerCommand
 :rtype: bool
 
         '''
-        return self.manager.AssignReturnRoute(homeid, nodeid)
+        cdef bool ret
+        with nogil:
+            ret = self.manager.AssignReturnRoute(homeid, nodeid)
+        return ret
 
-    def deleteAllReturnRoutes(self, homeid, nodeid):
+    def deleteAllReturnRoutes(self, uint32_t homeid, uint8_t nodeid):
         '''
 .. _deleteAllReturnRoutes:
 
@@ -4414,9 +5232,12 @@ Notification::Type_ControllerCommand
 :rtype: bool
 
         '''
-        return self.manager.DeleteAllReturnRoutes(homeid, nodeid)
+        cdef bool ret
+        with nogil:
+            ret = self.manager.DeleteAllReturnRoutes(homeid, nodeid)
+        return ret
 
-    def sendNodeInformation(self, homeid, nodeid):
+    def sendNodeInformation(self, uint32_t homeid, uint8_t nodeid):
         '''
 .. _sendNodeInformation:
 
@@ -4435,9 +5256,12 @@ Notification::Type_ControllerCommand
 :rtype: bool
 
         '''
-        return self.manager.SendNodeInformation(homeid, nodeid)
+        cdef bool ret
+        with nogil:
+            ret = self.manager.SendNodeInformation(homeid, nodeid)
+        return ret
 
-    def replaceFailedNode(self, homeid, nodeid):
+    def replaceFailedNode(self, uint32_t homeid, uint8_t nodeid):
         '''
 .. _replaceFailedNode:
 
@@ -4458,9 +5282,12 @@ Notification::Type_ControllerCommand
 :rtype: bool
 
         '''
-        return self.manager.ReplaceFailedNode(homeid, nodeid)
+        cdef bool ret
+        with nogil:
+            ret = self.manager.ReplaceFailedNode(homeid, nodeid)
+        return ret
 
-    def requestNetworkUpdate(self, homeid, nodeid):
+    def requestNetworkUpdate(self, uint32_t homeid, uint8_t nodeid):
         '''
 .. _requestNetworkUpdate:
 
@@ -4477,9 +5304,12 @@ Notification::Type_ControllerCommand
 :rtype: bool
 
         '''
-        return self.manager.RequestNetworkUpdate(homeid, nodeid)
+        cdef bool ret
+        with nogil:
+            ret = self.manager.RequestNetworkUpdate(homeid, nodeid)
+        return ret
 
-    def replicationSend(self, homeid, nodeid):
+    def replicationSend(self, uint32_t homeid, uint8_t nodeid):
         '''
 .. _replicationSend:
 
@@ -4500,9 +5330,12 @@ Notification::Type_ControllerCommand
 :rtype: bool
 
         '''
-        return self.manager.ReplicationSend(homeid, nodeid)
+        cdef bool ret
+        with nogil:
+            ret = self.manager.ReplicationSend(homeid, nodeid)
+        return ret
 
-    def createButton(self, homeid, nodeid, buttonid):
+    def createButton(self, uint32_t homeid, uint8_t nodeid, uint8_t buttonid):
         '''
 .. _createButton:
 
@@ -4523,9 +5356,12 @@ Notification::Type_ControllerCommand
 :rtype: bool
 
         '''
-        return self.manager.CreateButton(homeid, nodeid, buttonid)
+        cdef bool ret
+        with nogil:
+            ret = self.manager.CreateButton(homeid, nodeid, buttonid)
+        return ret
 
-    def deleteButton(self, homeid, nodeid, buttonid):
+    def deleteButton(self, uint32_t homeid, uint8_t nodeid, uint8_t buttonid):
         '''
 .. _deleteButton:
 
@@ -4544,7 +5380,10 @@ Notification::Type_ControllerCommand
 :rtype: bool
 
         '''
-        return self.manager.DeleteButton(homeid, nodeid, buttonid)
+        cdef bool ret
+        with nogil:
+            ret = self.manager.DeleteButton(homeid, nodeid, buttonid)
+        return ret
 
 #-----------------------------------------------------------------------------
 # Scene commands
@@ -4721,7 +5560,7 @@ sceneGetValues_, removeAllScenes_
         return ret
 
 
-    def addSceneValue(self, uint8_t sceneid, id, value):
+    def addSceneValue(self, uint8_t sceneid, id, value, uint32_t homeid=0):
         '''
 .. _addSceneValue:
 
@@ -4733,6 +5572,8 @@ Actually I don't know how to use it :)
 :type sceneid: int
 :param id: The ID of a value.
 :type id: int
+:param homeid: The home id of the network of the value. 0 to look for it in all the networks.
+:type homeid: int
 :param value: The value to set
 :type value: bool, int, float, string
 :return: An integer representing the result of the operation
@@ -4752,43 +5593,43 @@ removeSceneValue_, setSceneValue_, sceneGetValues_
         cdef int16_t type_short
         cdef string type_string
         ret = 2
-        if values_map.find(id) != values_map.end():
-            datatype = PyValueTypes[values_map.at(id).GetType()]
+        if findValueId(id, homeid) != NULL:
+            datatype = PyValueTypes[deref(findValueId(id, homeid)).GetType()]
             if datatype == "Bool":
                 type_bool = value
-                cret = self.manager.AddSceneValue(sceneid, values_map.at(id), type_bool)
+                cret = self.manager.AddSceneValue(sceneid, deref(findValueId(id, homeid)), type_bool)
                 ret = 1 if cret else 0
             elif datatype == "Byte":
                 type_byte = value
-                cret = self.manager.AddSceneValue(sceneid, values_map.at(id), type_byte)
+                cret = self.manager.AddSceneValue(sceneid, deref(findValueId(id, homeid)), type_byte)
                 ret = 1 if cret else 0
             elif datatype == "Decimal":
                 type_float = value
-                cret = self.manager.AddSceneValue(sceneid, values_map.at(id), type_float)
+                cret = self.manager.AddSceneValue(sceneid, deref(findValueId(id, homeid)), type_float)
                 ret = 1 if cret else 0
             elif datatype == "Int":
                 type_int = value
-                cret = self.manager.AddSceneValue(sceneid, values_map.at(id), type_int)
+                cret = self.manager.AddSceneValue(sceneid, deref(findValueId(id, homeid)), type_int)
                 ret = 1 if cret else 0
             elif datatype == "Short":
                 type_short = value
-                cret = self.manager.AddSceneValue(sceneid, values_map.at(id), type_short)
+                cret = self.manager.AddSceneValue(sceneid, deref(findValueId(id, homeid)), type_short)
                 ret = 1 if cret else 0
             elif datatype == "String":
                 type_string = string(value)
-                cret = self.manager.AddSceneValue(sceneid, values_map.at(id), type_string)
+                cret = self.manager.AddSceneValue(sceneid, deref(findValueId(id, homeid)), type_string)
                 ret = 1 if cret else 0
             elif datatype == "Button":
                 type_bool = value
-                cret = self.manager.AddSceneValue(sceneid, values_map.at(id), type_bool)
+                cret = self.manager.AddSceneValue(sceneid, deref(findValueId(id, homeid)), type_bool)
                 ret = 1 if cret else 0
             elif datatype == "List":
                 type_string = string(value)
-                cret = self.manager.AddSceneValueListSelection(sceneid, values_map.at(id), type_string)
+                cret = self.manager.AddSceneValueListSelection(sceneid, deref(findValueId(id, homeid)), type_string)
                 ret = 1 if cret else 0
         return ret
 
-    def removeSceneValue(self, uint8_t sceneid, id):
+    def removeSceneValue(self, uint8_t sceneid, id, uint32_t homeid=0):
         '''
 .. _removeSceneValue:
 
@@ -4798,6 +5639,8 @@ Remove the Value ID from an existing scene.
 :type sceneid: int
 :param id: The ID of a value.
 :type id: int
+:param homeid: The home id of the network of the value. 0 to look for it in all the networks.
+:type homeid: int
 :return: True if succee. False otherwise
 :rtype: bool
 :see: getNumScenes_, getAllScenes_, sceneExists_, removeAllScenes_, \
@@ -4806,11 +5649,11 @@ getSceneLabel_, setSceneLabel_, removeSceneValue_, setSceneValue_, \
 sceneGetValues_
 
         '''
-        if values_map.find(id) != values_map.end():
-            return self.manager.RemoveSceneValue(sceneid, values_map.at(id))
+        if findValueId(id, homeid) != NULL:
+            return self.manager.RemoveSceneValue(sceneid, deref(findValueId(id, homeid)))
         return False
 
-    def setSceneValue(self, uint8_t sceneid, id, value):
+    def setSceneValue(self, uint8_t sceneid, id, value, uint32_t homeid=0):
         '''
 .. _setSceneValue:
 
@@ -4820,6 +5663,8 @@ Set a value to an existing scene's ValueID.
 :type sceneid: int
 :param id: The ID of a value.
 :type id: int
+:param homeid: The home id of the network of the value. 0 to look for it in all the networks.
+:type homeid: int
 :param value: The value to set
 :type value: bool, int, float, string
 :return: An integer representing the result of the operation
@@ -4840,39 +5685,39 @@ sceneGetValues_
         cdef int16_t type_short
         cdef string type_string
         ret = 2
-        if values_map.find(id) != values_map.end():
-            datatype = PyValueTypes[values_map.at(id).GetType()]
+        if findValueId(id, homeid) != NULL:
+            datatype = PyValueTypes[deref(findValueId(id, homeid)).GetType()]
             if datatype == "Bool":
                 type_bool = value
-                cret = self.manager.SetSceneValue(sceneid, values_map.at(id), type_bool)
+                cret = self.manager.SetSceneValue(sceneid, deref(findValueId(id, homeid)), type_bool)
                 ret = 1 if cret else 0
             elif datatype == "Byte":
                 type_byte = value
-                cret = self.manager.SetSceneValue(sceneid, values_map.at(id), type_byte)
+                cret = self.manager.SetSceneValue(sceneid, deref(findValueId(id, homeid)), type_byte)
                 ret = 1 if cret else 0
             elif datatype == "Decimal":
                 type_float = value
-                cret = self.manager.SetSceneValue(sceneid, values_map.at(id), type_float)
+                cret = self.manager.SetSceneValue(sceneid, deref(findValueId(id, homeid)), type_float)
                 ret = 1 if cret else 0
             elif datatype == "Int":
                 type_int = value
-                cret = self.manager.SetSceneValue(sceneid, values_map.at(id), type_int)
+                cret = self.manager.SetSceneValue(sceneid, deref(findValueId(id, homeid)), type_int)
                 ret = 1 if cret else 0
             elif datatype == "Short":
                 type_short = value
-                cret = self.manager.SetSceneValue(sceneid, values_map.at(id), type_short)
+                cret = self.manager.SetSceneValue(sceneid, deref(findValueId(id, homeid)), type_short)
                 ret = 1 if cret else 0
             elif datatype == "String":
                 type_string = string(value)
-                cret = self.manager.SetSceneValue(sceneid, values_map.at(id), type_string)
+                cret = self.manager.SetSceneValue(sceneid, deref(findValueId(id, homeid)), type_string)
                 ret = 1 if cret else 0
             elif datatype == "Button":
                 type_bool = value
-                cret = self.manager.SetSceneValue(sceneid, values_map.at(id), type_bool)
+                cret = self.manager.SetSceneValue(sceneid, deref(findValueId(id, homeid)), type_bool)
                 ret = 1 if cret else 0
             elif datatype == "List":
                 type_string = string(value)
-                cret = self.manager.SetSceneValueListSelection(sceneid, values_map.at(id), type_string)
+                cret = self.manager.SetSceneValueListSelection(sceneid, deref(findValueId(id, homeid)), type_string)
                 ret = 1 if cret else 0
         return ret
 
@@ -4933,7 +5778,7 @@ setSceneValue_, sceneGetValues_
         '''
         return self.manager.SceneExists(sceneid)
 
-    def activateScene(self, sceneid):
+    def activateScene(self, uint8_t sceneid):
         '''
 .. _activateScene:
 
@@ -4949,4 +5794,7 @@ removeSceneValue_, addSceneValue_, setSceneValue_, \
 sceneGetValues_
 
         '''
-        return self.manager.ActivateScene(sceneid)
+        cdef bool ret
+        with nogil:
+            ret = self.manager.ActivateScene(sceneid)
+        return ret
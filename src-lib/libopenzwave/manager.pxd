@@ -37,7 +37,7 @@ import os
 ctypedef uint8_t** int_associations
 ctypedef InstanceAssociation_t** struct_associations
 
-cdef extern from "Manager.h" namespace "OpenZWave":
+cdef extern from "Manager.h" namespace "OpenZWave" nogil:
 
     cdef cppclass Manager:
         # // Destructor
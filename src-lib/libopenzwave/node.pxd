@@ -19,6 +19,7 @@ along with python-openzwave. If not, see http://www.gnu.org/licenses.
 """
 from libc.stdint cimport uint32_t, int32_t, int16_t, uint8_t, int8_t
 from mylibc cimport string
+from libcpp.list cimport list as cpplist
 
 cdef extern from "Node.h" namespace "OpenZWave::Node":
 
@@ -53,6 +54,7 @@ cdef extern from "Node.h" namespace "OpenZWave::Node":
         uint8_t m_quality                                # Node quality measure
         uint8_t m_lastReceivedMessage[254]      # Place to hold last received message
         uint8_t m_errors                                  # Count errors for dead node detection
+        cpplist[CommandClassData] m_ccData          # Statistics of the command classes
 
 ctypedef NodeData NodeData_t
 
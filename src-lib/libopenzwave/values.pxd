@@ -41,8 +41,12 @@ cdef extern from "ValueID.h" namespace "OpenZWave::ValueID":
         ValueType_Raw = 9                   # Used as a list of Bytes
         ValueType_Max = ValueType_Raw       # The highest-number type defined.  Not to be used as a type itself.
 
+cdef extern from "Defs.h":
+    ctypedef unsigned long long uint64
+
 cdef extern from "ValueID.h" namespace "OpenZWave":
     cdef cppclass ValueID:
+        ValueID(uint32_t homeId, uint64 id)
         uint32_t GetHomeId()
         uint8_t GetNodeId()
         ValueGenre GetGenre()
@@ -132,6 +132,8 @@ def create_app(config_object='pyozwweb.config.DevelopmentConfig'):
         app.config['HOST'] = settings.get(section, 'host')
     if settings.has_option(section, 'port'):
         app.config['PORT'] = settings.getint(section, 'port')
+    if settings.has_option(section, 'delta_interval'):
+        app.config['DELTA_INTERVAL'] = settings.getfloat(section, 'delta_interval')
     #Flask stuff
     #global fanstatic
     #fanstatic = Fanstatic(app)
@@ -60,6 +60,12 @@ listener = None
 
 class ListenerThread(Thread):
     """ The listener Tread
+
+    Nodes and values changes are not sent one by one : the listener keeps
+    the last fields sent for each node and value, and queues only the
+    fields which have changed. The queued deltas are merged and sent in
+    a single 'my delta response' frame every delta_interval seconds.
+    The clients get the full nodes and values when they connect.
     """
 
     def __init__(self, _socketio, _app):
@@ -69,6 +75,12 @@ class ListenerThread(Thread):
         self.socketio = _socketio
         self.app = _app
         self.connected = False
+        self.delta_interval = _app.config.get('DELTA_INTERVAL', 0.5)
+        self._delta_lock = threading.Lock()
+        self._sent_nodes = {}
+        self._sent_values = {}
+        self._pending_nodes = {}
+        self._pending_values = {}
 
     def connect(self):
         """Connect to the zwave notifications
@@ -88,7 +100,49 @@ class ListenerThread(Thread):
         self._stopevent.wait(5.0)
         self.connect()
         while not self._stopevent.isSet():
-            self._stopevent.wait(0.1)
+            self._stopevent.wait(self.delta_interval)
+            self.flush_deltas()
+
+    def _queue_delta(self, sent, pending, key, data, keys):
+        """Queue the fields of data which have changed since the last frame.
+        The fields in keys are always sent to identify the object.
+        """
+        with self._delta_lock:
+            last = sent.get(key, {})
+            delta = dict((k, v) for k, v in data.items() if k in keys or last.get(k, None) != v)
+            if len(delta) == len(keys) and key in sent:
+                return False
+            sent[key] = data
+            if key in pending:
+                pending[key].update(delta)
+            else:
+                pending[key] = delta
+            return True
+
+    def flush_deltas(self):
+        """Send the pending deltas in a single frame
+        """
+        with self._delta_lock:
+            if len(self._pending_nodes) == 0 and len(self._pending_values) == 0:
+                return False
+            nodes = list(self._pending_nodes.values())
+            values = list(self._pending_values.values())
+            self._pending_nodes = {}
+            self._pending_values = {}
+        self.socketio.emit('my delta response',
+            {'data': {'nodes': nodes, 'values': values}},
+            namespace='/ozwave')
+        logging.debug('OpenZWave delta : %d nodes, %d values.', len(nodes), len(values))
+        return True
+
+    def reset_deltas(self):
+        """Forget the fields sent, ie after a network reset
+        """
+        with self._delta_lock:
+            self._sent_nodes = {}
+            self._sent_values = {}
+            self._pending_nodes = {}
+            self._pending_values = {}
 
     def join_room_network(self):
         """Join room network
@@ -113,6 +167,8 @@ class ListenerThread(Thread):
     def _louie_network(self, network):
         """Louie dispatch for netowrk
         """
+        if network is None or network.state < network.STATE_STARTED:
+            self.reset_deltas()
         with self.app.test_request_context():
             from flask import request
             if network is None:
@@ -140,11 +196,12 @@ class ListenerThread(Thread):
     def _louie_node(self, network, node):
         """Louie dispatch for node
         """
-        data=node.to_dict()
-        self.socketio.emit('my node response',
-            {'data': data},
-            namespace='/ozwave')
-        logging.debug('OpenZWave node notification : node %s.', data)
+        if node is None:
+            return
+        #Only the cheap fields : values, groups and neighbors are not serialized
+        data=node.to_dict(extras=[])
+        if self._queue_delta(self._sent_nodes, self._pending_nodes, node.node_id, data, ('node_id',)):
+            logging.debug('OpenZWave node notification : node %s.', data)
 
     def join_room_values(self):
         """Join room values
@@ -179,10 +236,10 @@ class ListenerThread(Thread):
                                    namespace='/ozwave')
                 logging.debug('OpenZWave values notification : Value is None.')
             else:
-                self.socketio.emit('my values response',
-                                   {'data': network.nodes[node.node_id].values[value.value_id].to_dict(),},
-                                   namespace='/ozwave')
-                logging.debug('OpenZWave values notification : homeid %0.8x - node %d - value %d.', network.home_id, node.node_id, value.value_id)
+                #No kvals : they are read from the database
+                data = value.to_dict(extras=[])
+                if self._queue_delta(self._sent_values, self._pending_values, value.value_id, data, ('value_id', 'node_id')):
+                    logging.debug('OpenZWave values notification : homeid %0.8x - node %d - value %d.', network.home_id, node.node_id, value.value_id)
 
     def join_room_controller(self):
         """Join room controller
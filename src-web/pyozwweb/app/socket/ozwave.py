@@ -299,6 +299,19 @@ def echo_value_event(message):
     emit('my value response',
          {'data': current_app.extensions['zwnetwork'].nodes[node_id].values[value_id].to_dict(), 'count': session['receive_count']})
 
+@socketio.on('my values event', namespace='/ozwave')
+def echo_values_event(message):
+    session['receive_count'] = session.get('receive_count', 0) + 1
+    logging.debug("Client %s values event : %s", request.remote_addr, message)
+    #The full values are sent as a delta : the client updates its table the same way
+    nodes = current_app.extensions['zwnetwork'].nodes
+    values = []
+    for node_id in nodes:
+        node_values = nodes[node_id].values
+        values.extend(node_values[value_id].to_dict(extras=[]) for value_id in node_values)
+    emit('my delta response',
+         {'data': {'nodes': [], 'values': values}, 'count': session['receive_count']})
+
 @socketio.on('my scenes event', namespace='/ozwave')
 def echo_scenes_event(message):
     session['receive_count'] = session.get('receive_count', 0) + 1
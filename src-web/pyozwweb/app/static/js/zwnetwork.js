@@ -30,3 +30,26 @@ if (!String.prototype.format) {
   };
 }
 
+
+// Update a row of a datatable with the fields of a delta.
+// The row is added when it is not in the table.
+// The table is not redrawn : call fnDraw when all the deltas are applied.
+// The table must set the id of its rows in fnCreatedRow : fnRowCallback only
+// sees the rows of the current page and the others would be added again.
+function ozw_datatable_delta(tableId, rowId, item, columns) {
+    var datatable = $(tableId).dataTable();
+    var row = datatable.$('tr#'+rowId);
+    if (row.length == 0) {
+        var data = [];
+        for (var i = 0; i < columns.length; i++) {
+            data.push(columns[i] in item ? item[columns[i]] : "");
+        }
+        datatable.fnAddData(data, false);
+        return;
+    }
+    for (var i = 0; i < columns.length; i++) {
+        if (columns[i] in item) {
+            datatable.fnUpdate(item[columns[i]], row[0], i, false, false);
+        }
+    }
+}
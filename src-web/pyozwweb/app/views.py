@@ -42,7 +42,7 @@ import os, sys
 import time
 from threading import Thread
 
-from flask import Flask, render_template, session, request, current_app
+from flask import Flask, render_template, session, request, current_app, Response, stream_with_context, abort
 from flask.ext.socketio import SocketIO, emit, join_room, leave_room, close_room, disconnect
 
 import libopenzwave
@@ -53,6 +53,8 @@ from openzwave.scene import ZWaveScene
 from openzwave.controller import ZWaveController
 from openzwave.network import ZWaveNetwork
 from openzwave.option import ZWaveOption
+from openzwave.object import ZWaveException
+from openzwave.serializer import ZWaveSerializer
 from louie import dispatcher, All
 from pyozwweb.app import socketio, app
 from listener import listener
@@ -103,3 +105,15 @@ def scenes():
 @app.route('/chat')
 def chat():
     return render_template('chat.html')
+
+@app.route('/nodes.json')
+def nodes_json():
+    node_fields = request.args.get('node_fields', None)
+    value_fields = request.args.get('value_fields', None)
+    try:
+        serializer = ZWaveSerializer(current_app.extensions['zwnetwork'],
+            node_fields=node_fields.split(',') if node_fields else None,
+            value_fields=value_fields.split(',') if value_fields else None)
+    except ZWaveException:
+        abort(400)
+    return Response(stream_with_context(serializer.iterencode()), mimetype='application/json')
@@ -48,6 +48,8 @@ class Config(object):
 
     HOST = "127.0.0.1"
     PORT = 5000
+    #The interval in seconds between two frames of nodes and values changes
+    DELTA_INTERVAL = 0.5
 
     LOGGING_CONF = 'logging.conf'
     APP_CONF = 'app.conf'
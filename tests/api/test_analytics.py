@@ -0,0 +1,104 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""
+.. module:: tests
+
+This file is part of **python-openzwave** project https://github.com/OpenZWave/python-openzwave.
+    :platform: Unix, Windows, MacOS X
+    :sinopsis: openzwave Library
+
+.. moduleauthor: bibi21000 aka Sébastien GALLET <bibi21000@gmail.com>
+
+License : GPL(v3)
+
+**python-openzwave** is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+**python-openzwave** is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with python-openzwave. If not, see http://www.gnu.org/licenses.
+
+"""
+
+import sys, os
+import unittest
+from openzwave.history import ZWaveHistory
+from tests.common import TestPyZWave
+
+try:
+    import numpy as np
+    from openzwave.analytics import ZWaveAnalytics
+except ImportError:
+    np = None
+
+class FakeNetwork(object):
+    home_id = 0x01020304
+
+class TestAnalytics(TestPyZWave):
+
+    def setUp(self):
+        if np is None:
+            self.skipTest("numpy is not installed")
+        self.history = ZWaveHistory(FakeNetwork(), path=':memory:')
+        self.analytics = ZWaveAnalytics(self.history)
+        for i in range(0, 10):
+            self.history.record(1, 20.0 + i, timestamp=1000.0 + i * 10)
+            self.history.record(2, 10.0, timestamp=1000.0 + i * 10)
+
+    def tearDown(self):
+        self.history.close()
+
+    def test_010_series(self):
+        series = self.analytics.series_many([1, 2, 3])
+        self.assertEqual(len(series[1][0]), 10)
+        self.assertTrue(series[1][1].flags['C_CONTIGUOUS'])
+        self.assertEqual(len(series[3][1]), 0)
+
+    def test_015_series_many_chunks(self):
+        #More than a chunk of ids, unsorted, with an id above 2^63
+        value_ids = list(range(1200, 100, -1)) + [(200 << 56) | 5]
+        for value_id in value_ids:
+            self.history.record(value_id, float(value_id % 1000), timestamp=1000.0)
+            self.history.record(value_id, float(value_id % 1000) + 1, timestamp=1001.0)
+        series = self.analytics.series_many(value_ids)
+        for value_id in value_ids:
+            self.assertEqual(list(series[value_id][1]), [float(value_id % 1000), float(value_id % 1000) + 1])
+            self.assertEqual(list(series[value_id][0]), [1000.0, 1001.0])
+
+    def test_020_resample(self):
+        grid, matrix = self.analytics.resample([1, 2], 20, 1000, 1100, method='mean')
+        self.assertEqual(matrix.shape, (2, 5))
+        self.assertEqual(list(matrix[0]), [20.5, 22.5, 24.5, 26.5, 28.5])
+        grid, matrix = self.analytics.resample([1], 5, 1005, 1030, method='last')
+        self.assertEqual(list(matrix[0]), [20.0, 21.0, 21.0, 22.0, 22.0])
+        grid, matrix = self.analytics.resample([1, 2, 3], 5, 1005, 1030, method='last')
+        self.assertEqual(list(matrix[1]), [10.0] * 5)
+        self.assertTrue(np.isnan(matrix[2]).all())
+        grid, matrix = self.analytics.resample([1], 20, 1000, 1100, method='max')
+        self.assertEqual(matrix[0][0], 21.0)
+
+    def test_030_aggregate(self):
+        grid, data = self.analytics.aggregate([1, 2], 20, 1000, 1120)
+        self.assertEqual(data[0], 15.25)
+        self.assertTrue(np.isnan(data[-1]))
+
+    def test_040_energy(self):
+        self.assertEqual(self.analytics.integrate(2, scale=1.0), 900.0)
+        for i, data in enumerate([1.0, 1.5, 2.0, 0.5, 1.0]):
+            self.history.record(3, data, timestamp=1000.0 + i)
+        self.assertEqual(self.analytics.meter_consumption([3])[3], 2.0)
+
+    def test_050_anomalies(self):
+        self.history.record(2, 100.0, timestamp=2000.0)
+        ts, data = self.analytics.anomalies(2, k=2, start=1000, end=3000)
+        self.assertEqual(list(data), [100.0])
+
+if __name__ == '__main__':
+    sys.argv.append('-v')
+    unittest.main()
@@ -0,0 +1,105 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""
+.. module:: tests
+
+This file is part of **python-openzwave** project https://github.com/OpenZWave/python-openzwave.
+    :platform: Unix, Windows, MacOS X
+    :sinopsis: openzwave Library
+
+.. moduleauthor: bibi21000 aka Sébastien GALLET <bibi21000@gmail.com>
+
+License : GPL(v3)
+
+**python-openzwave** is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+**python-openzwave** is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with python-openzwave. If not, see http://www.gnu.org/licenses.
+
+"""
+
+import sys, os
+import unittest
+from openzwave.group import ZWaveGroup, ZWaveAssociationIndex
+from tests.common import TestPyZWave
+
+class FakeManager(object):
+    def __init__(self):
+        self.calls = 0
+        self.associations = {(2, 1): set([1]), (3, 1): set([1, 4])}
+    def getAssociations(self, home_id, node_id, groupidx):
+        self.calls += 1
+        return set(self.associations.get((node_id, groupidx), ()))
+    def getGroupLabel(self, home_id, node_id, groupidx):
+        self.calls += 1
+        return 'Lifeline'
+
+class FakeNetwork(object):
+    object_id = 0x01020304
+    def __init__(self):
+        self.manager = FakeManager()
+
+class TestGroup(TestPyZWave):
+
+    def setUp(self):
+        self.network = FakeNetwork()
+        self.group = ZWaveGroup(1, network=self.network, node_id=3)
+
+    def test_010_cache(self):
+        self.assertEqual(self.group.associations, set([1, 4]))
+        self.assertEqual(self.group.label, 'Lifeline')
+        self.assertEqual(self.group.associations, set([1, 4]))
+        self.assertEqual(self.group.label, 'Lifeline')
+        self.assertEqual(self.network.manager.calls, 2)
+
+    def test_020_invalidate(self):
+        self.assertEqual(self.group.associations, set([1, 4]))
+        self.network.manager.associations[(3, 1)] = set([1])
+        self.group.associations.add(5)
+        self.assertEqual(self.group.associations, set([1, 4]))
+        self.group.invalidate()
+        self.assertEqual(self.group.associations, set([1]))
+
+class TestAssociationIndex(TestPyZWave):
+
+    def setUp(self):
+        self.index = ZWaveAssociationIndex()
+        self.index.update(2, 1, set([1]))
+        self.index.update(3, 1, set([1, 4]))
+        self.index.update(3, 2, set([5]))
+
+    def test_010_sources(self):
+        self.assertEqual(self.index.get_sources(1), set([(2, 1), (3, 1)]))
+        self.assertEqual(self.index.get_sources(4), set([(3, 1)]))
+        self.assertEqual(self.index.get_sources(6), set())
+        self.assertEqual(self.index.get_targets(3), {1: set([1, 4]), 2: set([5])})
+
+    def test_020_update(self):
+        self.index.update(3, 1, set([4, 6]))
+        self.assertEqual(self.index.get_sources(1), set([(2, 1)]))
+        self.assertEqual(self.index.get_sources(6), set([(3, 1)]))
+        self.index.update(2, 1, ())
+        self.assertEqual(self.index.get_sources(1), set())
+        self.assertEqual(self.index.get_targets(2), {})
+
+    def test_030_remove_node(self):
+        self.index.remove_node(3)
+        self.assertEqual(self.index.get_sources(1), set([(2, 1)]))
+        self.assertEqual(self.index.get_sources(5), set())
+        self.assertEqual(self.index.get_targets(3), {})
+        self.index.loaded = True
+        self.index.clear()
+        self.assertFalse(self.index.loaded)
+        self.assertEqual(self.index.get_sources(1), set())
+
+if __name__ == '__main__':
+    sys.argv.append('-v')
+    unittest.main()
@@ -0,0 +1,164 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""
+.. module:: tests
+
+This file is part of **python-openzwave** project https://github.com/OpenZWave/python-openzwave.
+    :platform: Unix, Windows, MacOS X
+    :sinopsis: openzwave Library
+
+.. moduleauthor: bibi21000 aka Sébastien GALLET <bibi21000@gmail.com>
+
+License : GPL(v3)
+
+**python-openzwave** is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+**python-openzwave** is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with python-openzwave. If not, see http://www.gnu.org/licenses.
+
+"""
+
+
+import sys, os
+import unittest
+from openzwave.heal import ZWaveHealer
+from openzwave.rpc import dispatcher
+from tests.common import TestPyZWave
+
+class FakeManager(object):
+    def __init__(self):
+        self.heals = []
+    def healNetworkNode(self, home_id, node_id, up_node_route):
+        self.heals.append(node_id)
+
+class FakeController(object):
+    STATE_COMPLETED = 'Completed'
+    STATE_FAILED = 'Failed'
+    STATE_NODEFAILED = 'NodeFailed'
+    STATE_ERROR = 'Error'
+    STATE_CANCEL = 'Cancel'
+    node_id = 1
+    send_queue_count = 0
+
+class FakeSendQueue(object):
+    def __init__(self):
+        self.interactive = {'pending': 0, 'executed': 0}
+    @property
+    def stats(self):
+        return {'interactive': dict(self.interactive)}
+
+class FakeScheduler(object):
+    def __init__(self):
+        self.jobs = {}
+    def add_job(self, name, callback, interval, delay=None):
+        self.jobs[name] = callback
+    def remove_job(self, name):
+        return self.jobs.pop(name, None) is not None
+
+class FakeNode(object):
+    def __init__(self, node_id, listening=True):
+        self.is_listening_device = listening
+        self.is_failed = False
+
+class FakeTopology(object):
+    def get_hops(self):
+        return {1: 0, 2: 2, 3: 1, 4: 1}
+
+class FakeNetwork(object):
+    SIGNAL_CONTROLLER_COMMAND = 'HealControllerCommand'
+    home_id = 0x01020304
+    def __init__(self):
+        self.manager = FakeManager()
+        self.controller = FakeController()
+        self.send_queue = FakeSendQueue()
+        self.scheduler = FakeScheduler()
+        self.topology = FakeTopology()
+        self.nodes = {1: FakeNode(1), 2: FakeNode(2), 3: FakeNode(3), 4: FakeNode(4), 5: FakeNode(5, False)}
+        self.store = {}
+    @property
+    def kvals(self):
+        return dict(self.store)
+    @kvals.setter
+    def kvals(self, kvs):
+        for key in kvs:
+            if kvs[key] is None:
+                self.store.pop(key, None)
+            else:
+                self.store[key] = kvs[key]
+
+class TestHeal(TestPyZWave):
+
+    def setUp(self):
+        self.network = FakeNetwork()
+        self.healer = ZWaveHealer(self.network, node_delay=0, quiet_time=10.0)
+        self.signals = []
+        dispatcher.connect(self._louie_done, ZWaveHealer.SIGNAL_HEAL_DONE)
+
+    def tearDown(self):
+        self.healer.cancel()
+        dispatcher.disconnect(self._louie_done, ZWaveHealer.SIGNAL_HEAL_DONE)
+
+    def _louie_done(self, network, done, failed):
+        self.signals.append((done, failed))
+
+    def command(self, node_id, state):
+        dispatcher.send(self.network.SIGNAL_CONTROLLER_COMMAND, **{'network': self.network, 'node_id': node_id, 'state': state})
+
+    def test_010_node_by_node(self):
+        self.assertEqual(self.healer.start(), 3)
+        self.assertTrue(ZWaveHealer.JOB_NAME in self.network.scheduler.jobs)
+        self.healer.step()
+        self.healer.step()
+        self.assertEqual(self.network.manager.heals, [3])
+        self.command(3, 'Completed')
+        self.healer.step()
+        self.command(4, 'Failed')
+        self.healer.step()
+        self.command(2, 'Completed')
+        self.healer.step()
+        self.command(4, 'Completed')
+        self.healer.step()
+        self.assertEqual(self.network.manager.heals, [3, 4, 2, 4])
+        self.assertEqual(self.signals, [([3, 2, 4], [])])
+        self.assertFalse(self.healer.is_active)
+        self.assertEqual(self.network.store, {})
+
+    def test_020_busy(self):
+        self.healer.start([2, 3])
+        self.network.controller.send_queue_count = 1
+        self.healer.step()
+        self.assertEqual(self.network.manager.heals, [])
+        self.network.controller.send_queue_count = 0
+        self.network.send_queue.interactive['executed'] = 1
+        self.healer.step()
+        self.assertEqual(self.network.manager.heals, [])
+        self.healer.quiet_time = 0
+        self.healer.step()
+        self.assertEqual(self.network.manager.heals, [2])
+
+    def test_030_resume(self):
+        self.healer.start([2, 3, 4], up_node_route=True)
+        self.healer.step()
+        self.assertEqual(self.network.store['heal_pending'], '2,3,4')
+        self.command(2, 'Completed')
+        self.healer.step()
+        self.healer.stop()
+        self.assertFalse(ZWaveHealer.JOB_NAME in self.network.scheduler.jobs)
+        self.assertEqual(self.network.store, {'heal_pending': '3,4', 'heal_up_node_route': '1'})
+        healer = ZWaveHealer(self.network, node_delay=0)
+        self.assertEqual(healer.resume(), 2)
+        healer.step()
+        self.assertEqual(self.network.manager.heals, [2, 3, 3])
+        healer.cancel()
+
+if __name__ == '__main__':
+    sys.argv.append('-v')
+    unittest.main()
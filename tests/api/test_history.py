@@ -0,0 +1,181 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""
+.. module:: tests
+
+This file is part of **python-openzwave** project https://github.com/OpenZWave/python-openzwave.
+    :platform: Unix, Windows, MacOS X
+    :sinopsis: openzwave Library
+
+.. moduleauthor: bibi21000 aka Sébastien GALLET <bibi21000@gmail.com>
+
+License : GPL(v3)
+
+**python-openzwave** is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+**python-openzwave** is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with python-openzwave. If not, see http://www.gnu.org/licenses.
+
+"""
+
+import sys, os
+import shutil
+import sqlite3 as lite
+import tempfile
+import time
+import unittest
+import six
+if six.PY3:
+    from pydispatch import dispatcher
+else:
+    from louie import dispatcher
+from openzwave.history import ZWaveHistory
+from openzwave.scheduler import ZWaveScheduler
+from tests.common import TestPyZWave
+
+class FakeValue(object):
+    def __init__(self, value_id, data):
+        self.value_id = value_id
+        self.data = data
+
+class FakeNetwork(object):
+    SIGNAL_VALUE_CHANGED = 'TestValueChanged'
+    SIGNAL_VALUE_REFRESHED = 'TestValueRefreshed'
+    def __init__(self, home_id=0x01020304):
+        self.home_id = home_id
+        self.scheduler = ZWaveScheduler(self)
+
+class TestHistory(TestPyZWave):
+
+    def setUp(self):
+        self.network = FakeNetwork()
+        self.history = ZWaveHistory(self.network, path=':memory:')
+
+    def tearDown(self):
+        self.history.close()
+
+    def test_010_record(self):
+        self.history.start()
+        dispatcher.send(self.network.SIGNAL_VALUE_CHANGED, **{'network':self.network, 'node':None, 'value':FakeValue(10, 21.5)})
+        dispatcher.send(self.network.SIGNAL_VALUE_REFRESHED, **{'network':self.network, 'node':None, 'value':FakeValue(10, 21.5)})
+        dispatcher.send(self.network.SIGNAL_VALUE_CHANGED, **{'network':self.network, 'node':None, 'value':FakeValue(11, 'On')})
+        #Signals from another network are ignored
+        dispatcher.send(self.network.SIGNAL_VALUE_CHANGED, **{'network':None, 'node':None, 'value':FakeValue(12, 1)})
+        self.history.stop()
+        self.assertEqual(len(self.history.get_range(10)), 2)
+        self.assertEqual(self.history.last(11)[1], 'On')
+        self.assertEqual(sorted(self.history.value_ids()), [10, 11])
+
+    def test_020_range(self):
+        for i in range(0, 100):
+            self.history.record(10, i, timestamp=1000.0 + i)
+        self.history.record(10, True, timestamp=1200.0)
+        samples = self.history.get_range(10, start=1010, end=1020)
+        self.assertEqual(len(samples), 10)
+        self.assertEqual(samples[0], (1010.0, 10.0))
+        self.assertEqual(self.history.last(10), (1200.0, 1.0))
+        self.assertEqual(self.history.last(10, before=1050), (1049.0, 49.0))
+        self.history.record(11, 'On', timestamp=1030.5)
+        self.assertEqual(self.history.last_many([10, 11, 12], before=1050), {10: (1049.0, 49.0), 11: (1030.5, 'On')})
+        self.assertEqual(self.history.last_many([10, 11], before=1000), {})
+        ts, data = self.history.get_numeric(10, end=1003)
+        self.assertEqual(data, [0.0, 1.0, 2.0])
+
+    def test_030_downsample(self):
+        for i in range(0, 100):
+            self.history.record(10, i, timestamp=1000.0 + i)
+        buckets = self.history.downsample(10, 10, start=1000)
+        self.assertEqual(len(buckets), 10)
+        self.assertEqual(buckets[1], (1010.0, 10.0, 19.0, 14.5, 10))
+
+    def test_040_purge(self):
+        for i in range(0, 100):
+            self.history.record(10, i, timestamp=1000.0 + i)
+        self.assertEqual(self.history.purge(1050), 50)
+        self.assertEqual(len(self.history.get_range(10)), 50)
+
+    def test_050_high_instance(self):
+        #An instance >= 128 sets the bit 63 of the value id
+        value_id = (200 << 56) | (0x31 << 14) | 3
+        self.history.record(value_id, 21.5, timestamp=1000.0)
+        self.history.record(value_id, 22.5, timestamp=1001.0)
+        self.assertEqual(self.history.flush(), 2)
+        self.assertEqual(self.history.value_ids(), [value_id])
+        self.assertEqual(self.history.last(value_id), (1001.0, 22.5))
+        self.assertEqual(self.history.last_many([value_id]), {value_id: (1001.0, 22.5)})
+        self.assertEqual(self.history.get_numeric_many([value_id]), [(value_id, 1000.0, 21.5), (value_id, 1001.0, 22.5)])
+        self.assertEqual(self.history.purge(1001.0, value_id=value_id), 1)
+
+    def test_060_flush_error(self):
+        self.history.record(10, 1, timestamp=1000.0)
+        dbcon = self.history._dbcon
+        self.history._dbcon = None
+        self.assertEqual(self.history.flush(), 0)
+        self.history._dbcon = dbcon
+        self.history.record(10, 2, timestamp=1001.0)
+        self.assertEqual(self.history.flush(), 2)
+        self.assertEqual(self.history.get_range(10), [(1000.0, 1.0), (1001.0, 2.0)])
+
+    def test_070_home_ids(self):
+        #The networks of a hub share the database
+        path = os.path.join(tempfile.mkdtemp(), 'history.sqlite')
+        try:
+            history1 = ZWaveHistory(FakeNetwork(0x0101), path=path)
+            history2 = ZWaveHistory(FakeNetwork(0x0202), path=path)
+            history1.record(10, 1, timestamp=1000.0)
+            history2.record(10, 2, timestamp=1001.0)
+            history2.record(11, 3, timestamp=1001.0)
+            self.assertEqual(history1.get_range(10), [(1000.0, 1.0)])
+            self.assertEqual(history2.get_range(10), [(1001.0, 2.0)])
+            self.assertEqual(history1.value_ids(), [10])
+            self.assertEqual(history1.purge(2000), 1)
+            self.assertEqual(history2.last(10), (1001.0, 2.0))
+            self.assertEqual(history2.last_many([10, 11]), {10: (1001.0, 2.0), 11: (1001.0, 3.0)})
+            history1.close()
+            history2.close()
+        finally:
+            shutil.rmtree(os.path.dirname(path))
+
+    def test_080_old_table(self):
+        path = os.path.join(tempfile.mkdtemp(), 'history.sqlite')
+        try:
+            dbcon = lite.connect(path)
+            dbcon.execute("CREATE TABLE history(value_id INTEGER, ts REAL, num REAL, data TEXT)")
+            dbcon.execute("INSERT INTO history VALUES (10, 1000.0, 1.0, NULL)")
+            dbcon.commit()
+            dbcon.close()
+            history = ZWaveHistory(FakeNetwork(0), path=path)
+            self.assertEqual(history.get_range(10), [(1000.0, 1.0)])
+            history.record(10, 2, timestamp=1001.0)
+            self.assertEqual(len(history.get_range(10)), 2)
+            history.close()
+        finally:
+            shutil.rmtree(os.path.dirname(path))
+
+    def test_090_buffer_full(self):
+        self.history.max_buffer = 5
+        dbcon = self.history._dbcon
+        self.history._dbcon = None
+        for i in range(0, 4):
+            self.history.record(10, i, timestamp=1000.0 + i)
+        self.assertEqual(self.history.flush(), 0)
+        for i in range(4, 8):
+            self.history.record(10, i, timestamp=1000.0 + i)
+        self.assertEqual(self.history.dropped, 3)
+        self.assertEqual(self.history.flush(), 0)
+        self.history._dbcon = dbcon
+        self.assertEqual(self.history.flush(), 5)
+        ts, data = self.history.get_numeric(10)
+        self.assertEqual(data, [3.0, 4.0, 5.0, 6.0, 7.0])
+
+if __name__ == '__main__':
+    sys.argv.append('-v')
+    unittest.main()
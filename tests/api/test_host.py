@@ -0,0 +1,204 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""
+.. module:: tests
+
+This file is part of **python-openzwave** project https://github.com/OpenZWave/python-openzwave.
+    :platform: Unix, Windows, MacOS X
+    :sinopsis: openzwave Library
+
+.. moduleauthor: bibi21000 aka Sébastien GALLET <bibi21000@gmail.com>
+
+License : GPL(v3)
+
+**python-openzwave** is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+**python-openzwave** is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with python-openzwave. If not, see http://www.gnu.org/licenses.
+
+"""
+
+import sys, os
+import shutil
+import tempfile
+import time
+import unittest
+import openzwave.host
+from openzwave.host import ZWaveSharedTable, ZWaveSharedTableWriter, ZWaveHost, ZWaveHostClient, FLAG_USED, _SEQ, _SLOT
+from openzwave.object import ZWaveException
+from tests.common import TestPyZWave
+
+class FakeSendQueue(object):
+    def __init__(self):
+        self.commands = []
+    def set_value(self, value_id, data, priority=None):
+        self.commands.append(('set_value', value_id, data))
+    def refresh_value(self, value_id, priority=None):
+        self.commands.append(('refresh_value', value_id))
+
+class FakeValue(object):
+    def __init__(self, value_id, data):
+        self.value_id = value_id
+        self.data = data
+
+class FakeNode(object):
+    def __init__(self, values):
+        self.values = dict((value.value_id, value) for value in values)
+
+class FakeNetwork(object):
+    SIGNAL_VALUE_ADDED = 'FakeValueAdded'
+    SIGNAL_VALUE_CHANGED = 'FakeValueChanged'
+    SIGNAL_VALUE_REFRESHED = 'FakeValueRefreshed'
+    SIGNAL_VALUE_REMOVED = 'FakeValueRemoved'
+    SIGNAL_DRIVER_RESET = 'FakeDriverReset'
+    SIGNAL_NODE_ADDED = 'FakeNodeAdded'
+    SIGNAL_NODE_REMOVED = 'FakeNodeRemoved'
+    SIGNAL_NODE_EVENT = 'FakeNodeEvent'
+    SIGNAL_SCENE_EVENT = 'FakeSceneEvent'
+    SIGNAL_NETWORK_READY = 'FakeNetworkReady'
+    SIGNAL_NETWORK_STOPPED = 'FakeNetworkStopped'
+    home_id = 0x01020304
+    def __init__(self):
+        self.send_queue = FakeSendQueue()
+        self.nodes = {2: FakeNode([FakeValue(72057594076299264, 21.5)])}
+
+class TestSharedTable(TestPyZWave):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'table')
+        self.writer = ZWaveSharedTableWriter(self.path, slots=16, data_size=8)
+        self.reader = ZWaveSharedTable(self.path)
+
+    def tearDown(self):
+        self.reader.close()
+        self.writer.close()
+        shutil.rmtree(self.tmpdir)
+
+    def test_010_types(self):
+        for value_id, data in ((1, True), (2, -12), (3, 21.5), (4, u'on'), (5, None)):
+            self.writer.write(0x0101, value_id, data)
+            self.assertEqual(self.reader.get(value_id, home_id=0x0101), data)
+            self.assertEqual(self.reader.get(value_id), data)
+        self.assertEqual(len(self.reader.entries()), 5)
+        self.assertEqual(self.reader.get(99, default='x'), 'x')
+
+    def test_020_home_ids(self):
+        self.writer.write(0x0101, 10, 1)
+        self.writer.write(0x0202, 10, 2)
+        self.assertEqual(self.reader.get(10, home_id=0x0101), 1)
+        self.assertEqual(self.reader.get(10, home_id=0x0202), 2)
+        self.assertEqual(self.reader.get(10, home_id=0x0303), None)
+
+    def test_030_truncated(self):
+        self.writer.write(0x0101, 10, u'a long string')
+        entry = self.reader.get_entry(10, home_id=0x0101)
+        self.assertEqual(entry['data'], u'a long s')
+        self.assertTrue(entry['truncated'])
+
+    def test_040_remove_and_clear(self):
+        self.writer.write(0x0101, 10, 1)
+        self.writer.remove(0x0101, 10)
+        self.assertEqual(self.reader.get(10, home_id=0x0101), None)
+        self.writer.write(0x0101, 10, 3)
+        self.assertEqual(self.reader.get(10, home_id=0x0101), 3)
+        self.writer.clear()
+        self.assertEqual(self.reader.get(10), None)
+        self.assertEqual(self.reader.generation, 1)
+
+    def test_050_full(self):
+        for value_id in range(16):
+            self.assertTrue(self.writer.write(0x0101, value_id + 1, value_id))
+        self.assertFalse(self.writer.write(0x0101, 100, 1))
+        for value_id in range(16):
+            self.assertEqual(self.reader.get(value_id + 1, home_id=0x0101), value_id)
+
+    def test_060_seqlock(self):
+        self.writer.write(0x0101, 10, 1)
+        index = self.writer._index[(0x0101, 10)]
+        offset = self.writer._offset(index)
+        seq = _SEQ.unpack_from(self.writer._mmap, offset)[0]
+        _SEQ.pack_into(self.writer._mmap, offset, seq + 1)
+        self.reader.retries = 3
+        self.assertEqual(self.reader.get(10, home_id=0x0101), None)
+        _SEQ.pack_into(self.writer._mmap, offset, seq + 2)
+        self.assertEqual(self.reader.get(10, home_id=0x0101), 1)
+
+    def test_070_seqlock_interleaved(self):
+        self.writer.write(0x0101, 10, u'aaaaaaaa')
+        index = self.writer._index[(0x0101, 10)]
+        offset = self.writer._offset(index)
+        mmap = self.writer._mmap
+        seq = _SEQ.unpack_from(mmap, offset)[0]
+
+        class InterleavedSeq(object):
+            #The host starts to write the slot just after the first read of the sequence
+            def __init__(self):
+                self.started = False
+            def unpack_from(self, buf, pos=0):
+                ret = _SEQ.unpack_from(buf, pos)
+                if not self.started:
+                    self.started = True
+                    slot = _SLOT.unpack_from(mmap, offset)
+                    _SEQ.pack_into(mmap, offset, seq + 1)
+                    mmap[offset + _SLOT.size:offset + _SLOT.size + 8] = b'bbbbbbbb'
+                    _SLOT.pack_into(mmap, offset, seq + 1, *slot[1:])
+                return ret
+            def pack_into(self, buf, pos, value):
+                return _SEQ.pack_into(buf, pos, value)
+
+        openzwave.host._SEQ = InterleavedSeq()
+        try:
+            self.reader.retries = 3
+            self.assertEqual(self.reader.get(10, home_id=0x0101), None)
+        finally:
+            openzwave.host._SEQ = _SEQ
+        _SEQ.pack_into(mmap, offset, seq + 2)
+        _SLOT.pack_into(mmap, offset, seq + 2, *_SLOT.unpack_from(mmap, offset)[1:])
+        self.assertEqual(self.reader.get(10, home_id=0x0101), u'bbbbbbbb')
+
+class TestHost(TestPyZWave):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.network = FakeNetwork()
+        table_path = os.path.join(self.tmpdir, 'table')
+        address = os.path.join(self.tmpdir, 'socket')
+        self.host = ZWaveHost(self.network, table_path, address, slots=64)
+        self.host.start()
+        self.client = ZWaveHostClient(table_path, address)
+
+    def tearDown(self):
+        self.client.close()
+        self.host.stop()
+        shutil.rmtree(self.tmpdir)
+
+    def test_010_published(self):
+        self.assertEqual(self.client.get(72057594076299264), 21.5)
+
+    def test_020_signals(self):
+        from openzwave.host import dispatcher
+        value = FakeValue(72057594076299265, 10)
+        dispatcher.send(self.network.SIGNAL_VALUE_CHANGED, **{'network': self.network, 'node': None, 'value': value})
+        self.assertEqual(self.client.get(72057594076299265, home_id=self.network.home_id), 10)
+        dispatcher.send(self.network.SIGNAL_VALUE_REMOVED, **{'network': self.network, 'node': None, 'value': value})
+        self.assertEqual(self.client.get(72057594076299265), None)
+
+    def test_030_commands(self):
+        self.assertTrue(self.client.call('ping'))
+        self.client.set_value(72057594076299264, 22)
+        self.client.refresh_value(72057594076299264)
+        self.assertEqual(self.network.send_queue.commands, [('set_value', 72057594076299264, 22), ('refresh_value', 72057594076299264)])
+        self.assertRaises(ZWaveException, self.client.call, 'unknown')
+
+if __name__ == '__main__':
+    sys.argv.append('-v')
+    unittest.main()
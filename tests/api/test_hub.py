@@ -0,0 +1,173 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""
+.. module:: tests
+
+This file is part of **python-openzwave** project https://github.com/OpenZWave/python-openzwave.
+    :platform: Unix, Windows, MacOS X
+    :sinopsis: openzwave Library
+
+.. moduleauthor: bibi21000 aka Sébastien GALLET <bibi21000@gmail.com>
+
+License : GPL(v3)
+
+**python-openzwave** is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+**python-openzwave** is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with python-openzwave. If not, see http://www.gnu.org/licenses.
+
+"""
+
+import sys, os
+import unittest
+import openzwave.hub
+from openzwave.hub import ZWaveHub
+from openzwave.value import ZWaveValue
+from tests.common import TestPyZWave
+
+class FakeManager(object):
+    def __init__(self):
+        self.drivers = {}
+        self.watchers = []
+        self.values = {}
+        self.refreshed = []
+    def create(self):
+        pass
+    def destroy(self):
+        pass
+    def addWatcher(self, callback, compact=False):
+        self.watchers.append(callback)
+    def removeWatcher(self, callback):
+        self.watchers.remove(callback)
+    def addDriver(self, device):
+        self.drivers[device] = None
+    def removeDriver(self, device):
+        del self.drivers[device]
+    def getControllerPath(self, home_id):
+        for device in self.drivers:
+            if self.drivers[device] == home_id:
+                return device
+        return ''
+    def notify(self, notification):
+        for callback in self.watchers:
+            callback(notification)
+    def _find(self, value_id, homeid):
+        #Like the binding : look in the driver of homeid, in all the drivers when it is 0
+        for key in sorted(self.values):
+            if key[1] == value_id and homeid in (0, key[0]):
+                return key
+        return None
+    def getValue(self, value_id, homeid=0):
+        key = self._find(value_id, homeid)
+        return self.values[key] if key is not None else None
+    def setValue(self, value_id, data, homeid=0):
+        key = self._find(value_id, homeid)
+        if key is None:
+            return 2
+        self.values[key] = data
+        return 1
+    def refreshValue(self, value_id, homeid=0):
+        key = self._find(value_id, homeid)
+        if key is not None:
+            self.refreshed.append(key)
+        return key is not None
+
+class FakeLib(object):
+    PyManager = FakeManager
+
+class FakeOptions(object):
+    def __init__(self, device):
+        self.device = device
+    def destroy(self):
+        pass
+
+class FakeNetwork(object):
+    def __init__(self, device):
+        self._options = FakeOptions(device)
+        self.notifications = []
+    def zwcallback(self, args):
+        self.notifications.append(args)
+    def stop(self):
+        pass
+
+class FakeValueNetwork(object):
+    def __init__(self, manager, home_id):
+        self.manager = manager
+        self.home_id = home_id
+
+class TestHub(TestPyZWave):
+
+    def setUp(self):
+        self._libopenzwave = openzwave.hub.libopenzwave
+        openzwave.hub.libopenzwave = FakeLib
+        self.hub = ZWaveHub(FakeOptions('/dev/ttyUSB0'))
+        self.manager = self.hub.manager
+        self.net1 = FakeNetwork('/dev/ttyUSB0')
+        self.net2 = FakeNetwork('/dev/ttyUSB1')
+        self.hub.add_network(self.net1)
+        self.hub.add_network(self.net2)
+
+    def tearDown(self):
+        openzwave.hub.libopenzwave = self._libopenzwave
+
+    def ready(self, device, home_id):
+        self.manager.drivers[device] = home_id
+        self.manager.notify({'notificationType':'DriverReady', 'homeId':home_id, 'nodeId':1})
+
+    def test_010_single_watcher(self):
+        self.assertEqual(len(self.manager.watchers), 1)
+        self.assertEqual(sorted(self.manager.drivers.keys()), ['/dev/ttyUSB0', '/dev/ttyUSB1'])
+        self.assertRaises(ValueError, self.hub.add_network, FakeNetwork('/dev/ttyUSB1'))
+
+    def test_020_routing(self):
+        self.ready('/dev/ttyUSB1', 0x0202)
+        self.ready('/dev/ttyUSB0', 0x0101)
+        self.assertTrue(self.hub.get_network(0x0101) is self.net1)
+        self.assertTrue(self.hub.get_network(0x0202) is self.net2)
+        self.manager.notify({'notificationType':'ValueChanged', 'homeId':0x0101, 'nodeId':2})
+        self.manager.notify({'notificationType':'ValueChanged', 'homeId':0x0202, 'nodeId':3})
+        self.manager.notify({'notificationType':'ValueChanged', 'homeId':0x0303, 'nodeId':3})
+        self.assertEqual([n['nodeId'] for n in self.net1.notifications], [1, 2])
+        self.assertEqual([n['nodeId'] for n in self.net2.notifications], [1, 3])
+
+    def test_030_driver_failed(self):
+        self.ready('/dev/ttyUSB0', 0x0101)
+        self.manager.notify({'notificationType':'DriverFailed', 'homeId':0, 'nodeId':0})
+        self.assertEqual(len(self.net1.notifications), 1)
+        self.assertEqual(len(self.net2.notifications), 1)
+
+    def test_040_remove_network(self):
+        self.ready('/dev/ttyUSB0', 0x0101)
+        self.hub.remove_network(self.net1)
+        self.assertTrue(self.hub.get_network(0x0101) is None)
+        self.assertEqual(list(self.manager.drivers.keys()), ['/dev/ttyUSB1'])
+        self.assertEqual(len(self.manager.watchers), 1)
+        self.hub.remove_network(self.net2)
+        self.assertEqual(len(self.manager.watchers), 0)
+
+    def test_050_same_value_id(self):
+        #Node 2, cc 0x25, instance 1, index 0 has the same id on every network
+        value_id = (2 << 24) | (0x25 << 14) | (1 << 4)
+        self.manager.values[(0x0101, value_id)] = False
+        self.manager.values[(0x0202, value_id)] = False
+        value1 = ZWaveValue(value_id, network=FakeValueNetwork(self.manager, 0x0101))
+        value2 = ZWaveValue(value_id, network=FakeValueNetwork(self.manager, 0x0202))
+        value2.data = True
+        self.assertEqual(self.manager.values[(0x0101, value_id)], False)
+        self.assertEqual(self.manager.values[(0x0202, value_id)], True)
+        self.assertEqual(value1.data, False)
+        self.assertEqual(value2.data, True)
+        value2.refresh()
+        self.assertEqual(self.manager.refreshed, [(0x0202, value_id)])
+
+if __name__ == '__main__':
+    sys.argv.append('-v')
+    unittest.main()
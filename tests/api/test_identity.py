@@ -0,0 +1,77 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""
+.. module:: tests
+
+This file is part of **python-openzwave** project https://github.com/OpenZWave/python-openzwave.
+    :platform: Unix, Windows, MacOS X
+    :sinopsis: openzwave Library
+
+.. moduleauthor: bibi21000 aka Sébastien GALLET <bibi21000@gmail.com>
+
+License : GPL(v3)
+
+**python-openzwave** is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+**python-openzwave** is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with python-openzwave. If not, see http://www.gnu.org/licenses.
+
+"""
+
+
+import sys, os
+import unittest
+from openzwave.value import ZWaveValue, decode_value_id, pack_identity, key_from_id_on_network
+from tests.common import TestPyZWave
+
+#node 5, genre User, command class 0x26, index 0, type Byte, instance 2
+VALUE_ID = (2 << 56) | (5 << 24) | (1 << 22) | (0x26 << 14) | (0 << 4) | 1
+
+class FakeManager(object):
+    def __getattr__(self, name):
+        raise AssertionError(u"Unexpected manager call %s" % name)
+
+class FakeNode(object):
+    object_id = 5
+
+class FakeNetwork(object):
+    home_id = 0x014d0ef5
+    id_separator = '.'
+    manager = FakeManager()
+
+class TestIdentity(TestPyZWave):
+
+    def test_010_decode(self):
+        identity = decode_value_id(VALUE_ID, 0x014d0ef5)
+        self.assertEqual(identity, (0x014d0ef5, 5, 0x26, 2, 0, 'User'))
+        self.assertEqual(identity.genre, 'User')
+
+    def test_020_value(self):
+        network = FakeNetwork()
+        value = ZWaveValue(VALUE_ID, network=network, parent=FakeNode())
+        self.assertEqual(value.command_class, 0x26)
+        self.assertEqual(value.instance, 2)
+        self.assertEqual(value.index, 0)
+        self.assertEqual(value.genre, 'User')
+        self.assertEqual(value.id_on_network, '014d0ef5.5.26.2.0')
+        self.assertEqual(value.key, pack_identity(0x014d0ef5, 5, 0x26, 2, 0))
+        network.id_separator = ':'
+        self.assertEqual(value.id_on_network, '014d0ef5:5:26:2:0')
+
+    def test_030_key_from_id_on_network(self):
+        self.assertEqual(key_from_id_on_network('014d0ef5.5.26.2.0'), pack_identity(0x014d0ef5, 5, 0x26, 2, 0))
+        self.assertEqual(key_from_id_on_network('014d0ef5:5:26:2:0', ':'), pack_identity(0x014d0ef5, 5, 0x26, 2, 0))
+        self.assertEqual(key_from_id_on_network('bad'), None)
+        self.assertEqual(key_from_id_on_network(None), None)
+
+if __name__ == '__main__':
+    sys.argv.append('-v')
+    unittest.main()
@@ -0,0 +1,115 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""
+.. module:: tests
+
+This file is part of **python-openzwave** project https://github.com/OpenZWave/python-openzwave.
+    :platform: Unix, Windows, MacOS X
+    :sinopsis: openzwave Library
+
+.. moduleauthor: bibi21000 aka Sébastien GALLET <bibi21000@gmail.com>
+
+License : GPL(v3)
+
+**python-openzwave** is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+**python-openzwave** is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with python-openzwave. If not, see http://www.gnu.org/licenses.
+
+"""
+
+import sys, os
+import unittest
+from openzwave.journal import ZWaveJournal
+from tests.common import TestPyZWave
+
+class FakeNetwork(object):
+    def __init__(self):
+        self.snapshots = 0
+    def nodes_to_dict(self, extras=['all']):
+        self.snapshots += 1
+        return {1: {'node_id': 1}}
+
+class TestJournal(TestPyZWave):
+
+    def setUp(self):
+        self.network = FakeNetwork()
+        self.journal = ZWaveJournal(self.network, size=5, enabled=True)
+
+    def test_010_sequence(self):
+        self.assertEqual(self.journal.seq, 0)
+        self.assertEqual(self.journal.record('node_added', 1), 1)
+        self.assertEqual(self.journal.record('value_added', 1, value_id=10, data={'data': 1}), 2)
+        self.assertEqual(self.journal.seq, 2)
+        self.assertEqual(self.journal.first_seq, 1)
+
+    def test_020_changes_since(self):
+        for i in range(3):
+            self.journal.record('value_changed', 1, value_id=10, data={'data': i})
+        ret = self.journal.changes_since(0)
+        self.assertEqual(ret['seq'], 3)
+        self.assertEqual([c['seq'] for c in ret['changes']], [1, 2, 3])
+        ret = self.journal.changes_since(2)
+        self.assertEqual([c['data']['data'] for c in ret['changes']], [2])
+        ret = self.journal.changes_since(3)
+        self.assertEqual(ret['changes'], [])
+        self.assertEqual(self.network.snapshots, 0)
+
+    def test_030_snapshot_when_too_old(self):
+        for i in range(8):
+            self.journal.record('value_changed', 1, value_id=10, data={'data': i})
+        self.assertEqual(self.journal.first_seq, 4)
+        ret = self.journal.changes_since(3)
+        self.assertEqual([c['seq'] for c in ret['changes']], [4, 5, 6, 7, 8])
+        ret = self.journal.changes_since(2)
+        self.assertFalse('changes' in ret)
+        self.assertEqual(ret['snapshot'], {1: {'node_id': 1}})
+        self.assertEqual(ret['seq'], 8)
+
+    def test_040_cursor_from_the_future(self):
+        self.journal.record('node_added', 1)
+        ret = self.journal.changes_since(100)
+        self.assertTrue('snapshot' in ret)
+
+    def test_050_reset(self):
+        self.journal.record('node_added', 1)
+        self.journal.record('node_added', 2)
+        seq = self.journal.reset()
+        self.assertEqual(seq, 3)
+        self.assertTrue('snapshot' in self.journal.changes_since(1))
+        ret = self.journal.changes_since(2)
+        self.assertEqual([c['kind'] for c in ret['changes']], ['reset'])
+
+    def test_060_enabled_by_a_cursor(self):
+        self.journal = ZWaveJournal(self.network, size=5)
+        self.assertFalse(self.journal.enabled)
+        #Changes happened before anyone followed the journal
+        seq = self.journal.seq
+        ret = self.journal.changes_since(0)
+        self.assertTrue(self.journal.enabled)
+        self.assertTrue('snapshot' in ret)
+        self.assertEqual(ret['seq'], seq + 1)
+        self.journal.record('node_added', 2)
+        ret = self.journal.changes_since(ret['seq'])
+        self.assertEqual([c['node_id'] for c in ret['changes']], [2])
+        self.journal.enabled = False
+        self.journal.enabled = True
+        self.assertTrue('snapshot' in self.journal.changes_since(ret['seq']))
+
+    def test_070_nothing_happened(self):
+        self.journal = ZWaveJournal(self.network, size=5)
+        ret = self.journal.changes_since(0)
+        self.assertEqual(ret['seq'], 1)
+        self.assertTrue('snapshot' in ret)
+
+if __name__ == '__main__':
+    sys.argv.append('-v')
+    unittest.main()
@@ -0,0 +1,73 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""
+.. module:: tests
+
+This file is part of **python-openzwave** project https://github.com/OpenZWave/python-openzwave.
+    :platform: Unix, Windows, MacOS X
+    :sinopsis: openzwave Library
+
+.. moduleauthor: bibi21000 aka Sébastien GALLET <bibi21000@gmail.com>
+
+License : GPL(v3)
+
+**python-openzwave** is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+**python-openzwave** is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with python-openzwave. If not, see http://www.gnu.org/licenses.
+
+"""
+
+import sys, os
+import unittest
+import six
+if six.PY3:
+    from pydispatch import dispatcher
+else:
+    from louie import dispatcher
+from tests.common import TestPyZWave
+
+try:
+    from openzwave.network import ZWaveNetwork
+except ImportError:
+    ZWaveNetwork = None
+
+class FakeOptions(object):
+    device = '/dev/ttyUSB0'
+
+class FakeHub(object):
+    manager = None
+
+class TestNetworkNotification(TestPyZWave):
+
+    def setUp(self):
+        if ZWaveNetwork is None:
+            self.skipTest("libopenzwave is not installed")
+        self.network = ZWaveNetwork(FakeOptions(), autostart=False, kvals=False, hub=FakeHub())
+        self.received = []
+        dispatcher.connect(self._notification, ZWaveNetwork.SIGNAL_NOTIFICATION)
+
+    def tearDown(self):
+        if ZWaveNetwork is not None:
+            dispatcher.disconnect(self._notification, ZWaveNetwork.SIGNAL_NOTIFICATION)
+
+    def _notification(self, network, args):
+        self.received.append(args)
+
+    def test_010_unknown_code(self):
+        #A code added to OpenZWave after the binding
+        args = {'notificationType':'Notification', 'homeId':0x01020304, 'nodeId':2, 'notificationCode':250}
+        self.network._handle_notification(args)
+        self.assertEqual(self.received, [args])
+
+if __name__ == '__main__':
+    sys.argv.append('-v')
+    unittest.main()
@@ -0,0 +1,71 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""
+.. module:: tests
+
+This file is part of **python-openzwave** project https://github.com/OpenZWave/python-openzwave.
+    :platform: Unix, Windows, MacOS X
+    :sinopsis: openzwave Library
+
+.. moduleauthor: bibi21000 aka Sébastien GALLET <bibi21000@gmail.com>
+
+License : GPL(v3)
+
+**python-openzwave** is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+**python-openzwave** is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with python-openzwave. If not, see http://www.gnu.org/licenses.
+
+"""
+
+
+import sys, os
+import unittest
+from tests.common import TestPyZWave
+
+try:
+    from openzwave.network import ZWaveNetwork
+except ImportError:
+    ZWaveNetwork = None
+
+class FakeOptions(object):
+    device = '/dev/ttyUSB0'
+
+class FakeManager(object):
+    def getLibraryTypeName(self, home_id):
+        return 'Static Controller'
+    def getLibraryVersion(self, home_id):
+        return 'Z-Wave 3.99'
+
+class FakeHub(object):
+    def __init__(self):
+        self.manager = FakeManager()
+
+class TestNetworkSnapshot(TestPyZWave):
+
+    def setUp(self):
+        if ZWaveNetwork is None:
+            self.skipTest("libopenzwave is not installed")
+        self.network = ZWaveNetwork(FakeOptions(), autostart=False, kvals=False, hub=FakeHub())
+
+    def test_010_driver_ready(self):
+        #A snapshot taken before DriverReady must not see the controller node
+        old = self.network.snapshot
+        self.network._handle_driver_ready({'homeId':0x01020304, 'nodeId':1})
+        self.assertEqual(len(old.nodes), 0)
+        new = self.network.snapshot
+        self.assertEqual(list(new.nodes.keys()), [1])
+        self.assertEqual(len(new.get_values(1)), 0)
+        self.assertEqual(new.diff(old)['nodes_added'], [1])
+
+if __name__ == '__main__':
+    sys.argv.append('-v')
+    unittest.main()
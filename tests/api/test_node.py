@@ -60,6 +60,14 @@ class TestNode(TestApi):
         node_id = max(self.network.nodes.keys())
         self.assertEqual(type(self.network.nodes[node_id].capabilities), type(set()))
 
+    def test_025_node_static_info_cache(self):
+        node_id = max(self.network.nodes.keys())
+        node = self.network.nodes[node_id]
+        self.assertEqual(type(node.command_classes), type(set()))
+        self.assertEqual(node.product_name, self.network.manager.getNodeProductName(self.network.home_id, node_id))
+        node.invalidate_static_info()
+        self.assertEqual(node.generic, self.network.manager.getNodeGeneric(self.network.home_id, node_id))
+
     def test_030_node_statistics(self):
         node_id = max(self.network.nodes.keys())
         self.assertEqual(type(self.network.nodes[node_id].stats), type(dict()))
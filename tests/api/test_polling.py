@@ -0,0 +1,125 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""
+.. module:: tests
+
+This file is part of **python-openzwave** project https://github.com/OpenZWave/python-openzwave.
+    :platform: Unix, Windows, MacOS X
+    :sinopsis: openzwave Library
+
+.. moduleauthor: bibi21000 aka Sébastien GALLET <bibi21000@gmail.com>
+
+License : GPL(v3)
+
+**python-openzwave** is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+**python-openzwave** is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with python-openzwave. If not, see http://www.gnu.org/licenses.
+
+"""
+
+import sys, os
+import unittest
+from openzwave.polling import ZWavePoller
+from tests.common import TestPyZWave
+
+class FakeManager(object):
+    def __init__(self):
+        self.intensities = {}
+    def getPollInterval(self):
+        return 10000
+    def getPollIntensity(self, value_id, homeid=0):
+        return self.intensities.get(value_id, 0)
+    def enablePoll(self, value_id, intensity=1, homeid=0):
+        self.intensities[value_id] = intensity
+        return True
+    def setPollIntensity(self, value_id, intensity, homeid=0):
+        self.intensities[value_id] = intensity
+    def disablePoll(self, value_id, homeid=0):
+        self.intensities.pop(value_id, None)
+        return True
+
+class FakeController(object):
+    send_queue_count = 0
+    stats = {'writeCnt':0, 'retries':0}
+
+class FakeNetwork(object):
+    home_id = 0x01020304
+    def __init__(self):
+        self.manager = FakeManager()
+        self.controller = FakeController()
+
+class TestPoller(TestPyZWave):
+
+    def setUp(self):
+        self.network = FakeNetwork()
+        self.poller = ZWavePoller(self.network, budget=1.0)
+
+    def test_010_manage(self):
+        state = self.poller.manage(1234, intensity=4, max_intensity=8)
+        self.assertEqual(self.network.manager.intensities[1234], 4)
+        self.assertTrue(state.is_polled)
+        self.assertTrue(self.poller.unmanage(1234, disable=True))
+        self.assertFalse(1234 in self.network.manager.intensities)
+        self.assertFalse(self.poller.unmanage(1234))
+
+    def test_020_self_reporting(self):
+        state = self.poller.manage(1234, intensity=8)
+        for i in range(0, 10):
+            self.poller.handle_update(1234, True)
+        self.poller.adjust()
+        self.assertTrue(state.self_reporting)
+        self.assertFalse(1234 in self.network.manager.intensities)
+        #Still reporting : poll stays disabled
+        self.poller.handle_update(1234, True)
+        self.poller.adjust()
+        self.assertFalse(state.is_polled)
+        #Silent for too long : poll again
+        state.max_age = 0
+        self.poller.adjust()
+        self.assertEqual(self.network.manager.intensities[1234], state.max_intensity)
+
+    def test_030_change_rate(self):
+        state = self.poller.manage(1234, intensity=4)
+        self.poller.handle_update(1234, True)
+        self.poller.adjust()
+        self.assertEqual(state.intensity, 2)
+        self.poller.handle_update(1234, False)
+        self.poller.adjust()
+        self.assertEqual(state.intensity, 4)
+
+    def test_040_budget(self):
+        for value_id in range(0, 20):
+            self.poller.manage(value_id, intensity=1)
+        self.poller.adjust()
+        rate = sum([1.0 / (intensity * 10) for intensity in self.network.manager.intensities.values()])
+        self.assertTrue(rate <= 1.0 + 1e-6)
+        self.network.controller.send_queue_count = 10
+        self.poller.adjust()
+        rate = sum([1.0 / (intensity * 10) for intensity in self.network.manager.intensities.values()])
+        self.assertTrue(rate <= 0.5 + 1e-6)
+
+    def test_050_budget_clamped(self):
+        #20 values at their max intensity poll 0.5 times by second
+        self.poller.budget = 0.1
+        for value_id in range(0, 20):
+            self.poller.manage(value_id, intensity=4, max_intensity=4)
+        for value_id in range(16, 20):
+            self.poller.handle_update(value_id, True)
+        self.poller.adjust()
+        #The values which have changed are still polled
+        self.assertEqual(sorted(self.network.manager.intensities.keys()), [16, 17, 18, 19])
+        rate = sum([1.0 / (intensity * 10) for intensity in self.network.manager.intensities.values()])
+        self.assertTrue(rate <= 0.1 + 1e-6)
+
+if __name__ == '__main__':
+    sys.argv.append('-v')
+    unittest.main()
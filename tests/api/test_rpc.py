@@ -0,0 +1,225 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""
+.. module:: tests
+
+This file is part of **python-openzwave** project https://github.com/OpenZWave/python-openzwave.
+    :platform: Unix, Windows, MacOS X
+    :sinopsis: openzwave Library
+
+.. moduleauthor: bibi21000 aka Sébastien GALLET <bibi21000@gmail.com>
+
+License : GPL(v3)
+
+**python-openzwave** is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+**python-openzwave** is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with python-openzwave. If not, see http://www.gnu.org/licenses.
+
+"""
+
+import sys, os
+import shutil
+import tempfile
+import threading
+import unittest
+from openzwave.rpc import ZWaveRpcServer, ZWaveRpcClient, CODEC_JSON, CODEC_MSGPACK, encode, decode, msgpack, dispatcher
+from openzwave.rpc import make_socket, send_frame, recv_frame
+from openzwave.object import ZWaveException
+from tests.common import TestPyZWave
+
+VALUE1 = 72057594076299264 | (2 << 24)
+VALUE2 = 72057594076299280 | (2 << 24)
+
+class FakeSendQueue(object):
+    def __init__(self):
+        self.commands = []
+    def set_value(self, value_id, data, priority=None):
+        self.commands.append(('set_value', value_id, data))
+    def refresh_value(self, value_id, priority=None):
+        self.commands.append(('refresh_value', value_id))
+
+class FakeValue(object):
+    def __init__(self, value_id, data):
+        self.value_id = value_id
+        self.data = data
+    def to_dict(self, extras=[]):
+        return {'value_id': self.value_id, 'data': self.data}
+
+class FakeNode(object):
+    def __init__(self, node_id, values):
+        self.node_id = node_id
+        self.values = dict((value.value_id, value) for value in values)
+    def get_values(self, genre='All'):
+        return self.values
+    def to_dict(self, extras=[]):
+        return {'node_id': self.node_id}
+
+class FakeNetwork(object):
+    SIGNAL_VALUE_ADDED = 'RpcValueAdded'
+    SIGNAL_VALUE_CHANGED = 'RpcValueChanged'
+    SIGNAL_VALUE_REFRESHED = 'RpcValueRefreshed'
+    SIGNAL_VALUE_REMOVED = 'RpcValueRemoved'
+    SIGNAL_NODE_ADDED = 'RpcNodeAdded'
+    SIGNAL_NODE_REMOVED = 'RpcNodeRemoved'
+    SIGNAL_NODE_EVENT = 'RpcNodeEvent'
+    SIGNAL_SCENE_EVENT = 'RpcSceneEvent'
+    SIGNAL_NETWORK_READY = 'RpcNetworkReady'
+    SIGNAL_NETWORK_STOPPED = 'RpcNetworkStopped'
+    home_id = 0x01020304
+    state = 10
+    state_str = 'Ready'
+    nodes_count = 1
+    def __init__(self):
+        self.send_queue = FakeSendQueue()
+        self.value1 = FakeValue(VALUE1, 21.5)
+        self.value2 = FakeValue(VALUE2, True)
+        self.nodes = {2: FakeNode(2, [self.value1, self.value2])}
+    def changes_since(self, seq, extras=['all']):
+        return {'seq': 3, 'changes': [{'seq': 3, 'kind': 'value_changed', 'node_id': 2, 'value_id': VALUE1, 'data': {'data': 21.5}}]}
+
+class TestRpcCodec(TestPyZWave):
+
+    def test_010_json(self):
+        message = {'id': 1, 'method': 'get_values', 'params': {'value_ids': [VALUE1]}}
+        self.assertEqual(decode(encode(message, CODEC_JSON)), (CODEC_JSON, message))
+
+    def test_020_msgpack(self):
+        if msgpack is None:
+            self.skipTest("msgpack is not installed")
+        message = {'id': 1, 'method': 'get_values', 'params': {'value_ids': [VALUE1]}}
+        self.assertEqual(decode(encode(message, CODEC_MSGPACK)), (CODEC_MSGPACK, message))
+
+class TestRpcServer(TestPyZWave):
+
+    codec = CODEC_JSON
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.network = FakeNetwork()
+        address = os.path.join(self.tmpdir, 'socket')
+        self.server = ZWaveRpcServer(self.network, address)
+        self.server.start()
+        self.client = ZWaveRpcClient(address, codec=self.codec, timeout=5.0)
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+        shutil.rmtree(self.tmpdir)
+
+    def test_010_queries(self):
+        self.assertTrue(self.client.call('ping'))
+        self.assertEqual(self.client.call('network')['home_id'], self.network.home_id)
+        self.assertEqual(self.client.call('nodes'), [{'node_id': 2}])
+        self.assertEqual(self.client.get_values([VALUE1, VALUE2, 1]), [21.5, True, None])
+        self.assertRaises(ZWaveException, self.client.call, 'node', node_id=5)
+        self.assertRaises(ZWaveException, self.client.call, 'unknown')
+        self.assertEqual(self.client.call('changes_since', seq=2)['changes'][0]['value_id'], VALUE1)
+
+    def test_020_batch(self):
+        results = self.client.batch([
+            ('set_value', {'value_id': VALUE1, 'data': 22}),
+            ('set_values', {'values': [[VALUE2, False]]}),
+            ('get_values', {'value_ids': [VALUE1]}),
+            ('unknown', {}),
+        ])
+        self.assertEqual(results[:3], [True, 1, [21.5]])
+        self.assertTrue(isinstance(results[3], ZWaveException))
+        self.assertEqual(self.network.send_queue.commands, [('set_value', VALUE1, 22), ('set_value', VALUE2, False)])
+
+    def test_030_subscribe(self):
+        events = []
+        received = threading.Event()
+        def callback(signal, data):
+            events.append((signal, data))
+            received.set()
+        self.client.subscribe(callback, signals=[self.network.SIGNAL_VALUE_CHANGED], value_ids=[VALUE2])
+        node = self.network.nodes[2]
+        dispatcher.send(self.network.SIGNAL_VALUE_CHANGED, **{'network': self.network, 'node': node, 'value': self.network.value1})
+        dispatcher.send(self.network.SIGNAL_VALUE_REFRESHED, **{'network': self.network, 'node': node, 'value': self.network.value2})
+        dispatcher.send(self.network.SIGNAL_VALUE_CHANGED, **{'network': self.network, 'node': node, 'value': self.network.value2})
+        self.assertTrue(received.wait(5.0))
+        self.assertEqual(events, [(self.network.SIGNAL_VALUE_CHANGED, {'node_id': 2, 'value_id': VALUE2, 'data': True})])
+
+class TestRpcServerMsgpack(TestRpcServer):
+
+    codec = CODEC_MSGPACK
+
+    def setUp(self):
+        if msgpack is None:
+            self.skipTest("msgpack is not installed")
+        TestRpcServer.setUp(self)
+
+class TestRpcClient(TestPyZWave):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.address = os.path.join(self.tmpdir, 'socket')
+        self.listener = make_socket(self.address)
+        self.listener.bind(self.address)
+        self.listener.listen(1)
+        self.client = ZWaveRpcClient(self.address, codec=CODEC_JSON, timeout=5.0)
+
+    def tearDown(self):
+        self.client.close()
+        self.listener.close()
+        shutil.rmtree(self.tmpdir)
+
+    def serve(self, handler):
+        def run():
+            sock = self.listener.accept()[0]
+            try:
+                while True:
+                    frame = recv_frame(sock)
+                    if frame is None:
+                        break
+                    handler(sock, decode(frame)[1])
+            finally:
+                sock.close()
+        thread = threading.Thread(target=run)
+        thread.daemon = True
+        thread.start()
+
+    def test_010_events_before_the_subscription(self):
+        def handler(sock, request):
+            if request['method'] == 'subscribe':
+                #The events are sent before the response of the subscription
+                send_frame(sock, encode({'sub': 7, 'event': 'ValueChanged', 'data': 1}, CODEC_JSON))
+                send_frame(sock, encode({'sub': 7, 'event': 'ValueChanged', 'data': 2}, CODEC_JSON))
+                send_frame(sock, encode({'id': request['id'], 'result': 7}, CODEC_JSON))
+                send_frame(sock, encode({'sub': 7, 'event': 'ValueChanged', 'data': 3}, CODEC_JSON))
+            else:
+                send_frame(sock, encode({'id': request['id'], 'result': True}, CODEC_JSON))
+        self.serve(handler)
+        events = []
+        received = threading.Event()
+        def callback(signal, data):
+            events.append(data)
+            if len(events) == 3:
+                received.set()
+        self.assertEqual(self.client.subscribe(callback), 7)
+        self.assertTrue(received.wait(5.0))
+        self.assertEqual(events, [1, 2, 3])
+
+    def test_020_malformed_frames(self):
+        def handler(sock, request):
+            send_frame(sock, encode([], CODEC_JSON))
+            send_frame(sock, encode(12, CODEC_JSON))
+            send_frame(sock, encode(['a'], CODEC_JSON))
+            send_frame(sock, encode({'id': request['id'], 'result': True}, CODEC_JSON))
+        self.serve(handler)
+        #The reader thread survives the malformed frames
+        self.assertTrue(self.client.call('ping'))
+        self.assertTrue(self.client.call('ping'))
+
+if __name__ == '__main__':
+    sys.argv.append('-v')
+    unittest.main()
@@ -0,0 +1,109 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""
+.. module:: tests
+
+This file is part of **python-openzwave** project https://github.com/OpenZWave/python-openzwave.
+    :platform: Unix, Windows, MacOS X
+    :sinopsis: openzwave Library
+
+.. moduleauthor: bibi21000 aka Sébastien GALLET <bibi21000@gmail.com>
+
+License : GPL(v3)
+
+**python-openzwave** is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+**python-openzwave** is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with python-openzwave. If not, see http://www.gnu.org/licenses.
+
+"""
+
+import sys, os
+import unittest
+from openzwave.scene import ZWaveScene
+from tests.common import TestPyZWave
+
+VALUE1 = 72057594076299264 | (2 << 24)
+VALUE2 = 72057594076299280 | (2 << 24)
+
+class FakeNode(object):
+    node_id = 2
+
+class FakeValue(object):
+    def __init__(self, value_id):
+        self.value_id = value_id
+        self.node = FakeNode()
+
+class FakeManager(object):
+    def __init__(self):
+        self.calls = 0
+        self.scenes = {1: {VALUE1: 50}}
+        self.labels = {1: 'Evening'}
+    def getSceneLabel(self, scene_id):
+        self.calls += 1
+        return self.labels[scene_id]
+    def setSceneLabel(self, scene_id, label):
+        self.labels[scene_id] = label
+    def sceneGetValues(self, scene_id):
+        self.calls += 1
+        return dict(self.scenes[scene_id])
+    def addSceneValue(self, scene_id, value_id, data, homeid=0):
+        self.scenes[scene_id][value_id] = data
+        return 1
+    def setSceneValue(self, scene_id, value_id, data, homeid=0):
+        return self.addSceneValue(scene_id, value_id, data)
+    def removeSceneValue(self, scene_id, value_id, homeid=0):
+        return self.scenes[scene_id].pop(value_id, None) is not None
+
+class FakeNetwork(object):
+    object_id = 0x01020304
+    home_id = 0x01020304
+    def __init__(self):
+        self.manager = FakeManager()
+        self.values = {VALUE1: FakeValue(VALUE1), VALUE2: FakeValue(VALUE2)}
+    def get_value(self, value_id):
+        return self.values.get(value_id, None)
+
+class TestSceneCache(TestPyZWave):
+
+    def setUp(self):
+        self.network = FakeNetwork()
+        self.scene = ZWaveScene(1, network=self.network)
+
+    def test_010_label(self):
+        self.assertEqual(self.scene.label, 'Evening')
+        self.assertEqual(self.scene.label, 'Evening')
+        self.scene.label = 'Night'
+        self.assertEqual(self.scene.label, 'Night')
+        self.assertEqual(self.network.manager.calls, 1)
+
+    def test_020_values(self):
+        values = self.scene.get_values()
+        self.assertEqual(values[VALUE1]['data'], 50)
+        self.assertTrue(self.scene.add_value(VALUE2, 10))
+        self.assertTrue(self.scene.set_value(VALUE1, 60))
+        by_node = self.scene.get_values_by_node()
+        self.assertEqual(sorted(by_node[2].keys()), [VALUE1, VALUE2])
+        self.assertEqual(by_node[2][VALUE1]['data'], 60)
+        self.assertTrue(self.scene.remove_value(VALUE2))
+        self.assertEqual(list(self.scene.get_values().keys()), [VALUE1])
+        self.assertEqual(self.network.manager.calls, 1)
+
+    def test_030_invalidate(self):
+        self.scene.get_values()
+        self.network.manager.scenes[1][VALUE2] = 1
+        self.assertEqual(len(self.scene.get_values()), 1)
+        self.scene.invalidate()
+        self.assertEqual(len(self.scene.get_values()), 2)
+
+if __name__ == '__main__':
+    sys.argv.append('-v')
+    unittest.main()
@@ -0,0 +1,162 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""
+.. module:: tests
+
+This file is part of **python-openzwave** project https://github.com/OpenZWave/python-openzwave.
+    :platform: Unix, Windows, MacOS X
+    :sinopsis: openzwave Library
+
+.. moduleauthor: bibi21000 aka Sébastien GALLET <bibi21000@gmail.com>
+
+License : GPL(v3)
+
+**python-openzwave** is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+**python-openzwave** is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with python-openzwave. If not, see http://www.gnu.org/licenses.
+
+"""
+
+import sys, os
+import unittest
+import six
+if six.PY3:
+    from pydispatch import dispatcher
+else:
+    from louie import dispatcher
+from openzwave.sceneengine import ZWaveSceneEngine
+from openzwave.scheduler import ZWaveScheduler
+from tests.common import TestPyZWave
+
+VALUE1 = 72057594076299264 | (2 << 24)
+VALUE2 = 72057594076299280 | (3 << 24)
+VALUE3 = 72057594076299296 | (2 << 24)
+VALUE4 = 72057594076299312 | (4 << 24)
+
+class FakeValue(object):
+    def __init__(self, value_id, data):
+        self.value_id = value_id
+        self.data = data
+
+class FakeScene(object):
+    scene_id = 1
+    def __init__(self, values):
+        self.values = values
+    def get_values(self):
+        return self.values
+
+class FakeCommand(object):
+    def __init__(self, args, result):
+        self.args = args
+        self.result = result
+
+class FakeSendQueue(object):
+    def __init__(self):
+        self.commands = []
+        self.callbacks = {}
+    def set_value(self, value_id, data, priority=None, callback=None):
+        self.commands.append((value_id, data, priority))
+        self.callbacks[value_id] = callback
+    def execute(self, value_id, data, result):
+        self.callbacks[value_id](FakeCommand([value_id, data, 0], result))
+
+class FakeNetwork(object):
+    SIGNAL_VALUE_CHANGED = 'SceneEngineValueChanged'
+    SIGNAL_VALUE_REFRESHED = 'SceneEngineValueRefreshed'
+    def __init__(self):
+        self.scheduler = ZWaveScheduler(self)
+        self.send_queue = FakeSendQueue()
+
+class TestSceneEngine(TestPyZWave):
+
+    def setUp(self):
+        self.network = FakeNetwork()
+        self.engine = ZWaveSceneEngine(self.network)
+        self.values = {
+            VALUE1: FakeValue(VALUE1, 0),
+            VALUE2: FakeValue(VALUE2, 0),
+            VALUE3: FakeValue(VALUE3, 99),
+        }
+        self.scene = FakeScene({
+            VALUE1: {'value': self.values[VALUE1], 'data': 99},
+            VALUE2: {'value': self.values[VALUE2], 'data': 50},
+            VALUE3: {'value': self.values[VALUE3], 'data': 99},
+            VALUE4: {'value': None, 'data': 1},
+        })
+
+    def tearDown(self):
+        self.engine.clear()
+        self.network.scheduler.stop()
+
+    def change(self, value_id, data):
+        self.values[value_id].data = data
+        dispatcher.send(self.network.SIGNAL_VALUE_CHANGED, \
+            **{'network': self.network, 'node': None, 'value': self.values[value_id]})
+
+    def test_010_execute(self):
+        finished = []
+        run = self.engine.execute(self.scene, priority=0, callback=finished.append)
+        self.assertEqual(run.skipped, [VALUE3])
+        self.assertEqual(run.unknown, [VALUE4])
+        self.assertEqual(self.network.send_queue.commands, [(VALUE1, 99, 0), (VALUE2, 50, 0)])
+        self.change(VALUE2, 10)
+        self.change(VALUE1, 99)
+        self.assertFalse(run.is_done)
+        self.assertEqual(len(self.engine.runs), 1)
+        self.change(VALUE2, 50)
+        self.assertTrue(run.wait(1))
+        self.assertTrue(run.is_success)
+        self.assertEqual(sorted(run.confirmed.keys()), [VALUE1, VALUE2])
+        self.assertTrue(run.latency >= 0)
+        self.assertEqual(finished, [run])
+        self.assertEqual(len(self.engine.runs), 0)
+
+    def test_020_timeout(self):
+        self.network.scheduler.start()
+        run = self.engine.execute(self.scene, timeout=0.1)
+        self.change(VALUE1, 99)
+        self.assertTrue(run.wait(5))
+        self.assertFalse(run.is_success)
+        self.assertEqual(run.failed, [VALUE2])
+        self.assertEqual(len(self.engine.runs), 0)
+
+    def test_030_nothing_to_do(self):
+        self.values[VALUE1].data = 99
+        self.values[VALUE2].data = 50
+        run = self.engine.execute(self.scene)
+        self.assertTrue(run.is_success)
+        self.assertEqual(self.network.send_queue.commands, [])
+        self.assertEqual(sorted(run.skipped), sorted([VALUE1, VALUE2, VALUE3]))
+
+    def test_040_rejected(self):
+        finished = []
+        run = self.engine.execute(self.scene, callback=finished.append)
+        self.network.send_queue.execute(VALUE1, 99, 1)
+        self.change(VALUE1, 99)
+        self.network.send_queue.execute(VALUE2, 50, 0)
+        self.assertTrue(run.wait(1))
+        self.assertFalse(run.is_success)
+        self.assertEqual(run.failed, [VALUE2])
+        self.assertEqual(finished, [run])
+        self.assertEqual(len(self.engine.runs), 0)
+        #The value is not known by the manager
+        self.values[VALUE1].data = 0
+        run = self.engine.execute(self.scene)
+        self.network.send_queue.execute(VALUE2, 50, 2)
+        self.assertFalse(run.is_done)
+        self.network.send_queue.execute(VALUE1, 99, None)
+        self.assertTrue(run.is_done)
+        self.assertEqual(sorted(run.failed), sorted([VALUE1, VALUE2]))
+
+if __name__ == '__main__':
+    sys.argv.append('-v')
+    unittest.main()
@@ -0,0 +1,117 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""
+.. module:: tests
+
+This file is part of **python-openzwave** project https://github.com/OpenZWave/python-openzwave.
+    :platform: Unix, Windows, MacOS X
+    :sinopsis: openzwave Library
+
+.. moduleauthor: bibi21000 aka Sébastien GALLET <bibi21000@gmail.com>
+
+License : GPL(v3)
+
+**python-openzwave** is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+**python-openzwave** is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with python-openzwave. If not, see http://www.gnu.org/licenses.
+
+"""
+
+import sys, os
+import time
+import unittest
+import threading
+from openzwave.scheduler import ZWaveScheduler, ZWaveScheduledJob
+from tests.common import TestPyZWave
+
+class FakeController(object):
+    send_queue_count = 0
+
+class FakeNetwork(object):
+    STATE_STARTED = 5
+    state = 5
+    def __init__(self):
+        self.controller = FakeController()
+
+class TestScheduler(TestPyZWave):
+
+    def setUp(self):
+        self.network = FakeNetwork()
+        self.scheduler = ZWaveScheduler(self.network, max_queue=2, backoff=0.05)
+        self.scheduler.start()
+
+    def tearDown(self):
+        self.scheduler.stop()
+
+    def test_010_periodic_job(self):
+        event = threading.Event()
+        counter = []
+        def callback():
+            counter.append(1)
+            if len(counter) >= 3:
+                event.set()
+        self.scheduler.add_job('periodic', callback, 0.05)
+        self.assertTrue(event.wait(5))
+        self.assertTrue(self.scheduler.get_job('periodic').runs >= 3)
+        self.assertTrue(self.scheduler.remove_job('periodic'))
+        self.assertEqual(self.scheduler.get_job('periodic'), None)
+        runs = len(counter)
+        time.sleep(0.2)
+        self.assertEqual(len(counter), runs)
+
+    def test_020_call_later(self):
+        event = threading.Event()
+        self.scheduler.call_later(0.05, event.set, name='once')
+        self.assertTrue(event.wait(5))
+        time.sleep(0.05)
+        self.assertEqual(self.scheduler.get_job('once'), None)
+
+    def test_025_call_later_same_callback(self):
+        counter = []
+        event = threading.Event()
+        def callback():
+            counter.append(1)
+            if len(counter) == 2:
+                event.set()
+        job1 = self.scheduler.call_later(0.05, callback)
+        job2 = self.scheduler.call_later(0.05, callback)
+        self.assertNotEqual(job1.name, job2.name)
+        self.assertTrue(event.wait(5))
+
+    def test_030_backpressure(self):
+        event = threading.Event()
+        self.network.controller.send_queue_count = 10
+        job = self.scheduler.add_job('busy', event.set, 0.05, backpressure=True, delay=0)
+        time.sleep(0.3)
+        self.assertFalse(event.is_set())
+        self.assertTrue(job.postponed > 0)
+        self.network.controller.send_queue_count = 0
+        self.assertTrue(event.wait(5))
+
+    def test_040_error_in_job(self):
+        event = threading.Event()
+        def callback():
+            raise RuntimeError("Boom")
+        self.scheduler.add_job('error', callback, 0.05, delay=0)
+        self.scheduler.call_later(0.1, event.set, name='after')
+        self.assertTrue(event.wait(5))
+        self.assertTrue(self.scheduler.is_running)
+
+    def test_050_stop(self):
+        self.scheduler.add_job('periodic', lambda: None, 0.05)
+        self.scheduler.stop()
+        self.assertFalse(self.scheduler.is_running)
+        self.assertTrue('periodic' in self.scheduler.jobs)
+
+if __name__ == '__main__':
+    sys.argv.append('-v')
+    unittest.main()
@@ -0,0 +1,128 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""
+.. module:: tests
+
+This file is part of **python-openzwave** project https://github.com/OpenZWave/python-openzwave.
+    :platform: Unix, Windows, MacOS X
+    :sinopsis: openzwave Library
+
+.. moduleauthor: bibi21000 aka Sébastien GALLET <bibi21000@gmail.com>
+
+License : GPL(v3)
+
+**python-openzwave** is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+**python-openzwave** is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with python-openzwave. If not, see http://www.gnu.org/licenses.
+
+"""
+
+import sys, os
+import unittest
+from openzwave.sendqueue import ZWaveSendQueue, PRIORITY_INTERACTIVE, PRIORITY_AUTOMATION, PRIORITY_MAINTENANCE
+from tests.common import TestPyZWave
+
+class FakeManager(object):
+    def __init__(self):
+        self.queue = []
+    def getSendQueueCount(self, home_id):
+        return len(self.queue)
+    def setValue(self, value_id, data, homeid=0):
+        assert homeid == FakeNetwork.home_id
+        self.queue.append(('setValue', value_id, data))
+        return True
+    def refreshValue(self, value_id, homeid=0):
+        assert homeid == FakeNetwork.home_id
+        self.queue.append(('refreshValue', value_id))
+        return True
+    def requestAllConfigParams(self, home_id, node_id):
+        self.queue.append(('requestAllConfigParams', node_id))
+
+class FakeController(object):
+    def __init__(self, manager):
+        self.manager = manager
+    @property
+    def send_queue_count(self):
+        return self.manager.getSendQueueCount(0)
+
+class FakeNetwork(object):
+    STATE_STARTED = 5
+    state = 5
+    home_id = 0x01020304
+    def __init__(self):
+        self.manager = FakeManager()
+        self.controller = FakeController(self.manager)
+
+def value_id(node_id, index):
+    return (node_id << 24) | (index << 4)
+
+class TestSendQueue(TestPyZWave):
+
+    def setUp(self):
+        self.network = FakeNetwork()
+        self.queue = ZWaveSendQueue(self.network, max_queue=1, interactive_queue=2)
+
+    def test_010_admission(self):
+        for i in range(0, 5):
+            self.queue.refresh_value(value_id(2, i))
+        self.assertEqual(len(self.network.manager.queue), 1)
+        self.assertEqual(self.queue.pending_count(), 4)
+        self.network.manager.queue = []
+        self.assertEqual(self.queue.pump(), 1)
+        self.assertEqual(self.queue.pending_count(), 3)
+
+    def test_020_priority(self):
+        self.queue.refresh_value(value_id(2, 1))
+        self.queue.request_all_config_params(3)
+        self.queue.refresh_value(value_id(2, 2))
+        self.assertEqual(self.queue.pending_count(PRIORITY_MAINTENANCE), 1)
+        #Interactive commands can use a longer queue
+        self.queue.set_value(value_id(4, 1), 10)
+        self.assertEqual(self.network.manager.queue[-1], ('setValue', value_id(4, 1), 10))
+        self.network.manager.queue = []
+        self.queue.pump()
+        self.assertEqual(self.network.manager.queue[0][0], 'refreshValue')
+
+    def test_030_fairness(self):
+        self.network.manager.queue = ['busy']
+        for i in range(0, 3):
+            self.queue.refresh_value(value_id(2, i))
+        self.queue.refresh_value(value_id(3, 1))
+        sent = []
+        for i in range(0, 4):
+            self.network.manager.queue = []
+            self.queue.pump()
+            sent.append(self.network.manager.queue[0][1] >> 24)
+        self.assertEqual(sent, [2, 3, 2, 2])
+
+    def test_040_coalesce(self):
+        self.network.manager.queue = ['busy', 'busy']
+        for data in range(0, 10):
+            self.queue.set_value(value_id(2, 1), data)
+        self.assertEqual(self.queue.pending_count(PRIORITY_INTERACTIVE), 1)
+        self.network.manager.queue = []
+        self.queue.pump()
+        self.assertEqual(self.network.manager.queue, [('setValue', value_id(2, 1), 9)])
+        self.assertEqual(self.queue.stats['interactive']['coalesced'], 9)
+
+    def test_050_drop_node(self):
+        self.network.manager.queue = ['busy', 'busy']
+        self.queue.refresh_value(value_id(2, 1))
+        self.queue.refresh_value(value_id(3, 1))
+        self.queue.drop_node(2)
+        self.assertEqual(self.queue.pending_count(), 1)
+        self.queue.clear()
+        self.assertEqual(self.queue.pending_count(), 0)
+
+if __name__ == '__main__':
+    sys.argv.append('-v')
+    unittest.main()
@@ -0,0 +1,103 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""
+.. module:: tests
+
+This file is part of **python-openzwave** project https://github.com/OpenZWave/python-openzwave.
+    :platform: Unix, Windows, MacOS X
+    :sinopsis: openzwave Library
+
+.. moduleauthor: bibi21000 aka Sébastien GALLET <bibi21000@gmail.com>
+
+License : GPL(v3)
+
+**python-openzwave** is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+**python-openzwave** is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with python-openzwave. If not, see http://www.gnu.org/licenses.
+
+"""
+
+
+import sys, os
+import json
+import unittest
+from openzwave.serializer import ZWaveSerializer, msgpack
+from openzwave import rpc
+from openzwave.snapshot import ZWaveSnapshot
+from openzwave.value import ZWaveValue
+from openzwave.object import ZWaveException
+from tests.common import TestPyZWave
+
+VALUE1 = 72057594076299264 | (2 << 24)
+VALUE2 = 72057594076299280 | (2 << 24)
+
+class FakeManager(object):
+    def getValueLabel(self, value_id, homeid=0):
+        return 'Level %s' % value_id
+    def getValue(self, value_id, homeid=0):
+        return 12
+    def getValueUnits(self, value_id, homeid=0):
+        return '%'
+
+class FakeNode(object):
+    def __init__(self, node_id):
+        self.node_id = node_id
+        self.object_id = node_id
+        self.name = 'node%s' % node_id
+        self.location = 'kitchen'
+        self.neighbors = set([1])
+        self.values = {}
+
+class FakeNetwork(object):
+    home_id = 0x01020304
+    id_separator = '.'
+    def __init__(self):
+        self.manager = FakeManager()
+        node1 = FakeNode(1)
+        node2 = FakeNode(2)
+        for value_id in (VALUE1, VALUE2):
+            node2.values[value_id] = ZWaveValue(value_id, network=self, parent=node2)
+        self.snapshot = ZWaveSnapshot.from_nodes(1, {1: node1, 2: node2})
+
+class TestSerializer(TestPyZWave):
+
+    def setUp(self):
+        self.network = FakeNetwork()
+
+    def test_010_fields(self):
+        serializer = ZWaveSerializer(self.network, node_fields=['node_id', 'name', 'neighbors', 'values'],
+                                     value_fields=['node_id', 'label', 'data'])
+        nodes = serializer.to_dict()
+        self.assertEqual(sorted(nodes.keys()), [1, 2])
+        self.assertEqual(nodes[1], {'node_id': 1, 'name': 'node1', 'neighbors': set([1]), 'values': {}})
+        self.assertEqual(nodes[2]['values'][VALUE1], {'node_id': 2, 'label': 'Level %s' % VALUE1, 'data': 12})
+        self.assertRaises(ZWaveException, ZWaveSerializer, self.network, node_fields=['kvals'])
+
+    def test_020_json(self):
+        serializer = ZWaveSerializer(self.network, node_fields=['node_id', 'neighbors', 'values'])
+        chunks = list(serializer.iterencode())
+        self.assertEqual(len(chunks), 4)
+        nodes = json.loads(serializer.encode())
+        self.assertEqual(nodes['1'], {'node_id': 1, 'neighbors': [1], 'values': {}})
+        self.assertEqual(nodes['2']['values'][str(VALUE2)]['units'], '%')
+
+    def test_030_msgpack(self):
+        if msgpack is None:
+            self.skipTest("msgpack is not installed")
+        serializer = ZWaveSerializer(self.network, node_fields=['node_id', 'values'], value_fields=['data'])
+        nodes = msgpack.unpackb(serializer.pack(), **rpc._UNPACK_KWARGS)
+        self.assertEqual(nodes, {1: {'node_id': 1, 'values': {}},
+                                 2: {'node_id': 2, 'values': {VALUE1: {'data': 12}, VALUE2: {'data': 12}}}})
+
+if __name__ == '__main__':
+    sys.argv.append('-v')
+    unittest.main()
@@ -0,0 +1,109 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""
+.. module:: tests
+
+This file is part of **python-openzwave** project https://github.com/OpenZWave/python-openzwave.
+    :platform: Unix, Windows, MacOS X
+    :sinopsis: openzwave Library
+
+.. moduleauthor: bibi21000 aka Sébastien GALLET <bibi21000@gmail.com>
+
+License : GPL(v3)
+
+**python-openzwave** is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+**python-openzwave** is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with python-openzwave. If not, see http://www.gnu.org/licenses.
+
+"""
+
+import sys, os
+import unittest
+from openzwave.snapshot import ZWaveSnapshot, ZWaveFrozenDict
+from tests.common import TestPyZWave
+
+VALUE1 = 72057594076299264 | (2 << 24)
+VALUE2 = 72057594076299280 | (2 << 24)
+VALUE3 = 72057594076299264 | (3 << 24)
+
+class FakeNode(object):
+    def __init__(self, node_id, value_ids):
+        self.node_id = node_id
+        self.values = dict((value_id, 'value %s' % value_id) for value_id in value_ids)
+
+class TestSnapshot(TestPyZWave):
+
+    def setUp(self):
+        self.nodes = {2: FakeNode(2, [VALUE1]), 3: FakeNode(3, [VALUE3])}
+        self.snapshot = ZWaveSnapshot.from_nodes(1, self.nodes)
+
+    def test_010_read(self):
+        self.assertEqual(self.snapshot.version, 1)
+        self.assertEqual(sorted(self.snapshot.nodes.keys()), [2, 3])
+        self.assertEqual(self.snapshot.get_node(2), self.nodes[2])
+        self.assertEqual(self.snapshot.get_node(4), None)
+        self.assertEqual(self.snapshot.get_value(VALUE3), 'value %s' % VALUE3)
+        self.assertEqual(self.snapshot.get_value(VALUE2), None)
+        self.assertEqual(list(self.snapshot.get_values(2).keys()), [VALUE1])
+        self.assertEqual(len(self.snapshot.get_values(5)), 0)
+
+    def test_020_read_only(self):
+        nodes = self.snapshot.nodes
+        self.assertTrue(isinstance(nodes, ZWaveFrozenDict))
+        def update():
+            nodes[4] = None
+        self.assertRaises(TypeError, update)
+
+    def test_030_copy_on_write(self):
+        #A writer replaces the dicts, so the old snapshot does not change
+        node = self.nodes[2]
+        values = dict(node.values)
+        values[VALUE2] = 'value %s' % VALUE2
+        node.values = values
+        nodes = dict(self.nodes)
+        del nodes[3]
+        nodes[4] = FakeNode(4, [])
+        new = ZWaveSnapshot.from_nodes(2, nodes)
+        self.assertEqual(sorted(self.snapshot.nodes.keys()), [2, 3])
+        self.assertEqual(len(self.snapshot.get_values(2)), 1)
+        self.assertEqual(len(new.get_values(2)), 2)
+        diff = new.diff(self.snapshot)
+        self.assertEqual(diff['nodes_added'], [4])
+        self.assertEqual(diff['nodes_removed'], [3])
+        self.assertEqual(diff['values_added'], [VALUE2])
+        self.assertEqual(diff['values_removed'], [VALUE3])
+
+    def test_035_node_values(self):
+        #Only the values of node 2 are read again
+        node = self.nodes[2]
+        values = dict(node.values)
+        values[VALUE2] = 'value %s' % VALUE2
+        node.values = values
+        self.nodes[3].values = {}
+        new = self.snapshot.with_node_values(2, self.nodes, 2)
+        self.assertEqual(new.version, 2)
+        self.assertEqual(len(new.get_values(2)), 2)
+        self.assertEqual(len(new.get_values(3)), 1)
+        self.assertEqual(len(self.snapshot.get_values(2)), 1)
+        self.assertEqual(new.diff(self.snapshot)['values_added'], [VALUE2])
+        #The dict of nodes was replaced : full rebuild
+        nodes = dict(self.nodes)
+        new = self.snapshot.with_node_values(3, nodes, 2)
+        self.assertEqual(len(new.get_values(3)), 0)
+
+    def test_040_diff_shared(self):
+        new = ZWaveSnapshot.from_nodes(2, dict(self.nodes))
+        self.assertEqual(new.diff(self.snapshot), {'nodes_added': [], 'nodes_removed': [], 'values_added': [], 'values_removed': []})
+
+if __name__ == '__main__':
+    sys.argv.append('-v')
+    unittest.main()
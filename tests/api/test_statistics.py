@@ -0,0 +1,91 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""
+.. module:: tests
+
+This file is part of **python-openzwave** project https://github.com/OpenZWave/python-openzwave.
+    :platform: Unix, Windows, MacOS X
+    :sinopsis: openzwave Library
+
+.. moduleauthor: bibi21000 aka Sébastien GALLET <bibi21000@gmail.com>
+
+License : GPL(v3)
+
+**python-openzwave** is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+**python-openzwave** is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with python-openzwave. If not, see http://www.gnu.org/licenses.
+
+"""
+
+
+import sys, os
+import unittest
+from openzwave.statistics import ZWaveStatisticsCollector, ZWaveNodesStatistics, COUNTERS, GAUGES
+from openzwave.snapshot import ZWaveSnapshot
+from tests.common import TestPyZWave
+
+class FakeNode(object):
+    def __init__(self, node_id):
+        self.node_id = node_id
+        self.values = {}
+
+class FakeManager(object):
+    def __init__(self):
+        self.calls = 0
+        self.stats = {1: 10, 2: 20}
+    def getAllNodesStatistics(self, home_id, node_ids):
+        self.calls += 1
+        ret = {'nodeIds': list(node_ids)}
+        for name in COUNTERS + GAUGES:
+            ret[name] = [self.stats.get(node_id, 0) for node_id in node_ids]
+        return ret
+
+class FakeNetwork(object):
+    home_id = 0x01020304
+    def __init__(self):
+        self.manager = FakeManager()
+        self.snapshot = ZWaveSnapshot.from_nodes(1, {1: FakeNode(1), 2: FakeNode(2)})
+
+class TestStatistics(TestPyZWave):
+
+    def test_010_collect(self):
+        network = FakeNetwork()
+        collector = ZWaveStatisticsCollector(network)
+        stats = collector.collect()
+        self.assertEqual(network.manager.calls, 1)
+        self.assertEqual(stats.node_ids, (1, 2))
+        self.assertEqual(stats.get(2, 'retries'), 20)
+        self.assertEqual(stats.get_delta(2, 'retries'), 0)
+        self.assertEqual(stats.get(3, 'retries'), None)
+        self.assertTrue(collector.last is stats)
+
+    def test_020_deltas(self):
+        previous = ZWaveNodesStatistics(10.0, {'nodeIds': [1, 2], 'sentCnt': [10, 20], 'sentFailed': [0, 0],
+            'retries': [5, 8], 'receivedCnt': [0, 0], 'receivedDups': [0, 0], 'receivedUnsolicited': [0, 0],
+            'lastRequestRTT': [0, 0], 'averageRequestRTT': [40, 50], 'lastResponseRTT': [0, 0],
+            'averageResponseRTT': [0, 0], 'quality': [0, 0]})
+        stats = ZWaveNodesStatistics(20.0, {'nodeIds': [1, 2, 3], 'sentCnt': [30, 5, 7], 'sentFailed': [0, 0, 0],
+            'retries': [5, 10, 1], 'receivedCnt': [0, 0, 0], 'receivedDups': [0, 0, 0], 'receivedUnsolicited': [0, 0, 0],
+            'lastRequestRTT': [0, 0, 0], 'averageRequestRTT': [45, 50, 60], 'lastResponseRTT': [0, 0, 0],
+            'averageResponseRTT': [0, 0, 0], 'quality': [0, 0, 0]}, previous)
+        self.assertEqual(stats.interval, 10.0)
+        #node 2 was reset, node 3 is new
+        self.assertEqual(stats.deltas['sentCnt'].tolist(), [20, 5, 7])
+        self.assertEqual(stats.get_rate(1, 'sentCnt'), 2.0)
+        self.assertEqual(stats.get_delta(2, 'retries'), 2)
+        self.assertEqual(stats.get(3, 'averageRequestRTT'), 60)
+        self.assertEqual(stats.to_dict()['rates']['retries'], [0.0, 0.2, 0.1])
+        self.assertFalse('deltas' in stats.to_dict(extras=[]))
+
+if __name__ == '__main__':
+    sys.argv.append('-v')
+    unittest.main()
@@ -0,0 +1,130 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""
+.. module:: tests
+
+This file is part of **python-openzwave** project https://github.com/OpenZWave/python-openzwave.
+    :platform: Unix, Windows, MacOS X
+    :sinopsis: openzwave Library
+
+.. moduleauthor: bibi21000 aka Sébastien GALLET <bibi21000@gmail.com>
+
+License : GPL(v3)
+
+**python-openzwave** is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+**python-openzwave** is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with python-openzwave. If not, see http://www.gnu.org/licenses.
+
+"""
+
+
+import sys, os
+import unittest
+from openzwave.topology import ZWaveTopology
+from openzwave.statistics import ZWaveNodesStatistics, ZWaveStatisticsCollector, COUNTERS, GAUGES
+from openzwave.snapshot import ZWaveSnapshot
+from tests.common import TestPyZWave
+
+class FakeNode(object):
+    def __init__(self, node_id):
+        self.node_id = node_id
+        self.values = {}
+
+class FakeManager(object):
+    def __init__(self):
+        self.calls = []
+        self.neighbors = {1: set([2, 3]), 2: set([1, 4]), 3: set([1]), 4: set([2]), 5: set()}
+    def getNodesNeighbors(self, home_id, node_ids):
+        self.calls.append(sorted(node_ids))
+        return dict((node_id, set(self.neighbors[node_id])) for node_id in node_ids)
+    def getAllNodesStatistics(self, home_id, node_ids):
+        self.calls.append(sorted(node_ids))
+        stats = {'nodeIds': list(node_ids)}
+        for name in COUNTERS + GAUGES:
+            stats[name] = [0] * len(node_ids)
+        stats['sentCnt'] = [10] * len(node_ids)
+        return stats
+
+class FakeController(object):
+    node_id = 1
+
+class FakeNetwork(object):
+    home_id = 0x01020304
+    def __init__(self):
+        self.manager = FakeManager()
+        self.controller = FakeController()
+        self.snapshot = ZWaveSnapshot.from_nodes(1, dict((node_id, FakeNode(node_id)) for node_id in range(1, 6)))
+        self.statistics = ZWaveStatisticsCollector(self)
+
+def make_stats(sent, failed, retries, rtt):
+    stats = {'nodeIds': [1, 2, 3, 4, 5]}
+    for name in COUNTERS + GAUGES:
+        stats[name] = [0] * 5
+    stats['sentCnt'] = sent
+    stats['sentFailed'] = failed
+    stats['retries'] = retries
+    stats['averageRequestRTT'] = rtt
+    return ZWaveNodesStatistics(0.0, stats)
+
+class TestTopology(TestPyZWave):
+
+    def setUp(self):
+        self.network = FakeNetwork()
+        self.topology = ZWaveTopology(self.network)
+
+    def test_010_cache(self):
+        self.assertFalse(self.topology.loaded)
+        self.assertEqual(self.topology.get_neighbors(2), frozenset([1, 4]))
+        self.assertEqual(self.topology.get_neighbors(3), frozenset([1]))
+        self.assertEqual(self.network.manager.calls, [[1, 2, 3, 4, 5]])
+        self.network.manager.neighbors[3] = set([1, 4])
+        self.topology.invalidate(3)
+        self.assertEqual(self.topology.get_neighbors(3), frozenset([1, 4]))
+        self.assertEqual(self.network.manager.calls[-1], [3])
+        self.topology.remove_node(5)
+        self.assertFalse(5 in self.topology.adjacency)
+        self.topology.invalidate()
+        self.assertFalse(self.topology.loaded)
+
+    def test_020_graph(self):
+        self.assertEqual(self.topology.get_links(), set([(1, 2), (1, 3), (2, 4)]))
+        self.assertEqual(self.topology.get_hops(), {1: 0, 2: 1, 3: 1, 4: 2})
+
+    def test_030_qualities(self):
+        stats = make_stats([100, 100, 100, 100, 0], [0, 50, 0, 0, 0], [0, 0, 100, 0, 0], [50, 50, 50, 200, 0])
+        self.assertEqual(self.topology.get_node_quality(1, stats), 1.0)
+        self.assertEqual(self.topology.get_node_quality(2, stats), 0.5)
+        self.assertEqual(self.topology.get_node_quality(3, stats), 0.5)
+        self.assertEqual(self.topology.get_node_quality(4, stats), 0.5)
+        self.assertEqual(self.topology.get_node_quality(5, stats), 1.0)
+        self.assertEqual(self.topology.get_link_quality(1, 2, stats), 0.5)
+        routes = self.topology.get_route_qualities(stats=stats)
+        self.assertEqual(routes, {1: 1.0, 2: 0.5, 3: 0.5, 4: 0.5})
+        self.assertEqual(self.topology.get_weak_links(0.6, stats=stats), [(1, 2, 0.5), (1, 3, 0.5), (2, 4, 0.5)])
+        self.assertEqual(self.topology.get_weak_links(0.5, stats=stats), [])
+        self.assertEqual(self.topology.get_weak_nodes(min_neighbors=2, threshold=0.5, stats=stats), set([3, 4, 5]))
+
+    def test_040_no_statistics(self):
+        self.assertEqual(self.topology.get_node_quality(2), 1.0)
+        self.assertEqual(self.network.manager.calls, [[1, 2, 3, 4, 5]])
+        #The snapshot is not used by the deltas of the next poll
+        self.assertEqual(self.network.statistics.last, None)
+        stats = self.network.statistics.collect()
+        self.assertEqual(stats.interval, 0.0)
+        self.assertEqual(list(stats.deltas['sentCnt']), [0] * 5)
+        #Then the last statistics are used
+        self.assertEqual(self.topology.get_node_quality(2), 1.0)
+        self.assertEqual(len(self.network.manager.calls), 2)
+
+if __name__ == '__main__':
+    sys.argv.append('-v')
+    unittest.main()
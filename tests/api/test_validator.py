@@ -0,0 +1,134 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""
+.. module:: tests
+
+This file is part of **python-openzwave** project https://github.com/OpenZWave/python-openzwave.
+    :platform: Unix, Windows, MacOS X
+    :sinopsis: openzwave Library
+
+.. moduleauthor: bibi21000 aka Sébastien GALLET <bibi21000@gmail.com>
+
+License : GPL(v3)
+
+**python-openzwave** is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+**python-openzwave** is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with python-openzwave. If not, see http://www.gnu.org/licenses.
+
+"""
+
+import sys, os
+import unittest
+from openzwave.value import ZWaveValue, ZWaveValueValidator
+from tests.common import TestPyZWave
+
+try:
+    from openzwave.network import ZWaveNetwork
+    from openzwave.node import ZWaveNode
+except ImportError:
+    ZWaveNetwork = None
+
+VALUE1 = (2 << 24) | (0x70 << 14) | (1 << 4) | 5
+
+class FakeManager(object):
+    def __init__(self):
+        self.items = set(['On', 'Off'])
+    def getValueType(self, value_id, homeid=0):
+        return 'List'
+    def isValueReadOnly(self, value_id, homeid=0):
+        return False
+    def getValueListItems(self, value_id, homeid=0):
+        return set(self.items)
+    def getValue(self, value_id, homeid=0):
+        return 'On'
+    def refreshValue(self, value_id, homeid=0):
+        return True
+    def getNodeName(self, home_id, node_id):
+        return ''
+    def getLibraryTypeName(self, home_id):
+        return 'Static Controller'
+    def getLibraryVersion(self, home_id):
+        return 'Z-Wave 3.99'
+
+class FakeNetwork(object):
+    home_id = 0x01020304
+    def __init__(self):
+        self.manager = FakeManager()
+
+class FakeOptions(object):
+    device = '/dev/ttyUSB0'
+
+class FakeHub(object):
+    def __init__(self):
+        self.manager = FakeManager()
+
+class TestValidator(TestPyZWave):
+
+    def test_010_bool(self):
+        validator = ZWaveValueValidator('Bool')
+        self.assertEqual(validator.check_many(["False", "0", "true", 1, 0]), [False, False, True, True, False])
+
+    def test_020_integer(self):
+        validator = ZWaveValueValidator('Byte')
+        self.assertEqual(validator.check_many([-1, "12", 300, "a"]), [0, 12, 255, None])
+        validator = ZWaveValueValidator('Byte', min_value=0, max_value=99)
+        self.assertEqual(validator.check_many([-1, 50, 255]), [0, 50, 99])
+        validator = ZWaveValueValidator('Short', min_value=0, max_value=0)
+        self.assertEqual(validator(40000), 32767)
+        validator = ZWaveValueValidator('Int')
+        self.assertEqual(validator(-2147483649), -2147483648)
+
+    def test_030_other_types(self):
+        self.assertEqual(ZWaveValueValidator('Decimal')("1.5"), 1.5)
+        self.assertEqual(ZWaveValueValidator('Decimal')("a"), None)
+        self.assertEqual(ZWaveValueValidator('String')("a"), "a")
+        self.assertEqual(ZWaveValueValidator('Raw')("a"), None)
+        validator = ZWaveValueValidator('List', items=set(['On', 'Off']))
+        self.assertEqual(validator.check_many(['On', 'Dim', 1]), ['On', None, None])
+
+    def test_040_read_only(self):
+        validator = ZWaveValueValidator('Byte', read_only=True)
+        self.assertEqual(validator(12), None)
+
+    def test_050_str(self):
+        validator = ZWaveValueValidator('List', items=set(['On', 'Off']))
+        self.assertEqual(str(validator), 'type: [List] read_only: [False] min: [None] max: [None] items: [2]')
+
+    def test_060_invalidate(self):
+        network = FakeNetwork()
+        value = ZWaveValue(VALUE1, network=network)
+        self.assertEqual(value.check_data('Dim'), None)
+        network.manager.items.add('Dim')
+        self.assertEqual(value.check_data('Dim'), None)
+        value.invalidate_validator()
+        self.assertEqual(value.check_data('Dim'), 'Dim')
+
+    def test_070_list_value_changed(self):
+        if ZWaveNetwork is None:
+            self.skipTest("libopenzwave is not installed")
+        network = ZWaveNetwork(FakeOptions(), autostart=False, kvals=False, hub=FakeHub())
+        network._handle_driver_ready({'homeId':FakeNetwork.home_id, 'nodeId':1})
+        node = ZWaveNode(2, network=network)
+        node.add_value(VALUE1)
+        network.nodes = {1: network.nodes[1], 2: node}
+        value = node.values[VALUE1]
+        self.assertEqual(value.check_data('Dim'), None)
+        network.manager.items.add('Dim')
+        network._handle_value_changed({'homeId':FakeNetwork.home_id, 'nodeId':2, 'valueId':{'id':VALUE1, 'type':'List'}})
+        self.assertEqual(value.check_data('Dim'), 'Dim')
+        network.manager.items.add('Low')
+        network._handle_value_refreshed({'homeId':FakeNetwork.home_id, 'nodeId':2, 'valueId':{'id':VALUE1, 'type':'List'}})
+        self.assertEqual(value.check_data('Low'), 'Low')
+
+if __name__ == '__main__':
+    sys.argv.append('-v')
+    unittest.main()
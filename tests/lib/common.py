@@ -91,6 +91,9 @@ class TestLib(TestPyZWave):
     STATE_AWAKED = 7
     STATE_READY = 10
 
+    #Use the compact notifications of the watcher
+    compact = False
+
     @classmethod
     def setUpClass(self):
         super(TestPyZWave, self).setUpClass()
@@ -132,7 +135,7 @@ class TestLib(TestPyZWave):
             self.network_awake = None
             self.manager = libopenzwave.PyManager()
             self.manager.create()
-            self.manager.addWatcher(self.zwcallback)
+            self.manager.addWatcher(self.zwcallback, compact=self.compact)
             time.sleep(1.0)
             self.manager.addDriver(self.device)
             time.sleep(5.0)
@@ -0,0 +1,192 @@
+//
+// This file is part of **python-openzwave** project https://github.com/OpenZWave/python-openzwave.
+//
+// License : GPL(v3)
+//
+// A simulated OpenZWave manager used by the concurrency tests of the binding.
+//
+// Like the real Manager, every method takes the manager mutex and the driver
+// thread sends the notifications while it holds this mutex. A thread calling
+// a method with the GIL held while the driver thread waits for the GIL in the
+// watcher deadlocks : the calls must release the GIL. The methods give up
+// waiting for the mutex after a second and count a timeout, so the tests fail
+// instead of hanging.
+//
+// The driver thread also removes and adds back the values, so a ValueID
+// pointer taken from the map of the binding may be freed while a call is
+// running.
+//
+
+#ifndef _FAKEMANAGER_H
+#define _FAKEMANAGER_H
+
+#include <stdint.h>
+#include <map>
+#include <mutex>
+#include <thread>
+#include <atomic>
+#include <chrono>
+
+namespace FakeZWave
+{
+    class ValueID
+    {
+    public:
+        ValueID( uint32_t const _homeId, uint64_t const _id ): m_homeId( _homeId ), m_id( _id ) {}
+        uint32_t GetHomeId() const { return m_homeId; }
+        uint64_t GetId() const { return m_id; }
+    private:
+        uint32_t m_homeId;
+        uint64_t m_id;
+    };
+
+    // Notification types sent to the watcher
+    enum NotificationType
+    {
+        Type_ValueAdded = 0,
+        Type_ValueRemoved = 1
+    };
+
+    typedef void ( *pfnOnNotification_t )( NotificationType _type, ValueID const* _valueId, void* _context );
+
+    class Manager
+    {
+    public:
+        Manager( uint32_t const _homeId, uint64_t const _values ):
+            m_homeId( _homeId ), m_values( _values ), m_watcher( NULL ), m_context( NULL ),
+            m_running( false ), m_calls( 0 ), m_notifications( 0 ), m_timeouts( 0 ) {}
+
+        ~Manager() { Stop(); }
+
+        uint32_t GetHomeId() const { return m_homeId; }
+        uint64_t GetValueCount() const { return m_values; }
+
+        void Start()
+        {
+            m_running = true;
+            m_thread = std::thread( &Manager::DriverThread, this );
+        }
+
+        void Stop()
+        {
+            m_running = false;
+            if( m_thread.joinable() )
+            {
+                m_thread.join();
+            }
+        }
+
+        bool AddWatcher( pfnOnNotification_t _watcher, void* _context )
+        {
+            std::unique_lock<std::timed_mutex> lock( m_mutex, std::defer_lock );
+            if( !Lock( lock ) )
+            {
+                return false;
+            }
+            m_watcher = _watcher;
+            m_context = _context;
+            return true;
+        }
+
+        bool RemoveWatcher( pfnOnNotification_t _watcher, void* _context )
+        {
+            std::unique_lock<std::timed_mutex> lock( m_mutex, std::defer_lock );
+            if( !Lock( lock ) )
+            {
+                return false;
+            }
+            if( m_watcher != _watcher || m_context != _context )
+            {
+                return false;
+            }
+            m_watcher = NULL;
+            m_context = NULL;
+            return true;
+        }
+
+        void WriteConfig( uint32_t const _homeId )
+        {
+            std::unique_lock<std::timed_mutex> lock( m_mutex, std::defer_lock );
+            if( !Lock( lock ) )
+            {
+                return;
+            }
+        }
+
+        int32_t GetSendQueueCount( uint32_t const _homeId )
+        {
+            std::unique_lock<std::timed_mutex> lock( m_mutex, std::defer_lock );
+            if( !Lock( lock ) )
+            {
+                return -1;
+            }
+            return _homeId == m_homeId ? 0 : -1;
+        }
+
+        bool RefreshValue( ValueID const& _id )
+        {
+            std::unique_lock<std::timed_mutex> lock( m_mutex, std::defer_lock );
+            if( !Lock( lock ) )
+            {
+                return false;
+            }
+            return _id.GetHomeId() == m_homeId && _id.GetId() < m_values;
+        }
+
+        uint64_t GetCallCount() const { return m_calls; }
+        uint64_t GetNotificationCount() const { return m_notifications; }
+        uint64_t GetTimeoutCount() const { return m_timeouts; }
+
+    private:
+        // Take the mutex and simulate the time spent talking to the controller
+        bool Lock( std::unique_lock<std::timed_mutex>& _lock )
+        {
+            if( !_lock.try_lock_for( std::chrono::seconds( 1 ) ) )
+            {
+                ++m_timeouts;
+                return false;
+            }
+            ++m_calls;
+            std::this_thread::sleep_for( std::chrono::microseconds( 50 ) );
+            return true;
+        }
+
+        void Notify( NotificationType _type, uint64_t const _id )
+        {
+            ValueID valueId( m_homeId, _id );
+            if( m_watcher != NULL )
+            {
+                m_watcher( _type, &valueId, m_context );
+                ++m_notifications;
+            }
+        }
+
+        void DriverThread()
+        {
+            uint64_t id = 0;
+            while( m_running )
+            {
+                {
+                    std::lock_guard<std::timed_mutex> lock( m_mutex );
+                    Notify( Type_ValueRemoved, id );
+                    Notify( Type_ValueAdded, id );
+                }
+                id = ( id + 1 ) % m_values;
+                std::this_thread::sleep_for( std::chrono::microseconds( 100 ) );
+            }
+        }
+
+        uint32_t m_homeId;
+        uint64_t m_values;
+        pfnOnNotification_t m_watcher;
+        void* m_context;
+        std::timed_mutex m_mutex;
+        std::thread m_thread;
+        std::atomic<bool> m_running;
+        std::atomic<uint64_t> m_calls;
+        std::atomic<uint64_t> m_notifications;
+        std::atomic<uint64_t> m_timeouts;
+    };
+}
+
+#endif
@@ -0,0 +1,148 @@
+"""
+This file is part of **python-openzwave** project https://github.com/OpenZWave/python-openzwave.
+
+License : GPL(v3)
+
+**python-openzwave** is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+**python-openzwave** is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with python-openzwave. If not, see http://www.gnu.org/licenses.
+
+A binding of the simulated manager of fakemanager.h for the concurrency tests.
+It calls the manager the same way libopenzwave does : the GIL is released around
+the calls, the watcher takes it back and the value based calls work on a heap
+copy of the ValueID of the map.
+
+"""
+from cython.operator cimport dereference as deref
+from libcpp cimport bool
+from libcpp.unordered_map cimport unordered_map
+from libc.stdint cimport uint32_t, int32_t, uint64_t
+
+cdef extern from "fakemanager.h" namespace "FakeZWave" nogil:
+
+    cdef cppclass ValueID:
+        ValueID(uint32_t homeId, uint64_t id)
+        uint32_t GetHomeId()
+        uint64_t GetId()
+
+    cdef enum NotificationType:
+        Type_ValueAdded = 0
+        Type_ValueRemoved = 1
+
+    ctypedef void (*pfnOnNotification_t)(NotificationType _type, const ValueID* _valueId, void* _context)
+
+    cdef cppclass Manager:
+        Manager(uint32_t homeId, uint64_t values)
+        uint32_t GetHomeId()
+        void Start()
+        void Stop()
+        bool AddWatcher(pfnOnNotification_t notification, void* context)
+        bool RemoveWatcher(pfnOnNotification_t notification, void* context)
+        void WriteConfig(uint32_t homeid)
+        int32_t GetSendQueueCount(uint32_t homeId)
+        bool RefreshValue(ValueID& valueid)
+        uint64_t GetCallCount()
+        uint64_t GetNotificationCount()
+        uint64_t GetTimeoutCount()
+
+#The ValueIDs reported by the notifications : id -> ValueID
+cdef unordered_map[uint64_t, ValueID*] values_map
+
+cdef ValueID* newValueId(uint64_t id):
+    """
+    Return a copy of a ValueID of the map or NULL if it is unknown.
+    """
+    if values_map.count(id) == 0:
+        return NULL
+    cdef ValueID* v = values_map.at(id)
+    return new ValueID(v.GetHomeId(), v.GetId())
+
+cdef void notif_callback(NotificationType _type, const ValueID* _valueId, void* _context) with gil:
+    """
+    Notification callback of the simulated manager
+    """
+    cdef uint64_t id = _valueId.GetId()
+    if _type == Type_ValueRemoved:
+        if values_map.count(id) != 0:
+            del values_map[id]
+            values_map.erase(id)
+    else:
+        values_map[id] = new ValueID(_valueId.GetHomeId(), id)
+    (<object>_context)(_type, id)
+
+cdef class PyFakeManager:
+    """
+    The simulated manager
+    """
+    cdef Manager *manager
+    cdef object _watcher
+
+    def __cinit__(self, uint32_t homeid, uint64_t values):
+        self.manager = new Manager(homeid, values)
+
+    def __dealloc__(self):
+        del self.manager
+
+    def start(self):
+        with nogil:
+            self.manager.Start()
+
+    def stop(self):
+        with nogil:
+            self.manager.Stop()
+
+    def addWatcher(self, pythonfunc):
+        cdef bool ret
+        with nogil:
+            ret = self.manager.AddWatcher(notif_callback, <void*>pythonfunc)
+        #The driver thread does not use the previous watcher anymore
+        self._watcher = pythonfunc
+        return ret
+
+    def removeWatcher(self, pythonfunc):
+        cdef bool ret
+        with nogil:
+            ret = self.manager.RemoveWatcher(notif_callback, <void*>pythonfunc)
+        if ret:
+            self._watcher = None
+        return ret
+
+    def writeConfig(self, uint32_t homeid):
+        with nogil:
+            self.manager.WriteConfig(homeid)
+
+    def getSendQueueCount(self, uint32_t homeid):
+        cdef int32_t ret
+        with nogil:
+            ret = self.manager.GetSendQueueCount(homeid)
+        return ret
+
+    def refreshValue(self, uint64_t id):
+        cdef bool ret
+        cdef ValueID* c_value = newValueId(id)
+        if c_value == NULL:
+            return False
+        with nogil:
+            ret = self.manager.RefreshValue(deref(c_value))
+        del c_value
+        return ret
+
+    @property
+    def calls(self):
+        return self.manager.GetCallCount()
+
+    @property
+    def notifications(self):
+        return self.manager.GetNotificationCount()
+
+    @property
+    def timeouts(self):
+        return self.manager.GetTimeoutCount()
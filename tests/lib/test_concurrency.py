@@ -0,0 +1,104 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""
+.. module:: tests
+
+This file is part of **python-openzwave** project https://github.com/OpenZWave/python-openzwave.
+    :platform: Unix, Windows, MacOS X
+    :sinopsis: openzwave Library
+
+.. moduleauthor: bibi21000 aka Sébastien GALLET <bibi21000@gmail.com>
+
+License : GPL(v3)
+
+**python-openzwave** is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+**python-openzwave** is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with python-openzwave. If not, see http://www.gnu.org/licenses.
+
+"""
+
+import sys, os
+import time
+import threading
+import unittest
+from .common import TestLib
+import libopenzwave
+
+class TestConcurrency(TestLib):
+    """
+    Call the blocking methods of the manager from many threads.
+    The calls release the GIL, so they must not deadlock with the notification thread.
+    """
+
+    threads = 16
+    loops = 20
+
+    def setUp(self):
+        self.values_added = []
+        self.start_lib()
+        self.wait_for_ready()
+
+    def _handle_value_added(self, args):
+        if 'valueId' in args and args['valueId']['genre'] != '':
+            self.values_added.append(args['valueId']['id'])
+
+    def _run_threads(self, target):
+        errors = []
+        def run():
+            try:
+                for i in range(self.loops):
+                    target()
+            except Exception as exc:
+                errors.append(exc)
+        threads = [threading.Thread(target=run) for i in range(self.threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(60)
+            self.assertFalse(thread.is_alive())
+        self.assertEqual(errors, [])
+
+    def test_010_statistics(self):
+        nodes = list(self.nodes.keys())
+        def target():
+            self.assertTrue(self.manager.getSendQueueCount(self.homeid) >= 0)
+            self.assertTrue('SOFCnt' in self.manager.getDriverStatistics(self.homeid))
+            for node in nodes:
+                self.manager.getNodeStatistics(self.homeid, node)
+        self._run_threads(target)
+
+    def test_020_requests(self):
+        nodes = list(self.nodes.keys())
+        def target():
+            for node in nodes:
+                self.manager.requestNodeDynamic(self.homeid, node)
+            self.manager.writeConfig(self.homeid)
+        self._run_threads(target)
+
+    def test_030_values(self):
+        self.assertTrue(len(self.values_added) > 0)
+        values = self.values_added[:10]
+        def target():
+            for value in values:
+                self.manager.refreshValue(value)
+                self.manager.getValueLabel(value)
+        self._run_threads(target)
+
+    def test_040_unknown_value(self):
+        self.assertFalse(self.manager.refreshValue(0))
+        self.assertFalse(self.manager.enablePoll(0))
+        self.assertFalse(self.manager.disablePoll(0))
+        self.assertEqual(self.manager.setValue(0, 1), 2)
+
+if __name__ == '__main__':
+    sys.argv.append('-v')
+    unittest.main()
@@ -0,0 +1,134 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""
+.. module:: tests
+
+This file is part of **python-openzwave** project https://github.com/OpenZWave/python-openzwave.
+    :platform: Unix, Windows, MacOS X
+    :sinopsis: openzwave Library
+
+.. moduleauthor: bibi21000 aka Sébastien GALLET <bibi21000@gmail.com>
+
+License : GPL(v3)
+
+**python-openzwave** is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+**python-openzwave** is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with python-openzwave. If not, see http://www.gnu.org/licenses.
+
+"""
+
+import sys, os
+import threading
+import unittest
+from tests.common import TestPyZWave
+
+try:
+    import pyximport
+except ImportError:
+    pyximport = None
+
+def build_fakemanager():
+    """
+    Build the binding of the simulated manager with pyximport.
+    Return None if Cython or a C++ compiler is not available.
+    """
+    if pyximport is None:
+        return None
+    pyximport.install(language_level=2)
+    try:
+        from tests.lib import fakemanager
+    except Exception:
+        return None
+    return fakemanager
+
+class TestFakeManager(TestPyZWave):
+    """
+    Call the binding of the simulated manager from many threads while its driver
+    thread sends notifications. The driver thread holds the manager mutex while
+    it waits for the GIL : a call which does not release the GIL deadlocks.
+    """
+
+    threads = 16
+    loops = 200
+    values = 32
+    homeid = 0x01020304
+
+    @classmethod
+    def setUpClass(cls):
+        super(TestFakeManager, cls).setUpClass()
+        cls.fakemanager = build_fakemanager()
+
+    def setUp(self):
+        if self.fakemanager is None:
+            self.skipTest("Cython or a C++ compiler is not available")
+        self.received = []
+        self.watcher = self._watcher
+        self.manager = self.fakemanager.PyFakeManager(self.homeid, self.values)
+        self.assertTrue(self.manager.addWatcher(self.watcher))
+        self.manager.start()
+
+    def tearDown(self):
+        if self.fakemanager is not None:
+            self.manager.stop()
+            self.manager.removeWatcher(self.watcher)
+
+    def _watcher(self, ntype, value_id):
+        self.received.append((ntype, value_id))
+
+    def _run_threads(self, target):
+        errors = []
+        def run():
+            try:
+                for i in range(self.loops):
+                    if self.manager.timeouts > 0:
+                        break
+                    target(i)
+            except Exception as exc:
+                errors.append(exc)
+        threads = [threading.Thread(target=run) for i in range(self.threads)]
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+        for thread in threads:
+            thread.join(60)
+            self.assertFalse(thread.is_alive())
+        self.assertEqual(errors, [])
+        #A call waited for the mutex while the driver thread was waiting for the GIL
+        self.assertEqual(self.manager.timeouts, 0)
+
+    def test_010_blocking_calls(self):
+        def target(i):
+            self.manager.writeConfig(self.homeid)
+            self.manager.getSendQueueCount(self.homeid)
+        self._run_threads(target)
+        self.assertEqual(self.manager.calls, self.threads * self.loops * 2 + 1)
+        self.assertTrue(self.manager.notifications > 0)
+
+    def test_020_removed_values(self):
+        def target(i):
+            #The value may be removed by the driver thread while the call is running
+            self.manager.refreshValue(i % self.values)
+        self._run_threads(target)
+        self.assertTrue(len(self.received) > 0)
+        self.assertFalse(self.manager.refreshValue(self.values + 1))
+
+    def test_030_watchers(self):
+        def target(i):
+            #The driver thread may be in the watcher
+            self.manager.removeWatcher(self.watcher)
+            self.manager.addWatcher(self.watcher)
+        self.threads = 1
+        self._run_threads(target)
+
+if __name__ == '__main__':
+    sys.argv.append('-v')
+    unittest.main()
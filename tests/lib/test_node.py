@@ -68,6 +68,26 @@ class TestNode(TestLib):
         newname = self.manager.getNodeName(self.homeid, 1)
         self.assertTrue(isinstance(newname, string_types))
 
+    def test_110_controller_static_info(self):
+        info = self.manager.getNodeStaticInfo(self.homeid, 1)
+        self.assertEqual(info['manufacturer_name'], self.manager.getNodeManufacturerName(self.homeid, 1))
+        self.assertEqual(info['product_name'], self.manager.getNodeProductName(self.homeid, 1))
+        self.assertEqual(info['type'], self.manager.getNodeType(self.homeid, 1))
+        self.assertEqual(info['generic'], self.manager.getNodeGeneric(self.homeid, 1))
+        self.assertEqual(info['is_listening_device'], self.manager.isNodeListeningDevice(self.homeid, 1))
+        classes = set([cls for cls in self.manager.COMMAND_CLASS_DESC if self.manager.getNodeClassInformation(self.homeid, 1, cls)])
+        self.assertEqual(info['command_classes'], classes)
+
+    def test_120_all_nodes_statistics(self):
+        stats = self.manager.getAllNodesStatistics(self.homeid, [1])
+        self.assertEqual(stats['nodeIds'], [1])
+        self.assertEqual(stats['quality'], [self.manager.getNodeStatistics(self.homeid, 1)['quality']])
+        self.assertEqual(len(stats['sentCnt']), 1)
+
+    def test_130_nodes_neighbors(self):
+        neighbors = self.manager.getNodesNeighbors(self.homeid, [1])
+        self.assertEqual(neighbors, {1: self.manager.getNodeNeighbors(self.homeid, 1)})
+
 
 if __name__ == '__main__':
     sys.argv.append('-v')
@@ -0,0 +1,84 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""
+.. module:: tests
+
+This file is part of **python-openzwave** project https://github.com/OpenZWave/python-openzwave.
+    :platform: Unix, Windows, MacOS X
+    :sinopsis: openzwave Library
+
+.. moduleauthor: bibi21000 aka Sébastien GALLET <bibi21000@gmail.com>
+
+License : GPL(v3)
+
+**python-openzwave** is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+**python-openzwave** is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with python-openzwave. If not, see http://www.gnu.org/licenses.
+
+"""
+
+import sys, os
+import time
+import unittest
+from .common import TestLib
+from six import string_types, integer_types
+import libopenzwave
+
+class TestCompactNotification(TestLib):
+
+    compact = True
+
+    def setUp(self):
+        self.values_added = []
+        self.start_lib()
+        self.wait_for_ready()
+
+    def _handle_value_added(self, args):
+        self.values_added.append(args)
+
+    def test_010_notification_type(self):
+        self.assertTrue(len(self.values_added) > 0)
+        args = self.values_added[0]
+        self.assertTrue(isinstance(args, libopenzwave.PyNotification))
+        self.assertEqual(args['notificationType'], 'ValueAdded')
+        self.assertEqual(args['homeId'], self.homeid)
+        self.assertTrue('valueId' in args)
+        self.assertFalse('groupIdx' in args)
+        self.assertEqual(args.get('groupIdx', 'missing'), 'missing')
+
+    def test_020_value_id(self):
+        args = self.values_added[0]
+        value_id = args['valueId']
+        self.assertTrue(isinstance(value_id['id'], integer_types))
+        self.assertEqual(value_id['nodeId'], args['nodeId'])
+        self.assertEqual(sorted(value_id.keys()), sorted(['homeId', 'nodeId', 'commandClass', 'instance', 'index', 'id', 'genre', 'type', 'value', 'label', 'units', 'readOnly']))
+        if value_id['genre'] != '':
+            self.assertTrue(isinstance(value_id['label'], string_types))
+            self.assertEqual(value_id['label'], self.manager.getValueLabel(value_id['id']))
+
+    def test_030_immutable(self):
+        args = self.values_added[0]
+        with self.assertRaises(TypeError):
+            args['nodeId'] = 0
+        with self.assertRaises(AttributeError):
+            args.node_id = 0
+
+    def test_040_to_dict(self):
+        args = self.values_added[0]
+        data = args.to_dict()
+        self.assertTrue(isinstance(data, dict))
+        self.assertTrue(isinstance(data['valueId'], dict))
+        self.assertEqual(args, data)
+
+if __name__ == '__main__':
+    sys.argv.append('-v')
+    unittest.main()
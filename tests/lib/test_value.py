@@ -0,0 +1,82 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""
+.. module:: tests
+
+This file is part of **python-openzwave** project https://github.com/OpenZWave/python-openzwave.
+    :platform: Unix, Windows, MacOS X
+    :sinopsis: openzwave Library
+
+.. moduleauthor: bibi21000 aka Sébastien GALLET <bibi21000@gmail.com>
+
+License : GPL(v3)
+
+**python-openzwave** is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+**python-openzwave** is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with python-openzwave. If not, see http://www.gnu.org/licenses.
+
+"""
+
+import sys, os
+import time
+import unittest
+from .common import TestLib
+from six import string_types
+import libopenzwave
+
+class TestValueMetadata(TestLib):
+
+    def setUp(self):
+        self.values_added = []
+        self.values_changed = []
+        self.start_lib()
+        self.wait_for_ready()
+
+    def _handle_value_added(self, args):
+        if 'valueId' in args and args['valueId']['genre'] != '':
+            self.values_added.append(args['valueId'])
+
+    def _handle_value_changed(self, args):
+        if 'valueId' in args:
+            self.values_changed.append(args['valueId'])
+
+    def test_010_cached_label(self):
+        self.assertTrue(len(self.values_added) > 0)
+        value_id = self.values_added[0]
+        self.assertEqual(self.manager.getValueLabel(value_id['id']), value_id['label'])
+        self.assertEqual(self.manager.getValueUnits(value_id['id']), value_id['units'])
+        self.assertEqual(self.manager.isValueReadOnly(value_id['id']), value_id['readOnly'])
+
+    def test_020_set_label(self):
+        value_id = self.values_added[0]
+        old_label = self.manager.getValueLabel(value_id['id'])
+        self.manager.setValueLabel(value_id['id'], "test lib label")
+        self.assertEqual(self.manager.getValueLabel(value_id['id']), "test lib label")
+        self.manager.setValueLabel(value_id['id'], old_label)
+        self.assertEqual(self.manager.getValueLabel(value_id['id']), old_label)
+
+    def test_030_set_units(self):
+        value_id = self.values_added[0]
+        old_units = self.manager.getValueUnits(value_id['id'])
+        self.manager.setValueUnits(value_id['id'], "test units")
+        self.assertEqual(self.manager.getValueUnits(value_id['id']), "test units")
+        self.manager.setValueUnits(value_id['id'], old_units)
+        self.assertEqual(self.manager.getValueUnits(value_id['id']), old_units)
+
+    def test_040_values_map_size(self):
+        self.assertTrue(self.manager.getValuesMapSize(self.homeid) > 0)
+        self.assertEqual(self.manager.getValuesMapSize(), self.manager.getValuesMapSize(self.homeid))
+        self.assertEqual(self.manager.getValuesMapSize(0), 0)
+
+if __name__ == '__main__':
+    sys.argv.append('-v')
+    unittest.main()